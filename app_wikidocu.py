@@ -7,7 +7,7 @@ from frontend.ui_podcast import ui_podcast
 
 # Import Podcast-LLM components
 from frontend.server_podcast_llm import podcast_llm_server
-from frontend.server_wikidocu import wikidocu_server
+from frontend.server_wikidocu import wikidocu_server, add_metrics_route
 
 # Import custom research body functions
 from frontend.utils_wikidocu import custom_research_body, remove_custom_research_body, restore_custom_research_body
@@ -55,8 +55,8 @@ def main_server(input, output, session):
             # 移除自定义研究输入栏
             remove_custom_research_body()
 
-# 创建 Shiny 应用实例
-app = App(app_ui, main_server)
+# 创建 Shiny 应用实例，并在 /metrics 暴露问答链路的 Prometheus 指标
+app = add_metrics_route(App(app_ui, main_server))
 
 # 启动应用
 if __name__ == "__main__":
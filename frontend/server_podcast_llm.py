@@ -15,6 +15,7 @@ import time
 import traceback
 import concurrent.futures
 import threading
+import shutil
 
 from shiny import App, ui, render, reactive
 #from shiny.types import FileInfo
@@ -26,7 +27,10 @@ logger = logging.getLogger(__name__)
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    from podcast_llm.generate import generate
+    from podcast_llm.utils.lazy_imports import lazy_import
+    from podcast_llm.utils.segment_playlist import read_playlist, segment_dir_for
+    # 生成流水线依赖较多，首次生成时再导入，加快应用启动
+    podcast_generate = lazy_import('podcast_llm.generate')
     MODULES_AVAILABLE = True
 except ImportError:
     MODULES_AVAILABLE = False
@@ -60,9 +64,51 @@ def podcast_llm_server(input, output, session):
         'is_playing': False,
         'pygame_initialized': False,
         'playback_finished': False,   # 新增：用于通知播放结束
-        'error': None                 # 新增：存储错误信息
+        'error': None,                # 新增：存储错误信息
+        'stream_dir': None,           # 边生成边播放：分段目录（None 表示播放完整文件）
+        'stream_index': -1            # 边生成边播放：当前播放的分段序号
     })
 
+    # 本次生成是否已自动开始边生成边播放
+    stream_autostarted = reactive.Value(False)
+
+    def init_mixer():
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                pygame.mixer.quit()
+                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+
+    def start_stream_playback(stream_dir):
+        """Start playing the published segments of an episode that is still being generated."""
+        segments, _ = read_playlist(stream_dir)
+        if not segments:
+            return False
+
+        logger.info("Streaming audio from %s...", stream_dir)
+        with open(temp_log_file, 'a') as f:
+            f.write(f"\n--- Streaming audio from {stream_dir} ---\n")
+        update_log()
+
+        init_mixer()
+        pygame.mixer.music.load(str(segments[0]))
+        pygame.mixer.music.play()
+
+        with reactive.isolate():
+            new_state = audio_playback_state.get().copy()
+        new_state.update({
+            'is_playing': True,
+            'pygame_initialized': True,
+            'playback_finished': False,
+            'error': None,
+            'stream_dir': stream_dir,
+            'stream_index': 0
+        })
+        audio_playback_state.set(new_state)
+        ui.update_action_button("audio_play", label="Audio Stop")
+        return True
+
     # Create a temporary file for logging
     #temp_log_file = tempfile.NamedTemporaryFile(mode='w', delete=False).name
     temp_log_file = LOG_FILE
@@ -150,6 +196,11 @@ def podcast_llm_server(input, output, session):
         audio_output_file = Path("output") / audio_output.strip() if audio_output.strip() else None
         audio_file_path.set(audio_output_file)
 
+        # 清理上一次生成发布的分段，避免边生成边播放时播放旧内容
+        if audio_output_file:
+            shutil.rmtree(segment_dir_for(audio_output_file), ignore_errors=True)
+        stream_autostarted.set(False)
+
         # Log input values
         logging.info(f'Topic: {topic} (type: {type(topic)})')
         logging.info(f'Mode of Operation: {mode} (type: {type(mode)})')
@@ -173,7 +224,7 @@ def podcast_llm_server(input, output, session):
                 # Create a future for the generate function
                 future = loop.run_in_executor(
                     executor,
-                    lambda: generate(
+                    lambda: podcast_generate.generate(
                         topic=topic.strip() if topic else "",
                         mode=mode,
                         sources=all_sources,
@@ -296,6 +347,7 @@ def podcast_llm_server(input, output, session):
                 new_state['is_playing'] = False
                 new_state['pygame_initialized'] = False
                 new_state['playback_finished'] = False  # 重置播放完成状态
+                new_state['stream_dir'] = None
                 audio_playback_state.set(new_state)
 
                 logger.info("Stopped playing audio %s", filename)
@@ -314,6 +366,11 @@ def podcast_llm_server(input, output, session):
                 ui.notification_show(f"❌ 播放音频时发生错误", type="error", duration=10)
             return
 
+        # 生成尚未完成时，播放已合成的分段
+        if is_generating.get() and filename:
+            if start_stream_playback(segment_dir_for(filename)):
+                return
+
         # Start playing the audio
         try:
             if not os.path.exists(filename):
@@ -327,12 +384,7 @@ def podcast_llm_server(input, output, session):
             ui.notification_show("⏳ 准备播放中...", type="message", duration=10)
 
             # Initialize mixer
-            if not pygame.mixer.get_init():
-                try:
-                    pygame.mixer.init()
-                except pygame.error:
-                    pygame.mixer.quit()
-                    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            init_mixer()
             
             pygame.mixer.music.load(filename)
             pygame.mixer.music.set_endevent(MUSIC_END_EVENT)  # 设置结束事件
@@ -344,6 +396,7 @@ def podcast_llm_server(input, output, session):
             new_state['pygame_initialized'] = True
             new_state['playback_finished'] = False
             new_state['error'] = None
+            new_state['stream_dir'] = None
             audio_playback_state.set(new_state)
 
             ui.update_action_button("audio_play", label="Audio Stop")
@@ -380,10 +433,25 @@ def podcast_llm_server(input, output, session):
             try:
                 # 检查是否仍在播放
                 if pygame.mixer.get_init() and not pygame.mixer.music.get_busy():
+                    if state['stream_dir'] is not None:
+                        # 边生成边播放：当前分段结束，继续下一个已发布的分段
+                        segments, finished = read_playlist(state['stream_dir'])
+                        next_index = state['stream_index'] + 1
+                        if next_index < len(segments):
+                            pygame.mixer.music.load(str(segments[next_index]))
+                            pygame.mixer.music.play()
+                            new_state = state.copy()
+                            new_state['stream_index'] = next_index
+                            audio_playback_state.set(new_state)
+                            return
+                        if not finished:
+                            # 下一个分段尚未合成，稍后再检查
+                            return
                     # 播放结束
                     new_state = audio_playback_state.get().copy()  # 创建副本
                     new_state['is_playing'] = False
                     new_state['playback_finished'] = True
+                    new_state['stream_dir'] = None
                     audio_playback_state.set(new_state)
                 # 如果仍在播放，effect会在0.1秒后重新运行
             except Exception as e:
@@ -411,3 +479,20 @@ def podcast_llm_server(input, output, session):
                         pygame.mixer.quit()
                 except Exception as e:
                     logger.error("更新UI时发生错误: %s", e)
+
+    # 边生成边播放：第一个分段合成后自动开始播放
+    @reactive.effect
+    def _autostart_stream_playback():
+        if not is_generating.get() or not input.stream_playback() or stream_autostarted.get():
+            return
+        reactive.invalidate_later(0.5)
+
+        with reactive.isolate():
+            state = audio_playback_state.get()
+            filename = audio_file_path.get()
+        if state['is_playing'] or not filename:
+            return
+
+        if start_stream_playback(segment_dir_for(filename)):
+            stream_autostarted.set(True)
+            ui.notification_show("🔊 首段语音已合成，开始边生成边播放", type="message", duration=10)
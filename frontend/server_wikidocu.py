@@ -19,12 +19,19 @@ from frontend.components import create_auto_scroll_div
 from frontend.navset_configs import navset_configs
 from frontend.utils_wikidocu import generate_full_report, show_api_config_modal, custom_research_body
 from src.func_utils import cpoy_directory,webfetch,clear_docs_folder
-from src.graph import create_async_tools_graph
+from src.metrics import REGISTRY, track_question
+from podcast_llm.utils.lazy_imports import lazy_import
 
 from config.global_vars import WIKIDOCU_QA_DIR
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 
 builder = NavsetUIBuilder(navset_configs)
 
+# 研究图依赖 langgraph 等较重的库，首次提问时再导入，加快应用启动
+graph_module = lazy_import('src.graph')
+
 # ========== Server Logic ==========
 # 初始化时从环境变量获取默认值
 api_key = os.getenv("OPENAI_API_KEY", "sk-xxx")
@@ -32,6 +39,27 @@ model_name = os.getenv("OPENAI_MODEL", "Qwen/Qwen2.5-7B-Instruct")
 #model_name_answer= os.getenv("OPENAI_MODEL", "Qwen/Qwen2.5-7B-Instruct")
 base_url = os.getenv("OPENAI_BASE_URL", "https://api.siliconflow.cn/v1")
 
+# Prometheus 文本格式的 Content-Type
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """以 Prometheus 文本格式返回问答链路指标（节点/文件耗时、Token、缓存命中、排队等待）。"""
+    return Response(REGISTRY.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def add_metrics_route(app, path: str = "/metrics"):
+    """
+    在 Shiny 应用上挂载指标接口，供 Prometheus 抓取。
+
+    Args:
+        app: shiny.App 实例
+        path: 接口路径
+    """
+    # 插入到最前面，避免被 Shiny 的静态资源挂载点拦截
+    app.starlette_app.router.routes.insert(0, Route(path, metrics_endpoint, methods=["GET"]))
+    return app
+
 def wikidocu_server(input, output,  session):
     g_value_main_output = reactive.Value("")
     g_value_detail_output = reactive.Value("")
@@ -137,7 +165,7 @@ def wikidocu_server(input, output,  session):
         # 2. 根据用户配置动态创建 graph 实例
         try:
             # 将用户配置传递给 graph 创建函数
-            graph = create_async_tools_graph(
+            graph = graph_module.create_async_tools_graph(
                 api_key=user_api_key,
                 model_name=user_model_name,
                 base_url=user_base_url
@@ -158,8 +186,9 @@ def wikidocu_server(input, output,  session):
 
         # 4. 执行分析
         try:
-            response = await graph.ainvoke({"messages": [HumanMessage(content=research_topic)]
-                                            }, config)
+            with track_question(research_topic) as question_metrics:
+                response = await graph.ainvoke({"messages": [HumanMessage(content=research_topic)]
+                                                }, config)
             
             logger.info("分析执行完成。")
 
@@ -178,7 +207,8 @@ def wikidocu_server(input, output,  session):
             if not answer_resp.strip():
                 full_report = "⚠️ 没有获取到有效的分析结果，请检查输入数据或稍后重试。"
             else:
-                full_report = generate_full_report(research_topic, answer_resp, file_paths, timestamp)
+                full_report = generate_full_report(research_topic, answer_resp, file_paths, timestamp,
+                                                   metrics=question_metrics.summary())
 
             g_value_main_output.set(full_report)
             g_value_detail_output.set(retrieve_resp)
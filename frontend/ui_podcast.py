@@ -351,6 +351,13 @@ ui_podcast = ui.page_fluid(
                             ),
                             class_="form-col"
                         ),
+                        ui.div(
+                            ui.div(
+                                ui.input_checkbox("stream_playback", "边生成边播放", value=True),
+                                class_="form-group"
+                            ),
+                            class_="form-col"
+                        ),
 
                         class_="form-row"
                     ),
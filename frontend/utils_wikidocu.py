@@ -1,12 +1,17 @@
+import json
 import shutil
 import os
 from shiny import App, ui, render, reactive, Session
 
-def generate_full_report(research_topic, answer, file_paths, timestamp):
+def generate_full_report(research_topic, answer, file_paths, timestamp, metrics=None):
     """
     生成完整的分析报告内容（Markdown 格式）
+
+    Args:
+        metrics: 本次问题的指标摘要（src.metrics.QuestionMetrics.summary()），
+                 提供时以 JSON 形式附加在报告末尾
     """
-    return f"""
+    report = f"""
 #### {research_topic}
 
 ---
@@ -15,6 +20,17 @@ def generate_full_report(research_topic, answer, file_paths, timestamp):
 
 > 🕒 ***{timestamp}***  \n> ⚠️ *注：以上分析基于当前输入的数据文件和模型理解能力，仅供参考。*
 """
+    if metrics is not None:
+        report += f"""
+<details>
+<summary>⏱️ 性能指标（耗时 {metrics.get('seconds', 0):.1f}s）</summary>
+
+```json
+{json.dumps(metrics, ensure_ascii=False, indent=2)}
+```
+</details>
+"""
+    return report
 
 def show_api_config_modal(input, output, session, openai_config, sdata):
     """
@@ -0,0 +1,423 @@
+"""
+Batch podcast generation module.
+
+This module generates many episodes in one process from a manifest of topics and
+sources. Compared to invoking podcast_llm.generate once per episode, a batch run:
+1. Shares LLM, embedding and TTS clients, provider rate limiters and the research,
+   embedding and audio caches across all episodes
+2. Runs several episodes at once, so while one episode waits on the LLM another can
+   research or synthesize audio, keeping every provider quota busy. The shared
+   token-bucket limiters keep the combined request rate within each quota.
+3. Reports per-episode stage timings and aggregate throughput and quota utilization
+
+The manifest is a YAML (or JSON) file:
+
+    max_parallel_episodes: 3      # optional
+    defaults:                     # optional, applied to every episode
+      mode: research
+      qa_rounds: 2
+      language: zh
+    episodes:
+      - topic: Quantum computing
+      - topic: The history of jazz
+        mode: context
+        sources: [jazz.pdf, https://example.com/jazz]
+        audio_output: output/jazz.mp3   # default: <output_dir>/<topic>.<output_format>
+        text_output: output/jazz.md     # default: <output_dir>/<topic>.md
+
+Example:
+    >>> generate_batch('nightly.yaml', report_output='output/nightly_report.json')
+
+    Or from the command line:
+    $ python -m podcast_llm.batch nightly.yaml --report-output output/nightly_report.json
+"""
+
+import argparse
+import concurrent.futures
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from podcast_llm.config import PodcastConfig, setup_logging
+from podcast_llm.generate import DEFAULT_CONFIG_PATH, build_episode_pipeline
+from podcast_llm.utils.checkpointer import Checkpointer, to_snake_case
+from podcast_llm.utils.rate_limits import get_limiter_metrics
+from podcast_llm.utils.shared_clients import get_shared_client_stats
+from podcast_llm.utils.telemetry import record_episode
+
+
+logger = logging.getLogger(__name__)
+
+
+EPISODE_FIELDS = {'topic', 'mode', 'sources', 'qa_rounds', 'audio_output', 'text_output', 'language'}
+
+
+@dataclass
+class EpisodeSpec:
+    """One episode of a batch manifest."""
+    topic: str
+    mode: str = 'research'
+    sources: Optional[List[str]] = None
+    qa_rounds: int = 2
+    audio_output: Optional[str] = None
+    text_output: Optional[str] = None
+    language: str = 'en'
+
+
+@dataclass
+class EpisodeReport:
+    """Outcome and timing of one episode of a batch run."""
+    topic: str
+    status: str = 'pending'
+    error: Optional[str] = None
+    start_s: float = 0.0
+    end_s: float = 0.0
+    stages: Dict[str, float] = field(default_factory=dict)
+    operations: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    script_lines: int = 0
+    audio_output: Optional[str] = None
+    text_output: Optional[str] = None
+
+    @property
+    def wall_s(self) -> float:
+        return self.end_s - self.start_s
+
+
+def load_manifest(manifest_path: str, config: PodcastConfig) -> Dict[str, Any]:
+    """
+    Load a batch manifest.
+
+    Episode fields missing from an entry are taken from the manifest's ``defaults``.
+    Outputs default to ``config.output_dir/<topic>.<output_format>`` for audio and
+    ``config.output_dir/<topic>.md`` for the script; set them to null to skip an output.
+
+    Args:
+        manifest_path (str): Path to the YAML or JSON manifest
+        config (PodcastConfig): Loaded configuration (for output defaults)
+
+    Returns:
+        Dict[str, Any]: {'episodes': List[EpisodeSpec], 'max_parallel_episodes': Optional[int]}
+
+    Raises:
+        ValueError: If the manifest has no episodes, an episode has no topic or unknown
+            fields, or a context-mode episode has no sources
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = yaml.safe_load(f) or {}
+    if isinstance(manifest, list):
+        manifest = {'episodes': manifest}
+
+    defaults = manifest.get('defaults', {}) or {}
+    entries = manifest.get('episodes') or []
+    if not entries:
+        raise ValueError(f'No episodes in manifest {manifest_path}')
+
+    output_dir = Path(config.output_dir)
+    episodes = []
+    for i, entry in enumerate(entries):
+        if isinstance(entry, str):
+            entry = {'topic': entry}
+        values = {**defaults, **entry}
+        unknown = set(values) - EPISODE_FIELDS
+        if unknown:
+            raise ValueError(f'Episode {i} has unknown fields: {sorted(unknown)}')
+        if not values.get('topic'):
+            raise ValueError(f'Episode {i} has no topic')
+
+        name = to_snake_case(values['topic'])[:60] or f'episode_{i}'
+        values.setdefault('audio_output', str(output_dir / f'{name}.{config.output_format}'))
+        values.setdefault('text_output', str(output_dir / f'{name}.md'))
+        episode = EpisodeSpec(**values)
+        if episode.mode == 'context' and not episode.sources:
+            raise ValueError(f'Episode {i} ({episode.topic}) uses context mode but has no sources')
+        episodes.append(episode)
+
+    return {'episodes': episodes, 'max_parallel_episodes': manifest.get('max_parallel_episodes')}
+
+
+def run_episode(config: PodcastConfig,
+                episode: EpisodeSpec,
+                use_checkpoints: bool,
+                batch_start: float,
+                fast_llm_base_url: Optional[str] = None,
+                long_context_llm_base_url: Optional[str] = None) -> EpisodeReport:
+    """
+    Generate one episode of a batch, recording its outcome instead of raising.
+
+    Args:
+        config (PodcastConfig): Configuration shared by the batch
+        episode (EpisodeSpec): Episode to generate
+        use_checkpoints (bool): Whether to use checkpointing
+        batch_start (float): time.monotonic() at the start of the batch
+        fast_llm_base_url (str, optional): Base URL for fast LLM (OpenAI-compatible APIs)
+        long_context_llm_base_url (str, optional): Base URL for long context LLM
+
+    Returns:
+        EpisodeReport: Outcome, stage durations, per-operation telemetry (see
+            utils.telemetry) and timing relative to the batch start
+    """
+    report = EpisodeReport(
+        topic=episode.topic,
+        audio_output=episode.audio_output,
+        text_output=episode.text_output,
+        start_s=time.monotonic() - batch_start
+    )
+    for output in (episode.audio_output, episode.text_output):
+        if output:
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+
+    checkpointer = Checkpointer(
+        checkpoint_key=to_snake_case(episode.topic)[:40],
+        checkpoint_dir=config.checkpoint_dir,
+        enabled=use_checkpoints
+    )
+    pipeline = None
+    with record_episode(config, to_snake_case(episode.topic)[:40], topic=episode.topic, mode=episode.mode) as recorder:
+        try:
+            pipeline, initial = build_episode_pipeline(
+                config, episode.topic, episode.mode, checkpointer,
+                sources=episode.sources,
+                qa_rounds=episode.qa_rounds,
+                audio_output=episode.audio_output,
+                text_output=episode.text_output,
+                fast_llm_base_url=fast_llm_base_url,
+                long_context_llm_base_url=long_context_llm_base_url,
+                language=episode.language
+            )
+            results = pipeline.run(initial)
+            report.script_lines = len(results.get('final_script', []))
+            report.status = 'succeeded'
+        except Exception as e:
+            logger.error(f'Episode {episode.topic} failed: {e}')
+            report.status = 'failed'
+            report.error = f'{type(e).__name__}: {e}'
+        finally:
+            report.end_s = time.monotonic() - batch_start
+            if pipeline is not None:
+                report.stages = {timing.name: round(timing.duration, 3) for timing in pipeline.timings}
+            if recorder is not None:
+                report.operations = recorder.summary()['operations']
+
+    logger.info(f'Episode {episode.topic} {report.status} in {report.wall_s:.1f}s')
+    return report
+
+
+def summarize_batch(reports: List[EpisodeReport], wall_s: float) -> Dict[str, Any]:
+    """
+    Build the batch report.
+
+    Args:
+        reports (List[EpisodeReport]): Reports of all episodes
+        wall_s (float): Wall time of the batch in seconds
+
+    Returns:
+        Dict[str, Any]: Per-episode reports plus aggregate throughput, time spent per
+            stage across episodes, per-limiter metrics with quota utilization, and shared
+            client reuse
+    """
+    succeeded = [report for report in reports if report.status == 'succeeded']
+    stage_seconds: Dict[str, float] = {}
+    for report in reports:
+        for name, duration in report.stages.items():
+            stage_seconds[name] = round(stage_seconds.get(name, 0.0) + duration, 3)
+
+    limiters = get_limiter_metrics()
+    for metrics in limiters.values():
+        # Share of the configured quota used over the whole batch
+        quota = metrics['configured_requests_per_minute'] * wall_s / 60
+        metrics['quota_utilization'] = round(metrics['requests'] / quota, 3) if quota else 0.0
+
+    episode_seconds = sum(report.wall_s for report in reports)
+    return {
+        'episodes': [{**asdict(report), 'wall_s': round(report.wall_s, 3)} for report in reports],
+        'aggregate': {
+            'episodes': len(reports),
+            'succeeded': len(succeeded),
+            'failed': len(reports) - len(succeeded),
+            'wall_s': round(wall_s, 3),
+            'episodes_per_hour': round(len(succeeded) * 3600 / wall_s, 2) if wall_s else 0.0,
+            'script_lines_per_minute': round(sum(r.script_lines for r in succeeded) * 60 / wall_s, 2) if wall_s else 0.0,
+            'mean_episode_wall_s': round(episode_seconds / len(reports), 3) if reports else 0.0,
+            # Episode wall time per batch wall time: >1 means episodes overlapped
+            'concurrency': round(episode_seconds / wall_s, 2) if wall_s else 0.0,
+            'stage_seconds': stage_seconds
+        },
+        'limiters': limiters,
+        'shared_clients': get_shared_client_stats()
+    }
+
+
+def format_batch_report(summary: Dict[str, Any]) -> str:
+    """
+    Format a batch report for the log.
+
+    Args:
+        summary (Dict[str, Any]): Report from summarize_batch
+
+    Returns:
+        str: One line per episode and per limiter, plus the aggregate throughput
+    """
+    aggregate = summary['aggregate']
+    lines = ['Batch report:']
+    for episode in summary['episodes']:
+        slowest = max(episode['stages'].items(), key=lambda item: item[1], default=('-', 0.0))
+        lines.append(f"  {episode['status']:<9} {episode['wall_s']:8.1f}s  {episode['script_lines']:4d} lines  "
+                     f"slowest stage {slowest[0]} ({slowest[1]:.1f}s)  {episode['topic']}")
+        if episode['error']:
+            lines.append(f"            {episode['error']}")
+    lines.append(f"  {aggregate['succeeded']}/{aggregate['episodes']} episodes in {aggregate['wall_s']:.1f}s "
+                 f"({aggregate['episodes_per_hour']} episodes/hour, concurrency {aggregate['concurrency']})")
+    for name, metrics in sorted(summary['limiters'].items()):
+        lines.append(f"  {name:<24} {metrics['requests']:6d} requests  "
+                     f"{metrics['quota_utilization'] * 100:5.1f}% of quota  "
+                     f"{metrics['throttled']} throttled  mean wait {metrics['mean_wait_s']}s")
+    return '\n'.join(lines)
+
+
+def generate_batch(
+    manifest: str,
+    config: str = DEFAULT_CONFIG_PATH,
+    max_parallel_episodes: Optional[int] = None,
+    use_checkpoints: bool = True,
+    report_output: Optional[str] = None,
+    debug: bool = False,
+    log_file: Optional[str] = None,
+    fast_llm_base_url: Optional[str] = None,
+    long_context_llm_base_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Generate every episode of a manifest.
+
+    A failed episode does not stop the batch; it is reported with its error.
+
+    Args:
+        manifest: Path to the batch manifest
+        config: Path to config file
+        max_parallel_episodes: Episodes generated at once. Defaults to the manifest's
+            max_parallel_episodes, or 2.
+        use_checkpoints: Whether to use checkpointing
+        report_output: Path to save the JSON batch report
+        debug: Whether to enable debug logging
+        log_file: Log output file
+        fast_llm_base_url: Base URL for fast LLM (OpenAI-compatible APIs)
+        long_context_llm_base_url: Base URL for long context LLM (OpenAI-compatible APIs)
+
+    Returns:
+        Dict[str, Any]: Batch report (see summarize_batch)
+    """
+    log_level = logging.DEBUG if debug else logging.INFO
+    setup_logging(log_level, output_file=log_file)
+
+    # One configuration for the whole batch, so all episodes share limiters and clients
+    config = PodcastConfig.load(yaml_path=config)
+    loaded = load_manifest(manifest, config)
+    episodes = loaded['episodes']
+    workers = max_parallel_episodes or loaded['max_parallel_episodes'] or 2
+    logger.info(f'Generating {len(episodes)} episodes, {workers} at a time')
+
+    batch_start = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [
+            executor.submit(run_episode, config, episode, use_checkpoints, batch_start,
+                            fast_llm_base_url, long_context_llm_base_url)
+            for episode in episodes
+        ]
+        reports = [future.result() for future in futures]
+
+    summary = summarize_batch(reports, time.monotonic() - batch_start)
+    logger.info(format_batch_report(summary))
+
+    if report_output:
+        Path(report_output).parent.mkdir(parents=True, exist_ok=True)
+        with open(report_output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    return summary
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Generate a batch of podcasts from a manifest'
+    )
+    parser.add_argument(
+        'manifest',
+        help='YAML or JSON manifest listing the episodes'
+    )
+    parser.add_argument(
+        '--max-parallel-episodes',
+        type=int,
+        default=None,
+        help='Episodes generated at once (default: from the manifest, or 2)'
+    )
+    parser.add_argument(
+        '--no-checkpoint',
+        action='store_false',
+        dest='checkpoint',
+        default=True,
+        help='Disable checkpointing'
+    )
+    parser.add_argument(
+        '--report-output',
+        type=str,
+        default=None,
+        help='Output filename for the JSON batch report'
+    )
+    parser.add_argument(
+        '--config',
+        type=str,
+        default=DEFAULT_CONFIG_PATH,
+        help='Path to YAML config file'
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Enable debug logging'
+    )
+    parser.add_argument(
+        '--log-file',
+        type=str,
+        default=None,
+        help='Log output file'
+    )
+    parser.add_argument(
+        '--fast-llm-base-url',
+        type=str,
+        default=None,
+        help='Base URL for fast LLM (OpenAI-compatible APIs)'
+    )
+    parser.add_argument(
+        '--long-context-llm-base-url',
+        type=str,
+        default=None,
+        help='Base URL for long context LLM (OpenAI-compatible APIs)'
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for the batch CLI."""
+    args = parse_arguments()
+
+    summary = generate_batch(
+        manifest=args.manifest,
+        config=args.config,
+        max_parallel_episodes=args.max_parallel_episodes,
+        use_checkpoints=args.checkpoint,
+        report_output=args.report_output,
+        debug=args.debug,
+        log_file=args.log_file,
+        fast_llm_base_url=args.fast_llm_base_url,
+        long_context_llm_base_url=args.long_context_llm_base_url
+    )
+    if summary['aggregate']['failed']:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
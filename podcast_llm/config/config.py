@@ -58,11 +58,27 @@ class PodcastConfig:
         long_context_llm_provider (str): Provider to use for long context operations
         tts_provider (str): Text-to-speech service provider
         tts_settings (Dict): Configuration settings for TTS
+        tts_cache (Dict): Settings for the synthesized audio cache ('enabled', 'max_size_mb')
+        llm_cache (Dict): Settings for the LLM response cache ('enabled', 'max_size_mb',
+            'ttl_hours', 'cache_sampled')
+        llm_temperatures (Dict): Sampling temperature per generation stage ('outline',
+            'wikipedia_suggestions', 'research_queries', 'section_summary', 'interviewer',
+            'interviewee', 'rewrite')
+        research_cache (Dict): Settings for the Wikipedia, search and web page caches
+            ('enabled', 'max_size_mb' per service, 'ttl_hours')
+        vector_store (Dict): Bounds of the persisted draft-script embeddings ('max_size_mb',
+            'ttl_hours' since a chunk was last used)
+        telemetry (Dict): Settings for per-episode performance telemetry ('enabled', 'output_dir')
+        writer_settings (Dict): Concurrency and background context settings for script writing stages
         output_format (str): Format for output audio files
+        audio_settings (Dict): Settings for assembling the episode audio (sample rate,
+            silence/crossfade between lines, loudness normalization, format requested from the
+            TTS provider, in-memory segment buffer)
         temp_audio_dir (str): Directory for temporary audio files
         output_dir (str): Directory for final output files
         rate_limits (Dict): Rate limiting settings for API calls
         checkpoint_dir (str): Directory for saving checkpoints
+        cache_dir (str): Directory for cached research results and other reusable artifacts
         podcast_name (str): Name of the podcast
         intro (str): Template for podcast intro
         outro (str): Template for podcast outro
@@ -85,18 +101,41 @@ class PodcastConfig:
     # TTS Config 
     tts_provider: str
     tts_settings: Dict
+    tts_cache: Dict
+
+    # LLM response cache config
+    llm_cache: Dict
+
+    # Sampling temperature per generation stage
+    llm_temperatures: Dict
+
+    # Research result cache config
+    research_cache: Dict
+
+    # Persisted embeddings config
+    vector_store: Dict
+
+    # Performance telemetry config
+    telemetry: Dict
+
+    # Script writing config
+    writer_settings: Dict
     
     # Output Config
     output_format: str
+    audio_settings: Dict
     temp_audio_dir: str
     output_dir: str
 
-    # Rate limits for TTS:
+    # Rate limits for TTS and research services:
     rate_limits: Dict
 
     # Checkpointer confif
     checkpoint_dir: str
 
+    # Cache for research results and other reusable artifacts
+    cache_dir: str
+
     podcast_name: str
     intro: str
     outro: str
@@ -178,27 +217,110 @@ class PodcastConfig:
                         'Interviewer': 'tts-1',
                         'Interviewee': 'tts-1'
                     }
+                },
+                'sine': {
+                    'chars_per_second': 15,
+                    'latency_ms': 0
                 }
             },
+            'tts_cache': {
+                'enabled': True,
+                'max_size_mb': 1024
+            },
+            'llm_cache': {
+                'enabled': True,
+                'max_size_mb': 256,
+                'ttl_hours': 168,
+                'cache_sampled': False
+            },
+            'llm_temperatures': {
+                'outline': 1.0,
+                'wikipedia_suggestions': 1.0,
+                'research_queries': 1.0,
+                'section_summary': 1.0,
+                'interviewer': 1.0,
+                'interviewee': 1.0,
+                'rewrite': 1.0
+            },
+            'research_cache': {
+                'enabled': True,
+                'max_size_mb': 256,
+                'ttl_hours': 72
+            },
+            'vector_store': {
+                'max_size_mb': 512,
+                'ttl_hours': 720
+            },
+            'telemetry': {
+                'enabled': True,
+                'output_dir': './output/telemetry'
+            },
+            'writer_settings': {
+                'parallel_subsections': 1,
+                'rewrite_parallelism': 1,
+                'rewrite_overlap': 0,
+                'background_mode': 'budget',
+                'background_max_chars': 24000,
+                'answer_context': 'content_search',
+                'answer_context_tokens': None,
+                'retrieval_search_type': 'similarity',
+                'retrieval_k': 5,
+                'retrieval_fetch_k': 20,
+                'retrieval_lambda': 0.5
+            },
             'output_format': 'mp3',
+            'audio_settings': {
+                'silence_ms': 0,
+                'crossfade_ms': 0,
+                'normalize': False,
+                'segment_format': 'auto',
+                'buffer_mb': 256,
+                'publish_segments': False
+            },
             'temp_audio_dir': './.temp_audio',
             'output_dir': './output',
             'checkpoint_dir': './.checkpoints',
+            'cache_dir': './.cache',
             'rate_limits': {
                 'elevenlabs': {
                     'requests_per_minute': 20,
+                    'max_concurrency': 4,
                     'max_retries': 10,
                     'base_delay': 2.0
                 },
                 'google': {
                     'requests_per_minute': 20,
+                    'max_concurrency': 4,
                     'max_retries': 10,
                     'base_delay': 2.0
                 },
                 'siliconcloud': {
                     'requests_per_minute': 20,
+                    'max_concurrency': 4,
+                    'max_retries': 10,
+                    'base_delay': 2.0
+                },
+                'dashscope': {
+                    'requests_per_minute': 20,
+                    'max_concurrency': 4,
                     'max_retries': 10,
                     'base_delay': 2.0
+                },
+                'wikipedia': {
+                    'requests_per_minute': 120,
+                    'max_concurrency': 4
+                },
+                'tavily': {
+                    'requests_per_minute': 60,
+                    'max_concurrency': 4
+                },
+                'web': {
+                    'requests_per_minute': 240,
+                    'max_concurrency': 8
+                },
+                'llm': {
+                    'requests_per_minute': 12,
+                    'burst': 10
                 }
             },
             'podcast_name': 'WikiDocu助手',
@@ -28,17 +28,24 @@ import logging
 from typing import List
 from collections import OrderedDict
 
-from .pdf import PDFSourceDocument
-from .youtube import YouTubeSourceDocument
-from .web import WebSourceDocument
-from .audio import AudioSourceDocument
-from .plaintext import MarkdownSourceDocument, TextSourceDocument
-from .word import WordSourceDocument
-
+from podcast_llm.utils.lazy_imports import ProviderRegistry
 
 logger = logging.getLogger(__name__)
 
 
+# Extractor class per source type; each extractor's parsing library is imported only
+# when a source of that type is extracted
+SOURCE_DOCUMENTS = ProviderRegistry('source type', {
+    'youtube': 'podcast_llm.extractors.youtube:YouTubeSourceDocument',
+    'web': 'podcast_llm.extractors.web:WebSourceDocument',
+    'pdf': 'podcast_llm.extractors.pdf:PDFSourceDocument',
+    'word': 'podcast_llm.extractors.word:WordSourceDocument',
+    'audio': 'podcast_llm.extractors.audio:AudioSourceDocument',
+    'markdown': 'podcast_llm.extractors.plaintext:MarkdownSourceDocument',
+    'text': 'podcast_llm.extractors.plaintext:TextSourceDocument'
+})
+
+
 def extract_content_from_sources(sources: List) -> List:
     """
     Extract content from a list of source URLs/files.
@@ -62,22 +69,22 @@ def extract_content_from_sources(sources: List) -> List:
     extracted_content = []
     
     source_type_mapping = OrderedDict([
-        ('youtube', (lambda s: 'youtube.com' in s or 'youtu.be' in s, YouTubeSourceDocument)),
-        ('web', (lambda s: s.startswith(('http://', 'https://', 'ftp://')), WebSourceDocument)),
-        ('pdf', (lambda s: s.lower().endswith('.pdf'), PDFSourceDocument)),
-        ('word', (lambda s: s.lower().endswith('.docx'), WordSourceDocument)),
-        ('audio', (lambda s: s.lower().endswith(('.mp3', '.wav', '.m4a', '.ogg')), AudioSourceDocument)),
-        ('markdown', (lambda s: s.lower().endswith(('.md', '.markdown')), MarkdownSourceDocument)),
-        ('text', (lambda s: s.lower().endswith('.txt'), TextSourceDocument))
+        ('youtube', lambda s: 'youtube.com' in s or 'youtu.be' in s),
+        ('web', lambda s: s.startswith(('http://', 'https://', 'ftp://'))),
+        ('pdf', lambda s: s.lower().endswith('.pdf')),
+        ('word', lambda s: s.lower().endswith('.docx')),
+        ('audio', lambda s: s.lower().endswith(('.mp3', '.wav', '.m4a', '.ogg'))),
+        ('markdown', lambda s: s.lower().endswith(('.md', '.markdown'))),
+        ('text', lambda s: s.lower().endswith('.txt'))
     ])
 
     for source in sources:
         try:
             logger.info(f"Extracting from source: {source}")
             
-            for check_source, source_class in source_type_mapping.values():
+            for source_type, check_source in source_type_mapping.items():
                 if check_source(source):
-                    source_doc = source_class(source=source)
+                    source_doc = SOURCE_DOCUMENTS.get(source_type)(source=source)
                     source_doc.extract()
                     extracted_content.append(source_doc.as_langchain_document())
                     break
@@ -25,8 +25,13 @@ articles fail to download or parse properly.
 
 from podcast_llm.extractors.base import BaseSourceDocument
 from typing import Optional
-from newspaper import Article, ArticleException
-from src.func_utils import webfetch
+from podcast_llm.utils.lazy_imports import lazy_import
+
+
+# Imported when the first page is fetched
+newspaper = lazy_import('newspaper')
+func_utils = lazy_import('src.func_utils')
+
 
 class WebSourceDocument(BaseSourceDocument):
     """Extracts text content from web articles using the newspaper3k library.
@@ -57,10 +62,10 @@ class WebSourceDocument(BaseSourceDocument):
         # article = Article(self.src)
         # article.download()
         # article.parse()
-        article = webfetch(self.src)
+        article = func_utils.webfetch(self.src)
         #print(f"----{article}")
         if not article:
-            raise ArticleException(f"No website text found for URL: {self.src}")
+            raise newspaper.ArticleException(f"No website text found for URL: {self.src}")
         
         #self.title = self.src
         self.content = article
@@ -21,7 +21,7 @@ Example:
 import os
 import argparse
 from pathlib import Path
-from typing import Optional, List, Literal
+from typing import Any, Dict, Optional, List, Literal, Tuple
 from podcast_llm.research import (
     research_background_info,
     research_discussion_topics
@@ -37,119 +37,208 @@ from podcast_llm.utils.checkpointer import (
 )
 from podcast_llm.text_to_speech import generate_audio
 from podcast_llm.config import PodcastConfig, setup_logging
+from podcast_llm.utils.pipeline import Pipeline, Stream
+from podcast_llm.utils.telemetry import record_episode
 from podcast_llm.utils.text import generate_markdown_script
 from podcast_llm.extractors import extract_content_from_sources
 import logging
 
 
+logger = logging.getLogger(__name__)
+
 PACKAGE_ROOT = Path(__file__).parent
 DEFAULT_CONFIG_PATH = os.path.join(PACKAGE_ROOT, 'config', 'config.yaml')
 
-def generate(
+def build_episode_pipeline(
+    config: PodcastConfig,
     topic: str,
     mode: Literal['research', 'context'],
+    checkpointer: Checkpointer,
     sources: Optional[List[str]] = None,
     qa_rounds: int = 2,
-    use_checkpoints: bool = True,
     audio_output: Optional[str] = None,
-    audio_play: bool = False,
     text_output: Optional[str] = None,
-    config: str = DEFAULT_CONFIG_PATH,
-    debug: bool = False,
-    log_file: Optional[str] = None,
     fast_llm_base_url: Optional[str] = None,
     long_context_llm_base_url: Optional[str] = None,
     language: str = 'en'
-) -> None:
+) -> Tuple[Pipeline, Dict[str, Any]]:
     """
-    Generate a podcast episode.
+    Declare the generation stages of one episode.
+
+    Stages run as soon as their inputs are ready; the final script is streamed to audio
+    synthesis batch by batch, so TTS starts while the rewrite is still running.
 
     Args:
+        config: Loaded configuration
         topic: Topic of the podcast
         mode: Generation mode - either 'research' or 'context'
+        checkpointer: Checkpointer for stage results
         sources: List of URLs and file paths to use as source material (for context mode)
         qa_rounds: Number of Q&A rounds
-        use_checkpoints: Whether to use checkpointing
         audio_output: Path to save audio output
-        audio_play: Whether to play audio output
         text_output: Path to save text output
-        config: Path to config file
-        debug: Whether to enable debug logging
-        log_file: Log output file
         fast_llm_base_url: Base URL for fast LLM (OpenAI-compatible APIs)
         long_context_llm_base_url: Base URL for long context LLM (OpenAI-compatible APIs)
         language: Language for prompts ('en' for English, 'zh' for Chinese)
+
+    Returns:
+        Tuple[Pipeline, Dict[str, Any]]: The pipeline and the initial values to run it with
     """
-    log_level = logging.DEBUG if debug else logging.INFO
-    setup_logging(log_level, output_file=log_file)
-    
-    config = PodcastConfig.load(yaml_path=config)
+    if mode == 'context' and not sources:
+        raise ValueError("Sources must be provided when using context mode")
 
-    checkpointer = Checkpointer(
-        checkpoint_key=f"{to_snake_case(topic)}_qa_{qa_rounds}_",
-        enabled=use_checkpoints
-    )
+    pipeline = Pipeline()
 
     # Get background info based on mode
     if mode == 'research':
-        background_info = checkpointer.checkpoint(
+        pipeline.add_stage('background_info', lambda: checkpointer.checkpoint(
             research_background_info,
             config, topic, fast_llm_base_url, language,
             stage_name='background_info'
-        )
+        ))
     else:  # context mode
-        if not sources:
-            raise ValueError("Sources must be provided when using context mode")
-        background_info = checkpointer.checkpoint(
+        pipeline.add_stage('background_info', lambda: checkpointer.checkpoint(
             extract_content_from_sources,
             sources,
             stage_name='background_info'
-        )
+        ))
 
-    outline = checkpointer.checkpoint(
+    pipeline.add_stage('outline', lambda background_info: checkpointer.checkpoint(
         outline_episode,
         config, topic, background_info, long_context_llm_base_url, language,
         stage_name='outline'
-    )
+    ), inputs=['background_info'])
 
     # Get detailed info based on mode
+    initial = {}
     if mode == 'research':
-        deep_info = checkpointer.checkpoint(
+        pipeline.add_stage('deep_info', lambda outline: checkpointer.checkpoint(
             research_discussion_topics,
             config, topic, outline, fast_llm_base_url, language,
             stage_name='deep_info'
-        )
+        ), inputs=['outline'])
     else:
         # deep_info = background_info  # Use the same extracted content
-        deep_info = ''
-        
-    draft_script = checkpointer.checkpoint(
+        initial['deep_info'] = ''
+
+    pipeline.add_stage('draft_script', lambda outline, background_info, deep_info: checkpointer.checkpoint(
         write_draft_script,
         config, topic, outline, background_info, deep_info, qa_rounds, long_context_llm_base_url, language,
+        checkpointer=checkpointer,
         stage_name='draft_script'
-    )
-    #draft_script=''
-    final_script = checkpointer.checkpoint(
-        write_final_script,
-        config, topic, draft_script, 4, long_context_llm_base_url, language,  # 4 is the default batch_size
-        stage_name='final_script'
-    )
+    ), inputs=['outline', 'background_info', 'deep_info'])
+
+    def final_script_stage(draft_script: list, final_script_batches: Stream) -> list:
+        emitted = []
+
+        def on_batch(lines: list) -> None:
+            emitted.append(lines)
+            final_script_batches.put(lines)
+
+        final_script = checkpointer.checkpoint(
+            write_final_script,
+            config, topic, draft_script, 4, long_context_llm_base_url, language,  # 4 is the default batch_size
+            checkpointer=checkpointer,
+            on_batch=on_batch,
+            stage_name='final_script'
+        )
+        if not emitted:
+            # Loaded from a checkpoint
+            final_script_batches.put(final_script)
+        return final_script
+
+    pipeline.add_stage('final_script', final_script_stage,
+                       inputs=['draft_script'], streams=['final_script_batches'])
 
     if text_output:
-        with open(text_output, 'w+', encoding='utf-8') as f:
-            f.write(generate_markdown_script(topic, outline, final_script))
+        def text_output_stage(outline, final_script) -> None:
+            with open(text_output, 'w+', encoding='utf-8') as f:
+                f.write(generate_markdown_script(topic, outline, final_script))
+
+        pipeline.add_stage('text_output', text_output_stage, inputs=['outline', 'final_script'])
 
     if audio_output:
-        generate_audio(config, final_script, audio_output)
-
-        if audio_play:
-            try:
-                print(f"Playing audio {audio_output}...")
-                from pydub import AudioSegment
-                from pydub.playback import play
-                play(AudioSegment.from_mp3(audio_output))
-            except Exception as e:
-                print(f"播放音频时发生错误: {e}")
+        pipeline.add_stage('audio', lambda final_script_batches: generate_audio(
+            config, final_script_batches, audio_output
+        ), inputs=['final_script_batches'])
+
+    return pipeline, initial
+
+
+def generate(
+    topic: str,
+    mode: Literal['research', 'context'],
+    sources: Optional[List[str]] = None,
+    qa_rounds: int = 2,
+    use_checkpoints: bool = True,
+    audio_output: Optional[str] = None,
+    audio_play: bool = False,
+    text_output: Optional[str] = None,
+    config: str = DEFAULT_CONFIG_PATH,
+    debug: bool = False,
+    log_file: Optional[str] = None,
+    fast_llm_base_url: Optional[str] = None,
+    long_context_llm_base_url: Optional[str] = None,
+    language: str = 'en'
+) -> None:
+    """
+    Generate a podcast episode.
+
+    Args:
+        topic: Topic of the podcast
+        mode: Generation mode - either 'research' or 'context'
+        sources: List of URLs and file paths to use as source material (for context mode)
+        qa_rounds: Number of Q&A rounds
+        use_checkpoints: Whether to use checkpointing
+        audio_output: Path to save audio output
+        audio_play: Whether to play audio output
+        text_output: Path to save text output
+        config: Path to config file
+        debug: Whether to enable debug logging
+        log_file: Log output file
+        fast_llm_base_url: Base URL for fast LLM (OpenAI-compatible APIs)
+        long_context_llm_base_url: Base URL for long context LLM (OpenAI-compatible APIs)
+        language: Language for prompts ('en' for English, 'zh' for Chinese)
+    """
+    log_level = logging.DEBUG if debug else logging.INFO
+    setup_logging(log_level, output_file=log_file)
+    
+    config = PodcastConfig.load(yaml_path=config)
+
+    # Checkpoint files are keyed by a hash of each stage's inputs; the topic prefix only
+    # makes them easier to find
+    checkpointer = Checkpointer(
+        checkpoint_key=to_snake_case(topic)[:40],
+        checkpoint_dir=config.checkpoint_dir,
+        enabled=use_checkpoints
+    )
+
+    pipeline, initial = build_episode_pipeline(
+        config, topic, mode, checkpointer,
+        sources=sources,
+        qa_rounds=qa_rounds,
+        audio_output=audio_output,
+        text_output=text_output,
+        fast_llm_base_url=fast_llm_base_url,
+        long_context_llm_base_url=long_context_llm_base_url,
+        language=language
+    )
+
+    with record_episode(config, to_snake_case(topic)[:40], topic=topic, mode=mode):
+        try:
+            pipeline.run(initial)
+        finally:
+            logger.info(pipeline.format_timings())
+
+    if audio_output and audio_play:
+        try:
+            print(f"Playing audio {audio_output}...")
+            from pydub import AudioSegment
+            from pydub.playback import play
+            play(AudioSegment.from_mp3(audio_output))
+        except Exception as e:
+            print(f"播放音频时发生错误: {e}")
+
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
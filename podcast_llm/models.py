@@ -55,8 +55,11 @@ class PodcastSubsection(BaseModel):
 
     Attributes:
         title (str): The title/heading text for this subsection
+        description (str): Short summary of the key points the subsection covers. Optional,
+            not part of as_str.
     """
     title: str = Field(..., description="A subsection in a podcast outline")
+    description: str = Field('', description="One or two sentences on the key points this subsection covers")
 
     @property
     def as_str(self) -> str:
@@ -25,9 +25,9 @@ Example:
 
 import logging
 from typing import Optional
-from langchain import hub
 from podcast_llm.config import PodcastConfig
-from podcast_llm.utils.llm import get_long_context_llm
+from podcast_llm.utils.llm import get_long_context_llm, get_stage_temperature
+from podcast_llm.utils.lazy_imports import lazy_import
 from podcast_llm.utils.local_prompts import get_local_prompt
 from podcast_llm.models import (
     PodcastOutline
@@ -37,6 +37,10 @@ from podcast_llm.models import (
 logger = logging.getLogger(__name__)
 
 
+# Imported on first use: the prompt hub is only a fallback for missing local prompts
+hub = lazy_import('langchain.hub')
+
+
 def format_wikipedia_document(doc):
     """
     Format a Wikipedia document for use in prompt context.
@@ -86,7 +90,7 @@ def outline_episode(config: PodcastConfig, topic: str, background_info: list, ba
     # Modify the prompt to explicitly request JSON output only
     outline_prompt.messages[0].prompt.template += "\n\nIMPORTANT: Respond ONLY with a valid JSON object that matches the PodcastOutline schema. Do not include any other text, explanations, or markdown formatting."
 
-    outline_llm = get_long_context_llm(config, base_url=base_url)
+    outline_llm = get_long_context_llm(config, base_url=base_url, temperature=get_stage_temperature(config, 'outline'))
     outline_chain = outline_prompt | outline_llm.with_structured_output(
         PodcastOutline
     )
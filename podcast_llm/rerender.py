@@ -0,0 +1,127 @@
+"""
+Incremental re-rendering of podcast episodes after script edits.
+
+After ``generate`` has written an episode's audio and markdown script, the script can be
+edited by hand (fixing a typo, rewording a line) and re-rendered with this module. Only
+the edited lines are synthesized again; the audio of unchanged lines is kept (see
+text_to_speech.rerender_speech), so small fixes take seconds instead of a full TTS run.
+
+Example:
+    $ python -m podcast_llm.rerender output/episode.md output/episode.mp3
+
+    >>> rerender('output/episode.md', 'output/episode.mp3')
+"""
+
+import argparse
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from podcast_llm.config import PodcastConfig, setup_logging
+from podcast_llm.text_to_speech import clean_text_for_tts, rerender_speech
+from podcast_llm.utils.text import parse_markdown_script
+
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_ROOT = Path(__file__).parent
+DEFAULT_CONFIG_PATH = os.path.join(PACKAGE_ROOT, 'config', 'config.yaml')
+
+
+def load_script(script_file: str) -> list:
+    """
+    Load an edited script.
+
+    Args:
+        script_file (str): Markdown script written by ``--text-output`` (any extension),
+            or a JSON list of lines with 'speaker' and 'text'
+
+    Returns:
+        list: Script lines with 'speaker' and 'text'
+
+    Raises:
+        ValueError: If the file contains no script lines
+    """
+    with open(script_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    script = json.loads(content) if script_file.endswith('.json') else parse_markdown_script(content)
+    if not script:
+        raise ValueError(f"No script lines found in {script_file}")
+    return script
+
+
+def rerender(
+    script_file: str,
+    audio_output: str,
+    config: str = DEFAULT_CONFIG_PATH,
+    debug: bool = False,
+    log_file: Optional[str] = None
+) -> str:
+    """
+    Re-render an episode's audio from its edited script.
+
+    Args:
+        script_file: Edited script (see load_script)
+        audio_output: Existing audio file of the episode, which is replaced
+        config: Path to config file; must match the settings the episode was generated with
+        debug: Whether to enable debug logging
+        log_file: Log output file
+
+    Returns:
+        str: Path to the audio file
+    """
+    log_level = logging.DEBUG if debug else logging.INFO
+    setup_logging(log_level, output_file=log_file)
+
+    config = PodcastConfig.load(yaml_path=config)
+    script = clean_text_for_tts(load_script(script_file))
+
+    Path(config.temp_audio_dir).mkdir(parents=True, exist_ok=True)
+    counts = rerender_speech(config, script, audio_output, config.temp_audio_dir, config.output_format)
+    logger.info(f"Re-rendered {audio_output}: {counts['synthesized_requests']} TTS requests for "
+                f"{counts['synthesized_blocks']} edited blocks, {counts['reused_blocks']} blocks reused")
+    return audio_output
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Re-render podcast audio after editing its script, synthesizing only changed lines'
+    )
+    parser.add_argument(
+        'script',
+        help='Edited script (markdown from --text-output, or a JSON list of lines)'
+    )
+    parser.add_argument(
+        'audio_output',
+        help='Audio file of the episode to update'
+    )
+    parser.add_argument(
+        '--config',
+        type=str,
+        default=DEFAULT_CONFIG_PATH,
+        help='Path to YAML config file'
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Enable debug logging'
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for the CLI."""
+    args = parse_arguments()
+    rerender(
+        script_file=args.script,
+        audio_output=args.audio_output,
+        config=args.config,
+        debug=args.debug
+    )
+
+
+if __name__ == '__main__':
+    main()
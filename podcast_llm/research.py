@@ -18,6 +18,8 @@ The research process includes:
 - Downloading Wikipedia article content
 - Performing targeted web searches with Tavily
 - Extracting key information from web articles
+- Running searches, downloads and parsing concurrently within per-service rate limits
+- Caching search results and downloaded pages on disk by query/URL
 - Organizing research into structured formats using Pydantic models
 
 The module uses various APIs and services to gather comprehensive background
@@ -25,15 +27,21 @@ information while maintaining rate limits and handling errors gracefully.
 """
 
 
+import asyncio
 import logging
+from pathlib import Path
 from typing import List, Optional
-from langchain import hub
+from urllib.parse import urlsplit, urlunsplit
 from langchain_community.retrievers import WikipediaRetriever
 from langchain_core.documents import Document
 from podcast_llm.outline import PodcastOutline
-from tavily import TavilyClient
 from podcast_llm.config import PodcastConfig
-from podcast_llm.utils.llm import get_fast_llm
+from podcast_llm.utils.disk_cache import DiskCache
+from podcast_llm.utils.concurrency import run_sync
+from podcast_llm.utils.llm import get_fast_llm, get_stage_temperature
+from podcast_llm.utils.rate_limits import TokenBucketLimiter, get_limiter
+from podcast_llm.utils.lazy_imports import lazy_import
+from podcast_llm.utils.telemetry import span
 from podcast_llm.utils.local_prompts import get_local_prompt
 from podcast_llm.models import (
     SearchQueries,
@@ -45,6 +53,29 @@ from podcast_llm.extractors.web import WebSourceDocument
 logger = logging.getLogger(__name__)
 
 
+# Imported on first use: the prompt hub is only a fallback for missing local prompts
+hub = lazy_import('langchain.hub')
+tavily = lazy_import('tavily')
+
+
+# Per-service limits used when config.rate_limits has no entry for the service
+DEFAULT_SERVICE_LIMITS = {
+    'wikipedia': {'requests_per_minute': 120, 'max_concurrency': 4},
+    'tavily': {'requests_per_minute': 60, 'max_concurrency': 4},
+    'web': {'requests_per_minute': 240, 'max_concurrency': 8}
+}
+
+TAVILY_EXCLUDE_DOMAINS = [
+    "wikipedia.org",
+    "youtube.com",
+    "books.google.com",
+    "academia.edu",
+    "washingtonpost.com"
+]
+
+TAVILY_MAX_RESULTS = 5
+
+
 def suggest_wikipedia_articles(config: PodcastConfig, topic: str, base_url: Optional[str] = None, language: str = 'en') -> WikipediaPages:
     """
     Suggest relevant Wikipedia articles for a given topic.
@@ -72,7 +103,7 @@ def suggest_wikipedia_articles(config: PodcastConfig, topic: str, base_url: Opti
         wikipedia_prompt = hub.pull(prompthub_path)
         logger.info(f"Got prompt from hub: {prompthub_path}")
 
-    fast_llm = get_fast_llm(config, base_url=base_url)
+    fast_llm = get_fast_llm(config, base_url=base_url, temperature=get_stage_temperature(config, 'wikipedia_suggestions'))
     wikipedia_chain = wikipedia_prompt | fast_llm.with_structured_output(
         WikipediaPages
     )
@@ -81,36 +112,144 @@ def suggest_wikipedia_articles(config: PodcastConfig, topic: str, base_url: Opti
     return result
 
 
-def download_wikipedia_articles(suggestions: WikipediaPages) -> list:
+def _document_to_dict(doc: Document) -> dict:
+    return {'id': doc.id, 'page_content': doc.page_content, 'metadata': doc.metadata}
+
+
+def _document_from_dict(data: dict) -> Document:
+    return Document(id=data.get('id'), page_content=data['page_content'], metadata=data['metadata'])
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings of the same page dedup together."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+
+def get_service_limiter(config: Optional[PodcastConfig], service: str) -> TokenBucketLimiter:
     """
-    Download Wikipedia articles based on suggested page titles.
+    Get the shared rate limiter for a research service.
 
-    Takes a structured list of Wikipedia page suggestions and downloads the full content
-    of each article using the WikipediaRetriever. Handles errors gracefully if any
-    articles fail to download.
+    Limits are read from ``config.rate_limits[service]`` (``requests_per_minute``,
+    ``max_concurrency`` and optionally ``burst``), falling back to DEFAULT_SERVICE_LIMITS
+    for missing values. The limiter is registered under ``research/<service>``, so
+    concurrent research calls share one budget.
 
     Args:
-        suggestions (WikipediaPages): Structured list of suggested Wikipedia page titles
+        config (PodcastConfig, optional): Configuration object containing rate limits
+        service (str): Service name ('wikipedia', 'tavily' or 'web')
 
     Returns:
-        list: List of retrieved Wikipedia document objects containing page content and metadata
+        TokenBucketLimiter: Limiter shared by all calls to the service
+    """
+    limits = dict(DEFAULT_SERVICE_LIMITS[service])
+    if config is not None:
+        limits.update(config.rate_limits.get(service, {}))
+    return get_limiter(
+        f'research/{service}',
+        requests_per_minute=limits['requests_per_minute'],
+        burst=limits.get('burst', 1),
+        max_concurrency=limits['max_concurrency']
+    )
+
+
+def get_research_cache(config: Optional[PodcastConfig], namespace: str) -> DiskCache:
+    """
+    Create the on-disk cache for a research service.
+
+    Caching is only enabled when a configuration is provided and ``config.research_cache``
+    enables it, in which case entries are stored under ``config.cache_dir/research/<namespace>``,
+    expire after ``ttl_hours`` and are limited to ``max_size_mb`` per namespace.
+
+    Args:
+        config (PodcastConfig, optional): Configuration object containing the cache directory
+            and research_cache settings
+        namespace (str): Cache namespace ('wikipedia', 'tavily' or 'web')
+
+    Returns:
+        DiskCache: Cache for the given namespace
+    """
+    if config is None or not config.research_cache.get('enabled', True):
+        return DiskCache('', namespace, enabled=False)
+    ttl_hours = config.research_cache.get('ttl_hours')
+    return DiskCache(
+        Path(config.cache_dir) / 'research',
+        namespace,
+        ttl_s=ttl_hours * 3600 if ttl_hours else None,
+        max_bytes=int(config.research_cache.get('max_size_mb', 256) * 1024 * 1024)
+    )
+
+
+async def _fetch_wikipedia_article(retriever: WikipediaRetriever,
+                                   page_name: str,
+                                   limiter: TokenBucketLimiter,
+                                   cache: DiskCache) -> Document:
+    with span('web.wikipedia', kind='web', page=page_name) as fetch_span:
+        cached = cache.get(page_name)
+        if cached is not None:
+            logger.debug(f'Loaded article from cache: {page_name}')
+            fetch_span.set(cached=True)
+            return _document_from_dict(cached)
+
+        logger.info(f'Retrieving article: {page_name}')
+        async with limiter:
+            documents = await asyncio.to_thread(retriever.invoke, page_name)
+        document = documents[0]
+        fetch_span.set(cached=False, bytes=len(document.page_content.encode('utf-8')))
+        cache.set(page_name, _document_to_dict(document))
+        logger.debug(f'Successfully retrieved article: {page_name}')
+        return document
+
+
+async def download_wikipedia_articles_async(suggestions: WikipediaPages, config: Optional[PodcastConfig] = None) -> list:
+    """
+    Asynchronous implementation of download_wikipedia_articles.
+
+    All suggested pages are retrieved concurrently, subject to the 'wikipedia'
+    service rate limit. Duplicate page names are only retrieved once.
     """
     logger.info('Starting Wikipedia article download')
     retriever = WikipediaRetriever()
+    limiter = get_service_limiter(config, 'wikipedia')
+    cache = get_research_cache(config, 'wikipedia')
+
+    page_names = list(dict.fromkeys(page.name for page in suggestions.pages))
+    results = await asyncio.gather(
+        *[_fetch_wikipedia_article(retriever, name, limiter, cache) for name in page_names],
+        return_exceptions=True
+    )
 
     wikipedia_documents = []
-    for page in suggestions.pages:
-        logger.info(f'Retrieving article: {page.name}')
-        try:
-            wikipedia_documents.append(retriever.invoke(page.name)[0])
-            logger.debug(f'Successfully retrieved article: {page.name}')
-        except Exception as e:
-            logger.error(f'Failed to retrieve article {page.name}: {str(e)}')
+    for page_name, result in zip(page_names, results):
+        if isinstance(result, Exception):
+            logger.error(f'Failed to retrieve article {page_name}: {str(result)}')
+        else:
+            wikipedia_documents.append(result)
 
     logger.info(f'Downloaded {len(wikipedia_documents)} Wikipedia articles')
     return wikipedia_documents
 
 
+def download_wikipedia_articles(suggestions: WikipediaPages, config: Optional[PodcastConfig] = None) -> list:
+    """
+    Download Wikipedia articles based on suggested page titles.
+
+    Takes a structured list of Wikipedia page suggestions and downloads the full content
+    of each article using the WikipediaRetriever. Articles are downloaded concurrently
+    and, when a config is given, cached on disk by page title. Handles errors gracefully
+    if any articles fail to download.
+
+    Args:
+        suggestions (WikipediaPages): Structured list of suggested Wikipedia page titles
+        config (PodcastConfig, optional): Configuration object with rate limits and cache directory
+
+    Returns:
+        list: List of retrieved Wikipedia document objects containing page content and metadata
+    """
+    return run_sync(download_wikipedia_articles_async(suggestions, config))
+
+
 def research_background_info(config: PodcastConfig, topic: str, base_url: Optional[str] = None, language: str = 'en') -> list:
     """
     Research background information for a podcast topic.
@@ -130,19 +269,106 @@ def research_background_info(config: PodcastConfig, topic: str, base_url: Option
     logger.info(f'Starting research for topic: {topic}')
     
     suggestions = suggest_wikipedia_articles(config, topic, base_url, language)
-    wikipedia_content = download_wikipedia_articles(suggestions)
+    wikipedia_content = download_wikipedia_articles(suggestions, config)
 
     logger.info('Research completed successfully')
     return wikipedia_content
 
 
+async def _search_tavily(tavily_client: 'tavily.TavilyClient',
+                         query: str,
+                         limiter: TokenBucketLimiter,
+                         cache: DiskCache) -> List[str]:
+    cache_key = f'{query}|max_results={TAVILY_MAX_RESULTS}'
+    with span('web.search', kind='web', query=query) as search_span:
+        urls = cache.get(cache_key)
+        search_span.set(cached=urls is not None)
+        if urls is None:
+            logger.info(f"Searching for {query}")
+            async with limiter:
+                response = await asyncio.to_thread(
+                    tavily_client.search,
+                    query,
+                    exclude_domains=TAVILY_EXCLUDE_DOMAINS,
+                    max_results=TAVILY_MAX_RESULTS
+                )
+            urls = [result['url'] for result in response['results']]
+            cache.set(cache_key, urls)
+        else:
+            logger.debug(f"Loaded search results from cache: {query}")
+        search_span.set(results=len(urls))
+
+    return [url for url in urls if not url.endswith(".pdf")]
+
+
+def _extract_web_document(url: str) -> Document:
+    web_source_doc = WebSourceDocument(url)
+    web_source_doc.extract()
+    return web_source_doc.as_langchain_document()
+
+
+async def _download_page(url: str, limiter: TokenBucketLimiter, cache: DiskCache) -> Document:
+    with span('web.fetch', kind='web', url=url) as fetch_span:
+        cached = cache.get(url)
+        if cached is not None:
+            logger.debug(f'Loaded page from cache: {url}')
+            fetch_span.set(cached=True)
+            return _document_from_dict(cached)
+
+        async with limiter:
+            document = await asyncio.to_thread(_extract_web_document, url)
+        fetch_span.set(cached=False, bytes=len(document.page_content.encode('utf-8')))
+        cache.set(url, _document_to_dict(document))
+        return document
+
+
+async def _gather_pages(urls: List[str], tasks: list) -> List[Document]:
+    downloaded_articles = []
+    for url, result in zip(urls, await asyncio.gather(*tasks, return_exceptions=True)):
+        if isinstance(result, Exception):
+            logger.error(f'Unexpected error downloading {url}: {str(result)}')
+        else:
+            downloaded_articles.append(result)
+
+    logger.info(f'Successfully downloaded {len(downloaded_articles)} articles')
+    return downloaded_articles
+
+
+async def perform_tavily_queries_async(config: PodcastConfig, queries: SearchQueries) -> list:
+    """
+    Asynchronous implementation of perform_tavily_queries.
+
+    All queries are issued concurrently, subject to the 'tavily' service rate limit.
+    """
+    logger.info("Performing search queries")
+    tavily_client = tavily.TavilyClient(api_key=config.tavily_api_key)
+    limiter = get_service_limiter(config, 'tavily')
+    cache = get_research_cache(config, 'tavily')
+
+    results = await asyncio.gather(
+        *[_search_tavily(tavily_client, query.query, limiter, cache) for query in queries.queries],
+        return_exceptions=True
+    )
+
+    urls_to_scrape = {}
+    for query, result in zip(queries.queries, results):
+        if isinstance(result, Exception):
+            logger.error(f'Search query failed {query.query}: {str(result)}')
+            continue
+        for url in result:
+            urls_to_scrape.setdefault(_normalize_url(url), url)
+
+    return list(urls_to_scrape.values())
+
+
 def perform_tavily_queries(config: PodcastConfig, queries: SearchQueries) -> list:
     """
     Execute search queries using the Tavily API.
 
     Performs web searches for each provided query using the Tavily search API, filtering out
-    certain domains and PDF files. Handles API interaction and result processing to extract
-    relevant URLs for further content scraping.
+    certain domains and PDF files. Queries run concurrently within the configured rate
+    limit and their results are cached on disk by query. URLs returned by several queries
+    are only listed once.
 
     Args:
         queries (SearchQueries): Structured list of search queries to execute
@@ -150,60 +376,94 @@ def perform_tavily_queries(config: PodcastConfig, queries: SearchQueries) -> lis
     Returns:
         list: List of URLs from search results, excluding PDFs and filtered domains
     """
-    logger.info("Performing search queries")
-    tavily_client = TavilyClient(api_key=config.tavily_api_key)
+    return run_sync(perform_tavily_queries_async(config, queries))
 
-    exclude_domains = [
-        "wikipedia.org", 
-        "youtube.com", 
-        "books.google.com", 
-        "academia.edu", 
-        "washingtonpost.com"
-    ]
 
-    urls_to_scrape = set()
-    for query in queries.queries:
-        logger.info(f"Searching for {query.query}")
-        response = tavily_client.search(query.query, exclude_domains=exclude_domains, max_results=5)
-        urls_to_scrape.update([
-            result['url'] for result in response['results'] 
-            if not result['url'].endswith(".pdf")])
+async def download_page_content_async(urls: List[str], config: Optional[PodcastConfig] = None) -> List[Document]:
+    """
+    Asynchronous implementation of download_page_content.
+
+    All URLs are downloaded and parsed concurrently, subject to the 'web' service
+    rate limit. URLs differing only in trailing slashes or fragments are downloaded once.
+    """
+    logger.info('Downloading page content from URLs.')
+    limiter = get_service_limiter(config, 'web')
+    cache = get_research_cache(config, 'web')
+
+    seen_urls = set()
+    unique_urls = []
+    for url in urls:
+        normalized = _normalize_url(url)
+        if normalized not in seen_urls:
+            seen_urls.add(normalized)
+            unique_urls.append(url)
 
-    return list(urls_to_scrape)
+    tasks = [_download_page(url, limiter, cache) for url in unique_urls]
+    return await _gather_pages(unique_urls, tasks)
 
 
-def download_page_content(urls: List[str]) -> List[Document]:
+def download_page_content(urls: List[str], config: Optional[PodcastConfig] = None) -> List[Document]:
     """
     Download and parse content from a list of URLs.
 
-    Uses the newspaper3k library to download and extract clean text content from web pages.
+    Downloads pages concurrently and extracts clean text content from them. When a config
+    is given, the configured 'web' rate limit applies and pages are cached on disk by URL.
     Handles errors gracefully and logs success/failure for each URL. Filters out articles
     with no text content.
 
     Args:
         urls (list): List of URLs to download and parse
+        config (PodcastConfig, optional): Configuration object with rate limits and cache directory
 
     Returns:
-        list: List of dictionaries containing the downloaded articles with structure:
-            {
-                'url': str,      # Original URL
-                'title': str,    # Article title
-                'text': str      # Cleaned article text content
-            }
+        list: List of LangChain documents containing the downloaded articles, with the
+            article text as page content and the title and URL in the metadata
     """
-    logger.info('Downloading page content from URLs.')
-    
-    downloaded_articles = []
-    for url in urls:
+    return run_sync(download_page_content_async(urls, config))
+
+
+async def search_and_download_async(config: PodcastConfig, queries: SearchQueries) -> List[Document]:
+    """
+    Run search queries and download their result pages as one pipelined stage.
+
+    Page downloads start as soon as the query that found them completes instead of
+    waiting for every query to finish. URLs found by several queries are downloaded once.
+
+    Args:
+        config (PodcastConfig): Configuration object with API keys, rate limits and cache directory
+        queries (SearchQueries): Structured list of search queries to execute
+
+    Returns:
+        list: List of LangChain documents for all successfully downloaded pages
+    """
+    logger.info("Performing search queries")
+    tavily_client = tavily.TavilyClient(api_key=config.tavily_api_key)
+    search_limiter = get_service_limiter(config, 'tavily')
+    search_cache = get_research_cache(config, 'tavily')
+    web_limiter = get_service_limiter(config, 'web')
+    web_cache = get_research_cache(config, 'web')
+
+    seen_urls = set()
+    urls, downloads = [], []
+
+    async def search_then_download(query: str) -> None:
         try:
-            web_source_doc = WebSourceDocument(url)
-            web_source_doc.extract()
-            downloaded_articles.append(web_source_doc.as_langchain_document())
+            found_urls = await _search_tavily(tavily_client, query, search_limiter, search_cache)
         except Exception as e:
-            logger.error(f'Unexpected error downloading {url}: {str(e)}')
-            
-    logger.info(f'Successfully downloaded {len(downloaded_articles)} articles')
-    return downloaded_articles
+            logger.error(f'Search query failed {query}: {str(e)}')
+            return
+
+        for url in found_urls:
+            normalized = _normalize_url(url)
+            if normalized in seen_urls:
+                continue
+            seen_urls.add(normalized)
+            urls.append(url)
+            downloads.append(asyncio.ensure_future(_download_page(url, web_limiter, web_cache)))
+
+    await asyncio.gather(*[search_then_download(query.query) for query in queries.queries])
+    logger.info(f'Found {len(urls)} unique URLs, downloading page content.')
+    return await _gather_pages(urls, downloads)
 
 
 def research_discussion_topics(config: PodcastConfig, topic: str, outline: PodcastOutline, base_url: Optional[str] = None, language: str = 'en') -> list:
@@ -240,13 +500,12 @@ def research_discussion_topics(config: PodcastConfig, topic: str, outline: Podca
         search_queries_prompt = hub.pull(prompthub_path)
         logger.info(f"Got prompt from hub: {prompthub_path}")
 
-    fast_llm = get_fast_llm(config, base_url=base_url)
+    fast_llm = get_fast_llm(config, base_url=base_url, temperature=get_stage_temperature(config, 'research_queries'))
     search_queries_chain = search_queries_prompt | fast_llm.with_structured_output(
         SearchQueries
     )
     queries = search_queries_chain.invoke({"topic": topic, "podcast_outline": outline.as_str})
     logger.info(f'Got {len(queries.queries)} suggested search queries')
 
-    urls_to_scrape = perform_tavily_queries(config, queries)
-    page_content = download_page_content(urls_to_scrape)
+    page_content = run_sync(search_and_download_async(config, queries))
     return page_content
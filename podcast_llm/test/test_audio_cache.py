@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the content-addressed TTS audio cache.
+"""
+
+import os
+import sys
+import time
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from podcast_llm.utils.audio_cache import AudioCache, tts_cache_key
+
+
+def test_cache_key_depends_on_voice_settings_speaker_and_text():
+    """Test that every input of a TTS request changes the cache key."""
+    settings = {'voice_mapping': {'Interviewer': 'anna', 'Interviewee': 'alex'}}
+    key = tts_cache_key('siliconcloud', settings, 'Interviewer', 'Hello')
+
+    assert key == tts_cache_key('siliconcloud', dict(settings), 'Interviewer', 'Hello')
+    assert key != tts_cache_key('google', settings, 'Interviewer', 'Hello')
+    assert key != tts_cache_key('siliconcloud', {'voice_mapping': {'Interviewer': 'bella'}}, 'Interviewer', 'Hello')
+    assert key != tts_cache_key('siliconcloud', settings, 'Interviewee', 'Hello')
+    assert key != tts_cache_key('siliconcloud', settings, 'Interviewer', 'Hello!')
+
+
+def test_get_returns_stored_audio(tmp_path):
+    """Test a round trip through the cache."""
+    cache = AudioCache(str(tmp_path), max_bytes=1024)
+    assert cache.get('abc', 'mp3') is None
+
+    cache.put('abc', 'mp3', b'audio')
+    assert cache.get('abc', 'mp3') == b'audio'
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Test that the cache stays within its size bound, evicting the oldest entries."""
+    cache = AudioCache(str(tmp_path), max_bytes=250)
+    cache.put('first', 'mp3', b'1' * 100)
+    time.sleep(0.01)
+    cache.put('second', 'mp3', b'2' * 100)
+    time.sleep(0.01)
+    cache.get('first', 'mp3')
+    time.sleep(0.01)
+    cache.put('third', 'mp3', b'3' * 100)
+
+    assert cache.get('second', 'mp3') is None
+    assert cache.get('first', 'mp3') is not None
+    assert cache.get('third', 'mp3') is not None
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script to verify segment format negotiation and stream-copy assembly.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from podcast_llm.text_to_speech import select_segment_format
+from podcast_llm.tts import get_tts_provider
+from podcast_llm.utils.audio_formats import negotiate_segment_format, pcm_to_wav, read_mp3_frames, read_wav
+from podcast_llm.utils.audio_stream import AudioStreamWriter
+
+
+# MPEG 1 Layer III, 128 kbit/s, 44.1 kHz, mono: 417 bytes and 1152 samples per frame
+MP3_FRAME = bytes([0xFF, 0xFB, 0x90, 0xC4]) + bytes(413)
+
+
+def mp3_segment(frames: int) -> bytes:
+    id3 = b'ID3\x03\x00\x00\x00\x00\x00\x05' + bytes(5)
+    return id3 + MP3_FRAME * frames
+
+
+def test_negotiation_prefers_copy_then_lossless():
+    """Test that segments are copied when possible and requested as WAV when decoding is needed."""
+    assert negotiate_segment_format(('mp3', 'wav'), 'mp3', {'silence_ms': 150}) == ('mp3', True)
+    assert negotiate_segment_format(('mp3', 'wav'), 'mp3', {'normalize': True}) == ('wav', False)
+    assert negotiate_segment_format(('wav',), 'mp3', {}) == ('wav', False)
+    assert negotiate_segment_format(('mp3',), 'ogg', {}) == ('mp3', False)
+
+
+def test_select_segment_format_sets_provider_format(tmp_path):
+    """Test the segment_format setting against the sine provider, which only returns WAV."""
+    provider = get_tts_provider(SimpleNamespace(tts_provider='sine', tts_settings={}))
+
+    assert select_segment_format(provider, 'wav', {'segment_format': 'auto'}) is True
+    assert provider.audio_format == 'wav'
+    with pytest.raises(ValueError):
+        select_segment_format(provider, 'mp3', {'segment_format': 'mp3'})
+
+
+def test_read_mp3_frames_skips_tags():
+    """Test frame walking over an ID3 tag and trailing garbage."""
+    info, frames = read_mp3_frames(mp3_segment(3) + b'TAG trailing')
+
+    assert frames == MP3_FRAME * 3
+    assert (info.sample_rate, info.channels, info.bitrate) == (44100, 1, 128)
+    assert info.duration == pytest.approx(3 * 1152 / 44100)
+    with pytest.raises(ValueError):
+        read_mp3_frames(b'not audio')
+
+
+def test_stream_copy_mp3_concatenates_frames(tmp_path):
+    """Test that MP3 segments are joined frame by frame without an encoder."""
+    output_file = str(tmp_path / 'episode.mp3')
+    with AudioStreamWriter(output_file, 'mp3', stream_copy=True) as writer:
+        writer.append(mp3_segment(2), 'mp3')
+        writer.append(mp3_segment(3), 'mp3')
+
+    with open(output_file, 'rb') as f:
+        assert f.read() == MP3_FRAME * 5
+
+
+def test_stream_copy_wav_inserts_silence(tmp_path):
+    """Test WAV assembly with silence, converting a segment with a different sample rate."""
+    output_file = str(tmp_path / 'episode.wav')
+    first = pcm_to_wav(b'\x01\x00' * 2400, 24000)
+    second = pcm_to_wav(b'\x01\x00' * 1600, 16000)
+    with AudioStreamWriter(output_file, 'wav', silence_ms=50, stream_copy=True) as writer:
+        writer.append(first, 'wav')
+        assert writer.append(second, 'wav') == pytest.approx(0.1)
+
+    with open(output_file, 'rb') as f:
+        info, sample_width, frames = read_wav(f.read())
+    assert (info.sample_rate, info.channels, sample_width) == (24000, 1, 2)
+    assert info.duration == pytest.approx(0.25, abs=0.001)
+    assert frames[4800:4800 + 2400] == bytes(2400)
+
+
+def test_writer_ignores_stream_copy_when_decoding_is_needed(tmp_path):
+    """Test that normalization or resampling turns stream copying off."""
+    writer = AudioStreamWriter(str(tmp_path / 'episode.mp3'), 'mp3', normalize=True, stream_copy=True)
+    assert writer.stream_copy is False
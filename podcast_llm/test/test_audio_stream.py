@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the segment buffer and the progressive segment playlist.
+"""
+
+import os
+import sys
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from podcast_llm.utils.audio_stream import SegmentBuffer
+from podcast_llm.utils.segment_playlist import SegmentPlaylist, read_playlist, segment_dir_for
+
+
+def test_segments_spill_over_memory_limit(tmp_path):
+    """Test that segments beyond max_bytes are spilled and read back intact."""
+    buffer = SegmentBuffer(max_bytes=10, spill_dir=str(tmp_path))
+    buffer.put(2, b'c' * 8)
+    buffer.put(1, b'b' * 8)
+    buffer.put(0, b'a' * 8)
+
+    assert buffer.spilled_segments == 2
+    assert len(os.listdir(tmp_path)) == 2
+    assert [buffer.take(i) for i in range(3)] == [b'a' * 8, b'b' * 8, b'c' * 8]
+    assert os.listdir(tmp_path) == []
+
+
+def test_clear_removes_spilled_files(tmp_path):
+    """Test that clearing the buffer deletes spilled segments."""
+    buffer = SegmentBuffer(max_bytes=0, spill_dir=str(tmp_path))
+    buffer.put(0, b'audio')
+    buffer.clear()
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_playlist_grows_until_finished(tmp_path):
+    """Test that published segments appear in order and the playlist is closed on finish."""
+    segment_dir = segment_dir_for(str(tmp_path / 'episode.mp3'))
+    playlist = SegmentPlaylist(segment_dir, 'mp3')
+    assert read_playlist(segment_dir) == ([], False)
+
+    playlist.publish(b'first', duration=1.5)
+    playlist.publish(b'second', duration=2.0)
+    segments, finished = read_playlist(segment_dir)
+    assert [path.read_bytes() for path in segments] == [b'first', b'second']
+    assert not finished
+
+    playlist.finish()
+    assert read_playlist(segment_dir)[1]
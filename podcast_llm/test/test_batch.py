@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script to verify batch manifests, batch reports and shared clients.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from podcast_llm.batch import EpisodeReport, load_manifest, summarize_batch
+from podcast_llm.utils.shared_clients import (
+    client_key,
+    get_shared_client,
+    get_shared_client_stats,
+    reset_shared_clients
+)
+
+
+CONFIG = SimpleNamespace(output_dir='out', output_format='mp3')
+
+
+def test_manifest_applies_defaults_and_output_paths(tmp_path):
+    """Test that defaults fill missing fields and outputs default to the output directory."""
+    manifest = tmp_path / 'manifest.yaml'
+    manifest.write_text(
+        'defaults:\n'
+        '  language: zh\n'
+        'episodes:\n'
+        '  - Quantum Computing\n'
+        '  - topic: Jazz\n'
+        '    mode: context\n'
+        '    sources: [jazz.pdf]\n'
+        '    text_output: null\n',
+        encoding='utf-8'
+    )
+    episodes = load_manifest(str(manifest), CONFIG)['episodes']
+
+    assert [episode.language for episode in episodes] == ['zh', 'zh']
+    assert episodes[0].audio_output == os.path.join('out', 'quantum_computing.mp3')
+    assert episodes[1].sources == ['jazz.pdf']
+    assert episodes[1].text_output is None
+
+
+def test_manifest_rejects_context_episode_without_sources(tmp_path):
+    """Test that invalid episodes fail before any episode is generated."""
+    manifest = tmp_path / 'manifest.yaml'
+    manifest.write_text('episodes:\n  - topic: Jazz\n    mode: context\n', encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        load_manifest(str(manifest), CONFIG)
+
+
+def test_summary_reports_throughput():
+    """Test aggregate throughput and per-stage time across episodes."""
+    reports = [
+        EpisodeReport(topic='a', status='succeeded', start_s=0, end_s=60,
+                      stages={'outline': 10.0, 'audio': 40.0}, script_lines=30),
+        EpisodeReport(topic='b', status='failed', error='ValueError: boom', start_s=0, end_s=30,
+                      stages={'outline': 5.0})
+    ]
+    aggregate = summarize_batch(reports, wall_s=60)['aggregate']
+
+    assert aggregate['succeeded'] == 1 and aggregate['failed'] == 1
+    assert aggregate['episodes_per_hour'] == 60
+    assert aggregate['concurrency'] == 1.5
+    assert aggregate['stage_seconds'] == {'outline': 15.0, 'audio': 40.0}
+
+
+def test_shared_clients_are_reused_per_key():
+    """Test that clients are created once per distinct configuration."""
+    reset_shared_clients()
+    first = get_shared_client(client_key('test', 'key-1'), object)
+    assert get_shared_client(client_key('test', 'key-1'), object) is first
+    assert get_shared_client(client_key('test', 'key-2'), object) is not first
+    assert get_shared_client_stats() == {'test': {'created': 2, 'reused': 1}}
+    reset_shared_clients()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script to verify content-addressed checkpoints and their compact storage format.
+"""
+
+import os
+import sys
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from langchain_core.documents import Document
+
+from podcast_llm.models import Answer, Question
+from podcast_llm.utils.checkpointer import Checkpointer
+
+
+def test_changed_inputs_do_not_reuse_checkpoints(tmp_path):
+    """Test that a checkpoint is only reused for identical inputs."""
+    checkpointer = Checkpointer('topic', checkpoint_dir=str(tmp_path))
+    calls = []
+
+    def stage(topic, rounds):
+        calls.append((topic, rounds))
+        return f'{topic}:{rounds}'
+
+    assert checkpointer.checkpoint(stage, 'jazz', 2, stage_name='draft') == 'jazz:2'
+    assert checkpointer.checkpoint(stage, 'jazz', 2, stage_name='draft') == 'jazz:2'
+    assert checkpointer.checkpoint(stage, 'jazz', 3, stage_name='draft') == 'jazz:3'
+    assert calls == [('jazz', 2), ('jazz', 3)]
+
+
+def test_documents_and_models_round_trip_as_json(tmp_path):
+    """Test that documents and Pydantic models are stored as compressed JSON and restored."""
+    checkpointer = Checkpointer('topic', checkpoint_dir=str(tmp_path))
+    result = [
+        Document(page_content='Some text', metadata={'source': 'wiki'}),
+        Question(question='Why?'),
+        Answer(answer='Because.'),
+        {'speaker': 'Interviewer', 'text': 'Hi'}
+    ]
+    checkpointer.checkpoint(lambda: result, stage_name='mixed', key_parts='k')
+
+    assert [p.name.endswith('.json.gz') for p in tmp_path.iterdir()] == [True]
+    loaded = checkpointer.checkpoint(lambda: None, stage_name='mixed', key_parts='k')
+    assert loaded[0].page_content == 'Some text' and loaded[0].metadata == {'source': 'wiki'}
+    assert loaded[1] == Question(question='Why?')
+    assert loaded[2] == Answer(answer='Because.')
+    assert loaded[3] == {'speaker': 'Interviewer', 'text': 'Hi'}
+
+
+def test_failed_unit_is_not_checkpointed(tmp_path):
+    """Test that only completed units are stored, so a resumed run redoes just the failed one."""
+    checkpointer = Checkpointer('topic', checkpoint_dir=str(tmp_path))
+    calls = []
+
+    def unit(i):
+        calls.append(i)
+        if i == 2 and calls.count(2) == 1:
+            raise RuntimeError('transient failure')
+        return i * 10
+
+    def run():
+        return [checkpointer.checkpoint(unit, i, stage_name='unit') for i in range(4)]
+
+    try:
+        run()
+    except RuntimeError:
+        pass
+    assert run() == [0, 10, 20, 30]
+    assert calls == [0, 1, 2, 2, 3]
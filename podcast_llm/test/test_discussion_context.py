@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the background context prepared for discussions.
+"""
+
+import os
+import sys
+import threading
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from langchain_core.documents import Document
+
+from podcast_llm.models import PodcastOutline, PodcastSection, PodcastSubsection
+from podcast_llm.utils.text import estimate_tokens
+from podcast_llm.writer import DiscussionContext, build_continuity_note, format_retrieved_context, trim_to_budget
+
+
+DOCUMENTS = [
+    Document(page_content='a' * 5000, metadata={'title': 'Long'}),
+    Document(page_content='short', metadata={'title': 'Short'})
+]
+
+
+def test_trim_keeps_short_texts_and_respects_budget():
+    """Test that short texts are kept whole and long ones share the rest of the budget."""
+    trimmed = trim_to_budget(['x' * 1000, 'short', 'y' * 1000], 300)
+
+    assert len(trimmed) <= 300
+    assert '\n\nshort\n\n' in trimmed
+    assert trimmed.count('…') == 2
+
+
+def test_budget_mode_bounds_interviewer_background():
+    """Test that every turn gets the same bounded background while the corpus stays complete."""
+    section = PodcastSection(title='Intro', subsections=[PodcastSubsection(title='Basics')])
+    with DiscussionContext(DOCUMENTS, mode='budget', max_chars=1000) as context:
+        background = context.background_for(section)
+        assert len(background) <= 1000
+        assert 'short' in background
+        assert context.background_for(section) is background
+        assert len(context.corpus) > 5000
+
+
+def test_summary_mode_summarizes_each_section_once():
+    """Test that concurrent subsections of a section share one summary."""
+    calls = []
+    section = PodcastSection(title='Intro', subsections=[PodcastSubsection(title='Basics')])
+
+    def summarize(section, corpus):
+        calls.append(section.title)
+        return f'notes on {section.title}'
+
+    with DiscussionContext(DOCUMENTS, mode='summary', max_chars=1000, summarize=summarize) as context:
+        threads = [threading.Thread(target=context.background_for, args=(section,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert context.background_for(section) == 'notes on Intro'
+
+    assert calls == ['Intro']
+
+
+def test_retrieved_context_respects_token_budget():
+    """Test that retrieved chunks are kept in order until the token budget is used up."""
+    docs = [Document(page_content='word ' * 40), Document(page_content='另一段中文内容' * 20), Document(page_content='dropped')]
+    context = format_retrieved_context(docs, max_tokens=80)
+
+    assert estimate_tokens(context) <= 82
+    assert context.startswith('word ')
+    assert 'dropped' not in context
+
+
+def test_continuity_note_describes_neighbouring_subsections():
+    """Test that the note names the surrounding subsections with their key points, within budget."""
+    outline = PodcastOutline(sections=[
+        PodcastSection(title='Intro', subsections=[
+            PodcastSubsection(title='Origins', description='New Orleans brass bands and ragtime.'),
+            PodcastSubsection(title='Swing', description='Big bands of the 1930s. ' + 'x' * 2000)
+        ]),
+        PodcastSection(title='Main', subsections=[
+            PodcastSubsection(title='Bebop'),
+            PodcastSubsection(title='Cool jazz', description='Miles Davis and the West Coast sound.')
+        ])
+    ])
+
+    note = build_continuity_note(outline, 1, 0, max_chars=400)
+
+    assert note.startswith('(Earlier in this episode we already discussed: '
+                           'Origins (New Orleans brass bands and ragtime.); Swing (Big bands of the 1930s. x')
+    assert '…' in note and len(note) < 400 + 100
+    assert note.endswith('(Coming up next: Cool jazz (Miles Davis and the West Coast sound.).)\n')
+    upcoming = build_continuity_note(outline, 0, 0, max_chars=100)
+    assert upcoming.startswith('(Coming up next: Swing (Big bands of the 1930s. xxx')
+    assert len(upcoming) == len('(Coming up next: .)\n') + 100
+    single = PodcastOutline(sections=[PodcastSection(title='Intro', subsections=[PodcastSubsection(title='Only')])])
+    assert build_continuity_note(single, 0, 0) == ''
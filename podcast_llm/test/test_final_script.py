@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that the final script is rewritten concurrently, in order and resumably.
+"""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+import podcast_llm.writer as writer
+from podcast_llm.models import Answer, Question, Script, ScriptLine
+from podcast_llm.utils.checkpointer import Checkpointer
+from podcast_llm.writer import write_final_script
+
+
+class RewriteRejected(Exception):
+    """A permanent API error, which is not retried."""
+    status_code = 400
+
+
+DRAFT = [Question(question=f'question {i}') if i % 2 == 0 else Answer(answer=f'answer {i}') for i in range(8)]
+
+
+class StubRewriter:
+    """Stands in for the long context model: upper-cases each line, earliest batches slowest."""
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def with_structured_output(self, schema):
+        return RunnableLambda(self.rewrite)
+
+    def rewrite(self, script):
+        lines = [line.split(': ', 1) for line in script.strip().splitlines()]
+        with self.lock:
+            self.calls.append(lines[0][1])
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            # The first batch finishes last
+            time.sleep(0.05 * (8 - int(lines[0][1].split()[-1])))
+            if lines[0][1] == self.fail_on:
+                raise RewriteRejected('rewrite failed')
+            return Script(lines=[ScriptLine(speaker=speaker, text=text.upper()) for speaker, text in lines])
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def rewriter(monkeypatch):
+    stub = StubRewriter()
+    # The prompt passes the formatted script straight to the model
+    monkeypatch.setattr(writer, 'get_local_prompt', lambda name, language: RunnableLambda(lambda inputs: inputs['script']))
+    monkeypatch.setattr(writer, 'get_long_context_llm', lambda *args, **kwargs: stub)
+    return stub
+
+
+CONFIG = SimpleNamespace(
+    writer_settings={'rewrite_parallelism': 4, 'rewrite_overlap': 0},
+    long_context_llm_provider='openai',
+    llm_temperatures={},
+    rate_limits={},
+    podcast_name='Jazz Hour',
+    intro='Welcome to {podcast_name}, today: {topic}.',
+    outro='Thanks for listening to {podcast_name}.'
+)
+
+EXPECTED = (
+    [{'speaker': 'Interviewer', 'text': 'Welcome to Jazz Hour, today: bebop.'}]
+    + [{'speaker': 'Interviewer' if i % 2 == 0 else 'Interviewee',
+        'text': f'QUESTION {i}' if i % 2 == 0 else f'ANSWER {i}'} for i in range(8)]
+    + [{'speaker': 'Interviewer', 'text': 'Thanks for listening to Jazz Hour.'}]
+)
+
+
+def test_concurrent_rewrites_keep_script_order(rewriter):
+    """Test that batches finishing out of order are reassembled and emitted in script order."""
+    parts = []
+    final_script = write_final_script(CONFIG, 'bebop', DRAFT, batch_size=2, on_batch=parts.append)
+
+    assert final_script == EXPECTED
+    assert rewriter.max_running == 4
+    assert parts == [EXPECTED[:1], EXPECTED[1:3], EXPECTED[3:5], EXPECTED[5:7], EXPECTED[7:9], EXPECTED[9:]]
+
+
+def test_failed_rewrite_resumes_from_batch_checkpoints(rewriter, tmp_path):
+    """Test that a rerun after a failed batch only rewrites that batch."""
+    checkpointer = Checkpointer(checkpoint_key='episode_', checkpoint_dir=str(tmp_path))
+    rewriter.fail_on = 'question 4'
+    with pytest.raises(RewriteRejected):
+        write_final_script(CONFIG, 'bebop', DRAFT, batch_size=2, checkpointer=checkpointer)
+    assert sorted(rewriter.calls) == ['question 0', 'question 2', 'question 4', 'question 6']
+
+    rewriter.fail_on = None
+    rewriter.calls.clear()
+    final_script = write_final_script(CONFIG, 'bebop', DRAFT, batch_size=2, checkpointer=checkpointer)
+
+    assert rewriter.calls == ['question 4']
+    assert final_script == EXPECTED
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script to verify JSON extraction, repair and schema coercion of LLM output.
+"""
+
+import os
+import sys
+from typing import List
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.prompt_values import ChatPromptValue
+from pydantic import BaseModel
+
+from podcast_llm.models import Question
+from podcast_llm.utils.json_extract import JsonObjectScanner, extract_json_object, parse_json_object
+from podcast_llm.utils.llm import LLMWrapper
+from podcast_llm.utils.rate_limits import retry_with_exponential_backoff
+
+
+class Outline(BaseModel):
+    title: str
+    sections: List[str]
+
+
+class FakeModel:
+    """Stands in for the plain chat model and records the repair prompts."""
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return AIMessage(content=self.reply)
+
+
+def make_wrapper(schema, reply: str = '') -> LLMWrapper:
+    wrapper = LLMWrapper.__new__(LLMWrapper)
+    wrapper.schema = schema
+    wrapper._base_llm = FakeModel(reply)
+    return wrapper
+
+
+def test_extracts_first_balanced_object():
+    """Test that the first object is found, ignoring braces inside strings and later objects."""
+    text = 'Here you go: {"a": "x } y", "b": {"c": [1, 2]}} and {"d": 1}'
+    assert extract_json_object(text) == ('{"a": "x } y", "b": {"c": [1, 2]}}', True)
+
+
+def test_scanner_handles_chunked_input():
+    """Test that feeding output in chunks gives the same result as one pass."""
+    scanner = JsonObjectScanner()
+    for chunk in ['noise {"a', '": "b\\"', '}"', '}', ' tail']:
+        scanner.feed(chunk)
+    assert scanner.result() == ('{"a": "b\\"}"}', True)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('```json\n{"a": 1,}\n```', {'a': 1}),
+    ("{'a': 'it\"s', 'b': True, 'c': None}", {'a': 'it"s', 'b': True, 'c': None}),
+    ('{question: "Why?"}', {'question': 'Why?'}),
+    ('{"a": "line one\nline two"}', {'a': 'line one\nline two'}),
+    ('{"a": [1, 2], "b": "trunc', {'a': [1, 2], 'b': 'trunc'}),
+    ('{"a": 1, "b": ', {'a': 1}),
+    ("{'a': 'it\\'s'}", {'a': "it's"}),
+    ('The {placeholder} answer is {"a": 1}', {'a': 1}),
+])
+def test_repairs_common_malformations(text, expected):
+    """Test repair of fences, quotes, literals, unquoted keys, raw newlines and truncation."""
+    assert parse_json_object(text) == expected
+
+
+def test_coerce_uses_raw_text_for_single_field_schema():
+    """Test that plain text becomes the only field without asking the model again."""
+    wrapper = make_wrapper(Question)
+    assert wrapper.coerce_to_schema('What is jazz?').question == 'What is jazz?'
+    assert wrapper._base_llm.prompts == []
+
+
+def test_coerce_reasks_only_for_malformed_fragment():
+    """Test that a fragment the repair step cannot fix is sent back on its own."""
+    wrapper = make_wrapper(Outline, reply='{"title": "Jazz", "sections": ["Origins"]}')
+    outline = wrapper.coerce_to_schema('Sure! {"title": "Jazz", "sections": "Origins"} Hope this helps.')
+
+    assert outline.sections == ['Origins']
+    prompt = wrapper._base_llm.prompts[0][0].content
+    assert prompt.endswith('{"title": "Jazz", "sections": "Origins"}')
+    assert 'Hope this helps' not in prompt
+
+
+def test_coerce_raises_when_repair_fails():
+    """Test that an unfixable response raises OutputParserException."""
+    wrapper = make_wrapper(Outline, reply='still not json')
+    with pytest.raises(OutputParserException):
+        wrapper.coerce_to_schema('no json here')
+
+
+class MalformedChatModel:
+    """Stands in for the structured chat model and always replies with unparseable output."""
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, input, config=None):
+        self.calls += 1
+        raise OutputParserException('bad output', llm_output='{"title": "Jazz", "sections": oops')
+
+
+def test_unparseable_reply_is_not_regenerated():
+    """Test that a reply that cannot be coerced costs one call and one re-ask, not retries."""
+    wrapper = make_wrapper(Outline, reply='still not json')
+    wrapper.provider = 'openai'
+    wrapper.model = 'gpt-4o'
+    wrapper.temperature = 0.0
+    wrapper.response_cache = None
+    wrapper.llm = MalformedChatModel()
+
+    @retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
+    def generate_outline():
+        return wrapper.invoke(ChatPromptValue(messages=[HumanMessage(content='Outline jazz')]))
+
+    with pytest.raises(OutputParserException):
+        generate_outline()
+    assert wrapper.llm.calls == 1
+    assert len(wrapper._base_llm.prompts) == 1
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the LLM response cache.
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+import podcast_llm.utils.llm as llm_module
+from podcast_llm.models import Question, WikipediaPage, WikipediaPages
+from podcast_llm.research import suggest_wikipedia_articles
+from podcast_llm.utils.llm import LLMWrapper
+from podcast_llm.utils.llm_cache import LLMResponseCache, llm_cache_key
+
+
+class CountingModel:
+    """Stands in for a chat model and counts the calls that reach it."""
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def invoke(self, input, config=None):
+        self.calls += 1
+        return self.response
+
+
+def make_wrapper(cache, response, temperature=0.0, schema=None) -> LLMWrapper:
+    wrapper = LLMWrapper.__new__(LLMWrapper)
+    wrapper.provider = 'openai'
+    wrapper.model = 'gpt-4o'
+    wrapper.temperature = temperature
+    wrapper.schema = schema
+    wrapper.response_cache = cache
+    wrapper.llm = CountingModel(response)
+    return wrapper
+
+
+PAGES = WikipediaPages(pages=[WikipediaPage(name='Jazz'), WikipediaPage(name='Bebop')])
+PROMPT = ChatPromptTemplate.from_messages([('system', 'You are a host.'), ('human', '{topic}')])
+
+
+def test_key_depends_on_every_input():
+    """Test that the key changes with provider, model, temperature, prompt and schema."""
+    key = llm_cache_key('openai', 'gpt-4o', 0, 'prompt')
+    assert key == llm_cache_key('openai', 'gpt-4o', 0.0, 'prompt')
+    assert key != llm_cache_key('google', 'gpt-4o', 0, 'prompt')
+    assert key != llm_cache_key('openai', 'gpt-4o-mini', 0, 'prompt')
+    assert key != llm_cache_key('openai', 'gpt-4o', 0.5, 'prompt')
+    assert key != llm_cache_key('openai', 'gpt-4o', 0, 'prompt!')
+    assert key != llm_cache_key('openai', 'gpt-4o', 0, 'prompt', schema={'title': 'Question'})
+
+
+def test_entries_expire_and_are_evicted_by_size(tmp_path):
+    """Test per-entry expiry and least-recently-used eviction."""
+    cache = LLMResponseCache(str(tmp_path / 'llm.sqlite'), max_bytes=40, ttl_s=0.05)
+    cache.put('a', 'x' * 10)
+    time.sleep(0.1)
+    assert cache.get('a') is None
+
+    cache.ttl_s = None
+    cache.put('b', 'y' * 15)
+    cache.put('c', 'z' * 15)
+    cache.get('b')
+    cache.put('d', 'w' * 15)
+    assert cache.get('c') is None
+    assert cache.get('b') == 'y' * 15
+    assert cache.stats()['bytes'] <= 40
+
+
+def test_wrapper_replays_deterministic_calls(tmp_path):
+    """Test that repeated temperature-0 calls are served from the cache, across instances."""
+    path = str(tmp_path / 'llm.sqlite')
+    first = make_wrapper(LLMResponseCache(path, max_bytes=1 << 20), AIMessage(content='Outline'))
+    prompt = PROMPT.invoke({'topic': 'Jazz'})
+    assert first.invoke(prompt).content == 'Outline'
+    assert first.invoke(prompt).content == 'Outline'
+    assert first.llm.calls == 1
+
+    second = make_wrapper(LLMResponseCache(path, max_bytes=1 << 20), Question(question='?'), schema=Question)
+    second.llm.response = Question(question='Why jazz?')
+    assert second.invoke(prompt) == Question(question='Why jazz?')
+    assert second.invoke(prompt) == Question(question='Why jazz?')
+    assert second.llm.calls == 1
+
+
+def test_wrapper_skips_sampled_calls_by_default(tmp_path):
+    """Test that calls with a temperature above 0 reach the model every time."""
+    wrapper = make_wrapper(LLMResponseCache(str(tmp_path / 'llm.sqlite'), max_bytes=1 << 20),
+                           AIMessage(content='Outline'), temperature=1.0)
+    prompt = PROMPT.invoke({'topic': 'Jazz'})
+    wrapper.invoke(prompt)
+    wrapper.invoke(prompt)
+    assert wrapper.llm.calls == 2
+
+
+def test_fast_llm_call_site_reaches_the_cache(tmp_path, monkeypatch):
+    """Test that a stage configured for temperature 0 is replayed from the cache, and sampled by default."""
+    models = []
+
+    class FakeChatModel(CountingModel):
+        def __init__(self, **kwargs):
+            super().__init__(PAGES)
+            self.kwargs = kwargs
+            models.append(self)
+
+        def with_structured_output(self, schema):
+            return self
+
+    monkeypatch.setattr(llm_module.CHAT_MODELS, 'get', lambda provider: FakeChatModel)
+    monkeypatch.setattr(llm_module, 'get_shared_client', lambda key, factory: factory())
+    config = SimpleNamespace(fast_llm_provider='openai', cache_dir=str(tmp_path),
+                             llm_cache={'enabled': True, 'cache_sampled': False}, llm_temperatures={})
+
+    # Sampled by default, so every run asks the model
+    suggest_wikipedia_articles(config, 'Jazz')
+    suggest_wikipedia_articles(config, 'Jazz')
+    assert [model.kwargs['temperature'] for model in models] == [1.0, 1.0]
+    assert sum(model.calls for model in models) == 2
+
+    models.clear()
+    config.llm_temperatures = {'wikipedia_suggestions': 0}
+    first = suggest_wikipedia_articles(config, 'Jazz')
+    second = suggest_wikipedia_articles(config, 'Jazz')
+
+    assert first == second == PAGES
+    assert [model.kwargs['temperature'] for model in models] == [0, 0]
+    assert sum(model.calls for model in models) == 1
@@ -19,7 +19,8 @@ def test_load_all_prompts():
         "podcast_research_queries",
         "podcast_interviewer_role",
         "podcast_interviewee_role",
-        "podcast_rewriter"
+        "podcast_rewriter",
+        "podcast_section_background"
     ]
     
     print("Testing local prompt loading...")
@@ -44,7 +45,8 @@ def test_get_all_prompts():
         "podcast_research_queries",
         "podcast_interviewer_role",
         "podcast_interviewee_role",
-        "podcast_rewriter"
+        "podcast_rewriter",
+        "podcast_section_background"
     ]
     
     print("\nTesting get_local_prompt function...")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the DAG stage scheduler.
+"""
+
+import os
+import sys
+import time
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+import podcast_llm.utils.pipeline as pipeline_module
+from podcast_llm.utils.pipeline import Pipeline, StreamError
+
+
+def test_independent_stages_run_concurrently():
+    """Test that stages sharing only an input run at the same time."""
+    def slow(source):
+        time.sleep(0.2)
+        return source + 1
+
+    pipeline = Pipeline()
+    pipeline.add_stage('left', slow, inputs=['source'])
+    pipeline.add_stage('right', slow, inputs=['source'])
+    pipeline.add_stage('total', lambda left, right: left + right, inputs=['left', 'right'])
+
+    start = time.monotonic()
+    results = pipeline.run({'source': 1})
+
+    assert results['total'] == 4
+    assert time.monotonic() - start < 0.35
+    assert {timing.name for timing in pipeline.timings} == {'left', 'right', 'total'}
+
+
+def test_consumer_starts_on_first_streamed_item():
+    """Test that a stream consumer sees items while the producer is still running."""
+    received = []
+
+    def produce(items):
+        for i in range(3):
+            items.put(i)
+            time.sleep(0.1)
+        return 'done'
+
+    def consume(items):
+        for item in items:
+            received.append((item, time.monotonic()))
+        return len(received)
+
+    pipeline = Pipeline()
+    pipeline.add_stage('producer', produce, streams=['items'])
+    pipeline.add_stage('consumer', consume, inputs=['items'])
+    results = pipeline.run()
+
+    assert results['consumer'] == 3
+    assert [item for item, _ in received] == [0, 1, 2]
+    producer_end = next(t.end for t in pipeline.timings if t.name == 'producer')
+    consumer_start = next(t.start for t in pipeline.timings if t.name == 'consumer')
+    assert consumer_start < producer_end
+
+
+def test_failing_producer_fails_consumer_and_skips_dependents():
+    """Test that a failure closes the producer's streams and later stages never run."""
+    ran = []
+
+    def produce(items):
+        items.put('partial')
+        raise ValueError('boom')
+
+    pipeline = Pipeline()
+    pipeline.add_stage('producer', produce, streams=['items'])
+    pipeline.add_stage('consumer', lambda items: list(items), inputs=['items'])
+    pipeline.add_stage('report', lambda producer: ran.append(producer), inputs=['producer'])
+
+    with pytest.raises(ValueError, match='boom'):
+        pipeline.run()
+    assert ran == []
+
+
+def test_producer_error_wins_over_consumer_that_finishes_first(monkeypatch):
+    """Test that a consumer re-wrapping a stream failure does not hide the producer's error."""
+    timing = pipeline_module.StageTiming
+
+    def slow_producer_timing(name, start, end):
+        # Runs after the producer closed its stream, so the consumer finishes first
+        if name == 'producer':
+            time.sleep(0.3)
+        return timing(name, start, end)
+
+    monkeypatch.setattr(pipeline_module, 'StageTiming', slow_producer_timing)
+    finished = []
+
+    def produce(items):
+        items.put('partial')
+        raise ValueError('boom')
+
+    def consume(items):
+        try:
+            try:
+                list(items)
+            except StreamError as e:
+                raise KeyError('consumer') from e
+        except KeyError as e:
+            finished.append('consumer')
+            raise RuntimeError('wrapped again') from e
+
+    pipeline = Pipeline()
+    pipeline.add_stage('producer', produce, streams=['items'])
+    pipeline.add_stage('consumer', consume, inputs=['items'])
+
+    with pytest.raises(ValueError, match='boom'):
+        pipeline.run()
+    assert finished == ['consumer']
+
+
+def test_cycles_are_rejected():
+    """Test that a cyclic pipeline is rejected before any stage runs."""
+    pipeline = Pipeline()
+    pipeline.add_stage('a', lambda b: b, inputs=['b'])
+    pipeline.add_stage('b', lambda a: a, inputs=['a'])
+
+    with pytest.raises(ValueError):
+        pipeline.run()
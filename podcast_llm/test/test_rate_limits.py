@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the shared token-bucket rate limiter and retry decorator.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from podcast_llm.utils.rate_limits import (
+    TokenBucketLimiter,
+    get_limiter,
+    reset_limiters,
+    retry_with_exponential_backoff
+)
+
+
+class FakeHTTPError(Exception):
+    """Client error carrying a status code and optional Retry-After, like SDK exceptions."""
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f'HTTP {status_code}')
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def test_registry_shares_limiters():
+    """Test that the same key returns the same limiter."""
+    reset_limiters()
+    assert get_limiter('test/shared', requests_per_minute=60) is get_limiter('test/shared')
+    reset_limiters()
+
+
+def test_burst_then_rate():
+    """Test that burst requests start immediately and later ones are spaced by the rate."""
+    limiter = TokenBucketLimiter('test', requests_per_minute=600, burst=3, max_concurrency=10)
+    start = time.monotonic()
+    for _ in range(5):
+        with limiter:
+            pass
+    elapsed = time.monotonic() - start
+
+    assert 0.15 <= elapsed < 0.5
+    assert limiter.metrics()['requests'] == 5
+
+
+def test_concurrency_cap_across_threads_and_coroutines():
+    """Test that threads and coroutines sharing a limiter respect its concurrency cap."""
+    limiter = TokenBucketLimiter('test', requests_per_minute=60000, burst=100, max_concurrency=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def enter():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+
+    def leave():
+        nonlocal active
+        with lock:
+            active -= 1
+
+    def worker():
+        with limiter:
+            enter()
+            time.sleep(0.05)
+            leave()
+
+    async def coroutine_worker():
+        async with limiter:
+            enter()
+            await asyncio.sleep(0.05)
+            leave()
+
+    async def run_coroutines():
+        await asyncio.gather(*[coroutine_worker() for _ in range(4)])
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    threads.append(threading.Thread(target=asyncio.run, args=(run_coroutines(),)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert limiter.metrics()['requests'] == 8
+
+
+def test_throttling_halves_rate_and_success_recovers():
+    """Test AIMD adaptation of the rate."""
+    limiter = TokenBucketLimiter('test', requests_per_minute=600, burst=5)
+    with pytest.raises(FakeHTTPError):
+        with limiter:
+            raise FakeHTTPError(429)
+    assert limiter.rate == pytest.approx(5.0)
+    assert limiter.metrics()['throttled'] == 1
+
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == pytest.approx(10.0)
+
+
+def test_retry_honours_retry_after_and_skips_client_errors():
+    """Test that Retry-After bounds the backoff and 4xx errors are not retried."""
+    calls = []
+
+    @retry_with_exponential_backoff(max_retries=3, base_delay=0.0)
+    def throttled():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            raise FakeHTTPError(429, retry_after=0.2)
+        return 'ok'
+
+    assert throttled() == 'ok'
+    assert calls[1] - calls[0] >= 0.2
+
+    attempts = 0
+
+    @retry_with_exponential_backoff(max_retries=3, base_delay=0.0)
+    def bad_request():
+        nonlocal attempts
+        attempts += 1
+        raise FakeHTTPError(400)
+
+    with pytest.raises(FakeHTTPError):
+        bad_request()
+    assert attempts == 1
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test script to verify line-level episode manifests and incremental re-rendering.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+import podcast_llm.text_to_speech as text_to_speech
+from podcast_llm.text_to_speech import convert_to_speech, pack_line_blocks, rerender_speech
+from podcast_llm.tts.sine import SineTTSProvider
+from podcast_llm.utils.audio_formats import read_wav
+from podcast_llm.utils.episode_manifest import EpisodeManifest, manifest_path_for
+from podcast_llm.utils.text import parse_markdown_script
+
+
+SCRIPT = [
+    {'speaker': 'Interviewer', 'text': 'Welcome to the show.'},
+    {'speaker': 'Interviewee', 'text': 'Thanks for having me.'},
+    {'speaker': 'Interviewer', 'text': 'What are you working on?'},
+    {'speaker': 'Interviewee', 'text': 'A podcast generator.'},
+]
+
+
+@pytest.fixture
+def episode(tmp_path, monkeypatch):
+    """Render SCRIPT with the sine provider into a stream-copied WAV episode, counting TTS requests."""
+    # WAV stream copying needs neither ffmpeg nor ffprobe
+    monkeypatch.setattr(text_to_speech, 'check_audio_dependencies', lambda: None)
+    synthesized = []
+    render = SineTTSProvider.render
+    monkeypatch.setattr(SineTTSProvider, 'render',
+                        lambda self, batch: synthesized.append(batch) or render(self, batch))
+
+    config = SimpleNamespace(
+        tts_provider='sine',
+        tts_settings={'sine': {'chars_per_second': 100}},
+        tts_cache={'enabled': False},
+        cache_dir=str(tmp_path / 'cache'),
+        audio_settings={'publish_segments': False, 'silence_ms': 100},
+        rate_limits={}
+    )
+    output_file = str(tmp_path / 'episode.wav')
+    convert_to_speech(config, SCRIPT, output_file, str(tmp_path), 'wav')
+    synthesized.clear()
+    return SimpleNamespace(config=config, output_file=output_file, synthesized=synthesized, tmp_path=tmp_path)
+
+
+def read_episode(output_file):
+    with open(output_file, 'rb') as f:
+        return read_wav(f.read())
+
+
+def test_line_blocks_cover_merged_and_split_lines():
+    """Test that blocks contain whole lines when lines are merged or split into requests."""
+    lines = [
+        {'speaker': 'Interviewer', 'text': 'Right.'},
+        {'speaker': 'Interviewer', 'text': 'And then?'},
+        {'speaker': 'Interviewee', 'text': 'One sentence. Another sentence.'},
+        {'speaker': 'Interviewer', 'text': 'Ok.'},
+    ]
+    blocks = pack_line_blocks(lines, max_chars=20)
+
+    assert [list(line_range) for line_range, _ in blocks] == [[0, 1], [2], [3]]
+    assert [len(requests) for _, requests in blocks] == [1, 2, 1]
+
+
+def test_parse_markdown_script_reads_edited_lines():
+    """Test that script lines are read back, joining wrapped text and ignoring the outline."""
+    markdown = ('# Topic\n\n## Outline\n\n**Not**: a line\n\n## Script\n\n'
+                '**Interviewer**: Hello\nthere.\n\n**Interviewee**: Hi!\n\n')
+
+    assert parse_markdown_script(markdown) == [
+        {'speaker': 'Interviewer', 'text': 'Hello there.'},
+        {'speaker': 'Interviewee', 'text': 'Hi!'},
+    ]
+
+
+def test_manifest_records_segment_offsets(episode):
+    """Test that the manifest maps every line to a segment with its position in the output."""
+    manifest = EpisodeManifest.load(manifest_path_for(episode.output_file))
+    info, _, frames = read_episode(episode.output_file)
+
+    assert manifest.stream_copy and manifest.lines == SCRIPT
+    assert manifest.payload_bytes == len(frames)
+    segments = [segment for block in manifest.blocks for segment in block.segments]
+    assert [segment.start for segment in segments] == pytest.approx([0.0, 0.3, 0.61, 0.95])
+    assert segments[-1].offset + segments[-1].length == len(frames)
+
+
+def test_rerender_synthesizes_only_edited_lines(episode):
+    """Test that a typo fix synthesizes one request and keeps the other lines' audio byte for byte."""
+    _, _, old_frames = read_episode(episode.output_file)
+    old = EpisodeManifest.load(manifest_path_for(episode.output_file)).blocks
+    edited = [dict(line) for line in SCRIPT]
+    edited[2]['text'] = 'What are you building?'
+
+    counts = rerender_speech(episode.config, edited, episode.output_file, str(episode.tmp_path), 'wav')
+
+    assert counts == {'reused_blocks': 3, 'synthesized_blocks': 1, 'synthesized_requests': 1}
+    assert episode.synthesized == [[edited[2]]]
+    info, _, frames = read_episode(episode.output_file)
+    assert info.duration == pytest.approx(0.2 + 0.21 + 0.22 + 0.2 + 3 * 0.1)
+    new = EpisodeManifest.load(manifest_path_for(episode.output_file))
+    assert new.lines == edited
+    for index in (0, 1, 3):
+        old_segment, new_segment = old[index].segments[0], new.blocks[index].segments[0]
+        assert (frames[new_segment.offset:new_segment.offset + new_segment.length]
+                == old_frames[old_segment.offset:old_segment.offset + old_segment.length])
+
+
+def test_rerender_handles_inserted_lines(episode):
+    """Test that inserting a line leaves the surrounding blocks untouched."""
+    edited = SCRIPT[:2] + [{'speaker': 'Interviewee', 'text': 'Really.'}] + SCRIPT[2:]
+
+    counts = rerender_speech(episode.config, edited, episode.output_file, str(episode.tmp_path), 'wav')
+
+    assert counts['synthesized_requests'] == 1
+    assert [turn['text'] for batch in episode.synthesized for turn in batch] == ['Really.']
+
+
+def test_failed_render_keeps_previous_episode(episode, monkeypatch):
+    """Test that a render failing midway leaves the old output file and manifest untouched."""
+    with open(episode.output_file, 'rb') as f:
+        old_audio = f.read()
+    with open(manifest_path_for(episode.output_file), 'rb') as f:
+        old_manifest = f.read()
+    render = SineTTSProvider.render
+
+    def fail_on_last_line(self, batch):
+        if batch[-1]['text'] == 'A podcast generator!':
+            raise ValueError('quota exceeded')
+        return render(self, batch)
+
+    monkeypatch.setattr(SineTTSProvider, 'render', fail_on_last_line)
+    episode.config.rate_limits = {'sine': {'max_retries': 0}}
+    edited = [dict(line, text=line['text'][:-1] + '!') for line in SCRIPT]
+
+    with pytest.raises(ValueError):
+        convert_to_speech(episode.config, edited, episode.output_file, str(episode.tmp_path), 'wav')
+
+    with open(episode.output_file, 'rb') as f:
+        assert f.read() == old_audio
+    with open(manifest_path_for(episode.output_file), 'rb') as f:
+        assert f.read() == old_manifest
+    assert not [name for name in os.listdir(episode.tmp_path) if name.endswith('.tmp')]
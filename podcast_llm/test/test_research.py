@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test script to verify concurrent research downloads, URL deduplication and the research caches.
+"""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+from langchain_core.documents import Document
+
+import podcast_llm.research as research
+from podcast_llm.models import SearchQueries, SearchQuery, WikipediaPage, WikipediaPages
+from podcast_llm.research import download_wikipedia_articles, search_and_download_async
+from podcast_llm.utils.concurrency import run_sync
+from podcast_llm.utils.disk_cache import DiskCache
+from podcast_llm.utils.rate_limits import reset_limiters
+
+
+SEARCH_RESULTS = {
+    'jazz history': ['https://Example.com/jazz/', 'https://example.com/bebop#top', 'https://example.com/a.pdf'],
+    'bebop': ['https://example.com/bebop', 'https://example.com/jazz'],
+    'swing': ['https://example.com/swing'],
+}
+
+
+class InFlight:
+    """Counts calls and the most calls running at the same time."""
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, value):
+        with self.lock:
+            self.calls.append(value)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+
+
+@pytest.fixture
+def config(tmp_path):
+    reset_limiters()
+    yield SimpleNamespace(
+        tavily_api_key='tvly-test',
+        cache_dir=str(tmp_path),
+        research_cache={'enabled': True, 'max_size_mb': 1, 'ttl_hours': 1},
+        rate_limits={service: {'requests_per_minute': 60000, 'burst': 100, 'max_concurrency': 4}
+                     for service in ('wikipedia', 'tavily', 'web')}
+    )
+    reset_limiters()
+
+
+@pytest.fixture
+def services(monkeypatch):
+    """Stub Tavily, web page extraction and Wikipedia, recording concurrent calls."""
+    searches, downloads, articles = InFlight(), InFlight(), InFlight()
+
+    class FakeTavilyClient:
+        def __init__(self, api_key):
+            pass
+
+        def search(self, query, exclude_domains, max_results):
+            searches(query)
+            return {'results': [{'url': url} for url in SEARCH_RESULTS[query]]}
+
+    def extract(url):
+        downloads(url)
+        return Document(page_content=f'text of {url}', metadata={'url': url})
+
+    class FakeWikipediaRetriever:
+        def invoke(self, page_name):
+            articles(page_name)
+            return [Document(page_content=f'article on {page_name}', metadata={'title': page_name})]
+
+    monkeypatch.setattr(research, 'tavily', SimpleNamespace(TavilyClient=FakeTavilyClient))
+    monkeypatch.setattr(research, '_extract_web_document', extract)
+    monkeypatch.setattr(research, 'WikipediaRetriever', FakeWikipediaRetriever)
+    return SimpleNamespace(searches=searches, downloads=downloads, articles=articles)
+
+
+QUERIES = SearchQueries(queries=[SearchQuery(query=query) for query in SEARCH_RESULTS])
+
+
+def test_searches_and_downloads_run_concurrently_and_dedup_urls(config, services):
+    """Test that queries and page downloads overlap and each normalized URL is fetched once."""
+    documents = run_sync(search_and_download_async(config, QUERIES))
+
+    assert sorted(services.searches.calls) == sorted(SEARCH_RESULTS)
+    assert services.searches.max_running == 3
+    # One spelling of each page is downloaded, whichever query found it first; PDFs are skipped
+    normalized = sorted(research._normalize_url(url) for url in services.downloads.calls)
+    assert normalized == ['https://example.com/bebop', 'https://example.com/jazz', 'https://example.com/swing']
+    assert services.downloads.max_running > 1
+    assert len(documents) == 3
+
+
+def test_repeated_research_is_served_from_cache(config, services):
+    """Test that a second run makes no search, download or Wikipedia requests."""
+    pages = WikipediaPages(pages=[WikipediaPage(name='Jazz'), WikipediaPage(name='Bebop'), WikipediaPage(name='Jazz')])
+    first_articles = download_wikipedia_articles(pages, config)
+    first_documents = run_sync(search_and_download_async(config, QUERIES))
+    assert sorted(services.articles.calls) == ['Bebop', 'Jazz']
+
+    for calls in (services.searches, services.downloads, services.articles):
+        calls.calls.clear()
+    second_articles = download_wikipedia_articles(pages, config)
+    second_documents = run_sync(search_and_download_async(config, QUERIES))
+
+    assert (services.searches.calls, services.downloads.calls, services.articles.calls) == ([], [], [])
+    assert [doc.page_content for doc in second_articles] == [doc.page_content for doc in first_articles]
+    assert sorted(doc.page_content for doc in second_documents) == sorted(doc.page_content for doc in first_documents)
+
+
+def test_disk_cache_entries_expire_and_are_evicted_by_size(tmp_path):
+    """Test per-entry expiry and that the oldest entries are deleted beyond the size limit."""
+    cache = DiskCache(str(tmp_path), 'web', ttl_s=0.05)
+    cache.set('a', 'x' * 10)
+    time.sleep(0.1)
+    assert cache.get('a') is None
+    assert list(cache.cache_dir.iterdir()) == []
+
+    cache = DiskCache(str(tmp_path), 'tavily', max_bytes=50)
+    for key in ('b', 'c', 'd'):
+        cache.set(key, key * 20)
+        time.sleep(0.01)
+    assert cache.get('b') is None
+    assert (cache.get('c'), cache.get('d')) == ('c' * 20, 'd' * 20)
+    assert sum(entry.stat().st_size for entry in cache.cache_dir.iterdir()) <= 50
+
+
+def test_research_cache_settings(config):
+    """Test that get_research_cache applies the configured bounds or disables caching."""
+    cache = research.get_research_cache(config, 'web')
+    assert (cache.enabled, cache.ttl_s, cache.max_bytes) == (True, 3600, 1024 * 1024)
+
+    config.research_cache = {'enabled': False}
+    assert not research.get_research_cache(config, 'web').enabled
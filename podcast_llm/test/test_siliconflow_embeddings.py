@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script to verify request batching and chunk pooling of the SiliconFlow embeddings client.
+"""
+
+import os
+import sys
+import threading
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pytest
+
+from podcast_llm.utils.siliconflow_embeddings import SiliconFlowEmbeddings
+
+
+def fake_vector(text):
+    return [float(len(text)), float(text.count('a'))]
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self.data = data
+        self.text = 'bad request'
+
+    def json(self):
+        return {'data': self.data}
+
+
+class FakeSession:
+    """Stands in for the pooled HTTP session, answering with items in reverse index order."""
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def post(self, url, json, timeout):
+        with self.lock:
+            self.requests.append(list(json['input']))
+        if self.fail_on & set(json['input']):
+            return FakeResponse(400)
+        data = [{'index': i, 'embedding': fake_vector(text)} for i, text in enumerate(json['input'])]
+        return FakeResponse(200, list(reversed(data)))
+
+
+def make_embeddings(session, **kwargs):
+    embeddings = SiliconFlowEmbeddings(api_key='sk-test', max_retries=0, **kwargs)
+    embeddings.session = session
+    return embeddings
+
+
+def test_batches_keep_input_order_and_deduplicate():
+    """Test that texts are sent once each in bounded batches and returned in input order."""
+    session = FakeSession()
+    embeddings = make_embeddings(session, max_batch_size=2)
+    texts = ['t0', 'aa1', 't2', 'aa1', 't3', 'a4']
+
+    result = embeddings.embed_documents(texts)
+
+    assert result == [fake_vector(text) for text in texts]
+    assert sorted(session.requests) == [['a4'], ['t0', 'aa1'], ['t2', 't3']]
+    assert make_embeddings(session).embed_query('t0') == fake_vector('t0')
+
+
+def test_requests_are_retried_by_one_layer_only():
+    """Test that the pooled session does not retry on its own below the backoff retries."""
+    embeddings = SiliconFlowEmbeddings(api_key='sk-test', max_retries=5)
+    assert embeddings.session.get_adapter('https://').max_retries.total == 0
+
+
+def test_long_texts_are_pooled_by_chunk_length():
+    """Test that a long text's embedding is the length-weighted average of its chunks."""
+    session = FakeSession()
+    embeddings = make_embeddings(session, max_tokens=100)
+    text = ' '.join(['banana'] * 50 + ['kiwi'] * 60)
+    chunks = embeddings.text_splitter.split_text(text)
+    assert len(chunks) > 1 and len({len(chunk) for chunk in chunks}) > 1
+
+    [result] = embeddings.embed_documents([text])
+
+    expected = np.average([fake_vector(chunk) for chunk in chunks], axis=0,
+                          weights=[len(chunk) for chunk in chunks])
+    assert result == pytest.approx(expected.tolist())
+
+
+def test_failed_chunks_are_skipped_but_failed_texts_raise():
+    """Test that a failed chunk is left out of its text's average and a failed short text raises."""
+    session = FakeSession()
+    embeddings = make_embeddings(session, max_tokens=100, max_batch_size=1)
+    text = ' '.join(['banana'] * 50 + ['kiwi'] * 60)
+    chunks = embeddings.text_splitter.split_text(text)
+    session.fail_on = {chunks[0], 'short'}
+
+    [result] = embeddings.embed_documents([text])
+
+    # Repeated chunks are embedded once, so every copy of the failed chunk is skipped
+    embedded = [chunk for chunk in chunks if chunk != chunks[0]]
+    expected = np.average([fake_vector(chunk) for chunk in embedded], axis=0,
+                          weights=[len(chunk) for chunk in embedded])
+    assert result == pytest.approx(expected.tolist())
+    with pytest.raises(Exception, match='bad request'):
+        embeddings.embed_documents(['short'])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script to verify lazy provider imports and track start-up import time.
+
+Start-up time is measured with ``python -X importtime`` in a fresh interpreter. Set
+PODCAST_LLM_IMPORT_BUDGET_S to tighten the time budget on a known machine.
+"""
+
+import os
+import subprocess
+import sys
+
+# Add the parent directory to the path so we can import podcast_llm modules
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+import pytest
+
+from podcast_llm.utils.lazy_imports import ProviderRegistry, lazy_import
+
+
+# Provider SDKs and parsers that must only be imported when they are used
+DEFERRED_MODULES = [
+    'dashscope',
+    'elevenlabs',
+    'google.cloud.texttospeech',
+    'google.cloud.texttospeech_v1beta1',
+    'langchain_google_genai',
+    'langchain_anthropic',
+    'langchain.hub',
+    'tavily',
+    'newspaper',
+    'markitdown',
+    'youtube_transcript_api',
+    'docx'
+]
+
+IMPORT_BUDGET_S = float(os.getenv('PODCAST_LLM_IMPORT_BUDGET_S', '15'))
+
+
+def import_times(module: str) -> dict:
+    """Import a module in a fresh interpreter and return cumulative import time (s) per module."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def test_generate_defers_provider_imports():
+    """Test that importing the CLI entry point imports no provider SDK and stays within budget."""
+    times = import_times('podcast_llm.generate')
+
+    eagerly_imported = [module for module in DEFERRED_MODULES if module in times]
+    assert eagerly_imported == []
+
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+    print('Slowest imports:', ', '.join(f'{name} {seconds:.2f}s' for name, seconds in slowest))
+    assert times['podcast_llm.generate'] < IMPORT_BUDGET_S
+
+
+def test_lazy_module_imports_on_first_use():
+    """Test that a lazy module is imported on attribute access and accepts module settings."""
+    module = lazy_import('json')
+    assert not module.loaded
+    assert module.dumps([1]) == '[1]'
+    assert module.loaded
+
+    module.lazy_import_test_setting = 1
+    assert module.load().lazy_import_test_setting == 1
+    del module.load().lazy_import_test_setting
+
+
+def test_provider_registry_resolves_targets():
+    """Test lookup of registered providers and the error for unknown ones."""
+    registry = ProviderRegistry('test provider', {'json': 'json:JSONDecoder'})
+    assert 'json' in registry
+    assert registry.get('json').__name__ == 'JSONDecoder'
+
+    with pytest.raises(ValueError, match="test provider value 'xml' is not supported"):
+        registry.get('xml')
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script to verify telemetry spans, their propagation across threads and the exports.
+"""
+
+import concurrent.futures
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from podcast_llm.utils.concurrency import submit_with_context
+from podcast_llm.utils.pipeline import Pipeline
+from podcast_llm.utils.rate_limits import retry_with_exponential_backoff
+from podcast_llm.utils.telemetry import TelemetryRecorder, add_to_span, record_episode, span
+
+
+def telemetry_config(tmp_path):
+    return SimpleNamespace(telemetry={'enabled': True, 'output_dir': str(tmp_path)})
+
+
+def test_spans_nest_across_pipeline_stages_and_workers(tmp_path):
+    """Test that calls made in stage worker threads are children of their stage span."""
+    def synthesize(script):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [submit_with_context(executor, call_tts, line) for line in script]
+            return [future.result() for future in futures]
+
+    def call_tts(line):
+        with span('tts.synthesize', kind='tts', chars=len(line)) as tts_span:
+            tts_span.set(bytes=10 * len(line))
+        return line
+
+    pipeline = Pipeline()
+    pipeline.add_stage('script', lambda: ['hello', 'world!'])
+    pipeline.add_stage('audio', synthesize, inputs=['script'])
+    with record_episode(telemetry_config(tmp_path), 'episode') as recorder:
+        pipeline.run()
+
+    spans = {s.name: s for s in recorder.spans}
+    assert spans['audio'].parent_id == spans['episode'].span_id
+    tts_spans = [s for s in recorder.spans if s.name == 'tts.synthesize']
+    assert [s.parent_id for s in tts_spans] == [spans['audio'].span_id] * 2
+    assert {s.trace_id for s in recorder.spans} == {recorder.trace_id}
+
+    operation = recorder.summary()['operations']['tts.synthesize']
+    assert (operation['count'], operation['chars'], operation['bytes']) == (2, 11, 110)
+    assert set(recorder.summary()['stages']) == {'script', 'audio'}
+
+
+def test_retries_and_errors_are_counted_on_the_enclosing_span():
+    """Test that backoff retries are added to the span around the retried call."""
+    attempts = []
+
+    @retry_with_exponential_backoff(max_retries=2, base_delay=0.0, max_delay=0.0)
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError('reset')
+        return 'ok'
+
+    recorder = TelemetryRecorder('episode')
+    with span('llm.invoke', kind='llm') as llm_span:
+        llm_span._recorder = recorder
+        flaky()
+        add_to_span(limiter_wait_s=0.25)
+    with pytest.raises(ValueError):
+        with span('llm.invoke', kind='llm') as failed:
+            failed._recorder = recorder
+            raise ValueError('bad request')
+
+    assert llm_span.attributes == {'retries': 2, 'limiter_wait_s': 0.25}
+    assert (failed.status, failed.error) == ('error', 'ValueError: bad request')
+    assert recorder.summary()['operations']['llm.invoke']['errors'] == 1
+
+
+def test_record_episode_writes_jsonl_otlp_and_summary(tmp_path):
+    """Test the exported files of an episode."""
+    with record_episode(telemetry_config(tmp_path), 'episode'):
+        with span('llm.invoke', kind='llm', model='gpt-4o', tokens_in=100, tokens_out=20, cached=False):
+            pass
+
+    spans_file = next(tmp_path.glob('episode_*.spans.jsonl'))
+    lines = [json.loads(line) for line in spans_file.read_text().splitlines()]
+    assert [line['name'] for line in lines] == ['llm.invoke', 'episode']
+
+    otlp = json.loads(next(tmp_path.glob('episode_*.otlp.json')).read_text())
+    otlp_spans = otlp['resourceSpans'][0]['scopeSpans'][0]['spans']
+    llm, episode = otlp_spans
+    assert len(llm['traceId']) == 32 and len(llm['spanId']) == 16
+    assert llm['parentSpanId'] == episode['spanId'] and 'parentSpanId' not in episode
+    assert llm['kind'] == 3 and episode['kind'] == 1
+    attributes = {a['key']: a['value'] for a in llm['attributes']}
+    assert attributes['tokens_in'] == {'intValue': '100'}
+    assert attributes['cached'] == {'boolValue': False}
+    assert int(llm['endTimeUnixNano']) >= int(llm['startTimeUnixNano'])
+
+    summary = json.loads(next(tmp_path.glob('episode_*.summary.json')).read_text())
+    assert summary['llm_models'] == {'gpt-4o': {'calls': 1, 'tokens_in': 100, 'tokens_out': 20}}
+
+
+def test_disabled_telemetry_records_nothing(tmp_path):
+    """Test that spans outside an enabled episode are discarded."""
+    config = SimpleNamespace(telemetry={'enabled': False, 'output_dir': str(tmp_path)})
+    with record_episode(config, 'episode') as recorder:
+        with span('web.fetch', kind='web'):
+            pass
+
+    assert recorder is None
+    assert list(tmp_path.iterdir()) == []
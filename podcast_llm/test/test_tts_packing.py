@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test script to verify conversation lines are packed into TTS requests within provider limits.
+"""
+
+import os
+import sys
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from podcast_llm.text_to_speech import pack_utterances, split_text
+
+
+def test_consecutive_lines_are_combined_up_to_the_limit():
+    """Test that same-speaker lines share a request only while they fit."""
+    lines = [
+        {'speaker': 'Interviewer', 'text': 'Right.'},
+        {'speaker': 'Interviewer', 'text': 'And then?'},
+        {'speaker': 'Interviewee', 'text': 'Well.'},
+        {'speaker': 'Interviewee', 'text': 'x' * 20},
+    ]
+    requests = pack_utterances(lines, max_chars=20)
+
+    assert requests == [
+        [{'speaker': 'Interviewer', 'text': 'Right. And then?'}],
+        [{'speaker': 'Interviewee', 'text': 'Well.'}],
+        [{'speaker': 'Interviewee', 'text': 'x' * 20}],
+    ]
+
+
+def test_multi_speaker_requests_group_turns():
+    """Test that multi-speaker providers get several turns per request."""
+    lines = [{'speaker': 'Interviewer' if i % 2 else 'Interviewee', 'text': f'Line {i}.'} for i in range(5)]
+    requests = pack_utterances(lines, max_chars=1000, multi_speaker=True, max_turns=2)
+
+    assert [len(turns) for turns in requests] == [2, 2, 1]
+
+
+def test_long_lines_split_at_sentence_boundaries():
+    """Test that overlong text is split between sentences and pieces respect byte limits."""
+    text = '第一句话。第二句话！Third sentence here. Fourth.'
+    pieces = split_text(text, max_bytes=30)
+
+    assert all(len(piece.encode('utf-8')) <= 30 for piece in pieces)
+    assert ''.join(pieces).replace(' ', '') == text.replace(' ', '')
+    assert pieces[0] == '第一句话。'
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the TTS provider registry and the offline sine-wave provider.
+"""
+
+import asyncio
+import io
+import os
+import sys
+import threading
+import wave
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from podcast_llm.text_to_speech import (
+    check_ffmpeg_available,
+    convert_to_speech,
+    get_tts_limits,
+    get_tts_text_limits,
+    stream_segments,
+    synthesize_segments
+)
+from podcast_llm.tts import TTS_PROVIDERS, get_tts_provider
+from podcast_llm.tts.sine import SineTTSProvider
+from podcast_llm.utils.rate_limits import reset_limiters
+
+
+def make_config(tmp_path, **sine_settings):
+    return SimpleNamespace(
+        tts_provider='sine',
+        tts_settings={'sine': {'chars_per_second': 100, **sine_settings}},
+        tts_cache={'enabled': False},
+        cache_dir=str(tmp_path / 'cache'),
+        audio_settings={'publish_segments': False},
+        rate_limits={'sine': {'max_concurrency': 2}}
+    )
+
+
+def wav_duration(audio: bytes) -> float:
+    with wave.open(io.BytesIO(audio)) as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def test_registry_knows_every_provider():
+    """Test that all configurable providers are registered, and unknown ones are rejected."""
+    assert set(TTS_PROVIDERS.names()) == {
+        'google', 'google_multispeaker', 'elevenlabs', 'dashscope', 'siliconcloud', 'sine'
+    }
+    with pytest.raises(ValueError):
+        get_tts_provider(SimpleNamespace(tts_provider='nope', tts_settings={}))
+
+
+def test_limits_come_from_provider_and_config(tmp_path):
+    """Test that declared limits apply unless the config overrides them."""
+    config = make_config(tmp_path, max_chars=50)
+    provider = get_tts_provider(config)
+
+    assert get_tts_text_limits(config, provider)['max_chars'] == 50
+    limits = get_tts_limits(config, provider)
+    assert limits['max_concurrency'] == 2
+    assert limits['requests_per_minute'] == provider.limits.requests_per_minute
+
+
+def test_sine_provider_synthesizes_async_and_sync(tmp_path):
+    """Test that both interfaces return WAV audio whose length follows the text."""
+    provider = get_tts_provider(make_config(tmp_path))
+    batch = [{'speaker': 'Interviewer', 'text': 'x' * 50}]
+
+    assert wav_duration(asyncio.run(provider.synthesize(batch))) == pytest.approx(0.5)
+    assert provider.synthesize_sync(batch) == provider.render(batch)
+
+
+def test_scheduler_returns_segments_in_order(tmp_path):
+    """Test concurrent synthesis with simulated latency keeps request order."""
+    config = make_config(tmp_path, latency_ms=20)
+    batches = [[{'speaker': 'Interviewee', 'text': 'x' * (10 * (i + 1))}] for i in range(6)]
+
+    durations = [wav_duration(audio) for audio in synthesize_segments(config, batches)]
+    assert durations == pytest.approx([0.1 * (i + 1) for i in range(6)])
+
+
+def test_scheduler_keeps_requests_in_flight_within_max_concurrency(tmp_path, monkeypatch):
+    """Test that streamed segments keep request order while at most max_concurrency requests run."""
+    config = make_config(tmp_path, latency_ms=30)
+    config.rate_limits = {'sine': {'max_concurrency': 3, 'requests_per_minute': 60000, 'burst': 100}}
+    in_flight = {'running': 0, 'max_running': 0}
+    lock = threading.Lock()
+    synthesize = SineTTSProvider.synthesize
+
+    async def counting_synthesize(self, batch):
+        with lock:
+            in_flight['running'] += 1
+            in_flight['max_running'] = max(in_flight['max_running'], in_flight['running'])
+        try:
+            return await synthesize(self, batch)
+        finally:
+            with lock:
+                in_flight['running'] -= 1
+
+    monkeypatch.setattr(SineTTSProvider, 'synthesize', counting_synthesize)
+    reset_limiters()
+    try:
+        requests = (([{'speaker': 'Interviewer', 'text': 'x' * (10 * (i + 1))}], None) for i in range(12))
+        durations = [wav_duration(audio) for audio in stream_segments(config, requests)]
+    finally:
+        reset_limiters()
+
+    assert durations == pytest.approx([0.1 * (i + 1) for i in range(12)])
+    assert in_flight['max_running'] == 3
+
+
+@pytest.mark.skipif(not check_ffmpeg_available(), reason='FFmpeg and FFprobe are required')
+def test_convert_to_speech_offline(tmp_path):
+    """Test a full synthesis and encoding run without network access."""
+    output_file = str(tmp_path / 'episode.wav')
+    script = [
+        {'speaker': 'Interviewer', 'text': 'Welcome to the show.'},
+        {'speaker': 'Interviewee', 'text': 'Thanks for having me.'}
+    ]
+    convert_to_speech(make_config(tmp_path), script, output_file, str(tmp_path / 'temp'), 'wav')
+
+    with open(output_file, 'rb') as f:
+        assert wav_duration(f.read()) == pytest.approx(0.41, abs=0.05)
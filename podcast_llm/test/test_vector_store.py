@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the persistent vector store reuses stored embeddings.
+"""
+
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+
+# Add the parent directory to the path so we can import podcast_llm modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from langchain_core.embeddings import Embeddings
+
+from podcast_llm.utils.vector_store import PersistentVectorStore
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic bag-of-letters embeddings that count how many texts were embedded."""
+    def __init__(self):
+        self.embedded = 0
+        self.calls = 0
+        self.queries = 0
+
+    def _vector(self, text):
+        vector = [0.0] * 26
+        for c in text.lower():
+            if 'a' <= c <= 'z':
+                vector[ord(c) - ord('a')] += 1.0
+        return vector
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        self.embedded += len(texts)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        self.queries += 1
+        return self._vector(text)
+
+
+def test_only_new_chunks_are_embedded(tmp_path):
+    """Test that a second store on the same path only embeds unseen chunks."""
+    persist_path = str(tmp_path / 'store')
+    embeddings = CountingEmbeddings()
+
+    PersistentVectorStore.from_texts(['apple pie', 'banana split'], embeddings, persist_path=persist_path)
+    assert embeddings.embedded == 2
+
+    store = PersistentVectorStore.from_texts(
+        ['apple pie', 'banana split', 'cherry tart'], embeddings, persist_path=persist_path
+    )
+    assert embeddings.embedded == 3
+    assert len(store.similarity_search('anything', k=10)) == 3
+
+
+def test_stored_chunks_are_keyed_by_model(tmp_path):
+    """Test that chunks embedded by another model behind the same client are not reused."""
+    persist_path = str(tmp_path / 'store')
+    old_model, new_model = CountingEmbeddings(), CountingEmbeddings()
+    old_model.model, new_model.model = 'letters-v1', 'letters-v2'
+
+    PersistentVectorStore.from_texts(['apple pie'], old_model, persist_path=persist_path)
+    PersistentVectorStore.from_texts(['apple pie'], new_model, persist_path=persist_path)
+    assert (old_model.embedded, new_model.embedded) == (1, 1)
+
+
+def test_unused_chunks_expire(tmp_path):
+    """Test that chunks not used within ttl_s are dropped when the store is next saved."""
+    persist_path = str(tmp_path / 'store')
+    embeddings = CountingEmbeddings()
+    PersistentVectorStore.from_texts(['apple pie'], embeddings, persist_path=persist_path)
+    time.sleep(0.1)
+
+    PersistentVectorStore.from_texts(['banana split'], embeddings, persist_path=persist_path, ttl_s=0.05)
+    PersistentVectorStore.from_texts(['apple pie', 'banana split'], embeddings, persist_path=persist_path)
+    assert embeddings.embedded == 3
+
+
+def test_least_recently_used_chunks_are_evicted_beyond_max_bytes(tmp_path):
+    """Test that the store keeps the chunks in use and the most recently used others."""
+    persist_path = str(tmp_path / 'store')
+    embeddings = CountingEmbeddings()
+    for text in ('apple pie', 'banana split', 'cherry tart'):
+        PersistentVectorStore.from_texts([text], embeddings, persist_path=persist_path)
+        time.sleep(0.01)
+
+    # Each chunk takes a little over 400 bytes: room for this episode's chunk and one more
+    PersistentVectorStore.from_texts(['date loaf'], embeddings, persist_path=persist_path, max_bytes=1000)
+    assert embeddings.embedded == 4
+
+    PersistentVectorStore.from_texts(['cherry tart', 'date loaf'], embeddings, persist_path=persist_path)
+    assert embeddings.embedded == 4
+    PersistentVectorStore.from_texts(['apple pie', 'banana split'], embeddings, persist_path=persist_path)
+    assert embeddings.embedded == 6
+
+
+def test_embeddings_are_requested_in_batches(tmp_path):
+    """Test that new chunks are embedded in batch_size calls."""
+    embeddings = CountingEmbeddings()
+    PersistentVectorStore.from_texts(
+        [f'text {i}' for i in range(10)], embeddings, persist_path=str(tmp_path / 'store'), batch_size=4
+    )
+    assert embeddings.calls == 3
+
+
+def test_search_returns_most_similar_active_documents(tmp_path):
+    """Test top-k ordering and that only active documents are searched."""
+    persist_path = str(tmp_path / 'store')
+    embeddings = CountingEmbeddings()
+    PersistentVectorStore.from_texts(['zzz zzz'], embeddings, persist_path=persist_path)
+
+    store = PersistentVectorStore.from_texts(['aaa', 'aab', 'bbb'], embeddings, persist_path=persist_path)
+    results = store.similarity_search_with_score('aaa', k=2)
+
+    assert [doc.page_content for doc, _ in results] == ['aaa', 'aab']
+    assert results[0][1] > results[1][1]
+
+
+def test_repeated_queries_reuse_embedding_and_results(tmp_path):
+    """Test that a repeated query is embedded once and new documents invalidate results."""
+    embeddings = CountingEmbeddings()
+    store = PersistentVectorStore.from_texts(['aaa', 'bbb'], embeddings, persist_path=str(tmp_path / 'store'))
+
+    first = store.similarity_search('aaa', k=1)
+    assert store.similarity_search(' aaa ', k=1) == first
+    assert embeddings.queries == 1
+    assert store.cache_stats()['result_hits'] == 1
+
+    store.add_texts(['aaaa'])
+    assert [doc.page_content for doc in store.similarity_search('aaa', k=2)] == ['aaa', 'aaaa']
+    assert embeddings.queries == 1
+
+
+def test_mmr_prefers_diverse_documents(tmp_path):
+    """Test that MMR skips a near-duplicate of an already selected document."""
+    embeddings = CountingEmbeddings()
+    store = PersistentVectorStore.from_texts(
+        ['aaaa b', 'aaaa bb', 'aaa c'], embeddings, persist_path=str(tmp_path / 'store')
+    )
+
+    similar = store.similarity_search('aaaa b', k=2)
+    diverse = store.max_marginal_relevance_search('aaaa b', k=2, fetch_k=3, lambda_mult=0.3)
+
+    assert [doc.page_content for doc in similar] == ['aaaa b', 'aaaa bb']
+    assert [doc.page_content for doc in diverse] == ['aaaa b', 'aaa c']
+
+
+class SlowEmbeddings(CountingEmbeddings):
+    """Embeddings that wait for the other writer, so both embed before either saves."""
+    def __init__(self, barrier):
+        super().__init__()
+        self.barrier = barrier
+
+    def embed_documents(self, texts):
+        self.barrier.wait(timeout=5)
+        return super().embed_documents(texts)
+
+
+def test_concurrent_stores_keep_each_others_embeddings(tmp_path):
+    """Test that two stores saving to one path at the same time both end up on disk."""
+    persist_path = str(tmp_path / 'store')
+    PersistentVectorStore.from_texts(['shared chunk'], CountingEmbeddings(), persist_path=persist_path,
+                                     model_name='letters')
+    barrier = threading.Barrier(2)
+    first = PersistentVectorStore(SlowEmbeddings(barrier), persist_path, model_name='letters')
+    second = PersistentVectorStore(SlowEmbeddings(barrier), persist_path, model_name='letters')
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(first.add_texts, ['apple pie', 'banana split']),
+                   executor.submit(second.add_texts, ['cherry tart', 'date loaf'])]
+        for future in futures:
+            future.result()
+
+    embeddings = CountingEmbeddings()
+    store = PersistentVectorStore.from_texts(
+        ['shared chunk', 'apple pie', 'banana split', 'cherry tart', 'date loaf'], embeddings,
+        persist_path=persist_path, model_name='letters'
+    )
+    assert embeddings.embedded == 0
+    assert len(store.similarity_search('anything', k=10)) == 5
+    assert sorted(os.listdir(tmp_path)) == ['store.lock', 'store.npz']
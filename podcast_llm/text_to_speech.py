@@ -2,13 +2,20 @@
 Text-to-speech conversion module for podcast generation.
 
 This module handles the conversion of text scripts into natural-sounding speech using
-multiple TTS providers (Google Cloud TTS and ElevenLabs). It includes functionality for:
+the TTS provider backends in podcast_llm.tts (Google Cloud TTS, ElevenLabs, DashScope,
+SiliconCloud and an offline sine-wave stub). It includes functionality for:
 
-- Rate limiting API requests to stay within provider quotas
+- Concurrent synthesis within per-provider concurrency and rate limits
+- Caching synthesized audio so unchanged lines are not sent to the provider again
 - Exponential backoff retry logic for API resilience 
-- Processing individual conversation lines with appropriate voices
-- Merging multiple audio segments into a complete podcast
-- Managing temporary audio file storage and cleanup
+- Packing conversation lines into requests within the provider's declared limits
+- Negotiating the segment format with the provider so audio is copied into the episode
+  without re-encoding, or delivered losslessly and encoded exactly once
+- Encoding segments into the episode file while later lines are still being synthesized
+- Publishing segments to a progressive playlist for playback during synthesis
+- Re-rendering an edited script by synthesizing only changed lines and splicing them
+  into the existing episode
+- Merging multiple audio files into a complete podcast in a single streaming pass
 
 The module supports different voices for interviewer/interviewee to create natural
 conversational flow and allows configuration of voice settings and audio effects
@@ -26,32 +33,58 @@ Typical usage:
 """
 
 
+import collections
+import concurrent.futures
+import contextvars
 import logging
 import os
+import re
 import shutil
-from io import BytesIO
+import sys
+import tempfile
+import threading
+import wave
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import base64
-import dashscope
-from dashscope.audio.tts import SpeechSynthesizer
-
-from elevenlabs import client as elevenlabs_client
-from google.cloud import texttospeech
-from google.cloud import texttospeech_v1beta1
-from pydub import AudioSegment
-import openai
 
 from podcast_llm.config import PodcastConfig
+from podcast_llm.tts import BaseTTSProvider, get_tts_provider
+from podcast_llm.utils.audio_cache import AudioCache, tts_cache_key
+from podcast_llm.utils.audio_formats import negotiate_segment_format, pcm_to_wav, read_mp3_frames, read_wav
+from podcast_llm.utils.audio_stream import AudioStreamWriter, SegmentBuffer, get_audio_settings
+from podcast_llm.utils.episode_manifest import (
+    EpisodeManifest,
+    ManifestBlock,
+    ManifestSegment,
+    RenderBlock,
+    manifest_path_for,
+    plan_rerender
+)
+from podcast_llm.utils.segment_playlist import SegmentPlaylist, segment_dir_for
+from podcast_llm.utils.concurrency import submit_with_context
 from podcast_llm.utils.rate_limits import (
-    rate_limit_per_minute,
+    get_limiter,
     retry_with_exponential_backoff
 )
+from podcast_llm.utils.telemetry import add_to_span, span
 
 
 logger = logging.getLogger(__name__)
 
 
+# Retry policy used when config.rate_limits has no entry (or an incomplete one) for the
+# TTS provider. Request rates, concurrency and text limits are declared by each provider
+# (see podcast_llm.tts).
+DEFAULT_TTS_RETRIES = {
+    'max_retries': 10,
+    'base_delay': 2.0
+}
+
+# Sentence and clause boundaries (Latin and CJK punctuation) used to split long lines
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?;。！？；…])\s*')
+CLAUSE_BOUNDARY = re.compile(r'(?<=[,:，、：])\s*|\s+')
+
 
 def check_ffmpeg_available():
     """
@@ -104,43 +137,34 @@ def clean_text_for_tts(lines: List) -> List:
 
 
 
-def merge_audio_files(audio_files: list, output_file: str, audio_format: str):
+def merge_audio_files(audio_files: list, output_file: str, audio_format: str, audio_settings: Optional[dict] = None):
     """
     Merge multiple audio files into a single output file.
 
     Takes a list of audio file paths and combines them sequentially into one continuous
-    audio file. Uses pydub library for audio processing and handles different audio
-    formats through the format parameter.
+    audio file. Segments are decoded one at a time and streamed into a single ffmpeg
+    encoder (see AudioStreamWriter), so merging takes linear time and memory does not grow
+    with episode length.
 
     Args:
         audio_files (list): List of paths to audio files to merge
         output_file (str): Path where the merged audio file should be saved
         audio_format (str): Format for the output file (e.g. 'mp3', 'wav')
+        audio_settings (dict, optional): AudioStreamWriter options such as 'silence_ms',
+            'crossfade_ms' and 'normalize' (see get_audio_settings)
 
     Raises:
         Exception: If there are any errors during the merging process
     """
     logger.info("Merging audio files...")
     try:
-        combined = AudioSegment.empty()
-
-        for filename in audio_files:
-            try:
-                audio = AudioSegment.from_file(filename)
-                combined += audio
-            except FileNotFoundError as e:
-                if "ffmpeg" in str(e).lower() or "ffprobe" in str(e).lower():
-                    raise FileNotFoundError(
-                        "FFmpeg/FFprobe not found. Please install FFmpeg and add it to your PATH. "
-                        "Visit https://ffmpeg.org/download.html to download FFmpeg."
-                    ) from e
-                else:
+        with AudioStreamWriter(output_file, audio_format, **(audio_settings or {})) as writer:
+            for filename in audio_files:
+                try:
+                    writer.append(filename)
+                except Exception as e:
+                    logger.error(f"Error processing audio file {filename}: {str(e)}")
                     raise
-            except Exception as e:
-                logger.error(f"Error processing audio file {filename}: {str(e)}")
-                raise
-
-        combined.export(output_file, format=audio_format)
 
         logger.info(f"Successfully merged audio files into {output_file}")
     except Exception as e:
@@ -148,281 +172,602 @@ def merge_audio_files(audio_files: list, output_file: str, audio_format: str):
         raise
 
 
-@retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-@rate_limit_per_minute(max_requests_per_minute=20)
-def process_line_google(config: PodcastConfig, text: str, speaker: str):
+def _fits(text: str, max_chars: Optional[int], max_bytes: Optional[int]) -> bool:
+    if max_chars is not None and len(text) > max_chars:
+        return False
+    if max_bytes is not None and len(text.encode('utf-8')) > max_bytes:
+        return False
+    return True
+
+
+def combine_consecutive_speaker_chunks(chunks: List[dict],
+                                       max_chars: Optional[int] = None,
+                                       max_bytes: Optional[int] = None) -> List[dict]:
+    """
+    Combine consecutive chunks from the same speaker into single chunks.
+    
+    Args:
+        chunks (List[dict]): List of dictionaries containing conversation chunks with structure:
+            {
+                'speaker': str,  # Speaker identifier
+                'text': str      # Text content
+            }
+        max_chars (int, optional): Do not grow a combined chunk beyond this many characters
+        max_bytes (int, optional): Do not grow a combined chunk beyond this many UTF-8 bytes
+    
+    Returns:
+        List[dict]: List of combined chunks where consecutive entries from the same speaker
+                   are merged into single chunks
     """
-    Process a single line of text using Google Text-to-Speech API.
+    combined_chunks = []
+    current_chunk = None
+
+    for chunk in chunks:
+        if current_chunk is None:
+            current_chunk = chunk.copy()
+        elif (current_chunk['speaker'] == chunk['speaker']
+              and _fits(current_chunk['text'] + ' ' + chunk['text'], max_chars, max_bytes)):
+            current_chunk['text'] += ' ' + chunk['text']
+        else:
+            combined_chunks.append(current_chunk)
+            current_chunk = chunk.copy()
+
+    if current_chunk is not None:
+        combined_chunks.append(current_chunk)
+
+    return combined_chunks
 
-    Takes a line of text and speaker identifier and generates synthesized speech using
-    Google's TTS service. Uses different voices based on the speaker to create natural
-    conversation flow.
+
+def split_text(text: str, max_chars: Optional[int] = None, max_bytes: Optional[int] = None) -> List[str]:
+    """
+    Split text that exceeds a TTS request limit into pieces that fit.
+
+    Splits at sentence boundaries, packing as many whole sentences into each piece as
+    fit. Sentences that are too long on their own are split at clause boundaries
+    (commas, whitespace) and, as a last resort, at the limit.
 
     Args:
-        text (str): The text content to convert to speech
-        speaker (str): Speaker identifier to determine voice selection
+        text (str): Text to split
+        max_chars (int, optional): Maximum characters per piece
+        max_bytes (int, optional): Maximum UTF-8 bytes per piece
 
     Returns:
-        bytes: Raw audio data in bytes format containing the synthesized speech
+        List[str]: Pieces in order; the text itself if it already fits
     """
-    client = texttospeech.TextToSpeechClient(client_options={'api_key': config.google_api_key})
-    tts_settings = config.tts_settings['google']
-    
-    interviewer_voice = texttospeech.VoiceSelectionParams(
-        language_code=tts_settings['language_code'],
-        name=tts_settings['voice_mapping']['Interviewer'],
-        ssml_gender=texttospeech.SsmlVoiceGender.FEMALE
-    )
-    
-    interviewee_voice = texttospeech.VoiceSelectionParams(
-        language_code=tts_settings['language_code'],
-        name=tts_settings['voice_mapping']['Interviewee'],
-        ssml_gender=texttospeech.SsmlVoiceGender.MALE
-    )
-    
-    synthesis_input = texttospeech.SynthesisInput(text=text)
-    voice = interviewee_voice
-    if speaker == 'Interviewer':
-        voice = interviewer_voice
-    
-    # Select the type of audio file you want returned
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.MP3,
-        effects_profile_id=tts_settings['effects_profile_id']
-    )
-    
-    # Perform the text-to-speech request on the text input with the selected
-    # voice parameters and audio file type
-    response = client.synthesize_speech(
-        input=synthesis_input, voice=voice, audio_config=audio_config
-    )
-    
-    return response.audio_content
+    if _fits(text, max_chars, max_bytes):
+        return [text]
+
+    def pack(parts: List[str], joiner: str, fallback) -> List[str]:
+        pieces = []
+        current = ''
+        for part in parts:
+            if not part:
+                continue
+            candidate = current + joiner + part if current else part
+            if _fits(candidate, max_chars, max_bytes):
+                current = candidate
+                continue
+            if current:
+                pieces.append(current)
+            if _fits(part, max_chars, max_bytes):
+                current = part
+            else:
+                pieces.extend(fallback(part))
+                current = ''
+        if current:
+            pieces.append(current)
+        return pieces
+
+    def hard_split(part: str) -> List[str]:
+        pieces = []
+        current = ''
+        for char in part:
+            if current and not _fits(current + char, max_chars, max_bytes):
+                pieces.append(current)
+                current = ''
+            current += char
+        if current:
+            pieces.append(current)
+        return pieces
+
+    def split_clauses(sentence: str) -> List[str]:
+        return pack(CLAUSE_BOUNDARY.split(sentence), ' ', hard_split)
+
+    return pack(SENTENCE_BOUNDARY.split(text.strip()), ' ', split_clauses)
+
+
+def pack_utterances(lines: List[dict],
+                    max_chars: Optional[int] = None,
+                    max_bytes: Optional[int] = None,
+                    multi_speaker: bool = False,
+                    max_turns: Optional[int] = None) -> List[List[dict]]:
+    """
+    Pack conversation lines into as few TTS requests as the provider's limits allow.
 
+    Overlong lines are first split at sentence boundaries (see split_text). Consecutive
+    lines from the same speaker are then combined up to the limit (see
+    combine_consecutive_speaker_chunks). For providers that accept several speakers per
+    request, consecutive turns are grouped into one request while the total text and
+    turn count stay within the limits.
 
-@retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-@rate_limit_per_minute(max_requests_per_minute=20)
-def process_line_elevenlabs(config: PodcastConfig, text: str, speaker: str):
+    Args:
+        lines (List[dict]): Conversation lines with 'speaker' and 'text'
+        max_chars (int, optional): Maximum characters per request
+        max_bytes (int, optional): Maximum UTF-8 bytes per request
+        multi_speaker (bool): Whether a request may contain turns from different speakers
+        max_turns (int, optional): Maximum speaker turns per multi-speaker request
+
+    Returns:
+        List[List[dict]]: One list of turns per request, in script order. Requests for
+            single-speaker providers always contain exactly one turn.
     """
-    Process a line of text into speech using ElevenLabs TTS service.
+    pieces = [
+        {'speaker': line['speaker'], 'text': piece}
+        for line in lines
+        for piece in split_text(line['text'], max_chars, max_bytes)
+    ]
+    return _pack_pieces(pieces, max_chars, max_bytes, multi_speaker, max_turns)
+
+
+def _pack_pieces(pieces: List[dict],
+                 max_chars: Optional[int],
+                 max_bytes: Optional[int],
+                 multi_speaker: bool,
+                 max_turns: Optional[int]) -> List[List[dict]]:
+    turns = combine_consecutive_speaker_chunks(pieces, max_chars, max_bytes)
+    if not multi_speaker:
+        return [[turn] for turn in turns]
+
+    requests = []
+    current = []
+    for turn in turns:
+        candidate = ' '.join(t['text'] for t in current + [turn])
+        if current and (not _fits(candidate, max_chars, max_bytes)
+                        or (max_turns is not None and len(current) >= max_turns)):
+            requests.append(current)
+            current = []
+        current.append(turn)
+    if current:
+        requests.append(current)
+    return requests
+
+
+def pack_line_blocks(lines: List[dict],
+                     max_chars: Optional[int] = None,
+                     max_bytes: Optional[int] = None,
+                     multi_speaker: bool = False,
+                     max_turns: Optional[int] = None) -> List[Tuple[range, List[List[dict]]]]:
+    """
+    Pack conversation lines like pack_utterances, grouped into blocks of whole lines.
 
-    Takes a line of text and speaker identifier and generates synthesized speech using
-    ElevenLabs' TTS service. Uses different voices based on the speaker to create natural
-    conversation flow.
+    A block starts with every request that starts at the beginning of a line, so the
+    audio of a block's requests covers exactly the block's lines. Blocks are the unit of
+    reuse when an edited script is re-rendered (see rerender_speech).
 
     Args:
-        config (PodcastConfig): Configuration object containing API keys and settings
-        text (str): The text content to convert to speech
-        speaker (str): Speaker identifier to determine voice selection
+        lines (List[dict]): Conversation lines with 'speaker' and 'text'
+        max_chars (int, optional): Maximum characters per request
+        max_bytes (int, optional): Maximum UTF-8 bytes per request
+        multi_speaker (bool): Whether a request may contain turns from different speakers
+        max_turns (int, optional): Maximum speaker turns per multi-speaker request
 
     Returns:
-        bytes: Raw audio data in bytes format containing the synthesized speech
+        List[Tuple[range, List[List[dict]]]]: Indices of the block's lines and its
+            requests (as returned by pack_utterances), in script order
     """
-    client = elevenlabs_client.ElevenLabs(api_key=config.elevenlabs_api_key)
-    tts_settings = config.tts_settings['elevenlabs']
+    pieces = [
+        {'speaker': line['speaker'], 'text': piece, 'line': index, 'first': position == 0}
+        for index, line in enumerate(lines)
+        for position, piece in enumerate(split_text(line['text'], max_chars, max_bytes))
+    ]
 
-    audio = client.generate(
-        text=text,
-        voice=tts_settings['voice_mapping'][speaker],
-        model=tts_settings['model']
-    )
+    starts, blocks = [], []
+    for request in _pack_pieces(pieces, max_chars, max_bytes, multi_speaker, max_turns):
+        # Merged turns keep the annotations of their first piece
+        if not blocks or request[0]['first']:
+            starts.append(request[0]['line'] if blocks else 0)
+            blocks.append([])
+        blocks[-1].append([{'speaker': turn['speaker'], 'text': turn['text']} for turn in request])
 
-    # Convert audio iterator to bytes that can be written to disk
-    audio_bytes = BytesIO()
-    for chunk in audio:
-        audio_bytes.write(chunk)
-    
-    return audio_bytes.getvalue()
+    ends = starts[1:] + [len(lines)]
+    return [(range(start, end), requests) for start, end, requests in zip(starts, ends, blocks)]
 
 
-@retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-@rate_limit_per_minute(max_requests_per_minute=20)
-def process_line_dashscope(config: PodcastConfig, text: str, speaker: str):
+def get_tts_text_limits(config: PodcastConfig, provider: Optional[BaseTTSProvider] = None) -> dict:
     """
-    Process a line of text into speech using DashScope (ModelScope) TTS service.
+    Get the per-request text limits for the configured TTS provider.
 
-    Takes a line of text and speaker identifier and generates synthesized speech using
-    DashScope's TTS service. Uses different voices based on the speaker to create natural
-    conversation flow.
+    Uses the limits declared by the provider, overridden by 'max_chars', 'max_bytes' and
+    'max_turns' in ``config.tts_settings[config.tts_provider]`` when present.
 
     Args:
-        config (PodcastConfig): Configuration object containing API keys and settings
-        text (str): The text content to convert to speech
-        speaker (str): Speaker identifier to determine voice selection
+        config (PodcastConfig): Configuration object containing the TTS provider and settings
+        provider (BaseTTSProvider, optional): Provider instance. Defaults to the configured one.
 
     Returns:
-        bytes: Raw audio data in bytes format containing the synthesized speech
+        dict: Keyword arguments for pack_utterances
     """
-    dashscope.api_key = config.dashscope_api_key
-    tts_settings = config.tts_settings['dashscope']
-    
-    # Map speakers to voices
-    voice = tts_settings['voice_mapping'].get(speaker, 'Cherry')  # Default to Cherry if not found
-    
-    # Call DashScope TTS API
-    response = SpeechSynthesizer.call(
-        model=os.getenv('OPENAI_MODEL', 'qwen-turbo'),
-        text=text,
-        voice=voice
-    )
-    
-    # Check if the request was successful
-    if response.status_code == 200:
-        # Get the audio data from the response
-        audio_url = response.output.audio.url
-        
-        # Download the audio file
-        import requests
-        audio_response = requests.get(audio_url)
-        if audio_response.status_code == 200:
-            return audio_response.content
-        else:
-            raise Exception(f"Failed to download audio file: {audio_response.status_code}")
-    else:
-        raise Exception(f"DashScope TTS API error: {response.message}")
+    provider = provider or get_tts_provider(config)
+    limits = provider.limits.text_limits()
+    for key in ('max_chars', 'max_bytes', 'max_turns'):
+        if key in provider.settings:
+            limits[key] = provider.settings[key]
+    return limits
 
-@retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-@rate_limit_per_minute(max_requests_per_minute=20)
-def process_line_siliconcloud(config: PodcastConfig, text: str, speaker: str):
+
+def get_tts_limits(config: PodcastConfig, provider: Optional[BaseTTSProvider] = None) -> dict:
     """
-    Process a line of text into speech using SiliconCloud TTS service.
+    Get the rate limits for the configured TTS provider.
 
-    Takes a line of text and speaker identifier and generates synthesized speech using
-    SiliconCloud's TTS service. Uses different voices based on the speaker to create natural
-    conversation flow.
+    Starts from the rate and concurrency declared by the provider and DEFAULT_TTS_RETRIES,
+    overridden by ``config.rate_limits[config.tts_provider]``.
 
     Args:
-        config (PodcastConfig): Configuration object containing API keys and settings
-        text (str): The text content to convert to speech
-        speaker (str): Speaker identifier to determine voice selection
+        config (PodcastConfig): Configuration object containing rate limits
+        provider (BaseTTSProvider, optional): Provider instance. Defaults to the configured one.
 
     Returns:
-        bytes: Raw audio data in bytes format containing the synthesized speech
+        dict: Limits with 'requests_per_minute', 'burst', 'max_concurrency', 'max_retries' and 'base_delay'
     """
-    client = openai.OpenAI(
-        api_key=os.getenv("SILICONFLOW_API_KEY"), # 从 https://cloud.siliconflow.cn/account/ak 获取
-        base_url="https://api.siliconflow.cn/v1"
-    )
-    tts_settings = config.tts_settings['siliconcloud']
-
-    # Map speakers to voices
-    voice = tts_settings['voice_mapping'].get(speaker, 'alex')  # Default to alex if not found
-    
-    # Map speakers to models
-    model = tts_settings.get('model_mapping', {}).get(speaker, 'FunAudioLLM/CosyVoice2-0.5B')  # Default to FunAudioLLM/CosyVoice2-0.5B if not found
-    
-    # Generate speech using SiliconCloud TTS
-    response = client.audio.speech.create(
-        model=model,
-        voice=f"{model}:{voice}", #voice="FunAudioLLM/CosyVoice2-0.5B:alex", # 系统预置音色
-        #input=f"[S1]{text}" if speaker == 'Interviewer' else f"[S2]{text}",
-        input=text,
-        response_format="mp3" # 支持 mp3, wav, pcm, opus 格式
-    )
-    
-    # Return the audio content as bytes
-    return response.content
+    provider = provider or get_tts_provider(config)
+    limits = {
+        'requests_per_minute': provider.limits.requests_per_minute,
+        'burst': provider.limits.burst,
+        'max_concurrency': provider.limits.max_concurrency,
+        **DEFAULT_TTS_RETRIES
+    }
+    limits.update(config.rate_limits.get(provider.name, {}))
+    return limits
 
 
-def combine_consecutive_speaker_chunks(chunks: List[dict]) -> List[dict]:
+def get_audio_cache(config: PodcastConfig) -> Optional[AudioCache]:
     """
-    Combine consecutive chunks from the same speaker into single chunks.
-    
+    Create the TTS audio cache described by ``config.tts_cache``.
+
     Args:
-        chunks (List[dict]): List of dictionaries containing conversation chunks with structure:
-            {
-                'speaker': str,  # Speaker identifier
-                'text': str      # Text content
-            }
-    
+        config (PodcastConfig): Configuration object with cache directory and tts_cache settings
+
     Returns:
-        List[dict]: List of combined chunks where consecutive entries from the same speaker
-                   are merged into single chunks
+        AudioCache: Cache under ``config.cache_dir/tts``, or None if caching is disabled
     """
-    combined_chunks = []
-    current_chunk = None
+    if not config.tts_cache.get('enabled', True):
+        return None
+    max_bytes = int(config.tts_cache.get('max_size_mb', 1024) * 1024 * 1024)
+    return AudioCache(os.path.join(config.cache_dir, 'tts'), max_bytes)
 
-    for chunk in chunks:
-        if current_chunk is None:
-            current_chunk = chunk.copy()
-        elif current_chunk['speaker'] == chunk['speaker']:
-            current_chunk['text'] += ' ' + chunk['text']
-        else:
-            combined_chunks.append(current_chunk)
-            current_chunk = chunk.copy()
 
-    if current_chunk is not None:
-        combined_chunks.append(current_chunk)
-
-    return combined_chunks
+def stream_segments(config: PodcastConfig,
+                    requests: Iterable[Tuple[List[dict], Optional[str]]],
+                    audio_cache: Optional[AudioCache] = None,
+                    buffer: Optional[SegmentBuffer] = None,
+                    provider: Optional[BaseTTSProvider] = None) -> Iterator[bytes]:
+    """
+    Run TTS requests concurrently within the provider's rate limits, yielding audio in order.
+
+    Each request is a batch of turns for one call to the provider's synthesize (see
+    pack_utterances), paired with its audio cache key (see tts_cache_key) or None. Requests whose audio is already in the
+    audio cache are not run at all. The remaining requests are dispatched to a pool of
+    ``max_concurrency`` workers sharing the provider's token-bucket limiter, so no more
+    than ``requests_per_minute`` requests are started per minute on average. The limiter
+    slows down when the provider throttles. A failed request is retried with jittered
+    exponential backoff in its own worker without holding up the other requests.
+
+    ``requests`` is consumed lazily, so it may be a generator fed by a stage that is
+    still producing the script: synthesis starts as soon as the first request arrives.
+    Audio is yielded in request order as soon as it and all earlier segments are
+    available, so the caller can process early segments while later ones are still being
+    synthesized. Segments finished ahead of their turn wait in the segment buffer.
 
+    Args:
+        config (PodcastConfig): Configuration object containing the TTS provider and rate limits
+        requests (Iterable[Tuple[List[dict], Optional[str]]]): Batches of turns, each with
+            its audio cache key
+        audio_cache (AudioCache, optional): Cache to read from and store new audio in
+        buffer (SegmentBuffer, optional): Holds segments finished out of order. Defaults to
+            an in-memory buffer without a size limit.
+        provider (BaseTTSProvider, optional): Provider to synthesize with. Defaults to the
+            configured one.
+
+    Yields:
+        bytes: Audio data for each request, in the same order as the requests
 
-@retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-@rate_limit_per_minute(max_requests_per_minute=20)
-def process_lines_google_multispeaker(config: PodcastConfig, chunks: List):
+    Raises:
+        Exception: If a request still fails after all retries. Requests that have not
+            started are cancelled.
+    """
+    provider = provider or get_tts_provider(config)
+    audio_format = provider.audio_format
+    if buffer is None:
+        buffer = SegmentBuffer(max_bytes=sys.maxsize)
+
+    limits = get_tts_limits(config, provider)
+    limiter = get_limiter(
+        f'tts/{provider.name}',
+        requests_per_minute=limits['requests_per_minute'],
+        burst=limits['burst'],
+        max_concurrency=limits['max_concurrency']
+    )
+    logger.info(f"Synthesizing segments with {provider.name} "
+                f"(concurrency {limits['max_concurrency']}, {limits['requests_per_minute']} requests/minute)")
+
+    jobs: Dict[int, List[dict]] = {}
+    cache_keys: Dict[int, Optional[str]] = {}
+
+    @retry_with_exponential_backoff(max_retries=limits['max_retries'], base_delay=limits['base_delay'])
+    def request_segment(index: int) -> bytes:
+        with limiter:
+            logger.info(f"Generating audio for segment {index}...")
+            return provider.synthesize_sync(jobs[index])
+
+    def synthesize_segment(index: int) -> bytes:
+        # The span encloses the retries, so they are counted on it
+        with span('tts.synthesize', kind='tts', provider=provider.name, format=audio_format,
+                  turns=len(jobs[index]), chars=sum(len(turn['text']) for turn in jobs[index])) as tts_span:
+            audio = request_segment(index)
+            tts_span.set(bytes=len(audio))
+        if cache_keys[index] is not None and audio_cache is not None:
+            audio_cache.put(cache_keys[index], audio_format, audio)
+        return audio
+
+    def synthesize_into_buffer(index: int) -> None:
+        buffer.put(index, synthesize_segment(index))
+
+    # Entries are ('future', Future) for requests being synthesized or ('cached', key)
+    entries: Dict[int, Tuple[str, Any]] = {}
+    condition = threading.Condition()
+    stop = threading.Event()
+    feed_state = {'total': None, 'cached': 0, 'error': None}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, limits['max_concurrency'])) as executor:
+        def feed() -> None:
+            count = 0
+            try:
+                for job, cache_key in requests:
+                    if stop.is_set():
+                        break
+                    index = count
+                    count += 1
+                    jobs[index] = job
+                    cache_keys[index] = cache_key
+                    if cache_key is not None and audio_cache is not None and audio_cache.contains(cache_key, audio_format):
+                        entry = ('cached', cache_key)
+                        feed_state['cached'] += 1
+                    else:
+                        entry = ('future', submit_with_context(executor, synthesize_into_buffer, index))
+                    with condition:
+                        entries[index] = entry
+                        condition.notify_all()
+            except BaseException as e:
+                feed_state['error'] = e
+            finally:
+                with condition:
+                    feed_state['total'] = count
+                    condition.notify_all()
+
+        feeder = threading.Thread(target=contextvars.copy_context().run, args=(feed,), name='tts-feeder', daemon=True)
+        feeder.start()
+
+        try:
+            index = 0
+            while True:
+                with condition:
+                    while index not in entries and feed_state['total'] is None:
+                        condition.wait()
+                    if index not in entries:
+                        if feed_state['error'] is not None:
+                            raise feed_state['error']
+                        break
+                    kind, value = entries.pop(index)
+
+                if kind == 'future':
+                    value.result()
+                    audio = buffer.take(index)
+                else:
+                    audio = audio_cache.get(value, audio_format)
+                    if audio is None:
+                        # Evicted since the lookup above
+                        audio = synthesize_segment(index)
+                jobs.pop(index, None)
+                yield audio
+                index += 1
+
+            if feed_state['cached']:
+                logger.info(f"Reused cached audio for {feed_state['cached']} of {index} segments")
+            add_to_span(tts_segments=index, tts_cached_segments=feed_state['cached'])
+        finally:
+            # Runs on errors and when the caller stops early
+            stop.set()
+            with condition:
+                for kind, value in entries.values():
+                    if kind == 'future':
+                        value.cancel()
+            buffer.clear()
+            logger.info(f"TTS rate limiter: {limiter.metrics()}")
+
+
+def synthesize_segments(config: PodcastConfig,
+                        batches: List[List[dict]],
+                        cache_keys: Optional[List[str]] = None,
+                        audio_cache: Optional[AudioCache] = None,
+                        provider: Optional[BaseTTSProvider] = None) -> List[bytes]:
     """
-    Process multiple lines of text into speech using Google's multi-speaker TTS service.
+    Run TTS requests concurrently within the provider's rate limits.
 
-    Takes a chunk of conversation lines and generates synthesized speech using Google's
-    multi-speaker TTS service. Handles up to 6 turns of conversation at once for more
-    natural conversational flow.
+    Collects the output of stream_segments into a list.
 
     Args:
-        config (PodcastConfig): Configuration object containing API keys and settings
-        chunks (List): List of dictionaries containing conversation lines with structure:
-            {
-                'speaker': str,  # Speaker identifier
-                'text': str      # Line content to convert to speech
-            }
+        config (PodcastConfig): Configuration object containing the TTS provider and rate limits
+        batches (List[List[dict]]): Batches of turns, one per TTS request
+        cache_keys (List[str], optional): Audio cache key for each batch (see tts_cache_key)
+        audio_cache (AudioCache, optional): Cache to read from and store new audio in
+        provider (BaseTTSProvider, optional): Provider to synthesize with. Defaults to the
+            configured one.
 
     Returns:
-        bytes: Raw audio data in bytes format containing the synthesized speech
+        List[bytes]: Audio data for each batch, in the same order as the batches
     """
-    client = texttospeech_v1beta1.TextToSpeechClient(client_options={'api_key': config.google_api_key})
-    tts_settings = config.tts_settings['google_multispeaker']
+    if cache_keys is None:
+        cache_keys = [None] * len(batches)
+    return list(stream_segments(config, zip(batches, cache_keys), audio_cache, provider=provider))
 
-    # Combine consecutive lines from same speaker
-    chunks = combine_consecutive_speaker_chunks(chunks)
 
-    # Create multi-speaker markup
-    multi_speaker_markup = texttospeech_v1beta1.MultiSpeakerMarkup()
+def _line_batches(script: Union[list, Iterable[list]]) -> Iterator[list]:
+    """Yield a script given as one list of lines, or as an iterable of line batches, batch by batch."""
+    if isinstance(script, list) and (not script or isinstance(script[0], dict)):
+        yield script
+    else:
+        yield from script
 
-    # Add each line as a conversation turn
-    for line in chunks:
-        turn = texttospeech_v1beta1.MultiSpeakerMarkup.Turn()
-        turn.text = line['text']
-        turn.speaker = tts_settings['voice_mapping'][line['speaker']]
-        multi_speaker_markup.turns.append(turn)
 
-    # Configure synthesis input with multi-speaker markup
-    synthesis_input = texttospeech_v1beta1.SynthesisInput(
-        multi_speaker_markup=multi_speaker_markup
-    )
+def select_segment_format(provider: BaseTTSProvider, output_format: str, audio_settings: dict) -> bool:
+    """
+    Select the audio format requested from the TTS provider.
 
-    # Configure voice parameters
-    voice = texttospeech_v1beta1.VoiceSelectionParams(
-        language_code=tts_settings['language_code'],
-        name='en-US-Studio-MultiSpeaker'
-    )
+    With ``audio_settings['segment_format']`` set to 'auto' the format is negotiated (see
+    negotiate_segment_format): the output format itself when segments can be copied into
+    the episode unchanged, otherwise lossless WAV where the provider supports it, so the
+    episode is encoded exactly once. 'native' keeps the provider's default format, and any
+    other value requests that format explicitly.
 
-    # Configure audio output
-    audio_config = texttospeech_v1beta1.AudioConfig(
-        audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3_64_KBPS,
-        effects_profile_id=tts_settings['effects_profile_id']
-    )
+    Args:
+        provider (BaseTTSProvider): Provider whose audio_format is set
+        output_format (str): Format of the episode file
+        audio_settings (dict): Assembly settings; 'segment_format' is removed
 
-    # Generate speech
-    response = client.synthesize_speech(
-        input=synthesis_input,
-        voice=voice,
-        audio_config=audio_config
-    )
+    Returns:
+        bool: Whether segments can be stream-copied into the episode
+
+    Raises:
+        ValueError: If an explicitly requested format is not supported by the provider
+    """
+    requested = audio_settings.pop('segment_format', 'auto')
+    if requested == 'auto':
+        segment_format, stream_copy = negotiate_segment_format(provider.limits.formats, output_format, audio_settings)
+    else:
+        segment_format = provider.limits.native_format if requested == 'native' else requested
+        stream_copy = segment_format == output_format
+    provider.set_audio_format(segment_format)
 
-    return response.audio_content
+    logger.info(f"Requesting {segment_format} audio from {provider.name}; "
+                f"{'copying segments into' if stream_copy else 'encoding'} the {output_format} episode")
+    return stream_copy
+
+
+class _EpisodeRenderer:
+    """
+    Provider, caches and settings shared by convert_to_speech and rerender_speech.
+
+    Assembles blocks of requests (see pack_line_blocks) into an episode file and records
+    the line-level manifest used to re-render the episode after script edits.
+    """
+    def __init__(self, config: PodcastConfig, audio_format: str, temp_audio_dir: str):
+        self.config = config
+        self.audio_format = audio_format
+        self.temp_audio_dir = temp_audio_dir
+        self.provider = get_tts_provider(config)
+        self.audio_cache = get_audio_cache(config)
+        self.voice_settings = self.provider.voice_settings()
+        self.audio_settings = get_audio_settings(config)
+        self.buffer = SegmentBuffer(
+            max_bytes=int(self.audio_settings.pop('buffer_mb') * 1024 * 1024),
+            spill_dir=temp_audio_dir
+        )
+        self.publish_segments = self.audio_settings.pop('publish_segments')
+        self.stream_copy = select_segment_format(self.provider, audio_format, self.audio_settings)
+        self.text_limits = get_tts_text_limits(config, self.provider)
+
+    def cache_key(self, turns: List[dict]) -> str:
+        # Single-speaker requests keep their historical cache key (speaker, text)
+        if self.provider.limits.multi_speaker:
+            return tts_cache_key(self.provider.name, self.voice_settings, None, turns)
+        turn, = turns
+        return tts_cache_key(self.provider.name, self.voice_settings, turn['speaker'], turn['text'])
+
+    def pack_blocks(self, lines: List[dict]) -> List[Tuple[range, List[List[dict]]]]:
+        return pack_line_blocks(lines, **self.text_limits)
+
+    def render_blocks(self, lines: List[dict]) -> List[RenderBlock]:
+        return [
+            RenderBlock([lines[i] for i in line_range], [(turns, self.cache_key(turns)) for turns in requests])
+            for line_range, requests in self.pack_blocks(lines)
+        ]
+
+    def write(self,
+              output_file: str,
+              blocks: Iterable[RenderBlock],
+              reused_audio: Optional[Callable[[ManifestSegment], bytes]] = None,
+              playlist: Optional[SegmentPlaylist] = None) -> EpisodeManifest:
+        """
+        Synthesize blocks and assemble them into an episode file.
+
+        Args:
+            output_file (str): Path of the episode file
+            blocks (Iterable[RenderBlock]): Blocks in script order; may still be arriving
+            reused_audio (Callable, optional): Returns the audio of a segment of a reused
+                block, in the output format. Without it, reused blocks are synthesized
+                (or read from the audio cache) like the others, and blocks may be lazy.
+            playlist (SegmentPlaylist, optional): Playlist to publish segments to
+
+        Returns:
+            EpisodeManifest: Manifest of the written episode
+        """
+        segment_format = self.provider.audio_format
+        if reused_audio is None:
+            # Follow the requests in the order the synthesizer takes them from the blocks
+            issued = collections.deque()
+
+            def requests() -> Iterator[Tuple[List[dict], str]]:
+                for block in blocks:
+                    for index, request in enumerate(block.requests):
+                        issued.append((block, index))
+                        yield request
+
+            def segments() -> Iterator[Tuple[RenderBlock, int, bytes, str]]:
+                for audio in stream_segments(self.config, requests(), self.audio_cache, self.buffer, self.provider):
+                    block, index = issued.popleft()
+                    yield block, index, audio, segment_format
+        else:
+            def segments() -> Iterator[Tuple[RenderBlock, int, bytes, str]]:
+                synthesized = stream_segments(
+                    self.config,
+                    [request for block in blocks if block.reused is None for request in block.requests],
+                    self.audio_cache, self.buffer, self.provider
+                )
+                for block in blocks:
+                    for index in range(len(block.requests)):
+                        if block.reused is None:
+                            yield block, index, next(synthesized), segment_format
+                        else:
+                            yield block, index, reused_audio(block.reused.segments[index]), self.audio_format
+
+        manifest = EpisodeManifest(self.audio_format, segment_format, False,
+                                   silence_ms=self.audio_settings.get('silence_ms') or 0)
+        with AudioStreamWriter(output_file, self.audio_format, stream_copy=self.stream_copy,
+                               **self.audio_settings) as writer:
+            for block, index, audio, audio_format in segments():
+                if index == 0:
+                    first_line = len(manifest.lines)
+                    manifest.lines.extend(block.lines)
+                    manifest.blocks.append(ManifestBlock(first_line, len(manifest.lines)))
+                duration = writer.append(audio, audio_format)
+
+                turns, cache_key = block.requests[index]
+                offset, length = writer.last_range if writer.stream_copy else (None, None)
+                manifest.blocks[-1].segments.append(
+                    ManifestSegment(turns, cache_key, writer.last_start, duration, offset, length)
+                )
+                if playlist is not None:
+                    playlist.publish(audio, duration)
+
+        manifest.stream_copy = writer.stream_copy
+        manifest.payload_bytes = writer.payload_bytes
+        if self.buffer.spilled_segments:
+            logger.info(f"Spilled {self.buffer.spilled_segments} audio segments to {self.temp_audio_dir}")
+        return manifest
 
 
 def convert_to_speech(config: PodcastConfig, 
-                    conversation: list, 
+                    conversation: Union[list, Iterable[list]], 
                     output_file: str, 
                     temp_audio_dir: str, 
                     audio_format: str):
@@ -430,18 +775,35 @@ def convert_to_speech(config: PodcastConfig,
     Convert a conversation script to speech and merge into a single audio file.
 
     Takes a conversation script and converts each line to speech using the configured
-    TTS provider. Individual audio segments are saved to temporary files and then
-    merged into a single output file. Temporary files are cleaned up after merging.
+    TTS provider. Lines are packed into as few requests as the provider's text limits
+    allow (see pack_utterances) and synthesized concurrently within the provider's rate
+    limits (see stream_segments) and each segment is handed to a streaming encoder as soon as it
+    and all earlier lines are done, so assembly overlaps with synthesis. Segments stay in
+    memory unless more than ``audio_settings['buffer_mb']`` is waiting for an earlier
+    line, in which case the excess is spilled to temporary files. With
+    ``audio_settings['publish_segments']`` each segment is also published to a growing
+    playlist (see SegmentPlaylist) so playback can start before synthesis finishes.
+
+    The conversation may also be an iterable of line batches (e.g. a pipeline Stream fed
+    by write_final_script). Each batch is packed and synthesized as soon as it arrives,
+    so audio synthesis overlaps with writing the rest of the script. Requests are never
+    packed across batches.
+
+    The episode is written to a temporary file next to the output file and moved into
+    place once complete, so a failed render leaves any previous episode intact. A
+    line-level manifest of the episode is then saved next to the output file (see
+    manifest_path_for), so an edited script can be re-rendered with rerender_speech.
 
     Args:
         config (PodcastConfig): Configuration object containing TTS settings
-        conversation (str): List of dictionaries containing conversation lines with structure:
+        conversation (Union[list, Iterable[list]]): List of dictionaries containing
+            conversation lines, or an iterable of such lists, with structure:
             {
                 'speaker': str,  # Speaker identifier ('Interviewer' or 'Interviewee')
                 'text': str      # Line content to convert to speech
             }
         output_file (str): Path where the final merged audio file should be saved
-        temp_audio_dir (str): Directory path for temporary audio file storage
+        temp_audio_dir (str): Directory path for spilled audio segments
         audio_format (str): Format of the audio files (e.g. 'mp3')
 
     Raises:
@@ -450,76 +812,165 @@ def convert_to_speech(config: PodcastConfig,
     # Check audio processing dependencies
     check_audio_dependencies()
 
-    tts_audio_formats = {
-        'elevenlabs': 'mp3',
-        'google': 'mp3',
-        'google_multispeaker': 'mp3',
-        'dashscope': 'wav',  # DashScope TTS returns WAV format
-        'siliconcloud': 'mp3'  # SiliconCloud TTS returns MP3 format
-    }
+    renderer = _EpisodeRenderer(config, audio_format, temp_audio_dir)
+    counts = {'lines': 0, 'requests': 0}
+
+    def blocks() -> Iterator[RenderBlock]:
+        for batch in _line_batches(conversation):
+            # Pack lines into as few requests as the provider's text limits allow
+            packed = renderer.render_blocks(batch)
+            requests = sum(len(block.requests) for block in packed)
+            logger.info(f"Packed {len(batch)} lines into {requests} TTS requests")
+            counts['lines'] += len(batch)
+            counts['requests'] += requests
+            yield from packed
+
+    playlist = (SegmentPlaylist(segment_dir_for(output_file), renderer.provider.audio_format)
+                if renderer.publish_segments else None)
+    try:
+        manifest = _write_episode(renderer, output_file, blocks(), playlist=playlist)
+    finally:
+        # Also on failure, so players stop waiting for more segments
+        if playlist is not None:
+            playlist.finish()
+    manifest.save(manifest_path_for(output_file))
+
+    segments = sum(len(block.segments) for block in manifest.blocks)
+    logger.info(f"Successfully wrote {segments} audio segments "
+                f"({counts['lines']} lines in {counts['requests']} TTS requests) to {output_file}")
+
+
+def rerender_speech(config: PodcastConfig,
+                    conversation: list,
+                    output_file: str,
+                    temp_audio_dir: str,
+                    audio_format: str) -> Dict[str, int]:
+    """
+    Re-render an episode after its script was edited.
+
+    Diffs the cleaned lines against the manifest saved by the previous render (see
+    plan_rerender) and synthesizes only the blocks of lines that changed. When the
+    previous episode was assembled by stream copying (see select_segment_format) and the
+    output settings are unchanged, the audio of unchanged blocks is copied from the
+    existing output file at the offsets recorded in the manifest, so fixing a typo costs
+    one TTS request and a file copy. Otherwise the episode is assembled again, with
+    unchanged requests read from the audio cache. Without a manifest this is a full
+    convert_to_speech.
 
+    Args:
+        config (PodcastConfig): Configuration object containing TTS settings
+        conversation (list): Cleaned conversation lines with 'speaker' and 'text'
+        output_file (str): Path of the existing episode file, which is replaced
+        temp_audio_dir (str): Directory path for spilled audio segments
+        audio_format (str): Format of the audio files (e.g. 'mp3')
+
+    Returns:
+        Dict[str, int]: Counts of 'reused_blocks', 'synthesized_blocks' and
+            'synthesized_requests'
+
+    Raises:
+        Exception: If any errors occur during TTS conversion or file operations
+    """
+    manifest_path = manifest_path_for(output_file)
     try:
-        logger.info(f"Generating audio files for {len(conversation)} lines...")
-        audio_files = []
-        counter = 0
-
-        if config.tts_provider == 'google_multispeaker':
-            # We will not use a line by line strategy. 
-            # Instead we will process in chunks of 6.
-            # Process conversation in chunks of 6 lines
-            for chunk_start in range(0, len(conversation), 4):
-                chunk = conversation[chunk_start:chunk_start + 4]
-                logger.info(f"Processing chunk {counter} with {len(chunk)} lines...")
-                
-                audio = process_lines_google_multispeaker(config, chunk)
-                
-                file_name = os.path.join(temp_audio_dir, f"{counter:03d}.{tts_audio_formats[config.tts_provider]}")
-                with open(file_name, "wb") as out:
-                    out.write(audio)
-                audio_files.append(file_name)
-                
-                counter += 1
-        else:
-            for line in conversation:
-                logger.info(f"Generating audio for line {counter}...")
+        manifest = EpisodeManifest.load(manifest_path)
+    except (FileNotFoundError, ValueError) as e:
+        logger.warning(f"Cannot re-render {output_file} incrementally ({e}); rendering the whole episode")
+        convert_to_speech(config, conversation, output_file, temp_audio_dir, audio_format)
+        return {'reused_blocks': 0, 'synthesized_blocks': 0, 'synthesized_requests': 0}
 
-                if config.tts_provider == 'google':
-                    audio = process_line_google(config, line['text'], line['speaker'])
-                elif config.tts_provider == 'elevenlabs':
-                    audio = process_line_elevenlabs(config, line['text'], line['speaker'])
-                elif config.tts_provider == 'dashscope':
-                    audio = process_line_dashscope(config, line['text'], line['speaker'])
-                elif config.tts_provider == 'siliconcloud':
-                    audio = process_line_siliconcloud(config, line['text'], line['speaker'])
+    check_audio_dependencies()
+    renderer = _EpisodeRenderer(config, audio_format, temp_audio_dir)
+    plan = plan_rerender(manifest, conversation, renderer.pack_blocks, renderer.cache_key)
+    changed = [block for block in plan if block.reused is None]
+    counts = {
+        'reused_blocks': len(plan) - len(changed),
+        'synthesized_blocks': len(changed),
+        'synthesized_requests': sum(len(block.requests) for block in changed)
+    }
+    logger.info(f"Re-rendering {output_file}: {counts['reused_blocks']} of {len(plan)} blocks unchanged, "
+                f"{counts['synthesized_requests']} TTS requests for edited lines")
 
-                logger.info(f"Saving audio chunk {counter}...")
-                file_name = os.path.join(temp_audio_dir, f"{counter:03d}.{tts_audio_formats[config.tts_provider]}")
-                with open(file_name, "wb") as out:
-                    out.write(audio)
-                audio_files.append(file_name)
+    payload = _read_spliceable_payload(manifest, renderer, output_file)
+    if payload is None:
+        manifest = _write_episode(renderer, output_file, plan)
+    else:
+        audio_data, wav_params = payload
 
-                counter += 1
+        def reused_audio(segment: ManifestSegment) -> bytes:
+            frames = audio_data[segment.offset:segment.offset + segment.length]
+            return pcm_to_wav(frames, *wav_params) if wav_params else frames
 
-        # Merge all audio files and save the result
-        merge_audio_files(audio_files, output_file, audio_format)
+        manifest = _write_episode(renderer, output_file, plan, reused_audio=reused_audio)
 
-        # Clean up individual audio files
-        for file in audio_files:
-            os.remove(file)
+    manifest.save(manifest_path)
+    return counts
 
-    except Exception as e:
-        raise
 
-def generate_audio(config: PodcastConfig, final_script: list, output_file: str) -> str:
+def _write_episode(renderer: _EpisodeRenderer, output_file: str, blocks: Iterable[RenderBlock],
+                   **kwargs) -> EpisodeManifest:
+    # Write next to the output file and move it into place only once the episode is
+    # complete, so a failed render leaves the previous episode (and its manifest) intact.
+    # A splicing re-render also keeps reading the old file while the new one is written
+    fd, temp_output = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)),
+                                       prefix=os.path.basename(output_file), suffix='.tmp')
+    os.close(fd)
+    try:
+        manifest = renderer.write(temp_output, blocks, **kwargs)
+        os.replace(temp_output, output_file)
+    finally:
+        if os.path.exists(temp_output):
+            os.remove(temp_output)
+    return manifest
+
+
+def _read_spliceable_payload(manifest: EpisodeManifest, renderer: _EpisodeRenderer,
+                             output_file: str) -> Optional[Tuple[bytes, Optional[tuple]]]:
+    # Audio data of the previous output if its segments can be copied into the new one,
+    # with the (sample rate, channels, sample width) needed to wrap WAV samples
+    reasons = []
+    if not (manifest.stream_copy and renderer.stream_copy):
+        reasons.append('segments are re-encoded')
+    if (manifest.output_format, manifest.segment_format, manifest.silence_ms) != (
+            renderer.audio_format, renderer.provider.audio_format, renderer.audio_settings.get('silence_ms') or 0):
+        reasons.append('output settings changed')
+    if not os.path.exists(output_file):
+        reasons.append('output file is missing')
+    if reasons:
+        logger.info(f"Assembling {output_file} again from synthesized and cached audio: {', '.join(reasons)}")
+        return None
+
+    with open(output_file, 'rb') as f:
+        data = f.read()
+    try:
+        if manifest.output_format == 'mp3':
+            _, audio_data = read_mp3_frames(data)
+            wav_params = None
+        else:
+            info, sample_width, audio_data = read_wav(data)
+            wav_params = (info.sample_rate, info.channels, sample_width)
+    except (ValueError, EOFError, wave.Error) as e:
+        logger.info(f"Assembling {output_file} again from synthesized and cached audio: {e}")
+        return None
+    if len(audio_data) != manifest.payload_bytes:
+        logger.info(f"Assembling {output_file} again from synthesized and cached audio: file changed since the manifest")
+        return None
+    return audio_data, wav_params
+
+
+def generate_audio(config: PodcastConfig, final_script: Union[list, Iterable[list]], output_file: str) -> str:
     """
     Generate audio from a podcast script using text-to-speech.
 
     Takes a final script consisting of speaker/text pairs and generates a single audio file
     using Google's Text-to-Speech service. The script is first cleaned and processed to be
     TTS-friendly, then converted to speech with different voices for different speakers.
+    The script may also arrive as an iterable of line batches while it is still being
+    written; each batch is cleaned and synthesized as soon as it arrives.
 
     Args:
-        final_script (list): List of dictionaries containing script lines with structure:
+        final_script (Union[list, Iterable[list]]): List of dictionaries containing script
+            lines, or an iterable of such lists, with structure:
             {
                 'speaker': str,  # Speaker identifier ('Interviewer' or 'Interviewee')
                 'text': str      # Line content to convert to speech
@@ -532,7 +983,7 @@ def generate_audio(config: PodcastConfig, final_script: list, output_file: str)
     Raises:
         Exception: If any errors occur during TTS conversion or file operations
     """
-    cleaned_script = clean_text_for_tts(final_script)
+    cleaned_script = (clean_text_for_tts(batch) for batch in _line_batches(final_script))
 
     temp_audio_dir = Path(config.temp_audio_dir)
     temp_audio_dir.mkdir(parents=True, exist_ok=True)
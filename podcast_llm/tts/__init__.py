@@ -0,0 +1,45 @@
+"""
+Text-to-speech provider backends.
+
+Each provider implements BaseTTSProvider and declares its limits (request size,
+multi-speaker support, concurrency, rate and native audio format). Providers are
+registered by name and imported only when selected, so only the configured provider's
+SDK is loaded.
+
+Example:
+    provider = get_tts_provider(config)
+    audio = await provider.synthesize([{'speaker': 'Interviewer', 'text': 'Welcome!'}])
+"""
+
+
+from podcast_llm.tts.base import BaseTTSProvider, TTSProviderLimits
+from podcast_llm.utils.lazy_imports import ProviderRegistry
+
+
+TTS_PROVIDERS = ProviderRegistry('TTS provider', {
+    'google': 'podcast_llm.tts.google:GoogleTTSProvider',
+    'google_multispeaker': 'podcast_llm.tts.google_multispeaker:GoogleMultiSpeakerTTSProvider',
+    'elevenlabs': 'podcast_llm.tts.elevenlabs:ElevenLabsTTSProvider',
+    'dashscope': 'podcast_llm.tts.dashscope:DashScopeTTSProvider',
+    'siliconcloud': 'podcast_llm.tts.siliconcloud:SiliconCloudTTSProvider',
+    'sine': 'podcast_llm.tts.sine:SineTTSProvider'
+})
+
+
+def get_tts_provider(config) -> BaseTTSProvider:
+    """
+    Create the TTS provider selected by ``config.tts_provider``.
+
+    Args:
+        config (PodcastConfig): Configuration object with the TTS provider and settings
+
+    Returns:
+        BaseTTSProvider: Provider instance
+
+    Raises:
+        ValueError: If the provider is not registered
+    """
+    return TTS_PROVIDERS.get(config.tts_provider)(config)
+
+
+__all__ = ['BaseTTSProvider', 'TTSProviderLimits', 'TTS_PROVIDERS', 'get_tts_provider']
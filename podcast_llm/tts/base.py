@@ -0,0 +1,153 @@
+"""
+Base text-to-speech provider interface for podcast generation.
+
+This module provides the abstract base class that every TTS backend implements, and the
+limits a backend declares so the synthesis scheduler (see text_to_speech.stream_segments)
+can pack lines into requests and run them concurrently according to the provider's
+capabilities instead of provider-specific branches.
+
+The module defines:
+- TTSProviderLimits: Request size, concurrency, rate and output formats of a provider
+- BaseTTSProvider: Abstract base class with a uniform async ``synthesize(batch)``
+
+Example:
+    >>> class MyProvider(BaseTTSProvider):
+    ...     name = 'my_provider'
+    ...     limits = TTSProviderLimits(native_format='wav', max_chars=500)
+    ...
+    ...     def synthesize_sync(self, batch):
+    ...         turn, = batch
+    ...         return my_sdk.speak(turn['text'], voice=self.settings['voice_mapping'][turn['speaker']])
+
+Providers backed by a blocking SDK implement ``synthesize_sync`` and get the async
+``synthesize`` for free (it runs in a worker thread); providers with a native async client
+implement ``synthesize`` and get ``synthesize_sync`` for free.
+"""
+
+
+import asyncio
+from abc import ABC
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from podcast_llm.utils.concurrency import run_sync
+
+
+@dataclass(frozen=True)
+class TTSProviderLimits:
+    """
+    Capabilities and limits declared by a TTS provider.
+
+    Attributes:
+        native_format (str): Audio format returned by the provider by default (e.g. 'mp3', 'wav')
+        alternative_formats (Tuple[str, ...]): Further formats the provider can be asked for
+        max_chars (Optional[int]): Maximum characters per request
+        max_bytes (Optional[int]): Maximum UTF-8 bytes per request
+        multi_speaker (bool): Whether one request may contain several speakers' turns
+        max_turns (Optional[int]): Maximum speaker turns per multi-speaker request
+        max_concurrency (int): Requests in flight at once
+        requests_per_minute (float): Requests started per minute on average
+        burst (int): Requests that may start back to back after an idle period
+    """
+    native_format: str = 'mp3'
+    alternative_formats: Tuple[str, ...] = ()
+    max_chars: Optional[int] = 1000
+    max_bytes: Optional[int] = None
+    multi_speaker: bool = False
+    max_turns: Optional[int] = None
+    max_concurrency: int = 4
+    requests_per_minute: float = 20
+    burst: int = 1
+
+    @property
+    def formats(self) -> Tuple[str, ...]:
+        """All formats the provider can return, native format first."""
+        return (self.native_format,) + tuple(f for f in self.alternative_formats if f != self.native_format)
+
+    def text_limits(self) -> Dict[str, Any]:
+        """
+        Get the per-request text limits.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for text_to_speech.pack_utterances
+        """
+        return {
+            'max_chars': self.max_chars,
+            'max_bytes': self.max_bytes,
+            'multi_speaker': self.multi_speaker,
+            'max_turns': self.max_turns
+        }
+
+
+class BaseTTSProvider(ABC):
+    """Abstract base class for text-to-speech providers.
+
+    A batch is one TTS request: a list of turns ``{'speaker': str, 'text': str}`` packed
+    within the provider's limits. Single-speaker providers always receive exactly one turn.
+
+    Attributes:
+        name (str): Provider name as used in ``config.tts_provider``
+        limits (TTSProviderLimits): Declared capabilities and limits
+        config (PodcastConfig): Configuration object with API keys and settings
+        settings (dict): This provider's entry in ``config.tts_settings``
+        audio_format (str): Format requested from the provider, one of ``limits.formats``
+            (see set_audio_format)
+    """
+    name: str = ''
+    limits: TTSProviderLimits = TTSProviderLimits()
+
+    def __init__(self, config: Any):
+        if (type(self).synthesize is BaseTTSProvider.synthesize
+                and type(self).synthesize_sync is BaseTTSProvider.synthesize_sync):
+            raise TypeError(f'{type(self).__name__} must implement synthesize or synthesize_sync')
+        self.config = config
+        self.settings = config.tts_settings.get(self.name, {})
+        self.audio_format = self.limits.native_format
+
+    def set_audio_format(self, audio_format: str) -> None:
+        """
+        Select the format returned by synthesize.
+
+        Args:
+            audio_format (str): One of ``limits.formats``
+
+        Raises:
+            ValueError: If the provider cannot return the format
+        """
+        if audio_format not in self.limits.formats:
+            raise ValueError(f'{self.name} cannot return {audio_format} audio '
+                             f'(supported: {", ".join(self.limits.formats)})')
+        self.audio_format = audio_format
+
+    async def synthesize(self, batch: List[dict]) -> bytes:
+        """
+        Synthesize one request.
+
+        Args:
+            batch (List[dict]): Turns with 'speaker' and 'text'
+
+        Returns:
+            bytes: Audio in ``audio_format``
+        """
+        return await asyncio.to_thread(self.synthesize_sync, batch)
+
+    def synthesize_sync(self, batch: List[dict]) -> bytes:
+        """
+        Synthesize one request from synchronous code (e.g. a scheduler worker thread).
+
+        Args:
+            batch (List[dict]): Turns with 'speaker' and 'text'
+
+        Returns:
+            bytes: Audio in ``audio_format``
+        """
+        return run_sync(self.synthesize(batch))
+
+    def voice_settings(self) -> Any:
+        """
+        Get the settings that affect the synthesized audio, for audio cache keys.
+
+        Returns:
+            Any: JSON-serializable settings (by default this provider's tts_settings)
+        """
+        return self.settings
@@ -0,0 +1,42 @@
+"""
+DashScope (ModelScope) text-to-speech provider.
+
+Synthesizes one speaker turn per request with the voices configured in
+``config.tts_settings['dashscope']``. DashScope returns a URL to a WAV file, which is
+downloaded.
+"""
+
+
+import os
+
+import dashscope
+import requests
+from dashscope.audio.tts import SpeechSynthesizer
+
+from podcast_llm.tts.base import BaseTTSProvider, TTSProviderLimits
+
+
+class DashScopeTTSProvider(BaseTTSProvider):
+    """DashScope TTS with one voice per speaker, returning WAV."""
+    name = 'dashscope'
+    limits = TTSProviderLimits(native_format='wav', max_chars=1000)
+
+    def synthesize_sync(self, batch):
+        turn, = batch
+        dashscope.api_key = self.config.dashscope_api_key
+
+        # Map speakers to voices, defaulting to Cherry
+        voice = self.settings['voice_mapping'].get(turn['speaker'], 'Cherry')
+
+        response = SpeechSynthesizer.call(
+            model=os.getenv('OPENAI_MODEL', 'qwen-turbo'),
+            text=turn['text'],
+            voice=voice
+        )
+        if response.status_code != 200:
+            raise Exception(f"DashScope TTS API error: {response.message}")
+
+        audio_response = requests.get(response.output.audio.url)
+        if audio_response.status_code != 200:
+            raise Exception(f"Failed to download audio file: {audio_response.status_code}")
+        return audio_response.content
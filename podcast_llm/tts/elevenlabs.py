@@ -0,0 +1,46 @@
+"""
+ElevenLabs text-to-speech provider.
+
+Synthesizes one speaker turn per request with the voices and model configured in
+``config.tts_settings['elevenlabs']``.
+"""
+
+
+from io import BytesIO
+
+from elevenlabs import client as elevenlabs_client
+
+from podcast_llm.tts.base import BaseTTSProvider, TTSProviderLimits
+from podcast_llm.utils.audio_formats import pcm_to_wav
+from podcast_llm.utils.shared_clients import client_key, get_shared_client
+
+
+class ElevenLabsTTSProvider(BaseTTSProvider):
+    """ElevenLabs TTS with one voice per speaker."""
+    name = 'elevenlabs'
+    limits = TTSProviderLimits(native_format='mp3', alternative_formats=('wav',), max_chars=4500)
+
+    # Raw PCM output, wrapped in a WAV container when WAV is requested
+    PCM_SAMPLE_RATE = 24000
+
+    def synthesize_sync(self, batch):
+        turn, = batch
+        client = get_shared_client(
+            client_key('tts/elevenlabs', self.config.elevenlabs_api_key),
+            lambda: elevenlabs_client.ElevenLabs(api_key=self.config.elevenlabs_api_key)
+        )
+
+        audio = client.generate(
+            text=turn['text'],
+            voice=self.settings['voice_mapping'][turn['speaker']],
+            model=self.settings['model'],
+            **({'output_format': f'pcm_{self.PCM_SAMPLE_RATE}'} if self.audio_format == 'wav' else {})
+        )
+
+        # Convert audio iterator to bytes
+        audio_bytes = BytesIO()
+        for chunk in audio:
+            audio_bytes.write(chunk)
+        if self.audio_format == 'wav':
+            return pcm_to_wav(audio_bytes.getvalue(), self.PCM_SAMPLE_RATE)
+        return audio_bytes.getvalue()
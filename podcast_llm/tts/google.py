@@ -0,0 +1,45 @@
+"""
+Google Cloud Text-to-Speech provider.
+
+Synthesizes one speaker turn per request with a separate voice per speaker, as
+configured in ``config.tts_settings['google']``.
+"""
+
+
+from google.cloud import texttospeech
+
+from podcast_llm.tts.base import BaseTTSProvider, TTSProviderLimits
+from podcast_llm.utils.shared_clients import client_key, get_shared_client
+
+
+class GoogleTTSProvider(BaseTTSProvider):
+    """Google Cloud TTS with one voice per speaker (Interviewer: female, Interviewee: male)."""
+    name = 'google'
+    limits = TTSProviderLimits(native_format='mp3', alternative_formats=('wav',),
+                               max_chars=None, max_bytes=4800)
+
+    def synthesize_sync(self, batch):
+        turn, = batch
+        client = get_shared_client(
+            client_key('tts/google', self.config.google_api_key),
+            lambda: texttospeech.TextToSpeechClient(client_options={'api_key': self.config.google_api_key})
+        )
+
+        voice = texttospeech.VoiceSelectionParams(
+            language_code=self.settings['language_code'],
+            name=self.settings['voice_mapping'][turn['speaker']],
+            ssml_gender=(texttospeech.SsmlVoiceGender.FEMALE if turn['speaker'] == 'Interviewer'
+                         else texttospeech.SsmlVoiceGender.MALE)
+        )
+
+        # Select the type of audio file you want returned (LINEAR16 comes with a WAV header)
+        audio_config = texttospeech.AudioConfig(
+            audio_encoding=(texttospeech.AudioEncoding.LINEAR16 if self.audio_format == 'wav'
+                            else texttospeech.AudioEncoding.MP3),
+            effects_profile_id=self.settings['effects_profile_id']
+        )
+
+        response = client.synthesize_speech(
+            input=texttospeech.SynthesisInput(text=turn['text']), voice=voice, audio_config=audio_config
+        )
+        return response.audio_content
@@ -0,0 +1,54 @@
+"""
+Google Cloud Text-to-Speech multi-speaker provider.
+
+Synthesizes several conversation turns per request with Google's multi-speaker voice,
+for a more natural conversational flow (see text_to_speech.pack_utterances for how
+lines are grouped into requests).
+"""
+
+
+from google.cloud import texttospeech_v1beta1
+
+from podcast_llm.tts.base import BaseTTSProvider, TTSProviderLimits
+from podcast_llm.utils.shared_clients import client_key, get_shared_client
+
+
+class GoogleMultiSpeakerTTSProvider(BaseTTSProvider):
+    """Google Cloud multi-speaker TTS, taking up to ``max_turns`` turns per request."""
+    name = 'google_multispeaker'
+    limits = TTSProviderLimits(native_format='mp3', alternative_formats=('wav',),
+                               max_chars=None, max_bytes=4000,
+                               multi_speaker=True, max_turns=6)
+
+    def synthesize_sync(self, batch):
+        from podcast_llm.text_to_speech import combine_consecutive_speaker_chunks
+
+        client = get_shared_client(
+            client_key('tts/google_multispeaker', self.config.google_api_key),
+            lambda: texttospeech_v1beta1.TextToSpeechClient(client_options={'api_key': self.config.google_api_key})
+        )
+
+        # Add each run of same-speaker lines as a conversation turn
+        multi_speaker_markup = texttospeech_v1beta1.MultiSpeakerMarkup()
+        for line in combine_consecutive_speaker_chunks(batch):
+            turn = texttospeech_v1beta1.MultiSpeakerMarkup.Turn()
+            turn.text = line['text']
+            turn.speaker = self.settings['voice_mapping'][line['speaker']]
+            multi_speaker_markup.turns.append(turn)
+
+        voice = texttospeech_v1beta1.VoiceSelectionParams(
+            language_code=self.settings['language_code'],
+            name='en-US-Studio-MultiSpeaker'
+        )
+        audio_config = texttospeech_v1beta1.AudioConfig(
+            audio_encoding=(texttospeech_v1beta1.AudioEncoding.LINEAR16 if self.audio_format == 'wav'
+                            else texttospeech_v1beta1.AudioEncoding.MP3_64_KBPS),
+            effects_profile_id=self.settings['effects_profile_id']
+        )
+
+        response = client.synthesize_speech(
+            input=texttospeech_v1beta1.SynthesisInput(multi_speaker_markup=multi_speaker_markup),
+            voice=voice,
+            audio_config=audio_config
+        )
+        return response.audio_content
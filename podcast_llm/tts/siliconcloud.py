@@ -0,0 +1,41 @@
+"""
+SiliconCloud text-to-speech provider.
+
+Synthesizes one speaker turn per request through SiliconCloud's OpenAI-compatible
+speech API, with the voices and models configured in
+``config.tts_settings['siliconcloud']``.
+"""
+
+
+import os
+
+import openai
+
+from podcast_llm.tts.base import BaseTTSProvider, TTSProviderLimits
+from podcast_llm.utils.shared_clients import client_key, get_shared_client
+
+
+class SiliconCloudTTSProvider(BaseTTSProvider):
+    """SiliconCloud TTS with one voice and model per speaker."""
+    name = 'siliconcloud'
+    limits = TTSProviderLimits(native_format='mp3', alternative_formats=('wav',), max_chars=1000)
+
+    def synthesize_sync(self, batch):
+        turn, = batch
+        api_key = os.getenv("SILICONFLOW_API_KEY")  # 从 https://cloud.siliconflow.cn/account/ak 获取
+        client = get_shared_client(
+            client_key('tts/siliconcloud', api_key),
+            lambda: openai.OpenAI(api_key=api_key, base_url="https://api.siliconflow.cn/v1")
+        )
+
+        # Map speakers to voices and models
+        voice = self.settings['voice_mapping'].get(turn['speaker'], 'alex')
+        model = self.settings.get('model_mapping', {}).get(turn['speaker'], 'FunAudioLLM/CosyVoice2-0.5B')
+
+        response = client.audio.speech.create(
+            model=model,
+            voice=f"{model}:{voice}",  # 系统预置音色
+            input=turn['text'],
+            response_format=self.audio_format  # 支持 mp3, wav, pcm, opus 格式
+        )
+        return response.content
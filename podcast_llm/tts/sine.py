@@ -0,0 +1,69 @@
+"""
+Local stub text-to-speech provider generating sine-wave audio.
+
+Produces deterministic WAV audio without network access or API keys: one tone per
+speaker, with a duration proportional to the text length. Used for offline tests,
+development of the audio pipeline and benchmarks of the synthesis scheduler. An
+artificial per-request latency can be configured to mimic a remote provider.
+
+Settings (``config.tts_settings['sine']``, all optional):
+- frequencies: Tone frequency in Hz per speaker
+- chars_per_second: Speaking rate used to derive the duration
+- sample_rate: Sample rate of the generated audio
+- latency_ms: Delay added to every request
+"""
+
+
+import asyncio
+import io
+import wave
+
+import numpy as np
+
+from podcast_llm.tts.base import BaseTTSProvider, TTSProviderLimits
+
+
+DEFAULT_FREQUENCIES = {'Interviewer': 440.0, 'Interviewee': 330.0}
+
+
+class SineTTSProvider(BaseTTSProvider):
+    """Offline stub provider returning a sine tone per turn as 16-bit mono WAV."""
+    name = 'sine'
+    limits = TTSProviderLimits(native_format='wav', max_chars=1000, max_concurrency=8,
+                               requests_per_minute=6000, burst=8)
+
+    async def synthesize(self, batch):
+        latency_ms = self.settings.get('latency_ms', 0)
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return self.render(batch)
+
+    def render(self, batch) -> bytes:
+        """
+        Generate the audio for a batch without the configured latency.
+
+        Args:
+            batch (List[dict]): Turns with 'speaker' and 'text'
+
+        Returns:
+            bytes: WAV audio with one tone per turn
+        """
+        sample_rate = self.settings.get('sample_rate', 24000)
+        chars_per_second = self.settings.get('chars_per_second', 15)
+        frequencies = {**DEFAULT_FREQUENCIES, **self.settings.get('frequencies', {})}
+
+        tones = []
+        for turn in batch:
+            duration_s = max(0.1, len(turn['text']) / chars_per_second)
+            t = np.arange(int(duration_s * sample_rate)) / sample_rate
+            frequency = frequencies.get(turn['speaker'], 220.0)
+            tones.append(0.3 * np.sin(2 * np.pi * frequency * t))
+        samples = (np.concatenate(tones) * 32767).astype('<i2')
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(samples.tobytes())
+        return buffer.getvalue()
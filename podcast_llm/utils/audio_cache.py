@@ -0,0 +1,156 @@
+"""
+Content-addressed cache for synthesized audio.
+
+Text-to-speech requests are slow and billed per character, while most lines of an
+episode are unchanged when a script is edited and regenerated. This module stores the
+audio returned for each request under a hash of everything that determines the audio
+(provider, voice settings, speaker and text), so only new or edited lines are sent to
+the TTS provider again.
+
+Key components:
+- AudioCache: A size-bounded directory of audio files with least-recently-used eviction
+- tts_cache_key: Helper function building the cache key for a TTS request
+
+Example:
+    cache = AudioCache('.cache/tts', max_bytes=512 * 1024 * 1024)
+    key = tts_cache_key('google', config.tts_settings['google'], 'Interviewer', text)
+    audio = cache.get(key, 'mp3')
+    if audio is None:
+        audio = provider.synthesize_sync([{'speaker': 'Interviewer', 'text': text}])
+        cache.put(key, 'mp3', audio)
+"""
+
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from podcast_llm.utils.disk_cache import hash_key
+
+
+logger = logging.getLogger(__name__)
+
+
+def tts_cache_key(provider: str, voice_settings: Any, speaker: Any, text: Any) -> str:
+    """
+    Build the cache key for a TTS request.
+
+    Args:
+        provider (str): TTS provider name
+        voice_settings (Any): Provider settings affecting the audio (voices, models, effects)
+        speaker (Any): Speaker identifier, or None for multi-speaker requests
+        text (Any): Cleaned text, or the list of lines for multi-speaker requests
+
+    Returns:
+        str: Hex digest identifying the audio
+    """
+    return hash_key(provider, voice_settings, speaker, text)
+
+
+class AudioCache:
+    """
+    A size-bounded, content-addressed store of audio files.
+
+    Each entry is a single file named ``<key>.<format>``. Reading an entry refreshes its
+    modification time, and when the total size exceeds ``max_bytes`` the entries with the
+    oldest modification time are deleted first. Safe to use from multiple threads.
+
+    Attributes:
+        cache_dir (Path): Directory holding the audio files
+        max_bytes (int): Maximum total size of the cache in bytes
+    """
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize the AudioCache.
+
+        Args:
+            cache_dir (str): Directory holding the audio files
+            max_bytes (int): Maximum total size of the cache in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes = sum(
+            p.stat().st_size for p in self.cache_dir.iterdir() if p.is_file() and p.suffix != '.tmp'
+        )
+
+    def _path(self, key: str, audio_format: str) -> Path:
+        return self.cache_dir / f'{key}.{audio_format}'
+
+    def contains(self, key: str, audio_format: str) -> bool:
+        """
+        Check whether audio is cached without reading it.
+
+        Args:
+            key (str): Cache key from tts_cache_key
+            audio_format (str): Audio file extension (e.g. 'mp3')
+
+        Returns:
+            bool: True if the entry exists
+        """
+        return self._path(key, audio_format).exists()
+
+    def get(self, key: str, audio_format: str) -> Optional[bytes]:
+        """
+        Load cached audio.
+
+        Args:
+            key (str): Cache key from tts_cache_key
+            audio_format (str): Audio file extension (e.g. 'mp3')
+
+        Returns:
+            bytes: The cached audio, or None on a cache miss
+        """
+        path = self._path(key, audio_format)
+        try:
+            with open(path, 'rb') as f:
+                audio = f.read()
+        except FileNotFoundError:
+            return None
+
+        # Mark as recently used
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        return audio
+
+    def put(self, key: str, audio_format: str, audio: bytes) -> None:
+        """
+        Store audio in the cache, evicting least recently used entries if needed.
+
+        Args:
+            key (str): Cache key from tts_cache_key
+            audio_format (str): Audio file extension (e.g. 'mp3')
+            audio (bytes): Audio data to store
+        """
+        path = self._path(key, audio_format)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(audio)
+
+        with self._lock:
+            previous_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            self._total_bytes += len(audio) - previous_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(
+            (p for p in self.cache_dir.iterdir() if p.is_file() and p.suffix != '.tmp'),
+            key=lambda p: p.stat().st_mtime
+        )
+        for entry in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            entry.unlink()
+            self._total_bytes -= size
+            logger.debug(f'Evicted cached audio {entry.name}')
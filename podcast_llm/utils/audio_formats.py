@@ -0,0 +1,212 @@
+"""
+Audio format negotiation and container-level helpers.
+
+Decoding every synthesized segment and re-encoding the episode costs CPU time and, when
+providers return a lossy format such as MP3, a second generation of lossy compression.
+This module picks the segment format requested from the TTS provider so that audio is
+either copied into the episode without decoding (when segments already match the output
+codec) or delivered losslessly as WAV and encoded exactly once, and provides the
+parsing needed to copy MP3 and WAV data without ffmpeg.
+
+Key components:
+- negotiate_segment_format: Chooses the provider output format and whether segments can
+  be stream-copied into the episode
+- read_mp3_frames: Walks the MPEG audio frames of an MP3 segment, returning its stream
+  parameters, duration and frame data without tags or VBR header frames
+- read_wav: Reads the PCM parameters and frames of a WAV segment
+- pcm_to_wav: Wraps raw PCM returned by a provider in a WAV container
+
+Example:
+    segment_format, stream_copy = negotiate_segment_format(['mp3', 'wav'], 'mp3', settings)
+"""
+
+
+import io
+import wave
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+
+# Formats the episode writer can assemble without decoding and re-encoding
+STREAM_COPY_FORMATS = ('mp3', 'wav')
+
+# Lossless format requested when segments have to be decoded anyway
+LOSSLESS_FORMAT = 'wav'
+
+# Audio settings that require decoded PCM; any of them rules out stream copying
+PCM_SETTINGS = ('crossfade_ms', 'normalize', 'sample_rate', 'channels', 'bitrate')
+
+_MP3_BITRATES = {
+    'mpeg1': [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    'mpeg2': [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+}
+_MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],  # MPEG 1
+    2: [22050, 24000, 16000],  # MPEG 2
+    0: [11025, 12000, 8000]    # MPEG 2.5
+}
+
+
+@dataclass
+class AudioStreamInfo:
+    """
+    Stream parameters of an audio segment.
+
+    Attributes:
+        sample_rate (int): Samples per second
+        channels (int): Channel count
+        duration (float): Duration in seconds
+        bitrate (int): Bitrate of the first frame in kbit/s for MP3, 0 for PCM
+    """
+    sample_rate: int
+    channels: int
+    duration: float
+    bitrate: int = 0
+
+
+def negotiate_segment_format(supported_formats: Sequence[str], output_format: str,
+                             audio_settings: dict) -> Tuple[str, bool]:
+    """
+    Choose the format to request from the TTS provider.
+
+    Segments are stream-copied into the episode when the provider can return the output
+    format directly and no setting requires decoded audio (silence between segments is
+    still possible). Otherwise a lossless format is requested when supported, so audio is
+    decoded cheaply and encoded exactly once; failing that the provider's native format.
+
+    Args:
+        supported_formats (Sequence[str]): Formats the provider can return, native first
+        output_format (str): Format of the episode file
+        audio_settings (dict): Assembly settings (see get_audio_settings)
+
+    Returns:
+        Tuple[str, bool]: Segment format and whether segments can be stream-copied
+    """
+    needs_pcm = any(audio_settings.get(key) for key in PCM_SETTINGS)
+    if not needs_pcm and output_format in STREAM_COPY_FORMATS and output_format in supported_formats:
+        return output_format, True
+    if LOSSLESS_FORMAT in supported_formats:
+        return LOSSLESS_FORMAT, False
+    return supported_formats[0], False
+
+
+def _skip_id3v2(data: bytes) -> int:
+    if data[:3] != b'ID3' or len(data) < 10:
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _parse_mp3_header(data: bytes, offset: int):
+    """Parse the Layer III frame header at offset; returns (frame_length, sample_rate, channels, samples, mpeg1, bitrate) or None."""
+    if offset + 4 > len(data) or data[offset] != 0xFF or (data[offset + 1] & 0xE0) != 0xE0:
+        return None
+    version = (data[offset + 1] >> 3) & 3
+    layer = (data[offset + 1] >> 1) & 3
+    bitrate_index = data[offset + 2] >> 4
+    rate_index = (data[offset + 2] >> 2) & 3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES['mpeg1' if mpeg1 else 'mpeg2'][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (data[offset + 2] >> 1) & 1
+    channels = 1 if (data[offset + 3] >> 6) == 3 else 2
+    frame_length = (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+    return frame_length, sample_rate, channels, 1152 if mpeg1 else 576, mpeg1, bitrate // 1000
+
+
+def _is_vbr_header(data: bytes, offset: int, channels: int, mpeg1: bool) -> bool:
+    side_info = (32 if channels == 2 else 17) if mpeg1 else (17 if channels == 2 else 9)
+    tag = data[offset + 4 + side_info:offset + 8 + side_info]
+    return tag in (b'Xing', b'Info') or data[offset + 36:offset + 40] == b'VBRI'
+
+
+def read_mp3_frames(data: bytes) -> Tuple[AudioStreamInfo, bytes]:
+    """
+    Walk the MPEG Layer III frames of an MP3 file.
+
+    ID3 tags, Xing/Info/VBRI header frames and trailing data are dropped, so the returned
+    frames of several files can be concatenated into one valid stream.
+
+    Args:
+        data (bytes): MP3 file contents
+
+    Returns:
+        Tuple[AudioStreamInfo, bytes]: Stream parameters and the audio frames
+
+    Raises:
+        ValueError: If the data contains no MP3 frames or the stream parameters change
+    """
+    start = offset = _skip_id3v2(data)
+    info = None
+    samples = 0
+    first = True
+    while True:
+        header = _parse_mp3_header(data, offset)
+        if header is None:
+            if info is None and offset < min(len(data), start + 4096):
+                # Tolerate a little junk before the first frame
+                offset += 1
+                start = offset
+                continue
+            break
+        frame_length, sample_rate, channels, frame_samples, mpeg1, bitrate = header
+        if offset + frame_length > len(data):
+            break
+        if first and _is_vbr_header(data, offset, channels, mpeg1):
+            start = offset + frame_length
+        else:
+            if info is None:
+                info = (sample_rate, channels)
+                first_bitrate = bitrate
+            elif info != (sample_rate, channels):
+                raise ValueError('MP3 stream parameters change mid-stream')
+            samples += frame_samples
+        first = False
+        offset += frame_length
+
+    if info is None:
+        raise ValueError('No MP3 frames found')
+    return AudioStreamInfo(info[0], info[1], samples / info[0], first_bitrate), data[start:offset]
+
+
+def pcm_to_wav(pcm: bytes, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    """
+    Wrap raw little-endian PCM in a WAV container.
+
+    Args:
+        pcm (bytes): Raw PCM frames
+        sample_rate (int): Samples per second
+        channels (int): Channel count
+        sample_width (int): Bytes per sample
+
+    Returns:
+        bytes: WAV file contents
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def read_wav(data: bytes) -> Tuple[AudioStreamInfo, int, bytes]:
+    """
+    Read a PCM WAV file.
+
+    Args:
+        data (bytes): WAV file contents
+
+    Returns:
+        Tuple[AudioStreamInfo, int, bytes]: Stream parameters, sample width in bytes and
+            the raw PCM frames
+    """
+    with wave.open(io.BytesIO(data)) as wav:
+        frames = wav.readframes(wav.getnframes())
+        info = AudioStreamInfo(wav.getframerate(), wav.getnchannels(), wav.getnframes() / wav.getframerate())
+        return info, wav.getsampwidth(), frames
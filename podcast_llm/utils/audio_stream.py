@@ -0,0 +1,470 @@
+"""
+Streaming audio assembly for podcast episodes.
+
+Concatenating pydub AudioSegments with ``combined += audio`` copies the whole episode's
+raw PCM on every append and keeps it all in memory until export. This module instead
+decodes one segment at a time to PCM and pipes it straight into a single ffmpeg encoder
+process, so assembly runs in linear time with memory bounded by the largest segment.
+When the segments already have the output codec and no setting needs decoded audio,
+their MP3 frames or WAV samples are copied into the output file without decoding or
+re-encoding at all (see podcast_llm.utils.audio_formats).
+
+Key components:
+- AudioStreamWriter: Incrementally encodes (or stream-copies) segments into one output
+  file, with optional silence or crossfades between segments and loudness normalization
+- SegmentBuffer: Thread-safe, ordered hand-off of synthesized segments to the writer that
+  keeps segments in memory and spills them to disk only above a size threshold
+- get_audio_settings: Helper function reading assembly settings from the config
+
+Example:
+    with AudioStreamWriter('episode.mp3', 'mp3', silence_ms=200) as writer:
+        for path in segment_files:
+            writer.append(path)
+"""
+
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+from io import BytesIO
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+from pydub import AudioSegment
+
+from podcast_llm.config import PodcastConfig
+from podcast_llm.utils.audio_formats import STREAM_COPY_FORMATS, read_mp3_frames, read_wav
+from podcast_llm.utils.telemetry import Span, end_span, span, start_span
+
+
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+# Settings used when config.audio_settings has no value for them
+DEFAULT_AUDIO_SETTINGS = {
+    'sample_rate': None,   # None: use the first segment's sample rate
+    'channels': None,      # None: use the first segment's channel count
+    'bitrate': None,       # None: ffmpeg's default for the output codec
+    'silence_ms': 0,
+    'crossfade_ms': 0,
+    'normalize': False,
+    'segment_format': 'auto',  # Format requested from the TTS provider (see negotiate_segment_format)
+    'buffer_mb': 256,      # Synthesized audio held in memory before spilling to disk
+    'publish_segments': False  # Publish segments for playback during synthesis (see SegmentPlaylist)
+}
+
+
+def get_audio_settings(config: PodcastConfig) -> dict:
+    """
+    Get the audio assembly settings.
+
+    Reads ``config.audio_settings`` and fills in missing values from DEFAULT_AUDIO_SETTINGS.
+
+    Args:
+        config (PodcastConfig): Configuration object
+
+    Returns:
+        dict: Settings accepted as keyword arguments by AudioStreamWriter, plus 'buffer_mb'
+            for the SegmentBuffer, 'publish_segments' and 'segment_format'
+    """
+    settings = dict(DEFAULT_AUDIO_SETTINGS)
+    settings.update(config.audio_settings)
+    return settings
+
+
+class AudioStreamWriter:
+    """
+    Encode a sequence of audio segments into one file in a single ffmpeg pass.
+
+    Segments are decoded and resampled to a common PCM format one at a time and written to
+    the stdin of an ffmpeg process that encodes the output file incrementally. Between
+    segments the writer can insert silence or, when no silence is configured, crossfade the
+    end of one segment into the start of the next. Loudness normalization is applied by the
+    encoder (EBU R128 ``loudnorm`` filter) without a second pass.
+
+    The encoder is started when the first segment arrives, so the output sample rate and
+    channel count default to those of the first segment.
+
+    With ``stream_copy`` the writer skips the encoder: MP3 frames or WAV samples of each
+    segment are appended to the output file as they are, and silence is encoded once and
+    reused. Segments whose format or stream parameters differ from the first segment's are
+    converted individually. Stream copying is only possible for MP3 and WAV output without
+    resampling, crossfades or normalization; otherwise the flag is ignored.
+
+    Attributes:
+        segments_written (int): Number of segments appended so far
+        position (float): Duration of the audio written so far in seconds
+        last_start (float): Start time of the last appended segment in the output
+        last_range (Optional[Tuple[int, int]]): Offset and length of the last segment's
+            frames within the output audio data (MP3 frames or WAV samples); only known
+            when stream copying
+        payload_bytes (int): Size of the output audio data written when stream copying
+    """
+    def __init__(self,
+                 output_file: str,
+                 audio_format: str,
+                 sample_rate: Optional[int] = None,
+                 channels: Optional[int] = None,
+                 bitrate: Optional[str] = None,
+                 silence_ms: int = 0,
+                 crossfade_ms: int = 0,
+                 normalize: bool = False,
+                 stream_copy: bool = False):
+        """
+        Initialize the AudioStreamWriter.
+
+        Args:
+            output_file (str): Path where the assembled audio file should be saved
+            audio_format (str): Format for the output file (e.g. 'mp3', 'wav')
+            sample_rate (int, optional): Output sample rate. Defaults to the first segment's.
+            channels (int, optional): Output channel count. Defaults to the first segment's.
+            bitrate (str, optional): Output bitrate for lossy formats (e.g. '128k')
+            silence_ms (int): Silence inserted between consecutive segments
+            crossfade_ms (int): Crossfade between consecutive segments; only used when
+                silence_ms is 0
+            normalize (bool): Whether to apply loudness normalization
+            stream_copy (bool): Copy segments in the output format without re-encoding
+        """
+        self.output_file = str(output_file)
+        self.audio_format = audio_format
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.bitrate = bitrate
+        self.silence_ms = silence_ms
+        self.crossfade_ms = crossfade_ms if not silence_ms else 0
+        self.normalize = normalize
+        self.segments_written = 0
+        self.position = 0.0
+        self.last_start = 0.0
+        self.last_range: Optional[Tuple[int, int]] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._encode_span: Optional[Span] = None
+        self._tail: Optional[np.ndarray] = None
+
+        self.stream_copy = (stream_copy and audio_format in STREAM_COPY_FORMATS
+                            and not (sample_rate or channels or bitrate or self.crossfade_ms or normalize))
+        if stream_copy and not self.stream_copy:
+            logger.info(f'Re-encoding {self.output_file}: the audio settings require decoded audio')
+        self._output = None
+        self._copy_params: Optional[tuple] = None
+        self._copy_bitrate = 0
+        self._copy_silence: Optional[Tuple[float, bytes]] = None
+        self.payload_bytes = 0
+
+    def __enter__(self) -> 'AudioStreamWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def _start(self, segment: AudioSegment) -> None:
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            raise FileNotFoundError(
+                "FFmpeg/FFprobe not found. Please install FFmpeg and add it to your PATH. "
+                "Visit https://ffmpeg.org/download.html to download FFmpeg."
+            )
+
+        self.sample_rate = self.sample_rate or segment.frame_rate
+        self.channels = self.channels or segment.channels
+
+        command = [
+            ffmpeg, '-y', '-hide_banner', '-loglevel', 'error',
+            '-f', 's16le', '-ar', str(self.sample_rate), '-ac', str(self.channels), '-i', 'pipe:0'
+        ]
+        if self.normalize:
+            command += ['-af', 'loudnorm=I=-16:TP=-1.5:LRA=11', '-ar', str(self.sample_rate)]
+        if self.bitrate:
+            command += ['-b:a', self.bitrate]
+        command += ['-f', self.audio_format, self.output_file]
+
+        logger.debug(f"Starting audio encoder: {' '.join(command)}")
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Covers the encoder's whole lifetime, closed by close or abort
+        self._encode_span = start_span('ffmpeg.encode', kind='ffmpeg', format=self.audio_format,
+                                       normalize=self.normalize)
+
+    def _write(self, frames: np.ndarray) -> None:
+        if frames.size:
+            self._process.stdin.write(frames.astype(np.int16).tobytes())
+
+    def _to_frames(self, segment: AudioSegment) -> np.ndarray:
+        segment = (segment
+                   .set_frame_rate(self.sample_rate)
+                   .set_channels(self.channels)
+                   .set_sample_width(SAMPLE_WIDTH))
+        return np.frombuffer(segment.raw_data, dtype=np.int16).reshape(-1, self.channels)
+
+    def append(self, source: Union[str, bytes, AudioSegment], audio_format: Optional[str] = None) -> float:
+        """
+        Decode a segment and append it to the output.
+
+        Args:
+            source (Union[str, bytes, AudioSegment]): Path to an audio file, encoded audio
+                bytes, or an already decoded segment
+            audio_format (str, optional): Format of the source when it is bytes or a path
+                without a recognizable extension
+
+        Returns:
+            float: Duration of the segment in seconds
+        """
+        if self.stream_copy:
+            return self._append_copy(source, audio_format)
+
+        if isinstance(source, AudioSegment):
+            segment = source
+        else:
+            with span('ffmpeg.decode', kind='ffmpeg', format=audio_format or 'auto') as decode_span:
+                if isinstance(source, (bytes, bytearray)):
+                    decode_span.set(bytes=len(source))
+                    segment = AudioSegment.from_file(BytesIO(source), format=audio_format)
+                else:
+                    segment = AudioSegment.from_file(source, format=audio_format)
+
+        if self._process is None:
+            self._start(segment)
+        frames = self._to_frames(segment)
+        duration = len(frames) / self.sample_rate
+
+        if self.segments_written and self.silence_ms:
+            silence_frames = int(self.sample_rate * self.silence_ms / 1000)
+            self._write(np.zeros((silence_frames, self.channels), dtype=np.int16))
+            self.position += silence_frames / self.sample_rate
+        self.last_start = self.position
+
+        if self.crossfade_ms:
+            fade_frames = int(self.sample_rate * self.crossfade_ms / 1000)
+            if self._tail is not None:
+                overlap = min(len(self._tail), len(frames))
+                self.last_start -= overlap / self.sample_rate
+                ramp = np.linspace(0.0, 1.0, overlap, endpoint=False)[:, None]
+                mixed = self._tail[:overlap] * (1.0 - ramp) + frames[:overlap] * ramp
+                self._write(np.clip(mixed, -32768, 32767))
+                self._write(self._tail[overlap:])
+                frames = frames[overlap:]
+            # Hold back the end of this segment to mix with the next one
+            split = max(0, len(frames) - fade_frames)
+            self._write(frames[:split])
+            self._tail = frames[split:].astype(np.float64)
+        else:
+            self._write(frames)
+
+        self.position = self.last_start + duration
+        self.segments_written += 1
+        return duration
+
+    def _read_copy(self, data: bytes) -> Tuple[tuple, float, bytes]:
+        # Stream parameters, duration and raw frames of a segment in the output format
+        if self.audio_format == 'mp3':
+            info, frames = read_mp3_frames(data)
+            self._copy_bitrate = self._copy_bitrate or info.bitrate
+            return (info.sample_rate, info.channels), info.duration, frames
+        info, sample_width, frames = read_wav(data)
+        return (info.sample_rate, info.channels, sample_width), info.duration, frames
+
+    def _conform(self, segment: AudioSegment) -> Tuple[tuple, float, bytes]:
+        # Convert a decoded segment to the parameters of the output stream
+        if self._copy_params is None:
+            params = (segment.frame_rate, segment.channels)
+            self._copy_params = params if self.audio_format == 'mp3' else params + (SAMPLE_WIDTH,)
+        segment = segment.set_frame_rate(self._copy_params[0]).set_channels(self._copy_params[1])
+        if self.audio_format == 'wav':
+            segment = segment.set_sample_width(self._copy_params[2])
+            return self._copy_params, len(segment) / 1000, segment.raw_data
+
+        encoded = BytesIO()
+        segment.export(encoded, format='mp3', bitrate=f'{self._copy_bitrate or 128}k')
+        return self._read_copy(encoded.getvalue())
+
+    def _open_copy(self) -> None:
+        if self.audio_format == 'wav':
+            self._output = wave.open(self.output_file, 'wb')
+            self._output.setframerate(self._copy_params[0])
+            self._output.setnchannels(self._copy_params[1])
+            self._output.setsampwidth(self._copy_params[2])
+        else:
+            self._output = open(self.output_file, 'wb')
+
+    def _write_copy(self, frames: bytes) -> None:
+        if self.audio_format == 'wav':
+            self._output.writeframesraw(frames)
+        else:
+            self._output.write(frames)
+        self.payload_bytes += len(frames)
+
+    def _append_copy(self, source: Union[str, bytes, AudioSegment], audio_format: Optional[str]) -> float:
+        segment = source if isinstance(source, AudioSegment) else None
+        if isinstance(source, str):
+            audio_format = audio_format or os.path.splitext(source)[1][1:].lower()
+            with open(source, 'rb') as f:
+                source = f.read()
+
+        copied = None
+        if segment is None and audio_format == self.audio_format:
+            try:
+                copied = self._read_copy(bytes(source))
+            except (ValueError, EOFError, wave.Error) as e:
+                logger.debug(f'Cannot copy segment without decoding: {e}')
+            if copied is not None and self._copy_params not in (None, copied[0]):
+                logger.debug(f'Converting segment with stream parameters {copied[0]} to {self._copy_params}')
+                copied = None
+        if copied is None:
+            if segment is None:
+                segment = AudioSegment.from_file(BytesIO(source), format=audio_format)
+            copied = self._conform(segment)
+        params, duration, frames = copied
+
+        if self._output is None:
+            self._copy_params = params
+            self._open_copy()
+
+        if self.segments_written and self.silence_ms:
+            if self._copy_silence is None:
+                silence = AudioSegment.silent(duration=self.silence_ms, frame_rate=params[0])
+                self._copy_silence = self._conform(silence)[1:]
+            silence_duration, silence_frames = self._copy_silence
+            self._write_copy(silence_frames)
+            self.position += silence_duration
+
+        self.last_start = self.position
+        self.last_range = (self.payload_bytes, len(frames))
+        self._write_copy(frames)
+        self.position += duration
+        self.segments_written += 1
+        return duration
+
+    def close(self) -> None:
+        """
+        Flush remaining audio and wait for the encoder to finish writing the output file.
+
+        Raises:
+            RuntimeError: If no segments were written or ffmpeg fails
+        """
+        if self.stream_copy:
+            if self._output is None:
+                raise RuntimeError("No audio segments to write")
+            self._output.close()
+            return
+
+        if self._process is None:
+            raise RuntimeError("No audio segments to write")
+
+        if self._tail is not None:
+            self._write(np.clip(self._tail, -32768, 32767))
+            self._tail = None
+
+        _, stderr = self._process.communicate()
+        if self._process.returncode != 0:
+            error = RuntimeError(f"ffmpeg failed to encode {self.output_file}: {stderr.decode(errors='replace')}")
+            end_span(self._encode_span, error)
+            raise error
+        self._encode_span.set(segments=self.segments_written, duration_audio_s=round(self.position, 3),
+                              bytes=os.path.getsize(self.output_file))
+        end_span(self._encode_span)
+
+    def abort(self) -> None:
+        """Stop the encoder without finishing the output file."""
+        if self._output is not None:
+            self._output.close()
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        if self._encode_span is not None:
+            end_span(self._encode_span, RuntimeError('aborted'))
+
+
+class SegmentBuffer:
+    """
+    Ordered hand-off of audio segments from concurrent producers to a single consumer.
+
+    TTS workers finish out of order while the writer needs segments in script order, so
+    finished segments wait here until their turn. Segments are kept in memory while the
+    buffered total stays under ``max_bytes``; beyond that they are written to temporary
+    files in ``spill_dir`` and read back when taken. Safe to use from multiple threads.
+    """
+    def __init__(self, max_bytes: int, spill_dir: Optional[str] = None):
+        """
+        Initialize the SegmentBuffer.
+
+        Args:
+            max_bytes (int): Maximum size of the segments held in memory
+            spill_dir (str, optional): Directory for spilled segments. Defaults to the
+                system temporary directory.
+        """
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.spilled_segments = 0
+        self._memory: Dict[int, bytes] = {}
+        self._spilled: Dict[int, str] = {}
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, index: int, audio: bytes) -> None:
+        """
+        Store a finished segment.
+
+        Args:
+            index (int): Position of the segment in the output
+            audio (bytes): Encoded audio data
+        """
+        with self._lock:
+            if self._memory_bytes + len(audio) <= self.max_bytes:
+                self._memory[index] = audio
+                self._memory_bytes += len(audio)
+                return
+
+        fd, path = tempfile.mkstemp(dir=self.spill_dir, prefix=f'{index:05d}_', suffix='.seg')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(audio)
+        with self._lock:
+            self._spilled[index] = path
+            self.spilled_segments += 1
+        logger.debug(f'Spilled audio segment {index} to {path}')
+
+    def take(self, index: int) -> bytes:
+        """
+        Remove and return a stored segment.
+
+        Args:
+            index (int): Position of the segment in the output
+
+        Returns:
+            bytes: Encoded audio data
+
+        Raises:
+            KeyError: If no segment was stored for the index
+        """
+        with self._lock:
+            if index in self._memory:
+                audio = self._memory.pop(index)
+                self._memory_bytes -= len(audio)
+                return audio
+            path = self._spilled.pop(index)
+
+        with open(path, 'rb') as f:
+            audio = f.read()
+        os.remove(path)
+        return audio
+
+    def clear(self) -> None:
+        """Drop all stored segments and delete spilled files."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            paths = list(self._spilled.values())
+            self._spilled.clear()
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
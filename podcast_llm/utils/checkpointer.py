@@ -9,6 +9,7 @@ that may need to be interrupted and resumed.
 Key components:
 - Checkpointer: A class that manages saving/loading of checkpoint data with configurable
   paths and serialization
+- fingerprint: Helper function reducing stage inputs to stable, hashable data
 - to_snake_case: Helper function for converting checkpoint names to valid filenames
 
 The checkpointing system helps with:
@@ -17,15 +18,32 @@ The checkpointing system helps with:
 - Debugging by examining saved checkpoint states
 - Reducing wasted computation on process restarts
 
-The module uses pickle for serialization by default but is designed to be extensible
-to other serialization formats as needed.
+Checkpoints are content-addressed: the file name contains a hash of the stage name and
+the stage inputs (including the configuration), so changing sources, settings, language
+or the number of Q&A rounds never reuses a stale result. Stages can also checkpoint
+individual units of work (a Q&A turn, a rewrite batch), so a resumed run only redoes the
+unit that failed.
+
+Results are stored as gzip-compressed JSON, with LangChain documents and Pydantic models
+encoded by type. Results that cannot be represented this way fall back to pickle.
 """
 
 
+import dataclasses
+import gzip
+import importlib
+import json
 import logging
-from typing import Any, Callable
-from pathlib import Path
+import os
 import pickle
+import tempfile
+from typing import Any, Callable, Optional
+from pathlib import Path
+
+from langchain_core.documents import Document
+from pydantic import BaseModel
+
+from podcast_llm.utils.disk_cache import hash_key
 
 
 logger = logging.getLogger(__name__)
@@ -64,6 +82,79 @@ def to_snake_case(text: str) -> str:
 
 
 
+def fingerprint(value: Any) -> Any:
+    """
+    Reduce a stage input to JSON-compatible data that identifies it.
+
+    Documents are reduced to their content and metadata, Pydantic models and dataclasses
+    to their fields (dropping ``*_api_key`` fields, so rotating a key does not invalidate
+    checkpoints), and containers are converted recursively. Other objects are identified
+    by their type only; pass explicit ``key_parts`` for inputs like LLM chains.
+
+    Args:
+        value (Any): Stage input
+
+    Returns:
+        Any: JSON-compatible fingerprint
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, Document):
+        return {'page_content': value.page_content, 'metadata': fingerprint(value.metadata)}
+    if isinstance(value, BaseModel):
+        return {type(value).__name__: fingerprint(value.model_dump())}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            type(value).__name__: {
+                field.name: fingerprint(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+                if not field.name.endswith('_api_key')
+            }
+        }
+    if isinstance(value, dict):
+        return {str(k): fingerprint(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        items = [fingerprint(v) for v in value]
+        return sorted(items, key=repr) if isinstance(value, set) else items
+    return f'<{type(value).__module__}.{type(value).__qualname__}>'
+
+
+def _encode(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Document):
+        return {'__document__': {'page_content': value.page_content, 'metadata': _encode(value.metadata)}}
+    if isinstance(value, BaseModel):
+        return {'__model__': f'{type(value).__module__}:{type(value).__qualname__}',
+                'data': value.model_dump(mode='json')}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        if '__document__' in value or '__model__' in value:
+            raise TypeError('Reserved key in checkpoint data')
+        return {k: _encode(v) for k, v in value.items()}
+    raise TypeError(f'Cannot encode {type(value).__name__} as JSON')
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if isinstance(value, dict):
+        if '__document__' in value:
+            data = value['__document__']
+            return Document(page_content=data['page_content'], metadata=_decode(data['metadata']))
+        if '__model__' in value:
+            module_name, class_name = value['__model__'].split(':')
+            model_class = importlib.import_module(module_name)
+            for attr in class_name.split('.'):
+                model_class = getattr(model_class, attr)
+            return model_class.model_validate(value['data'])
+        return {k: _decode(v) for k, v in value.items()}
+    return value
+
+
 class Checkpointer:
     """
     A class for managing checkpointing of intermediate results during processing.
@@ -75,7 +166,9 @@ class Checkpointer:
     - Configurable checkpoint directory and key prefix for files
     - Can be enabled/disabled via constructor
     - Automatically creates checkpoint directory if needed
-    - Saves results as pickle files with stage-specific names
+    - Checkpoints are keyed by a hash of the stage name and inputs, so changed inputs
+      never load a stale result
+    - Written atomically as gzip-compressed JSON (pickle only as a fallback)
     - Loads from existing checkpoints when available
     
     Example usage:
@@ -86,15 +179,22 @@ class Checkpointer:
         
         # Will save result to disk and return it
         result = checkpointer.checkpoint(
-            expensive_computation(), 
+            expensive_computation, config, topic,
             stage_name='stage1'
         )
         
-        # On subsequent runs, will load from disk instead of recomputing
+        # On subsequent runs with the same inputs, will load from disk instead of recomputing
         result = checkpointer.checkpoint(
-            expensive_computation(),
+            expensive_computation, config, topic,
             stage_name='stage1'
         )
+
+        # Inputs that cannot be fingerprinted (e.g. LLM chains) are keyed explicitly
+        line = checkpointer.checkpoint(
+            rewrite, batch, chain,
+            stage_name='rewrite_batch',
+            key_parts=(batch, language)
+        )
     """
     def __init__(self, checkpoint_key: str, checkpoint_dir: str = '.checkpoints', enabled: bool = True):
         """
@@ -112,25 +212,107 @@ class Checkpointer:
         if enabled:
             self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
-    def checkpoint(self, fn: Callable, *args, stage_name: str = 'result', **kwargs) -> Any:
+    def input_key(self, stage_name: str, inputs: Any) -> str:
+        """
+        Compute the content hash identifying a stage run.
+
+        Args:
+            stage_name (str): Name of the stage or unit of work
+            inputs (Any): Stage inputs (see fingerprint)
+
+        Returns:
+            str: Hex digest of the stage name and inputs
+        """
+        return hash_key(stage_name, fingerprint(inputs))
+
+    def _path(self, stage_name: str, digest: str, extension: str) -> Path:
+        return self.checkpoint_dir / f'{self.checkpoint_key}_{stage_name}_{digest[:20]}{extension}'
+
+    def load(self, stage_name: str, digest: str) -> tuple:
+        """
+        Load a checkpoint.
+
+        Args:
+            stage_name (str): Name of the stage or unit of work
+            digest (str): Input hash from input_key
+
+        Returns:
+            tuple: (True, result) if a readable checkpoint exists, otherwise (False, None)
+        """
+        json_file = self._path(stage_name, digest, '.json.gz')
+        pickle_file = self._path(stage_name, digest, '.pkl')
+        try:
+            if json_file.exists():
+                logger.info(f'Loading checkpoint from {json_file}')
+                with gzip.open(json_file, 'rt', encoding='utf-8') as f:
+                    return True, _decode(json.load(f))
+            if pickle_file.exists():
+                logger.info(f'Loading checkpoint from {pickle_file}')
+                with open(pickle_file, 'rb') as f:
+                    return True, pickle.load(f)
+        except Exception as e:
+            logger.warning(f'Ignoring unreadable checkpoint for {stage_name}: {e}')
+        return False, None
+
+    def save(self, stage_name: str, digest: str, result: Any) -> None:
+        """
+        Save a checkpoint atomically.
+
+        Args:
+            stage_name (str): Name of the stage or unit of work
+            digest (str): Input hash from input_key
+            result (Any): Result to store
+        """
+        try:
+            payload = gzip.compress(json.dumps(_encode(result), ensure_ascii=False,
+                                               separators=(',', ':')).encode('utf-8'))
+            checkpoint_file = self._path(stage_name, digest, '.json.gz')
+        except TypeError:
+            payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            checkpoint_file = self._path(stage_name, digest, '.pkl')
+
+        logger.info(f'Saving checkpoint to {checkpoint_file}')
+        fd, tmp_path = tempfile.mkstemp(dir=self.checkpoint_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, checkpoint_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def checkpoint(self,
+                   fn: Callable,
+                   *args,
+                   stage_name: str = 'result',
+                   key_parts: Optional[Any] = None,
+                   **kwargs) -> Any:
+        """
+        Return the checkpointed result of ``fn(*args, **kwargs)``, computing and saving it if needed.
+
+        Args:
+            fn (Callable): Function computing the result
+            *args: Positional arguments for fn
+            stage_name (str): Name of the stage or unit of work
+            key_parts (Any, optional): Values identifying the inputs. Defaults to the
+                fingerprint of args and kwargs.
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Any: The loaded or computed result
+        """
         if not self.enabled:
             return fn(*args, **kwargs)
 
-        # Generate checkpoint filename using base key
-        checkpoint_file = self.checkpoint_dir / f'{self.checkpoint_key}_{stage_name}.pkl'
+        digest = self.input_key(stage_name, key_parts if key_parts is not None else (args, kwargs))
 
         # Try to load from checkpoint
-        if checkpoint_file.exists():
-            logger.info(f'Loading checkpoint from {checkpoint_file}')
-            with open(checkpoint_file, 'rb') as f:
-                return pickle.load(f)
-        
+        found, result = self.load(stage_name, digest)
+        if found:
+            return result
+
         # If it doesn't exist, call the function
         result = fn(*args, **kwargs)
-
-        # Save checkpoint
-        logger.info(f'Saving checkpoint to {checkpoint_file}')
-        with open(checkpoint_file, 'wb') as f:
-            pickle.dump(result, f)
-
+        self.save(stage_name, digest, result)
         return result
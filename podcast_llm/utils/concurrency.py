@@ -0,0 +1,66 @@
+"""
+Helpers for running concurrent work from the synchronous generation pipeline.
+
+The podcast generation stages are plain synchronous functions (they are wrapped by
+the Checkpointer and executed from the CLI or from a worker thread in the Shiny
+app), while several stages fan out to many network calls internally. This module
+bridges the two worlds.
+
+Functions:
+    run_sync: Run a coroutine to completion from synchronous code
+    submit_with_context: Submit work to an executor in the caller's context
+"""
+
+
+import asyncio
+import concurrent.futures
+import contextvars
+from typing import Any, Callable, Coroutine, TypeVar
+
+
+T = TypeVar('T')
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion and return its result.
+
+    Uses ``asyncio.run`` when the calling thread has no running event loop. When called
+    from inside a running loop (e.g. from an async UI callback), the coroutine is run on
+    a fresh loop in a helper thread so the caller's loop is never re-entered.
+
+    Args:
+        coro (Coroutine): The coroutine to run
+
+    Returns:
+        Any: The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return submit_with_context(executor, asyncio.run, coro).result()
+
+
+def submit_with_context(executor: concurrent.futures.Executor,
+                        fn: Callable[..., T],
+                        *args: Any,
+                        **kwargs: Any) -> 'concurrent.futures.Future[T]':
+    """
+    Submit a call to an executor, running it in a copy of the caller's context.
+
+    Worker threads do not inherit context variables, so without this the call would
+    lose e.g. the caller's telemetry span (see utils.telemetry).
+
+    Args:
+        executor (Executor): The executor
+        fn (Callable): The function to call
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        Future: The call's future
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
@@ -7,10 +7,13 @@ import os
 import logging
 from typing import Any, Callable
 from pathlib import Path
-from src.filecontentextract import FileContentExtract, FileMatchList
+from podcast_llm.utils.lazy_imports import lazy_import
 
 logger = logging.getLogger(__name__)
 
+# Imported on first search (pulls in the LLM client and document converters)
+filecontentextract = lazy_import('src.filecontentextract')
+
 def content_search(api_key=os.getenv("OPENAI_API_KEY", "sk-xxx"),
                   base_url=os.getenv("OPENAI_BASE_URL", "https://api.siliconflow.cn/v1"),
                   model_name=os.getenv("OPENAI_MODEL", "Qwen/Qwen2.5-7B-Instruct"),
@@ -18,7 +21,7 @@ def content_search(api_key=os.getenv("OPENAI_API_KEY", "sk-xxx"),
                   context=None
                   ) -> str:
 
-    researcher = FileContentExtract(
+    researcher = filecontentextract.FileContentExtract(
         model=model_name,
         api_key=api_key,
         api_base=base_url,
@@ -31,7 +34,7 @@ def content_search(api_key=os.getenv("OPENAI_API_KEY", "sk-xxx"),
     )
 
 
-    response_matches: FileMatchList = result
+    response_matches: 'filecontentextract.FileMatchList' = result
 
     # 组装 sources_gathered
     sources_gathered = []
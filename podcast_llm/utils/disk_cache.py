@@ -0,0 +1,188 @@
+"""
+Utilities for caching JSON-serializable results on disk.
+
+This module provides a small content-addressed cache used to avoid repeating
+expensive network calls (search queries, page downloads, article lookups) across
+podcast generation runs. Entries are stored as individual JSON files named by a
+hash of their key, grouped into one sub-directory per namespace. A namespace can be
+bounded by entry age and total size.
+
+Key components:
+- DiskCache: A namespaced key/value store backed by JSON files
+- hash_key: Helper function for turning arbitrary key parts into a stable digest
+
+Example:
+    cache = DiskCache('.cache', namespace='tavily')
+    urls = cache.get('history of jazz')
+    if urls is None:
+        urls = search('history of jazz')
+        cache.set('history of jazz', urls)
+"""
+
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def hash_key(*parts: Any) -> str:
+    """
+    Build a stable SHA-256 hex digest from one or more key parts.
+
+    Args:
+        *parts: Values making up the key. Non-string values are JSON encoded with
+            sorted keys so that equal values always produce the same digest.
+
+    Returns:
+        str: Hex digest identifying the key
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, str):
+            part = json.dumps(part, sort_keys=True, ensure_ascii=False, default=str)
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    A namespaced, file-per-entry JSON cache.
+
+    Each entry is written atomically (temporary file followed by a rename) so that
+    concurrent writers and interrupted runs never leave a half-written entry behind.
+    Unreadable entries are treated as cache misses. Entries older than ``ttl_s`` are
+    misses too and are deleted when read, and when the namespace grows beyond
+    ``max_bytes`` the oldest entries are deleted first. Safe to use from multiple threads.
+
+    Attributes:
+        cache_dir (Path): Directory holding the entries of this namespace
+        enabled (bool): Whether reads and writes are performed at all
+        ttl_s (float): Seconds an entry stays valid after it was written, or None for no expiry
+        max_bytes (int): Maximum total size of the namespace in bytes, or None for no limit
+    """
+    def __init__(self,
+                 cache_dir: str,
+                 namespace: str,
+                 enabled: bool = True,
+                 ttl_s: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Initialize the DiskCache.
+
+        Args:
+            cache_dir (str): Root directory for all cache namespaces
+            namespace (str): Sub-directory used for this cache's entries
+            enabled (bool): Whether to enable caching functionality
+            ttl_s (float, optional): Seconds an entry stays valid after it was written.
+                Defaults to None (no expiry).
+            max_bytes (int, optional): Maximum total size of the namespace in bytes.
+                Defaults to None (no limit).
+        """
+        self.cache_dir = Path(cache_dir) / namespace
+        self.enabled = enabled
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        if enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if max_bytes is not None:
+                self._total_bytes = sum(entry.stat().st_size for entry in self._entries())
+
+    def _entries(self) -> list:
+        return [p for p in self.cache_dir.iterdir() if p.is_file() and p.suffix == '.json']
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{hash_key(key)}.json'
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Load a cached value.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Any: The cached value, or None if the entry is missing or unreadable
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            if self.ttl_s is not None and time.time() - path.stat().st_mtime > self.ttl_s:
+                self._remove(path)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable cache entry {path}: {e}')
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key (str): Cache key
+            value (Any): JSON-serializable value to store
+        """
+        if not self.enabled:
+            return
+
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False, default=str)
+            size = os.path.getsize(tmp_path)
+            with self._lock:
+                previous_size = path.stat().st_size if path.exists() else 0
+                os.replace(tmp_path, path)
+                self._total_bytes += size - previous_size
+                if self.max_bytes is not None and self._total_bytes > self.max_bytes:
+                    self._evict()
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _remove(self, path: Path) -> None:
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                return
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        # Other processes may share the namespace, so recount from disk
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append((entry.stat(), entry))
+            except FileNotFoundError:
+                continue
+        self._total_bytes = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+            if self._total_bytes <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+            self._total_bytes -= stat.st_size
+            logger.debug(f'Evicted cache entry {entry.name}')
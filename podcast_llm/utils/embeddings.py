@@ -11,15 +11,22 @@ Functions:
 
 import logging
 import os
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.embeddings import DashScopeEmbeddings
 
 from podcast_llm.config import PodcastConfig
-from podcast_llm.utils.siliconflow_embeddings import SiliconFlowEmbeddings
+from podcast_llm.utils.shared_clients import client_key, get_shared_client
+from podcast_llm.utils.lazy_imports import ProviderRegistry
 
 logger = logging.getLogger(__name__)
 
 
+# Embeddings class per provider, imported when the provider is first used
+EMBEDDINGS_MODELS = ProviderRegistry('embeddings model', {
+    'openai': 'langchain_openai:OpenAIEmbeddings',
+    'dashscope': 'langchain_community.embeddings:DashScopeEmbeddings',
+    'siliconcloud': 'podcast_llm.utils.siliconflow_embeddings:SiliconFlowEmbeddings'
+})
+
+
 def get_embeddings_model(config: PodcastConfig, base_url: str = None, api_key: str = None):
     """Get the configured embeddings model instance.
 
@@ -29,42 +36,41 @@ def get_embeddings_model(config: PodcastConfig, base_url: str = None, api_key: s
         api_key (str, optional): API key for the embeddings service
 
     Returns:
-        BaseEmbeddings: Initialized embeddings model instance based on config.embeddings_model.
+        BaseEmbeddings: Shared embeddings model instance based on config.embeddings_model.
             Currently supports 'openai' which returns OpenAIEmbeddings and 'dashscope' for 
             ModelScope embeddings.
             Defaults to OpenAIEmbeddings if model type not recognized.
     """
-    # Default models
-    models = {
-        'openai': OpenAIEmbeddings,
-        'dashscope': DashScopeEmbeddings,
-        'siliconcloud': SiliconFlowEmbeddings
-    }
-
-    # Check if we're using DashScope (ModelScope)
-    logger.info(f"Using embeddings model: {config.embeddings_model} ...")
-
-    if config.embeddings_model == 'dashscope':
-        dashscope_api_key = api_key or os.getenv("DASHSCOPE_API_KEY")
-        if not dashscope_api_key:
-            raise ValueError("DASHSCOPE_API_KEY is required for DashScope embeddings but not provided.")
-
-        return DashScopeEmbeddings(
-            model="text-embedding-v4",
-            dashscope_api_key=dashscope_api_key
-        )
-
-    elif config.embeddings_model == 'siliconcloud':
-        # Initialize embedding model
-        return SiliconFlowEmbeddings(
-            base_url="https://api.siliconflow.cn/v1/embeddings",
-            api_key=os.getenv("SILICONFLOW_API_KEY"),
-            model="BAAI/bge-m3"
-        )
-
-    else:
-        # Default to OpenAIEmbeddings
-        model_class = models.get(config.embeddings_model, OpenAIEmbeddings)
-        return model_class()
-
-
+    def create():
+        # Check if we're using DashScope (ModelScope)
+        logger.info(f"Using embeddings model: {config.embeddings_model} ...")
+
+        if config.embeddings_model == 'dashscope':
+            dashscope_api_key = api_key or os.getenv("DASHSCOPE_API_KEY")
+            if not dashscope_api_key:
+                raise ValueError("DASHSCOPE_API_KEY is required for DashScope embeddings but not provided.")
+
+            return EMBEDDINGS_MODELS.get('dashscope')(
+                model="text-embedding-v4",
+                dashscope_api_key=dashscope_api_key
+            )
+
+        elif config.embeddings_model == 'siliconcloud':
+            # Initialize embedding model
+            return EMBEDDINGS_MODELS.get('siliconcloud')(
+                base_url="https://api.siliconflow.cn/v1/embeddings",
+                api_key=os.getenv("SILICONFLOW_API_KEY"),
+                model="BAAI/bge-m3"
+            )
+
+        else:
+            # Default to OpenAIEmbeddings
+            name = config.embeddings_model if config.embeddings_model in EMBEDDINGS_MODELS else 'openai'
+            return EMBEDDINGS_MODELS.get(name)()
+
+    # Embedding models are shared per configuration, so documents and queries embedded by
+    # different stages (or episodes) reuse one client and its batching/caching
+    return get_shared_client(
+        client_key(f'embeddings/{config.embeddings_model}', base_url, api_key),
+        create
+    )
@@ -0,0 +1,244 @@
+"""
+Line-level manifest of a synthesized episode, for incremental re-rendering.
+
+When an episode is synthesized, the cleaned script lines, the TTS requests they were
+packed into and where each request's audio ended up in the output file are saved next
+to the audio. After the script is edited, the manifest is diffed against the new lines:
+blocks of unchanged lines keep their audio, and only edited lines are synthesized again
+and spliced in at the recorded offsets (see text_to_speech.rerender_speech).
+
+Key components:
+- EpisodeManifest: Script lines, blocks and output parameters of an episode
+- ManifestBlock / ManifestSegment: A run of whole lines and the audio of its requests
+- RenderBlock: A block of a re-render plan, either reused or to be synthesized
+- plan_rerender: Diffs edited lines against a manifest
+- manifest_path_for: Location of the manifest of an output file
+
+Example:
+    manifest = EpisodeManifest.load(manifest_path_for('output/episode.mp3'))
+    plan = plan_rerender(manifest, edited_lines, pack_blocks, cache_key)
+    changed = [block for block in plan if block.reused is None]
+"""
+
+
+import difflib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestSegment:
+    """
+    Audio of one TTS request in the episode.
+
+    Attributes:
+        turns (List[dict]): Turns sent to the provider ('speaker' and 'text')
+        cache_key (str): Audio cache key of the request
+        start (float): Start time in the episode in seconds
+        duration (float): Duration in seconds
+        offset (Optional[int]): Offset of the segment's frames within the output audio
+            data; None unless the episode was stream-copied
+        length (Optional[int]): Length of the segment's frames in bytes
+    """
+    turns: List[dict]
+    cache_key: str
+    start: float
+    duration: float
+    offset: Optional[int] = None
+    length: Optional[int] = None
+
+
+@dataclass
+class ManifestBlock:
+    """
+    A run of whole script lines and the requests they were packed into.
+
+    Packing may merge consecutive lines of a speaker or split long lines, so requests do
+    not map to lines one to one; blocks are the smallest units whose audio covers exactly
+    their lines.
+
+    Attributes:
+        first_line (int): Index of the first line in the script
+        end_line (int): Index after the last line
+        segments (List[ManifestSegment]): Audio of the block's requests, in order
+    """
+    first_line: int
+    end_line: int
+    segments: List[ManifestSegment] = field(default_factory=list)
+
+
+@dataclass
+class EpisodeManifest:
+    """
+    Line-level record of how an episode's audio was assembled.
+
+    Attributes:
+        output_format (str): Format of the episode file
+        segment_format (str): Format requested from the TTS provider
+        stream_copy (bool): Whether segments were copied into the episode without
+            re-encoding, so their recorded byte ranges can be spliced
+        silence_ms (int): Silence between segments
+        payload_bytes (int): Size of the output audio data, to detect files changed since
+        lines (List[dict]): Cleaned script lines ('speaker' and 'text')
+        blocks (List[ManifestBlock]): Blocks covering the lines, in order
+        version (int): Manifest format version
+    """
+    output_format: str
+    segment_format: str
+    stream_copy: bool
+    silence_ms: int = 0
+    payload_bytes: int = 0
+    lines: List[dict] = field(default_factory=list)
+    blocks: List[ManifestBlock] = field(default_factory=list)
+    version: int = MANIFEST_VERSION
+
+    def save(self, path: str) -> None:
+        """
+        Write the manifest atomically.
+
+        Args:
+            path (str): Manifest file path
+        """
+        path = Path(path)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(asdict(self), f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'EpisodeManifest':
+        """
+        Read a manifest.
+
+        Args:
+            path (str): Manifest file path
+
+        Returns:
+            EpisodeManifest: The manifest
+
+        Raises:
+            FileNotFoundError: If there is no manifest
+            ValueError: If the manifest has an unknown version
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported episode manifest version: {data.get('version')}")
+        data['blocks'] = [
+            ManifestBlock(block['first_line'], block['end_line'],
+                          [ManifestSegment(**segment) for segment in block['segments']])
+            for block in data['blocks']
+        ]
+        return cls(**data)
+
+
+@dataclass
+class RenderBlock:
+    """
+    A block of a re-render plan.
+
+    Attributes:
+        lines (List[dict]): The block's lines in the edited script
+        requests (List[Tuple[List[dict], str]]): Turns and audio cache key per request
+        reused (Optional[ManifestBlock]): Block of the previous render whose audio is
+            unchanged, or None if the lines have to be synthesized
+    """
+    lines: List[dict]
+    requests: List[Tuple[List[dict], str]]
+    reused: Optional[ManifestBlock] = None
+
+
+def manifest_path_for(output_file: str) -> Path:
+    """
+    Get the manifest path of an episode file.
+
+    Args:
+        output_file (str): Path of the episode audio file
+
+    Returns:
+        Path: ``<output dir>/<output stem>.manifest.json``
+    """
+    output_file = Path(output_file)
+    return output_file.with_name(f'{output_file.stem}.manifest.json')
+
+
+def _line_key(line: dict) -> Tuple[str, str]:
+    return line['speaker'], line['text']
+
+
+def plan_rerender(manifest: EpisodeManifest,
+                  lines: List[dict],
+                  pack_blocks: Callable[[List[dict]], List[Tuple[range, List[List[dict]]]]],
+                  cache_key: Callable[[List[dict]], str]) -> List[RenderBlock]:
+    """
+    Diff edited script lines against the manifest of the previous render.
+
+    A previous block is reused when all of its lines survive the edit unchanged and
+    adjacent, and its requests still have the same cache keys (so provider and voice
+    settings did not change either). Runs of lines between reused blocks are packed into
+    new requests.
+
+    Args:
+        manifest (EpisodeManifest): Manifest of the previous render
+        lines (List[dict]): Cleaned lines of the edited script
+        pack_blocks (Callable): Packs lines into blocks of requests (see
+            text_to_speech.pack_line_blocks), returning line ranges relative to its input
+        cache_key (Callable): Audio cache key of a request's turns
+
+    Returns:
+        List[RenderBlock]: Blocks covering all lines, in order
+    """
+    matcher = difflib.SequenceMatcher(
+        a=[_line_key(line) for line in manifest.lines],
+        b=[_line_key(line) for line in lines],
+        autojunk=False
+    )
+    new_index = {}
+    for old_start, new_start, size in matcher.get_matching_blocks():
+        for offset in range(size):
+            new_index[old_start + offset] = new_start + offset
+
+    reused = {}
+    for block in manifest.blocks:
+        if block.first_line >= block.end_line or block.first_line not in new_index:
+            continue
+        start = new_index[block.first_line]
+        if (all(new_index.get(line) == start + line - block.first_line
+                for line in range(block.first_line, block.end_line))
+                and all(cache_key(segment.turns) == segment.cache_key for segment in block.segments)):
+            reused[start] = block
+
+    plan = []
+    pending_start = 0
+
+    def flush(end: int) -> None:
+        run = lines[pending_start:end]
+        for line_range, requests in pack_blocks(run):
+            plan.append(RenderBlock(
+                [run[i] for i in line_range],
+                [(turns, cache_key(turns)) for turns in requests]
+            ))
+
+    index = 0
+    while index < len(lines):
+        block = reused.get(index)
+        if block is None:
+            index += 1
+            continue
+        flush(index)
+        end = index + block.end_line - block.first_line
+        plan.append(RenderBlock(
+            lines[index:end],
+            [(segment.turns, segment.cache_key) for segment in block.segments],
+            reused=block
+        ))
+        index = pending_start = end
+    flush(len(lines))
+    return plan
@@ -0,0 +1,263 @@
+"""
+Fast extraction and repair of JSON objects embedded in LLM output.
+
+LLMs asked for structured output often wrap the JSON in prose or code fences, or emit
+almost-JSON: trailing commas, single quotes, Python literals, raw newlines inside
+strings, or an object cut off by the token limit. This module finds JSON objects in a
+single left-to-right pass and repairs the common malformations, so a
+malformed response can usually be used without asking the model again.
+
+Key components:
+- JsonObjectScanner: Incremental scanner that can be fed output chunk by chunk (e.g.
+  while streaming) and reports the first balanced object as soon as it is complete
+- extract_json_object: Returns the first balanced object in a text, or the unterminated
+  remainder if the text ends inside an object
+- repair_json: Fixes common malformations in a JSON fragment
+- parse_json_object: extract, parse and, if needed, repair in one call, skipping
+  candidates that cannot be parsed
+
+Example:
+    data = parse_json_object('Sure! ```json\n{"question": "Why?",}\n```')
+    # {'question': 'Why?'}
+"""
+
+
+import json
+import re
+from typing import Any, Dict, Optional, Tuple
+
+
+CODE_FENCE = re.compile(r'```[a-zA-Z]*\s*')
+TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+UNQUOTED_KEY = re.compile(r'([{,]\s*)([A-Za-z_][A-Za-z0-9_]*)(\s*:)')
+PYTHON_LITERAL = re.compile(r'\b(True|False|None)\b')
+PYTHON_LITERALS = {'True': 'true', 'False': 'false', 'None': 'null'}
+DANGLING_TAIL = re.compile(r'(,\s*"[^"]*"\s*:?\s*|,\s*|:\s*)$')
+STRING_LITERAL = re.compile(r'("(?:[^"\\]|\\.)*")')
+SMART_QUOTES = str.maketrans({'“': '"', '”': '"'})
+
+
+class JsonObjectScanner:
+    """
+    Find the first balanced JSON object in text fed incrementally.
+
+    Tracks nesting depth, string and escape state, so every character is looked at once
+    no matter how the text is split into chunks. Braces inside strings are ignored;
+    both double- and single-quoted strings are recognized so almost-JSON is scanned
+    correctly too.
+    """
+    def __init__(self):
+        self._parts = []
+        self._start: Optional[int] = None
+        self._length = 0
+        self._depth = 0
+        self._quote: Optional[str] = None
+        self._escaped = False
+        self.complete = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Scan the next chunk of text.
+
+        Args:
+            chunk (str): Next part of the output
+
+        Returns:
+            bool: True once the first object is complete (further chunks are ignored)
+        """
+        if self.complete:
+            return True
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+
+        for i, c in enumerate(chunk):
+            if self._quote is not None:
+                if self._escaped:
+                    self._escaped = False
+                elif c == '\\':
+                    self._escaped = True
+                elif c == self._quote:
+                    self._quote = None
+                continue
+            if self._start is None:
+                if c == '{':
+                    self._start = offset + i
+                    self._depth = 1
+                continue
+            if c in '"\'':
+                self._quote = c
+            elif c in '{[':
+                self._depth += 1
+            elif c in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end = offset + i + 1
+                    self.complete = True
+                    return True
+        return False
+
+    def result(self) -> Tuple[Optional[str], bool]:
+        """
+        Get the object found so far.
+
+        Returns:
+            Tuple[Optional[str], bool]: The object text (None if no object started) and
+                whether it is complete. An incomplete object runs to the end of the text.
+        """
+        if self._start is None:
+            return None, False
+        text = ''.join(self._parts)
+        end = self._end if self.complete else len(text)
+        return text[self._start:end], self.complete
+
+
+def extract_json_object(text: str) -> Tuple[Optional[str], bool]:
+    """
+    Find the first JSON object in a text.
+
+    Args:
+        text (str): LLM output
+
+    Returns:
+        Tuple[Optional[str], bool]: The object text (None if there is no '{') and whether
+            it is balanced
+    """
+    scanner = JsonObjectScanner()
+    scanner.feed(text)
+    return scanner.result()
+
+
+def _close_unterminated(fragment: str) -> str:
+    """Close strings, arrays and objects left open by truncated output."""
+    stack = []
+    quote = None
+    escaped = False
+    for c in fragment:
+        if quote is not None:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == quote:
+                quote = None
+            continue
+        if c == '"':
+            quote = c
+        elif c == '{':
+            stack.append('}')
+        elif c == '[':
+            stack.append(']')
+        elif c in '}]' and stack:
+            stack.pop()
+
+    if escaped:
+        fragment = fragment[:-1]
+    if quote is not None:
+        fragment += quote
+    fragment = fragment.rstrip()
+    # A dangling key or separator cannot be completed sensibly
+    fragment = DANGLING_TAIL.sub('', fragment)
+    return fragment + ''.join(reversed(stack))
+
+
+def _normalize_strings(fragment: str) -> str:
+    """Convert single-quoted strings to double quotes and escape raw control characters inside strings."""
+    out = []
+    quote = None
+    escaped = False
+    for c in fragment:
+        if quote is None:
+            if c in '"\'':
+                quote = c
+                out.append('"')
+            else:
+                out.append(c)
+            continue
+        if escaped:
+            escaped = False
+            # \' is not a JSON escape; a plain quote needs none inside double quotes
+            out.append(c if c == "'" else '\\' + c)
+        elif c == '\\':
+            escaped = True
+        elif c == quote:
+            quote = None
+            out.append('"')
+        elif c == '"':
+            # Double quote inside a single-quoted string
+            out.append('\\"')
+        elif c == '\n':
+            out.append('\\n')
+        elif c == '\r':
+            out.append('\\r')
+        elif c == '\t':
+            out.append('\\t')
+        else:
+            out.append(c)
+    return ''.join(out)
+
+
+def _replace_outside_strings(fragment: str, pattern: re.Pattern, replacement) -> str:
+    """Apply a regex substitution only to the parts of a fragment that are not inside strings."""
+    parts = STRING_LITERAL.split(fragment)
+    return ''.join(part if i % 2 else pattern.sub(replacement, part) for i, part in enumerate(parts))
+
+
+def repair_json(fragment: str, complete: bool = True) -> str:
+    """
+    Fix common malformations in a JSON fragment produced by an LLM.
+
+    Handles code fences, curly quotes, single-quoted strings, raw newlines and tabs inside
+    strings, unquoted keys, Python literals (True/False/None), trailing commas and, for
+    incomplete fragments, unterminated strings, arrays and objects.
+
+    Args:
+        fragment (str): JSON-like text starting with '{'
+        complete (bool): Whether the fragment is balanced; False for truncated output
+
+    Returns:
+        str: Repaired text (not guaranteed to be valid JSON)
+    """
+    fragment = CODE_FENCE.sub('', fragment).translate(SMART_QUOTES)
+    fragment = _normalize_strings(fragment)
+    if not complete:
+        fragment = _close_unterminated(fragment)
+    fragment = _replace_outside_strings(fragment, UNQUOTED_KEY, r'\1"\2"\3')
+    fragment = _replace_outside_strings(
+        fragment, PYTHON_LITERAL, lambda m: PYTHON_LITERALS[m.group(1)]
+    )
+    return _replace_outside_strings(fragment, TRAILING_COMMA, r'\1')
+
+
+def parse_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract and parse the first valid JSON object in a text, repairing it if needed.
+
+    Balanced candidates that cannot be parsed even after repair (e.g. a ``{placeholder}``
+    in the prose before the object) are skipped and scanning resumes after them.
+
+    Args:
+        text (str): LLM output
+
+    Returns:
+        Optional[Dict[str, Any]]: The parsed object, or None if no object could be parsed
+    """
+    position = 0
+    while True:
+        fragment, complete = extract_json_object(text[position:])
+        if fragment is None:
+            return None
+
+        candidates = [fragment] if complete else []
+        candidates.append(repair_json(fragment, complete))
+        for candidate in candidates:
+            try:
+                parsed = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, dict):
+                return parsed
+        if not complete:
+            # An unterminated object runs to the end of the text
+            return None
+        position = text.index(fragment, position) + len(fragment)
@@ -0,0 +1,158 @@
+"""
+Deferred imports for optional and provider-specific dependencies.
+
+Every run uses a single LLM, embeddings and TTS provider, but importing all provider SDKs
+up front (Google GenAI, Anthropic, DashScope, ElevenLabs, Google Cloud TTS, newspaper,
+pydub, ...) costs seconds of start-up time for the CLI and the Shiny app. This module
+lets those dependencies be named at module level but imported on first use.
+
+Key components:
+- lazy_import: Returns a module proxy that imports the module on first attribute access
+- ProviderRegistry: Maps provider names to ``'module:attribute'`` targets that are
+  imported only when the provider is selected
+
+Example:
+    texttospeech = lazy_import('google.cloud.texttospeech')
+    CHAT_MODELS = ProviderRegistry('LLM provider', {'openai': 'langchain_openai:ChatOpenAI'})
+
+    client = texttospeech.TextToSpeechClient()   # google.cloud.texttospeech is imported here
+    model_class = CHAT_MODELS.get('openai')      # langchain_openai is imported here
+"""
+
+
+import importlib
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class LazyModule:
+    """
+    Proxy for a module that is imported on first attribute access.
+
+    Attributes:
+        name (str): Dotted name of the proxied module
+    """
+    _OWN_ATTRIBUTES = ('name', '_module', '_lock')
+
+    def __init__(self, name: str):
+        self.name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Any:
+        """
+        Import the module if needed.
+
+        Returns:
+            module: The imported module
+        """
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self.name)
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the module has been imported through this proxy."""
+        return self._module is not None
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        # Module-level settings such as ``dashscope.api_key = ...`` go to the real module
+        if attribute in self._OWN_ATTRIBUTES:
+            object.__setattr__(self, attribute, value)
+        else:
+            setattr(self.load(), attribute, value)
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Only called for attributes not found on the proxy itself
+        if attribute.startswith('__'):
+            raise AttributeError(attribute)
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f'<lazy module {self.name!r} ({state})>'
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Get a proxy for a module that is imported on first use.
+
+    Args:
+        name (str): Dotted module name, e.g. 'google.cloud.texttospeech'
+
+    Returns:
+        LazyModule: Module proxy
+    """
+    return LazyModule(name)
+
+
+class ProviderRegistry:
+    """
+    Registry of provider implementations imported on first use.
+
+    Targets are given as ``'module:attribute'`` strings, so registering a provider does
+    not import its SDK.
+    """
+    def __init__(self, kind: str, targets: Optional[Dict[str, str]] = None):
+        """
+        Initialize the ProviderRegistry.
+
+        Args:
+            kind (str): Description of the registered providers, used in error messages
+            targets (Dict[str, str], optional): Provider names mapped to 'module:attribute'
+        """
+        self.kind = kind
+        self._targets: Dict[str, str] = {}
+        self._loaded: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        for name, target in (targets or {}).items():
+            self.register(name, target)
+
+    def register(self, name: str, target: str) -> None:
+        """
+        Register a provider.
+
+        Args:
+            name (str): Provider name
+            target (str): 'module:attribute' of the implementation
+        """
+        if ':' not in target:
+            raise ValueError(f"Target for {self.kind} '{name}' must look like 'module:attribute', got '{target}'")
+        with self._lock:
+            self._targets[name] = target
+            self._loaded.pop(name, None)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._targets
+
+    def names(self) -> List[str]:
+        """
+        Get the registered provider names.
+
+        Returns:
+            List[str]: Provider names in registration order
+        """
+        return list(self._targets)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a provider implementation, importing it on first use.
+
+        Args:
+            name (str): Provider name
+
+        Returns:
+            Any: The registered attribute (usually a class)
+
+        Raises:
+            ValueError: If the provider is not registered
+        """
+        if name not in self._targets:
+            raise ValueError(f"The {self.kind} value '{name}' is not supported.")
+        with self._lock:
+            if name not in self._loaded:
+                module_name, attribute = self._targets[name].split(':', 1)
+                self._loaded[name] = getattr(importlib.import_module(module_name), attribute)
+            return self._loaded[name]
@@ -21,28 +21,135 @@ This allows the rest of the application to work with LLMs in a provider-agnostic
 while still leveraging provider-specific capabilities when beneficial.
 """
 import os
+import json
 import logging
 import pydantic
 from typing import Any, Optional, Union
 
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.exceptions import OutputParserException
 from langchain_core.language_models.base import LanguageModelInput
-from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import LLMResult
 from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
 from langchain_core.prompt_values import ChatPromptValue
 from langchain_core.rate_limiters import BaseRateLimiter
 from langchain_core.runnables.base import Runnable
 from langchain_core.runnables.config import RunnableConfig
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
-from langchain_core.rate_limiters import BaseRateLimiter
 from podcast_llm.config import PodcastConfig
+from podcast_llm.utils.lazy_imports import ProviderRegistry
+from podcast_llm.utils.json_extract import extract_json_object, parse_json_object
+from podcast_llm.utils.llm_cache import LLMResponseCache, get_llm_cache, llm_cache_key
+from podcast_llm.utils.rate_limits import TokenBucketLimiter, get_limiter
+from podcast_llm.utils.shared_clients import client_key, get_shared_client
+from podcast_llm.utils.telemetry import Span, span
 
 
 logger = logging.getLogger(__name__)
 
 
+# Chat model class per LLM provider, imported when the provider is first used
+CHAT_MODELS = ProviderRegistry('LLM provider', {
+    'openai': 'langchain_openai:ChatOpenAI',
+    'google': 'langchain_google_genai:ChatGoogleGenerativeAI',
+    'anthropic': 'langchain_anthropic:ChatAnthropic'
+})
+
+# Limits used when config.rate_limits has no 'llm' entry
+DEFAULT_LLM_LIMITS = {'requests_per_minute': 12, 'burst': 10}
+
+
+class TokenBucketRateLimiter(BaseRateLimiter):
+    """
+    LangChain rate limiter backed by a shared TokenBucketLimiter.
+
+    Lets every chat model for the same provider draw from one budget, no matter how many
+    model instances or worker threads are created.
+    """
+    def __init__(self, limiter: TokenBucketLimiter):
+        self.limiter = limiter
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        return self.limiter.acquire_token(blocking)
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        return await self.limiter.acquire_token_async(blocking)
+
+
+def get_llm_rate_limiter(config: PodcastConfig, provider: str) -> TokenBucketRateLimiter:
+    """
+    Get the shared rate limiter for an LLM provider.
+
+    Limits are read from ``config.rate_limits['llm']`` (``requests_per_minute`` and
+    ``burst``), falling back to DEFAULT_LLM_LIMITS for missing values.
+
+    Args:
+        config (PodcastConfig): Configuration object containing rate limits
+        provider (str): LLM provider name
+
+    Returns:
+        TokenBucketRateLimiter: Rate limiter to pass to get_fast_llm or get_long_context_llm
+    """
+    limits = dict(DEFAULT_LLM_LIMITS)
+    limits.update(config.rate_limits.get('llm', {}))
+    return TokenBucketRateLimiter(get_limiter(
+        f'llm/{provider}',
+        requests_per_minute=limits['requests_per_minute'],
+        burst=limits['burst']
+    ))
+
+
+class TokenUsageCallback(BaseCallbackHandler):
+    """
+    Adds the token usage reported by a chat model to a telemetry span.
+
+    Passed as a callback so usage is captured even when structured output parsing
+    replaces the message (and its usage metadata) with a schema object.
+    """
+    def __init__(self, span: Span):
+        self.span = span
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        tokens_in = tokens_out = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, 'message', None), 'usage_metadata', None) or {}
+                tokens_in += usage.get('input_tokens', 0)
+                tokens_out += usage.get('output_tokens', 0)
+        if not tokens_in and not tokens_out:
+            # Providers that only report usage in llm_output
+            usage = (response.llm_output or {}).get('token_usage') or (response.llm_output or {}).get('usage') or {}
+            tokens_in = usage.get('prompt_tokens', usage.get('input_tokens', 0)) or 0
+            tokens_out = usage.get('completion_tokens', usage.get('output_tokens', 0)) or 0
+        self.span.add(tokens_in=tokens_in, tokens_out=tokens_out)
+
+
+def _with_callback(config: Optional[RunnableConfig], callback: BaseCallbackHandler) -> RunnableConfig:
+    """Copy a runnable config, adding a callback to its callbacks."""
+    config = dict(config or {})
+    callbacks = config.get('callbacks')
+    if callbacks is None:
+        config['callbacks'] = [callback]
+    elif isinstance(callbacks, list):
+        config['callbacks'] = callbacks + [callback]
+    else:
+        callbacks = callbacks.copy()
+        callbacks.add_handler(callback, inherit=True)
+        config['callbacks'] = callbacks
+    return config
+
+
+def _prompt_for_cache_key(prompt: LanguageModelInput) -> Any:
+    """Render a prompt to the JSON-serializable form hashed into response cache keys."""
+    if isinstance(prompt, str):
+        return prompt
+    if hasattr(prompt, 'to_messages'):
+        prompt = prompt.to_messages()
+    if isinstance(prompt, list):
+        return [[getattr(m, 'type', None), getattr(m, 'content', m)] for m in prompt]
+    return str(prompt)
+
+
 class LLMWrapper(Runnable):
     def __init__(self, 
                  provider: str, 
@@ -50,7 +157,8 @@ class LLMWrapper(Runnable):
                  temperature: float = 1.0, 
                  max_tokens: int = 8192, 
                  rate_limiter: Union[BaseRateLimiter, None] = None,
-                 base_url: Optional[str] = None
+                 base_url: Optional[str] = None,
+                 response_cache: Optional[LLMResponseCache] = None
                   ):
         """
         A wrapper class for various LLM providers that standardizes their interfaces.
@@ -68,6 +176,8 @@ class LLMWrapper(Runnable):
             max_tokens (int, optional): Maximum tokens in response. Defaults to 8192
             rate_limiter (BaseRateLimiter | None, optional): Rate limiter for API calls. Defaults to None
             base_url (str, optional): Base URL for OpenAI-compatible APIs. Only used with 'openai' provider.
+            response_cache (LLMResponseCache, optional): Cache for responses. Only used for
+                calls the cache applies to (by default temperature 0). Defaults to None
 
         Raises:
             ValueError: If an unsupported provider is specified
@@ -85,21 +195,10 @@ class LLMWrapper(Runnable):
         self.parser = StrOutputParser()
         self.schema = None
         self.base_url = base_url  # Store for debugging or dynamic use if needed
+        self.response_cache = response_cache
 
-        provider_to_model = {
-            'openai': ChatOpenAI,
-            'google': ChatGoogleGenerativeAI,
-            'anthropic': ChatAnthropic
-        }
-
-        if self.provider not in provider_to_model:
-            raise ValueError(f"The LLM provider value '{self.provider}' is not supported.")
-
-        '''
-        model_class = provider_to_model[self.provider]
-        self.llm = model_class(model=self.model, rate_limiter=self.rate_limiter, max_tokens=self.max_tokens)
-        '''
-        model_class = provider_to_model[self.provider]
+        # Only the selected provider's SDK is imported
+        model_class = CHAT_MODELS.get(self.provider)
 
         # Conditionally pass base_url only to OpenAI-compatible models
         init_kwargs = {
@@ -113,15 +212,32 @@ class LLMWrapper(Runnable):
             if self.base_url:
                 init_kwargs["base_url"] = self.base_url
 
-        self.llm = model_class(**init_kwargs)
+        # Chat models are shared per configuration so their HTTP connection pools are
+        # reused. Only models with a registry-backed limiter (or none) can be shared.
+        if self.rate_limiter is None or isinstance(self.rate_limiter, TokenBucketRateLimiter):
+            limiter_name = self.rate_limiter.limiter.name if self.rate_limiter is not None else None
+            self.llm = get_shared_client(
+                client_key(f'llm/{self.provider}', self.model, self.temperature, self.max_tokens,
+                           limiter_name, self.base_url),
+                lambda: model_class(**init_kwargs)
+            )
+        else:
+            self.llm = model_class(**init_kwargs)
+        # Unstructured model, kept for cheap repair requests after structured parsing fails
+        self._base_llm = self.llm
 
     def coerce_to_schema(self, llm_output: str):
         """
         Coerce raw LLM output into a structured schema object.
 
         Takes unstructured text output from the LLM and attempts to parse it into
-        a structured Pydantic object based on the defined schema. Currently supports
-        Question and Answer schema types.
+        a structured Pydantic object based on the defined schema, cheapest step first:
+
+        1. Extract the first JSON object in one pass and repair common malformations
+           (code fences, trailing commas, single quotes, truncated output, ...)
+        2. For schemas with a single string field (e.g. Question, Answer), use the raw text
+        3. Re-ask the model to fix only the malformed fragment, which is far shorter than
+           regenerating the whole response
 
         Args:
             llm_output (str): Raw text output from the LLM to be coerced
@@ -132,10 +248,6 @@ class LLMWrapper(Runnable):
         Raises:
             ValueError: If no schema is defined
             OutputParserException: If output cannot be coerced to the schema
-
-        The coercion maps the raw text to the appropriate schema field:
-        - Question schema -> 'question' field
-        - Answer schema -> 'answer' field
         """
         if not self.schema:
             raise ValueError('Schema is not defined.')
@@ -150,41 +262,71 @@ class LLMWrapper(Runnable):
         if not isinstance(llm_output, str):
             llm_output = str(llm_output)
 
-        # Try to extract JSON from the output if it contains extra text
-        import json
-        import re
-        
-        # Attempt to find JSON object in the output
-        json_match = re.search(r'\{.*\}', llm_output, re.DOTALL)
-        if json_match:
+        parsed_json = parse_json_object(llm_output)
+        error = 'no JSON object found'
+        if parsed_json is not None:
             try:
-                # Try to parse the extracted JSON
-                json_str = json_match.group(0)
-                parsed_json = json.loads(json_str)
-                
-                # If successful, use the parsed JSON to create the schema object
-                if isinstance(parsed_json, dict):
-                    pydantic_object = self.schema(**parsed_json)
-                    return pydantic_object
-            except json.JSONDecodeError:
-                pass  # If JSON parsing fails, fall back to original method
-
-        schema_class_name = self.schema.__name__
-
-        if schema_class_name == 'Question':
-            schema_field_name = 'question'
-        elif schema_class_name == 'Answer':
-            schema_field_name = 'answer'
-        else:
+                return self.schema(**parsed_json)
+            except pydantic.ValidationError as ex:
+                error = str(ex)
+
+        text_field = self._single_text_field()
+        if text_field is not None:
+            return self.schema(**{text_field: llm_output})
+
+        fragment, _ = extract_json_object(llm_output)
+        pydantic_object = self._reask_for_fragment(fragment or llm_output, error)
+        if pydantic_object is None:
             raise OutputParserException(
-                f"Unable to coerce output to schema: {schema_class_name}",
+                f"Unable to coerce output to schema: {self.schema.__name__}",
                 llm_output=llm_output
             )
-
-        schema_values = {schema_field_name: llm_output}
-        pydantic_object = self.schema(**schema_values)
         return pydantic_object
 
+    def _single_text_field(self) -> Optional[str]:
+        """Name of the schema's only field if it is a string field, otherwise None."""
+        fields = self.schema.model_fields
+        if len(fields) != 1:
+            return None
+        name, field = next(iter(fields.items()))
+        return name if field.annotation is str else None
+
+    def _reask_for_fragment(self, fragment: str, error: str) -> Optional[pydantic.BaseModel]:
+        """
+        Ask the model to fix a malformed JSON fragment against the schema.
+
+        Only the fragment, the schema and the parse error are sent, and the plain
+        (unstructured) model is used so the reply goes through the same cheap parser.
+
+        Args:
+            fragment (str): Malformed JSON (or the raw output if no object was found)
+            error (str): Why the fragment could not be used
+
+        Returns:
+            Optional[BaseModel]: The schema object, or None if the fix failed too
+        """
+        logger.debug(f"Re-asking for malformed {self.schema.__name__} fragment: {error}")
+        prompt = [HumanMessage(content=(
+            'Fix the following JSON so that it is valid and matches the JSON schema. '
+            'Reply with the corrected JSON object only.\n\n'
+            f'Schema:\n{json.dumps(self.schema.model_json_schema())}\n\n'
+            f'Error:\n{error}\n\n'
+            f'JSON:\n{fragment}'
+        ))]
+        try:
+            reply = self._base_llm.invoke(prompt)
+        except Exception as ex:
+            logger.warning(f"Re-asking for malformed output failed: {ex}")
+            return None
+
+        parsed_json = parse_json_object(getattr(reply, 'content', reply) or '')
+        if parsed_json is None:
+            return None
+        try:
+            return self.schema(**parsed_json)
+        except pydantic.ValidationError:
+            return None
+
     def invoke(
         self,
         input: LanguageModelInput,
@@ -222,11 +364,45 @@ class LLMWrapper(Runnable):
             prompt = ChatPromptValue(messages=messages)
             logger.debug(f"Modified prompt:\n{prompt.to_string()}")
 
-        try:
-            return self.llm.invoke(input=prompt, config=config)
-        except OutputParserException as ex:
-            logger.debug(f"Error parsing LLM output. Coercing to fit schema.\n{ex.llm_output}")
-            return self.coerce_to_schema(ex.llm_output)
+        with span('llm.invoke', kind='llm', provider=self.provider, model=self.model,
+                  structured=self.schema is not None) as llm_span:
+            cache_key = None
+            if self.response_cache is not None and self.response_cache.applies_to(self.temperature):
+                cache_key = llm_cache_key(
+                    self.provider, self.model, self.temperature, _prompt_for_cache_key(input),
+                    self.schema.model_json_schema() if self.schema is not None else None
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Using cached LLM response {cache_key[:12]}")
+                    llm_span.set(cached=True)
+                    return self._response_from_cache(cached)
+
+            llm_span.set(cached=False)
+            try:
+                response = self.llm.invoke(input=prompt, config=_with_callback(config, TokenUsageCallback(llm_span)))
+            except OutputParserException as ex:
+                logger.debug(f"Error parsing LLM output. Coercing to fit schema.\n{ex.llm_output}")
+                llm_span.add(coerced=1)
+                response = self.coerce_to_schema(ex.llm_output)
+
+            if cache_key is not None:
+                self.response_cache.put(cache_key, self._response_to_cache(response))
+            return response
+
+    def _response_to_cache(self, response: Any) -> dict:
+        """Convert a response to the JSON-serializable form stored in the response cache."""
+        if isinstance(response, BaseMessage):
+            return {'content': response.content}
+        if isinstance(response, pydantic.BaseModel):
+            return {'schema': response.model_dump(mode='json')}
+        return {'content': response}
+
+    def _response_from_cache(self, cached: dict) -> Any:
+        """Rebuild a response from its cached form."""
+        if 'schema' in cached:
+            return self.schema(**cached['schema'])
+        return AIMessage(content=cached['content'])
 
 
     def with_structured_output(
@@ -261,7 +437,29 @@ class LLMWrapper(Runnable):
         return self
 
 
-def get_fast_llm(config: PodcastConfig, rate_limiter: BaseRateLimiter | None = None, base_url: Optional[str] = None):
+# Sampling temperature of stages not listed in config.llm_temperatures
+DEFAULT_TEMPERATURE = 1.0
+
+
+def get_stage_temperature(config: PodcastConfig, stage: str) -> float:
+    """
+    Get the sampling temperature configured for a generation stage.
+
+    Stages run at temperature 0 are reproducible, and their responses are always eligible
+    for the response cache; sampled stages are only cached with ``llm_cache.cache_sampled``.
+
+    Args:
+        config (PodcastConfig): Configuration object with llm_temperatures settings
+        stage (str): Stage name, e.g. 'outline' or 'rewrite'
+
+    Returns:
+        float: The configured temperature, or DEFAULT_TEMPERATURE
+    """
+    return config.llm_temperatures.get(stage, DEFAULT_TEMPERATURE)
+
+
+def get_fast_llm(config: PodcastConfig, rate_limiter: BaseRateLimiter | None = None, base_url: Optional[str] = None,
+                 temperature: float = 1.0):
     """
     Get a fast LLM model optimized for quick responses.
 
@@ -273,9 +471,12 @@ def get_fast_llm(config: PodcastConfig, rate_limiter: BaseRateLimiter | None = N
         rate_limiter (BaseRateLimiter | None, optional): Rate limiter to control API request 
             frequency. Defaults to None.
         base_url (str, optional): Base URL for OpenAI-compatible APIs. Only used with 'openai' provider.
+        temperature (float, optional): Sampling temperature, usually get_stage_temperature for the
+            calling stage. Defaults to 1.0.
 
     Returns:
-        LLMWrapper: Wrapper instance configured with a fast model variant
+        LLMWrapper: Wrapper instance configured with a fast model variant and the response
+            cache described by config.llm_cache
 
     Raises:
         ValueError: If the configured fast_llm_provider is not supported
@@ -299,10 +500,12 @@ def get_fast_llm(config: PodcastConfig, rate_limiter: BaseRateLimiter | None = N
     if config.fast_llm_provider not in fast_llm_models:
         raise ValueError(f"The fast_llm_provider value '{config.fast_llm_provider}' is not supported.")
         
-    return LLMWrapper(config.fast_llm_provider, fast_llm_models[config.fast_llm_provider], rate_limiter=rate_limiter, base_url=base_url)
+    return LLMWrapper(config.fast_llm_provider, fast_llm_models[config.fast_llm_provider], temperature=temperature,
+                      rate_limiter=rate_limiter, base_url=base_url, response_cache=get_llm_cache(config))
 
 
-def get_long_context_llm(config: PodcastConfig, rate_limiter: BaseRateLimiter | None = None, base_url: Optional[str] = None):
+def get_long_context_llm(config: PodcastConfig, rate_limiter: BaseRateLimiter | None = None, base_url: Optional[str] = None,
+                         temperature: float = 1.0):
     """
     Get a long context LLM model optimized for handling larger prompts.
 
@@ -315,9 +518,12 @@ def get_long_context_llm(config: PodcastConfig, rate_limiter: BaseRateLimiter |
         rate_limiter (BaseRateLimiter | None, optional): Rate limiter to control API request
             frequency. Defaults to None.
         base_url (str, optional): Base URL for OpenAI-compatible APIs. Only used with 'openai' provider.
+        temperature (float, optional): Sampling temperature, usually get_stage_temperature for the
+            calling stage. Defaults to 1.0.
 
     Returns:
-        LLMWrapper: Wrapper instance configured with a long context model variant
+        LLMWrapper: Wrapper instance configured with a long context model variant and the response
+            cache described by config.llm_cache
 
     Raises:
         ValueError: If the configured long_context_llm_provider is not supported
@@ -341,4 +547,5 @@ def get_long_context_llm(config: PodcastConfig, rate_limiter: BaseRateLimiter |
     if config.long_context_llm_provider not in long_context_llm_models:
         raise ValueError(f"The long_context_llm_provider value '{config.long_context_llm_provider}' is not supported.")
 
-    return LLMWrapper(config.long_context_llm_provider, long_context_llm_models[config.long_context_llm_provider], rate_limiter=rate_limiter, base_url=base_url)
+    return LLMWrapper(config.long_context_llm_provider, long_context_llm_models[config.long_context_llm_provider], temperature=temperature,
+                      rate_limiter=rate_limiter, base_url=base_url, response_cache=get_llm_cache(config))
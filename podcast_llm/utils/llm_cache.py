@@ -0,0 +1,221 @@
+"""
+Persistent cache of LLM responses.
+
+Outline generation, Wikipedia suggestions, research queries and final-script rewrites
+send the same prompts again whenever an episode is regenerated, e.g. while iterating on
+later stages. This module stores responses in a SQLite database keyed by everything that
+determines the response (provider, model, temperature, rendered prompt and output
+schema), so repeated calls are answered locally.
+
+By default only deterministic (temperature 0) calls are cached: sampling at a higher
+temperature is usually intentional, and replaying one sample would hide that.
+
+Key components:
+- LLMResponseCache: SQLite-backed store with per-entry expiry and size-bounded
+  least-recently-used eviction
+- llm_cache_key: Helper function building the cache key for a call
+- get_llm_cache: Returns the process-wide cache described by ``config.llm_cache``
+
+Example:
+    cache = LLMResponseCache('.cache/llm.sqlite', max_bytes=64 * 1024 * 1024, ttl_s=86400)
+    key = llm_cache_key('openai', 'gpt-4o', 0.0, prompt, schema=None)
+    response = cache.get(key)
+    if response is None:
+        response = llm.invoke(prompt).content
+        cache.put(key, response)
+"""
+
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from podcast_llm.utils.disk_cache import hash_key
+
+
+logger = logging.getLogger(__name__)
+
+
+_caches: Dict[str, 'LLMResponseCache'] = {}
+_caches_lock = threading.Lock()
+
+
+def llm_cache_key(provider: str, model: str, temperature: float, prompt: Any, schema: Any = None) -> str:
+    """
+    Build the cache key for an LLM call.
+
+    Args:
+        provider (str): LLM provider name
+        model (str): Model name
+        temperature (float): Sampling temperature
+        prompt (Any): Rendered prompt (a string or a JSON-serializable list of messages)
+        schema (Any): JSON schema of the structured output, or None for plain text
+
+    Returns:
+        str: Hex digest identifying the response
+    """
+    return hash_key(provider, model, float(temperature), hash_key(prompt), schema)
+
+
+class LLMResponseCache:
+    """
+    A size-bounded SQLite store of JSON-serializable LLM responses.
+
+    Each entry records its size, last access time and expiry time. Expired entries are
+    treated as misses and removed lazily; when the total size exceeds ``max_bytes`` the
+    least recently used entries are deleted first. Safe to use from multiple threads.
+
+    Attributes:
+        path (str): Path of the SQLite database
+        max_bytes (int): Maximum total size of the stored responses in bytes
+        ttl_s (Optional[float]): Lifetime of an entry in seconds, or None for no expiry
+        cache_sampled (bool): Whether calls with a temperature above 0 are cached too
+        hits (int): Number of responses served from the cache
+        misses (int): Number of lookups that found no usable entry
+    """
+    def __init__(self, path: str, max_bytes: int, ttl_s: Optional[float] = None, cache_sampled: bool = False):
+        """
+        Initialize the LLMResponseCache.
+
+        Args:
+            path (str): Path of the SQLite database, created if missing
+            max_bytes (int): Maximum total size of the stored responses in bytes
+            ttl_s (float, optional): Lifetime of an entry in seconds. Defaults to no expiry.
+            cache_sampled (bool): Whether to cache calls with a temperature above 0
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.cache_sampled = cache_sampled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, '
+            'accessed REAL NOT NULL, expires REAL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def applies_to(self, temperature: float) -> bool:
+        """
+        Check whether calls at a temperature are cached.
+
+        Args:
+            temperature (float): Sampling temperature of the call
+
+        Returns:
+            bool: True for deterministic calls, or for any call if cache_sampled is set
+        """
+        return self.cache_sampled or temperature == 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Load a cached response.
+
+        Args:
+            key (str): Cache key from llm_cache_key
+
+        Returns:
+            Any: The cached response, or None on a miss or if the entry has expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute('SELECT value, size, expires FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is not None and row[2] is not None and row[2] <= now:
+                self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._total_bytes -= row[1]
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a response, evicting least recently used entries if needed.
+
+        Args:
+            key (str): Cache key from llm_cache_key
+            value (Any): JSON-serializable response
+        """
+        data = json.dumps(value, ensure_ascii=False)
+        size = len(data.encode('utf-8'))
+        now = time.time()
+        expires = now + self.ttl_s if self.ttl_s else None
+        with self._lock:
+            row = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, value, size, accessed, expires) VALUES (?, ?, ?, ?, ?)',
+                (key, data, size, now, expires)
+            )
+            self._total_bytes += size - (row[0] if row else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        removed = self._conn.execute(
+            'DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?', (now,)
+        ).rowcount
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        rows = self._conn.execute('SELECT key, size FROM responses ORDER BY accessed').fetchall()
+        for key, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._total_bytes -= size
+            removed += 1
+        logger.debug(f'Evicted {removed} cached LLM responses')
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, int]: Hits, misses, number of entries and total size in bytes
+        """
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            return {'hits': self.hits, 'misses': self.misses, 'entries': entries, 'bytes': self._total_bytes}
+
+
+def get_llm_cache(config: Any) -> Optional[LLMResponseCache]:
+    """
+    Get the LLM response cache described by ``config.llm_cache``.
+
+    One cache is kept per database path for the lifetime of the process, so every model
+    wrapper and worker thread shares a single SQLite connection.
+
+    Args:
+        config (PodcastConfig): Configuration object with cache directory and llm_cache settings
+
+    Returns:
+        LLMResponseCache: Cache at ``config.cache_dir/llm.sqlite``, or None if caching is disabled
+    """
+    settings = config.llm_cache
+    if not settings.get('enabled', True):
+        return None
+    path = os.path.abspath(os.path.join(config.cache_dir, 'llm.sqlite'))
+    with _caches_lock:
+        if path not in _caches:
+            ttl_hours = settings.get('ttl_hours')
+            _caches[path] = LLMResponseCache(
+                path,
+                max_bytes=int(settings.get('max_size_mb', 256) * 1024 * 1024),
+                ttl_s=ttl_hours * 3600 if ttl_hours else None,
+                cache_sampled=settings.get('cache_sampled', False)
+            )
+        return _caches[path]
@@ -22,7 +22,8 @@ PROMPT_MAPPINGS = {
         "podcast_research_queries": "podcast_research_queries",
         "podcast_interviewer_role": "podcast_interviewer_role",
         "podcast_interviewee_role": "podcast_interviewee_role",
-        "podcast_rewriter": "podcast_rewriter"
+        "podcast_rewriter": "podcast_rewriter",
+        "podcast_section_background": "podcast_section_background"
     },
     'zh': {
         "podcast_outline": "podcast_outline_zh",
@@ -30,7 +31,8 @@ PROMPT_MAPPINGS = {
         "podcast_research_queries": "podcast_research_queries_zh",
         "podcast_interviewer_role": "podcast_interviewer_role_zh",
         "podcast_interviewee_role": "podcast_interviewee_role_zh",
-        "podcast_rewriter": "podcast_rewriter_zh"
+        "podcast_rewriter": "podcast_rewriter_zh",
+        "podcast_section_background": "podcast_section_background_zh"
     }
 }
 
@@ -0,0 +1,297 @@
+"""
+A small DAG executor for podcast generation stages.
+
+Podcast generation is a chain of long-running stages (research, outline, draft, final
+script, audio), but not every stage depends on every earlier one. This module runs
+stages as soon as their declared inputs are available, runs independent stages
+concurrently, and lets a stage stream partial results to downstream stages while it
+is still running, so e.g. audio synthesis can start on the first finished batch of the
+final script.
+
+Key components:
+- Pipeline: Declares stages with named inputs and outputs and runs them
+- Stream: Thread-safe, single-consumer channel for partial results of a running stage
+- StreamError: Raised when iterating over the stream of a failed stage
+- StageTiming: Start/end time of a stage, recorded for every run
+
+Each stage also runs in a telemetry span (see utils.telemetry) in the context of the
+caller of ``run``, so its LLM, TTS and web calls are attributed to the stage.
+
+Example:
+    pipeline = Pipeline()
+    pipeline.add_stage('outline', make_outline, inputs=['research'])
+    pipeline.add_stage('script', write_script, inputs=['outline'], streams=['script_batches'])
+    pipeline.add_stage('audio', synthesize, inputs=['script_batches'])
+    results = pipeline.run({'research': documents})
+    logger.info(pipeline.format_timings())
+"""
+
+
+import concurrent.futures
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from podcast_llm.utils.concurrency import submit_with_context
+from podcast_llm.utils.telemetry import span
+
+
+logger = logging.getLogger(__name__)
+
+
+class StreamError(RuntimeError):
+    """Raised to a consumer iterating over a stream whose producing stage failed."""
+
+
+def _caused_by_stream(error: BaseException) -> bool:
+    """Whether an error was (directly or through wrapping) caused by a failed stream."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, StreamError):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class Stream:
+    """
+    Channel carrying the partial results of a running stage to a downstream stage.
+
+    The producing stage calls ``put`` for each partial result; the pipeline closes the
+    stream when the stage returns. Iterating over the stream yields items as they arrive
+    and ends when the stream is closed. If the producing stage fails, iteration raises.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._items: List[Any] = []
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+
+    def put(self, item: Any) -> None:
+        """Publish a partial result."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f'Stream {self.name} is closed')
+            self._items.append(item)
+            self._condition.notify_all()
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """Mark the stream complete, optionally because the producer failed."""
+        with self._condition:
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+
+    def __iter__(self) -> Iterator[Any]:
+        index = 0
+        while True:
+            with self._condition:
+                while index >= len(self._items) and not self._closed:
+                    self._condition.wait()
+                if index < len(self._items):
+                    item = self._items[index]
+                elif self._error is not None:
+                    raise StreamError(f'Stream {self.name} failed') from self._error
+                else:
+                    return
+            index += 1
+            yield item
+
+
+@dataclass
+class StageTiming:
+    """Wall-clock timing of one stage run, in seconds relative to the start of the pipeline."""
+    name: str
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class _Stage:
+    name: str
+    fn: Callable[..., Any]
+    inputs: List[str]
+    streams: List[str]
+
+
+class Pipeline:
+    """
+    Run stages in dependency order, with independent stages running concurrently.
+
+    Each stage is a function receiving its inputs as keyword arguments and returning a
+    value that becomes available under the stage name. A stage may also declare
+    streams: each is passed to the stage as a Stream keyword argument and is available
+    to downstream stages as soon as the producing stage starts.
+
+    When a stage fails, stages that have not started are skipped, the streams of the
+    failed stage are closed with the error, and the first error is raised once running
+    stages have finished. Errors of consumers caused by a failed stream (StreamError)
+    only win if no stage failed on its own.
+
+    Attributes:
+        timings (List[StageTiming]): Timing of every stage that ran, in start order
+    """
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the Pipeline.
+
+        Args:
+            max_workers (int, optional): Maximum number of stages running at once.
+                Defaults to the number of stages.
+        """
+        self.max_workers = max_workers
+        self.timings: List[StageTiming] = []
+        self._stages: Dict[str, _Stage] = {}
+
+    def add_stage(self,
+                  name: str,
+                  fn: Callable[..., Any],
+                  inputs: Optional[List[str]] = None,
+                  streams: Optional[List[str]] = None) -> 'Pipeline':
+        """
+        Declare a stage.
+
+        Args:
+            name (str): Stage name; the stage's return value is published under this name
+            fn (Callable[..., Any]): Stage function, called with its inputs and streams as
+                keyword arguments
+            inputs (List[str], optional): Names of stage results, streams or initial values
+                the stage needs
+            streams (List[str], optional): Names of streams the stage produces
+
+        Returns:
+            Pipeline: self, for chaining
+        """
+        if name in self._stages:
+            raise ValueError(f'Duplicate stage {name}')
+        self._stages[name] = _Stage(name, fn, list(inputs or []), list(streams or []))
+        return self
+
+    def _validate(self, available: set) -> None:
+        produced = set(available)
+        for stage in self._stages.values():
+            produced.add(stage.name)
+            produced.update(stage.streams)
+        for stage in self._stages.values():
+            missing = [name for name in stage.inputs if name not in produced]
+            if missing:
+                raise ValueError(f'Stage {stage.name} has unknown inputs: {missing}')
+
+        # Detect cycles over stage results (streams become available at producer start)
+        producers = {s: stage.name for stage in self._stages.values() for s in stage.streams}
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f'Cycle in pipeline at stage {name}')
+            visiting.add(name)
+            for dependency in self._stages[name].inputs:
+                dependency = producers.get(dependency, dependency)
+                if dependency in self._stages:
+                    visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._stages:
+            visit(name)
+
+    def run(self, initial: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run all stages.
+
+        Args:
+            initial (Dict[str, Any], optional): Values available to stages from the start
+
+        Returns:
+            Dict[str, Any]: Initial values, stage results and streams by name
+
+        Raises:
+            Exception: The first exception raised by a stage
+        """
+        values: Dict[str, Any] = dict(initial or {})
+        self._validate(set(values))
+        self.timings = []
+        pending = dict(self._stages)
+        running: Dict[concurrent.futures.Future, _Stage] = {}
+        error: Optional[BaseException] = None
+        start_time = time.monotonic()
+        workers = self.max_workers or max(1, len(self._stages))
+
+        def run_stage(stage: _Stage, kwargs: Dict[str, Any]) -> Any:
+            started = time.monotonic() - start_time
+            logger.info(f'Stage {stage.name} started')
+            try:
+                with span(stage.name, kind='stage'):
+                    result = stage.fn(**kwargs)
+            except BaseException as e:
+                for name in stage.streams:
+                    kwargs[name].close(e)
+                raise
+            finally:
+                ended = time.monotonic() - start_time
+                self.timings.append(StageTiming(stage.name, started, ended))
+            for name in stage.streams:
+                kwargs[name].close()
+            logger.info(f'Stage {stage.name} finished in {ended - started:.1f}s')
+            return result
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            while pending or running:
+                if error is None:
+                    for name, stage in list(pending.items()):
+                        if all(dependency in values for dependency in stage.inputs):
+                            kwargs = {dependency: values[dependency] for dependency in stage.inputs}
+                            for stream_name in stage.streams:
+                                values[stream_name] = kwargs[stream_name] = Stream(stream_name)
+                            running[submit_with_context(executor, run_stage, stage, kwargs)] = stage
+                            del pending[name]
+                else:
+                    pending.clear()
+
+                if not running:
+                    if pending:
+                        raise RuntimeError(f'Stages can never run: {sorted(pending)}')
+                    break
+
+                finished, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    try:
+                        values[stage.name] = future.result()
+                    except BaseException as e:
+                        logger.error(f'Stage {stage.name} failed: {e}')
+                        # A consumer of a failed stream may finish before its producer;
+                        # report the producer's own error rather than the consumer's
+                        if error is None or (_caused_by_stream(error) and not _caused_by_stream(e)):
+                            error = e
+
+        if error is not None:
+            raise error
+        return values
+
+    def format_timings(self) -> str:
+        """
+        Summarize the stage timings of the last run.
+
+        Returns:
+            str: One line per stage with start, end and duration, plus the total wall time
+        """
+        if not self.timings:
+            return 'No stages ran'
+        lines = ['Stage timings (start / end / duration, seconds):']
+        for timing in sorted(self.timings, key=lambda t: t.start):
+            lines.append(f'  {timing.name:<20} {timing.start:8.1f} {timing.end:8.1f} {timing.duration:8.1f}')
+        total = max(t.end for t in self.timings)
+        busy = sum(t.duration for t in self.timings)
+        lines.append(f'  total wall time {total:.1f}s for {busy:.1f}s of stage work')
+        return '\n'.join(lines)
@@ -1,53 +1,552 @@
+"""
+Shared, adaptive rate limiting and retry utilities for external API calls.
+
+All calls to the same provider or endpoint should go through one limiter so that
+parallel workers (threads or coroutines) respect a single budget. Limiters are kept in
+a process-wide registry keyed by name, e.g. ``'tts/google'`` or ``'research/tavily'``.
+
+Key components:
+- TokenBucketLimiter: Token bucket with burst capacity and a concurrency cap, usable as
+  a context manager from threads (``with``) and coroutines (``async with``). It adapts
+  its rate with AIMD: the rate is halved when the provider throttles (HTTP 429) and
+  grows back additively on success. Retry-After hints pause the whole bucket.
+- get_limiter: Get or create the shared limiter for a key
+- get_limiter_metrics: Wait-time and throttling metrics for all limiters
+- retry_with_exponential_backoff: Retry decorator with full jitter that honours
+  Retry-After and does not retry permanent client errors
+- rate_limit_per_minute: Decorator limiting a function through a shared limiter
+
+Example:
+    limiter = get_limiter('tts/google', requests_per_minute=60, max_concurrency=4)
+
+    @retry_with_exponential_backoff(max_retries=5, base_delay=1.0)
+    def synthesize(line):
+        with limiter:
+            return client.synthesize(line)
+"""
+
+
+import asyncio
+import collections
+import email.utils
+import functools
+import inspect
 import logging
+import random
+import threading
 import time
-from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+import pydantic
+from langchain_core.exceptions import OutputParserException
+
+from podcast_llm.utils.telemetry import add_to_span
 
 
 logger = logging.getLogger(__name__)
 
 
-def rate_limit_per_minute(max_requests_per_minute: int):
+# HTTP status codes worth retrying; other 4xx responses are permanent client errors
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+def get_status_code(exc: BaseException) -> Optional[int]:
+    """
+    Extract the HTTP status code from an API client exception, if it carries one.
+
+    Understands the conventions of requests/httpx (``exc.response.status_code``), the
+    OpenAI/Anthropic SDKs (``exc.status_code``) and Google API errors (``exc.code``).
+
+    Args:
+        exc (BaseException): Exception raised by an API call
+
+    Returns:
+        int: HTTP status code, or None if unknown
+    """
+    for candidate in (getattr(exc, 'status_code', None),
+                      getattr(getattr(exc, 'response', None), 'status_code', None),
+                      getattr(exc, 'code', None)):
+        if isinstance(candidate, int) and 100 <= candidate < 600:
+            return candidate
+    return None
+
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """
+    Extract a Retry-After hint in seconds from an API client exception.
+
+    Args:
+        exc (BaseException): Exception raised by an API call
+
+    Returns:
+        float: Seconds to wait before retrying, or None if the exception has no hint
+    """
+    retry_after = getattr(exc, 'retry_after', None)
+    if retry_after is None:
+        headers = getattr(getattr(exc, 'response', None), 'headers', None) or {}
+        try:
+            retry_after = headers.get('Retry-After') or headers.get('retry-after')
+        except AttributeError:
+            retry_after = None
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        pass
+    try:
+        # HTTP-date form
+        return max(0.0, email.utils.parsedate_to_datetime(str(retry_after)).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """
+    Check whether an exception means the provider is throttling requests.
+
+    Args:
+        exc (BaseException): Exception raised by an API call
+
+    Returns:
+        bool: True for HTTP 429 and errors that identify themselves as rate limiting
+    """
+    if get_status_code(exc) == 429:
+        return True
+    name = type(exc).__name__.lower()
+    return 'ratelimit' in name or 'resourceexhausted' in name or 'toomanyrequests' in name
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Decide whether a failed call should be retried.
+
+    Errors with a known HTTP status are retried only for throttling, timeouts and server
+    errors. Errors without a status (network failures) are retried, except structured
+    output that could not be parsed: it has already been repaired or re-asked cheaply, so
+    regenerating the whole response is not worth it.
+
+    Args:
+        exc (BaseException): Exception raised by the call
+
+    Returns:
+        bool: True if the call should be retried
+    """
+    if is_rate_limit_error(exc):
+        return True
+    if isinstance(exc, (OutputParserException, pydantic.ValidationError)):
+        return False
+    status = get_status_code(exc)
+    if status is None:
+        return True
+    return status in RETRYABLE_STATUS_CODES
+
+
+class _ConcurrencySlots:
+    """Counting semaphore that threads and coroutines (on any event loop) can share."""
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self._condition = threading.Condition()
+        self._async_waiters = collections.deque()
+
+    def try_acquire(self) -> bool:
+        with self._condition:
+            if self.in_use < self.limit:
+                self.in_use += 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_use >= self.limit:
+                self._condition.wait()
+            self.in_use += 1
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self.in_use < self.limit:
+                    self.in_use += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._condition:
+                    try:
+                        self._async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        # Already woken: pass the wake-up on
+                        self._wake_one()
+                raise
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_use -= 1
+            self._condition.notify()
+            self._wake_one()
+
+    def _wake_one(self) -> None:
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_future_result, waiter)
+                return
+
+
+def _set_future_result(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class TokenBucketLimiter:
+    """
+    Thread- and asyncio-safe token bucket limiting request rate and concurrency.
+
+    Tokens refill at the current rate up to ``burst`` tokens, each request takes one
+    token, and at most ``max_concurrency`` requests may be in flight at once. Requests
+    reserve tokens in arrival order, so waiting callers are served first come, first
+    served without busy polling.
+
+    When used as a context manager the limiter observes the outcome of the request:
+    a rate-limit error halves the rate (down to ``min_rate_fraction`` of the configured
+    rate) and honours any Retry-After hint by pausing the bucket, while each success
+    raises the rate additively back towards the configured rate.
+
+    Attributes:
+        name (str): Registry key of the limiter
+        max_rate (float): Configured rate in requests per second
+        rate (float): Current, adapted rate in requests per second
+        burst (float): Bucket capacity
+        max_concurrency (int): Maximum number of requests in flight at once
+    """
+    def __init__(self,
+                 name: str,
+                 requests_per_minute: float,
+                 burst: float = 1,
+                 max_concurrency: int = 1,
+                 adaptive: bool = True,
+                 min_rate_fraction: float = 1 / 16):
+        """
+        Initialize the TokenBucketLimiter.
+
+        Args:
+            name (str): Registry key of the limiter, used in logs and metrics
+            requests_per_minute (float): Maximum sustained number of requests per minute
+            burst (float): Number of requests that may start back to back after idling
+            max_concurrency (int): Maximum number of requests in flight at once
+            adaptive (bool): Whether to adapt the rate to throttling responses (AIMD)
+            min_rate_fraction (float): Lowest adapted rate as a fraction of the configured rate
+        """
+        self.name = name
+        self.max_rate = requests_per_minute / 60.0
+        self.rate = self.max_rate
+        self.min_rate = self.max_rate * min_rate_fraction
+        self.burst = max(1.0, float(burst))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.adaptive = adaptive
+
+        self._slots = _ConcurrencySlots(self.max_concurrency)
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+        self._requests = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._throttled = 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(-self._tokens / self.rate if self._tokens < 0 else 0.0, self._paused_until - now)
+            return wait
+
+    def _record_wait(self, wait: float) -> None:
+        with self._lock:
+            self._requests += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            if wait > 0.001:
+                self._waited += 1
+        # Also attribute the wait to the call that is being limited
+        add_to_span(limiter_wait_s=wait)
+
+    def acquire(self) -> None:
+        """Block until a concurrency slot and a token are available."""
+        start = time.monotonic()
+        self._slots.acquire()
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                time.sleep(wait)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._record_wait(time.monotonic() - start)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a concurrency slot and a token are available."""
+        start = time.monotonic()
+        await self._slots.acquire_async()
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._record_wait(time.monotonic() - start)
+
+    def acquire_token(self, blocking: bool = True) -> bool:
+        """
+        Take a token without occupying a concurrency slot.
+
+        For callers that cannot signal when a request finishes (e.g. LangChain chat models).
+
+        Args:
+            blocking (bool): Whether to wait for the token
+
+        Returns:
+            bool: True if a token was taken
+        """
+        if not blocking:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens < 1 or self._paused_until > now:
+                    return False
+                self._tokens -= 1
+            self._record_wait(0.0)
+            return True
+
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        self._record_wait(wait)
+        return True
+
+    async def acquire_token_async(self, blocking: bool = True) -> bool:
+        """Async version of acquire_token."""
+        if not blocking:
+            return self.acquire_token(blocking=False)
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._record_wait(wait)
+        return True
+
+    def release(self) -> None:
+        """Release the concurrency slot taken by acquire or acquire_async."""
+        self._slots.release()
+
+    def on_success(self) -> None:
+        """Record a successful request, growing an adapted rate back towards the configured rate."""
+        if not self.adaptive or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Record a throttled request.
+
+        Args:
+            retry_after (float, optional): Seconds the provider asked clients to wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._throttled += 1
+            if self.adaptive:
+                self.rate = max(self.min_rate, self.rate / 2)
+            # Drop any accumulated burst
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            rate = self.rate
+        logger.warning(f'{self.name} throttled; rate reduced to {rate * 60:.1f} requests/minute'
+                       + (f', pausing {retry_after:.1f}s' if retry_after else ''))
+
+    def _observe(self, exc: Optional[BaseException]) -> None:
+        if exc is None:
+            self.on_success()
+        elif isinstance(exc, Exception) and is_rate_limit_error(exc):
+            self.on_throttle(get_retry_after(exc))
+
+    def __enter__(self) -> 'TokenBucketLimiter':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        self._observe(exc)
+        return False
+
+    async def __aenter__(self) -> 'TokenBucketLimiter':
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        self._observe(exc)
+        return False
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get wait-time and throttling metrics for this limiter.
+
+        Returns:
+            dict: Request count, number of requests that had to wait, total/mean/max wait
+                in seconds, throttled responses, in-flight requests and the current rate
+        """
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'waited': self._waited,
+                'total_wait_s': round(self._total_wait, 3),
+                'mean_wait_s': round(self._total_wait / self._requests, 3) if self._requests else 0.0,
+                'max_wait_s': round(self._max_wait, 3),
+                'throttled': self._throttled,
+                'in_flight': self._slots.in_use,
+                'requests_per_minute': round(self.rate * 60, 2),
+                'configured_requests_per_minute': round(self.max_rate * 60, 2)
+            }
+
+
+_registry: Dict[str, TokenBucketLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_limiter(key: str,
+                requests_per_minute: float = 60,
+                burst: float = 1,
+                max_concurrency: int = 1,
+                adaptive: bool = True) -> TokenBucketLimiter:
+    """
+    Get the shared limiter for a provider or endpoint, creating it on first use.
+
+    The limits passed by the first caller for a key win; later callers get the same
+    limiter so that all of them share one budget.
+
+    Args:
+        key (str): Provider/endpoint key, e.g. 'tts/google'
+        requests_per_minute (float): Maximum sustained number of requests per minute
+        burst (float): Number of requests that may start back to back after idling
+        max_concurrency (int): Maximum number of requests in flight at once
+        adaptive (bool): Whether to adapt the rate to throttling responses
+
+    Returns:
+        TokenBucketLimiter: The shared limiter for the key
+    """
+    with _registry_lock:
+        limiter = _registry.get(key)
+        if limiter is None:
+            limiter = TokenBucketLimiter(key, requests_per_minute, burst, max_concurrency, adaptive)
+            _registry[key] = limiter
+        return limiter
+
+
+def get_limiter_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Get metrics for every registered limiter.
+
+    Returns:
+        dict: Metrics (see TokenBucketLimiter.metrics) keyed by limiter key
+    """
+    with _registry_lock:
+        limiters = list(_registry.values())
+    return {limiter.name: limiter.metrics() for limiter in limiters}
+
+
+def reset_limiters() -> None:
+    """Remove all registered limiters, e.g. after the configured limits changed."""
+    with _registry_lock:
+        _registry.clear()
+
+
+def rate_limit_per_minute(max_requests_per_minute: int, key: Optional[str] = None, burst: float = 1):
     """
     Decorator that adds per-minute rate limiting to a function.
-    
+
+    Calls go through the shared limiter registered under ``key`` (by default the
+    function's qualified name), so several functions hitting the same provider can
+    share one budget by passing the same key. Works for regular and async functions.
+
     Args:
         max_requests_per_minute (int): Maximum number of requests allowed per minute
-        
+        key (str, optional): Limiter registry key
+        burst (float): Number of calls that may start back to back after idling
+
     Returns:
         Callable: Decorated function with rate limiting
     """
     def decorator(func):
-        last_request_time = 0
-        min_interval = 60.0 / max_requests_per_minute  # Time between requests in seconds
-        
-        @wraps(func)
+        limiter = get_limiter(key or f'{func.__module__}.{func.__qualname__}',
+                              requests_per_minute=max_requests_per_minute,
+                              burst=burst,
+                              max_concurrency=2 ** 31)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                async with limiter:
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            nonlocal last_request_time
-            current_time = time.time()
-            time_since_last = current_time - last_request_time
-            
-            if time_since_last < min_interval:
-                sleep_time = min_interval - time_since_last
-                time.sleep(sleep_time)
-                
-            last_request_time = time.time()
-            return func(*args, **kwargs)
-            
+            with limiter:
+                return func(*args, **kwargs)
         return wrapper
     return decorator
 
 
-def retry_with_exponential_backoff(max_retries: int, base_delay: float = 1.0):
+def _backoff_delay(exc: BaseException, attempt: int, base_delay: float, max_delay: float) -> float:
+    # Full jitter: spread retries uniformly over [0, base * 2^attempt] so that workers
+    # throttled together do not retry together
+    delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+    retry_after = get_retry_after(exc)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, max_delay))
+    return delay
+
+
+def retry_with_exponential_backoff(max_retries: int,
+                                   base_delay: float = 1.0,
+                                   max_delay: float = 60.0,
+                                   retry_if: Callable[[BaseException], bool] = is_retryable):
     """
-    Decorator that retries a function with exponential backoff when exceptions occur.
-    
+    Decorator that retries a function with jittered exponential backoff when exceptions occur.
+
+    Delays are drawn uniformly between zero and ``base_delay * 2 ** attempt`` (capped at
+    ``max_delay``), but are never shorter than a Retry-After hint carried by the
+    exception. Exceptions for which ``retry_if`` returns False, such as permanent HTTP
+    4xx errors, are raised immediately. Works for regular and async functions.
+
     Args:
         max_retries (int): Maximum number of retry attempts
         base_delay (float): Initial delay between retries in seconds. Will be exponentially increased.
-        
+        max_delay (float): Maximum delay between retries in seconds
+        retry_if (Callable[[BaseException], bool]): Predicate deciding whether to retry an exception
+
     Returns:
         Callable: Decorated function with retry logic
-        
+
     Example:
         @retry_with_exponential_backoff(max_retries=3, base_delay=1.0)
         def flaky_function():
@@ -55,27 +554,40 @@ def retry_with_exponential_backoff(max_retries: int, base_delay: float = 1.0):
             pass
     """
     def decorator(func):
-        @wraps(func)
+        def should_retry(e: Exception, attempt: int) -> Optional[float]:
+            if attempt == max_retries or not retry_if(e):
+                return None
+            delay = _backoff_delay(e, attempt, base_delay, max_delay)
+            logger.warning(
+                f'Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}. '
+                f'Retrying in {delay:.1f}s...'
+            )
+            logger.warning(f"Caught exception: {str(e)}")
+            add_to_span(retries=1)
+            return delay
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        delay = should_retry(e, attempt)
+                        if delay is None:
+                            raise
+                        await asyncio.sleep(delay)
+            return async_wrapper
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            delay = base_delay
-            last_exception = None
-            
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-                    if attempt == max_retries:
-                        raise last_exception
-                    
-                    logger.warning(
-                        f'Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}. '
-                        f'Retrying in {delay:.1f}s...'
-                    )
-                    logger.warning(f"Caught exception: {str(e)}")
+                    delay = should_retry(e, attempt)
+                    if delay is None:
+                        raise
                     time.sleep(delay)
-                    delay *= 2  # Exponential backoff
-                    
-            return None  # Should never reach here
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -0,0 +1,148 @@
+"""
+Progressive playlist of episode audio segments for playback during synthesis.
+
+While an episode is being synthesized, every finished segment is written, in script
+order, to a directory next to the output file, and appended to an HLS-style
+``playlist.m3u8``. A player can start on the first segment while the rest of the
+episode is still being synthesized and keep polling the playlist for new segments.
+The playlist is closed with ``#EXT-X-ENDLIST`` once the last segment is published.
+
+Key components:
+- SegmentPlaylist: Publishes segments and maintains the playlist
+- read_playlist: Parses a playlist into segment paths and a finished flag
+- segment_dir_for: Directory holding the segments of an output file
+
+Example:
+    playlist = SegmentPlaylist(segment_dir_for('output/episode.mp3'), 'mp3')
+    for audio in segments:
+        playlist.publish(audio, duration=4.2)
+    playlist.finish()
+"""
+
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+PLAYLIST_NAME = 'playlist.m3u8'
+ENDLIST_TAG = '#EXT-X-ENDLIST'
+
+
+def segment_dir_for(output_file: str) -> Path:
+    """
+    Get the directory holding the published segments of an output file.
+
+    Args:
+        output_file (str): Path of the episode audio file
+
+    Returns:
+        Path: ``<output dir>/<output stem>_segments``
+    """
+    output_file = Path(output_file)
+    return output_file.with_name(f'{output_file.stem}_segments')
+
+
+def read_playlist(segment_dir: str) -> Tuple[List[Path], bool]:
+    """
+    Read the segments published so far.
+
+    Args:
+        segment_dir (str): Directory passed to SegmentPlaylist
+
+    Returns:
+        Tuple[List[Path], bool]: Segment paths in playback order, and whether the
+            playlist is complete. No segments and False if nothing was published yet.
+    """
+    segment_dir = Path(segment_dir)
+    try:
+        with open(segment_dir / PLAYLIST_NAME, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f]
+    except FileNotFoundError:
+        return [], False
+
+    segments = [segment_dir / line for line in lines if line and not line.startswith('#')]
+    return segments, ENDLIST_TAG in lines
+
+
+class SegmentPlaylist:
+    """
+    Publish audio segments in order together with a growing HLS-style playlist.
+
+    Each segment file is fully written before it is added to the playlist, and the
+    playlist itself is replaced atomically, so a reader never sees a partial segment.
+    Creating a SegmentPlaylist removes segments left over from a previous run.
+    """
+    def __init__(self, segment_dir: str, audio_format: str):
+        """
+        Initialize the SegmentPlaylist.
+
+        Args:
+            segment_dir (str): Directory for the segments and the playlist
+            audio_format (str): File extension of the published segments (e.g. 'mp3')
+        """
+        self.segment_dir = Path(segment_dir)
+        self.audio_format = audio_format
+        self._entries: List[Tuple[str, Optional[float]]] = []
+        self._finished = False
+        self._lock = threading.Lock()
+
+        shutil.rmtree(self.segment_dir, ignore_errors=True)
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self._write_playlist()
+
+    def publish(self, audio: bytes, duration: Optional[float] = None) -> Path:
+        """
+        Write the next segment and add it to the playlist.
+
+        Args:
+            audio (bytes): Encoded audio data
+            duration (float, optional): Segment duration in seconds
+
+        Returns:
+            Path: Path of the segment file
+        """
+        with self._lock:
+            name = f'segment_{len(self._entries):05d}.{self.audio_format}'
+            path = self.segment_dir / name
+            self._atomic_write(path, audio)
+            self._entries.append((name, duration))
+            self._write_playlist()
+        return path
+
+    def finish(self) -> None:
+        """Mark the playlist as complete."""
+        with self._lock:
+            if not self._finished:
+                self._finished = True
+                self._write_playlist()
+        logger.info(f'Published {len(self._entries)} segments to {self.segment_dir}')
+
+    def _write_playlist(self) -> None:
+        durations = [duration for _, duration in self._entries if duration is not None]
+        lines = [
+            '#EXTM3U',
+            '#EXT-X-VERSION:3',
+            '#EXT-X-PLAYLIST-TYPE:EVENT',
+            f'#EXT-X-TARGETDURATION:{int(max(durations, default=0)) + 1}',
+            '#EXT-X-MEDIA-SEQUENCE:0'
+        ]
+        for name, duration in self._entries:
+            lines.append(f'#EXTINF:{duration if duration is not None else 0:.3f},')
+            lines.append(name)
+        if self._finished:
+            lines.append(ENDLIST_TAG)
+        self._atomic_write(self.segment_dir / PLAYLIST_NAME, ('\n'.join(lines) + '\n').encode('utf-8'))
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.segment_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
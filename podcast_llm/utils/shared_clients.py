@@ -0,0 +1,95 @@
+"""
+Process-wide registry of reusable API clients.
+
+Creating chat models, embedding models and TTS clients is not free: each one sets up its
+own HTTP connection pool, and some SDKs load credentials or discovery documents on
+construction. This module keeps one client per distinct configuration for the lifetime
+of the process, so stages, threads and (in batch mode) episodes reuse connections
+instead of re-creating clients for every call.
+
+Key components:
+- get_shared_client: Returns the client registered under a key, creating it on first use
+- client_key: Builds a registry key, hashing secrets such as API keys
+- get_shared_client_stats: Number of clients created and reused, per kind
+- reset_shared_clients: Drops all registered clients (mainly for tests)
+
+Example:
+    client = get_shared_client(
+        client_key('tts/elevenlabs', config.elevenlabs_api_key),
+        lambda: ElevenLabs(api_key=config.elevenlabs_api_key)
+    )
+"""
+
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from podcast_llm.utils.disk_cache import hash_key
+
+
+logger = logging.getLogger(__name__)
+
+
+_clients: Dict[Tuple, Any] = {}
+_stats: Dict[str, Dict[str, int]] = {}
+_lock = threading.Lock()
+
+
+def client_key(kind: str, *parts: Any) -> Tuple[str, str]:
+    """
+    Build the registry key for a client.
+
+    Args:
+        kind (str): Client kind, e.g. 'llm/openai' or 'tts/google'
+        *parts: Everything that distinguishes two clients of the same kind (model, base
+            URL, API key, ...). Parts are hashed, so secrets never appear in the key.
+
+    Returns:
+        Tuple[str, str]: Registry key
+    """
+    return kind, hash_key(*[repr(part) for part in parts])
+
+
+def get_shared_client(key: Tuple[str, str], factory: Callable[[], Any]) -> Any:
+    """
+    Get the client registered under a key, creating it with factory on first use.
+
+    Only use this for clients that are safe to share between threads.
+
+    Args:
+        key (Tuple[str, str]): Key from client_key
+        factory (Callable[[], Any]): Creates the client
+
+    Returns:
+        Any: The shared client
+    """
+    kind = key[0]
+    with _lock:
+        stats = _stats.setdefault(kind, {'created': 0, 'reused': 0})
+        if key in _clients:
+            stats['reused'] += 1
+            return _clients[key]
+        client = factory()
+        _clients[key] = client
+        stats['created'] += 1
+    logger.debug(f'Created shared client {kind}')
+    return client
+
+
+def get_shared_client_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the number of clients created and reused so far.
+
+    Returns:
+        Dict[str, Dict[str, int]]: {'created': n, 'reused': n} per client kind
+    """
+    with _lock:
+        return {kind: dict(stats) for kind, stats in _stats.items()}
+
+
+def reset_shared_clients() -> None:
+    """Drop all registered clients and statistics."""
+    with _lock:
+        _clients.clear()
+        _stats.clear()
@@ -1,10 +1,19 @@
-import requests
+import concurrent.futures
 import os
-from typing import List
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 from langchain_core.embeddings import Embeddings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 import logging
 
+from podcast_llm.utils.concurrency import submit_with_context
+from podcast_llm.utils.disk_cache import hash_key
+from podcast_llm.utils.rate_limits import get_limiter, retry_with_exponential_backoff
+
 logger = logging.getLogger(__name__)
 
 class SiliconFlowEmbeddings(Embeddings):
@@ -13,12 +22,58 @@ class SiliconFlowEmbeddings(Embeddings):
         api_key: str,
         base_url: str = "https://api.siliconflow.cn/v1/embeddings",
         model: str = "BAAI/bge-large-zh-v1.5",
-        max_tokens: int = 512
+        max_tokens: int = 512,
+        max_batch_size: int = 32,
+        max_batch_tokens: int = 16384,
+        max_concurrency: int = 4,
+        requests_per_minute: float = 2000,
+        max_retries: int = 5,
+        timeout: float = 60.0
     ):
+        """
+        Embeddings client for the SiliconFlow embeddings API.
+
+        Texts are deduplicated, looked up in an in-memory embedding cache and the remaining ones are
+        sent in batches of up to ``max_batch_size`` inputs and roughly ``max_batch_tokens``
+        tokens per request. Batches are dispatched concurrently over a pooled HTTP session,
+        through the shared ``embeddings/siliconflow`` rate limiter, and rate-limited or
+        failed requests are retried with jittered backoff.
+
+        Texts longer than ``max_tokens * 4`` characters are split into chunks whose
+        embeddings are averaged, weighted by chunk length. Chunks that still fail after all
+        retries are skipped with a warning; a text only fails if none of its chunks could be
+        embedded, or if it was not split and its request failed.
+
+        Embeddings are only cached for the lifetime of the instance; the draft-script vector
+        store persists them between runs.
+
+        Args:
+            api_key (str): SiliconFlow API key
+            base_url (str): Embeddings endpoint URL
+            model (str): Embeddings model name
+            max_tokens (int): Chunk size used when splitting long texts
+            max_batch_size (int): Maximum number of inputs per request
+            max_batch_tokens (int): Approximate token budget per request (estimated from characters)
+            max_concurrency (int): Maximum number of requests in flight at once
+            requests_per_minute (float): Maximum sustained number of requests per minute
+            max_retries (int): Retries per request on connection errors and 429/5xx responses
+            timeout (float): Request timeout in seconds
+        """
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
         self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._limiter = get_limiter(
+            "embeddings/siliconflow",
+            requests_per_minute=requests_per_minute,
+            burst=max_concurrency,
+            max_concurrency=max_concurrency
+        )
         # 初始化文本分割器
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=max_tokens,
@@ -27,80 +82,145 @@ class SiliconFlowEmbeddings(Embeddings):
             separators=["\n\n", "\n", ". ", " ", ""]
         )
 
+        # 复用连接的会话；失败重试统一由 _get_embeddings_for_batch 的退避重试处理，避免两层重试叠加
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # 嵌入缓存，键为 (模型, 文本哈希)
+        self._cache: Dict[str, List[float]] = {}
+        self._cache_lock = threading.Lock()
+
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        """Embed a list of documents."""
-        embeddings = []
+        """Embed a list of documents, handling long texts by chunking and pooling embeddings."""
+        # 将每个文本拆分为待嵌入的片段（超长文本按块拆分）
+        pieces: List[List[str]] = []
         for text in texts:
-            embedding = self.embed_query(text)
-            embeddings.append(embedding)
+            if len(text) > self.max_tokens * 4:  # 简单的字符数检查
+                chunks = self.text_splitter.split_text(text)
+                logger.info(f"Text too long ({len(text)} chars), split into {len(chunks)} chunks")
+                pieces.append(chunks)
+            else:
+                pieces.append([text])
+
+        # 所有片段统一去重、查缓存、批量请求
+        vectors, errors = self._embed_unique([piece for chunks in pieces for piece in chunks])
+
+        embeddings = []
+        for chunks in pieces:
+            if len(chunks) == 1:
+                if chunks[0] in errors:
+                    raise errors[chunks[0]]
+                embeddings.append(vectors[chunks[0]])
+                continue
+
+            # 跳过嵌入失败的块，其余块按长度加权平均
+            embedded = [chunk for chunk in chunks if chunk in vectors]
+            for i, chunk in enumerate(chunks):
+                if chunk in errors:
+                    logger.warning(f"Failed to embed chunk {i+1}: {errors[chunk]}")
+            if not embedded:
+                raise Exception("Failed to embed any chunk of the text")
+            embeddings.append(self._average_embeddings(
+                [vectors[chunk] for chunk in embedded],
+                weights=[len(chunk) for chunk in embedded]
+            ))
         return embeddings
 
     def embed_query(self, text: str) -> List[float]:
         """Embed a query, handling long texts by chunking and averaging embeddings."""
-        # 如果文本长度超过限制，进行分块处理
-        if len(text) > self.max_tokens * 4:  # 简单的字符数检查
-            logger.info(f"Text too long ({len(text)} chars), splitting into chunks...")
-            # 使用文本分割器将长文本分割成块
-            chunks = self.text_splitter.split_text(text)
-            logger.info(f"Split text into {len(chunks)} chunks")
-            
-            # 获取每个块的嵌入并平均
-            chunk_embeddings = []
-            for i, chunk in enumerate(chunks):
-                try:
-                    chunk_embedding = self._get_embedding_for_chunk(chunk)
-                    chunk_embeddings.append(chunk_embedding)
-                    logger.info(f"Processed chunk {i+1}/{len(chunks)}")
-                except Exception as e:
-                    logger.warning(f"Failed to embed chunk {i+1}: {e}")
-                    # 如果某个块失败，跳过它
-                    continue
-            
-            if chunk_embeddings:
-                # 对所有块的嵌入进行平均
-                avg_embedding = self._average_embeddings(chunk_embeddings)
-                return avg_embedding
+        return self.embed_documents([text])[0]
+
+    def _cache_key(self, text: str) -> str:
+        return hash_key(self.model, text)
+
+    def _embed_unique(self, texts: List[str]) -> Tuple[Dict[str, List[float]], Dict[str, Exception]]:
+        """Embed each distinct text once, using the cache where possible; texts whose batch failed map to its error."""
+        vectors: Dict[str, List[float]] = {}
+        errors: Dict[str, Exception] = {}
+        missing: List[str] = []
+        for text in dict.fromkeys(texts):
+            key = self._cache_key(text)
+            with self._cache_lock:
+                vector = self._cache.get(key)
+            if vector is None:
+                missing.append(text)
             else:
-                # 如果所有块都失败，抛出异常
-                raise Exception("Failed to embed any chunk of the text")
-        else:
-            # 文本长度在限制内，直接处理
-            return self._get_embedding_for_chunk(text)
+                vectors[text] = vector
 
-    def _get_embedding_for_chunk(self, text: str) -> List[float]:
-        """Get embedding for a single text chunk."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
+        if missing:
+            batches = self._make_batches(missing)
+            logger.info(f"Embedding {len(missing)} texts in {len(batches)} requests "
+                        f"({len(vectors)} served from cache)")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = [submit_with_context(executor, self._get_embeddings_for_batch, batch) for batch in batches]
+                for batch, future in zip(batches, futures):
+                    try:
+                        batch_vectors = future.result()
+                    except Exception as e:
+                        errors.update((text, e) for text in batch)
+                        continue
+                    for text, vector in zip(batch, batch_vectors):
+                        key = self._cache_key(text)
+                        with self._cache_lock:
+                            self._cache[key] = vector
+                        vectors[text] = vector
+
+        return vectors, errors
+
+    def _make_batches(self, texts: List[str]) -> List[List[str]]:
+        """Group texts into batches bounded by input count and approximate token budget."""
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = len(text)
+            if current and (len(current) >= self.max_batch_size or current_tokens + tokens > self.max_batch_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _get_embeddings_for_batch(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for a batch of text chunks in a single request."""
+        return retry_with_exponential_backoff(max_retries=self.max_retries)(self._post_batch)(texts)
+
+    def _post_batch(self, texts: List[str]) -> List[List[float]]:
         payload = {
             "model": self.model,
-            "input": text,
+            "input": texts,
             "encoding_format": "float"
         }
-        
-        response = requests.post(
-            self.base_url,
-            json=payload,
-            headers=headers
-        )
-        
-        if response.status_code == 200:
-            return response.json()["data"][0]["embedding"]
-        else:
-            raise Exception(f"Error in embedding: {response.text}")
-
-    def _average_embeddings(self, embeddings: List[List[float]]) -> List[float]:
-        """Average a list of embeddings."""
+
+        with self._limiter:
+            response = self.session.post(
+                self.base_url,
+                json=payload,
+                timeout=self.timeout
+            )
+            if response.status_code != 200:
+                # HTTPError 携带状态码和 Retry-After，供限流器和重试逻辑使用
+                raise requests.HTTPError(f"Error in embedding: {response.text}", response=response)
+
+        data = sorted(response.json()["data"], key=lambda item: item.get("index", 0))
+        return [item["embedding"] for item in data]
+
+    def _get_embedding_for_chunk(self, text: str) -> List[float]:
+        """Get embedding for a single text chunk."""
+        return self._get_embeddings_for_batch([text])[0]
+
+    def _average_embeddings(self, embeddings: List[List[float]], weights: Optional[List[float]] = None) -> List[float]:
+        """Average a list of embeddings, optionally weighted (e.g. by chunk length)."""
         if not embeddings:
             raise ValueError("Cannot average empty list of embeddings")
-        
-        # 计算平均嵌入
-        avg_embedding = []
-        for i in range(len(embeddings[0])):
-            avg_value = sum(embedding[i] for embedding in embeddings) / len(embeddings)
-            avg_embedding.append(avg_value)
-        
-        return avg_embedding
 
+        # 计算(加权)平均嵌入
+        return np.average(np.asarray(embeddings, dtype=np.float64), axis=0, weights=weights).tolist()
@@ -0,0 +1,451 @@
+"""
+Structured performance telemetry for podcast generation.
+
+Generation stages and the external calls they make (LLM, embeddings, TTS, web fetches,
+ffmpeg) are recorded as spans: named, timed operations with a parent span and numeric
+attributes such as tokens in/out, characters synthesized, bytes downloaded, retries and
+time spent waiting for a rate limiter. The spans of one episode form a trace that is
+exported as JSON lines and as OTLP/JSON (the OpenTelemetry protocol's JSON encoding,
+accepted by OpenTelemetry collectors), together with a summary report of where the
+episode spent its time and quota.
+
+The active recorder and span are context variables, so concurrent episodes (see
+podcast_llm.batch) are recorded separately. Work handed to other threads keeps its
+parent span when submitted with utils.concurrency.submit_with_context (asyncio tasks
+and ``asyncio.to_thread`` inherit the context by themselves). Without an active
+recorder spans cost a few microseconds and are discarded.
+
+Key components:
+- Span: A timed operation with attributes
+- span: Context manager recording a span as a child of the current one
+- start_span / end_span: Spans that outlive a block, e.g. an encoder process
+- add_to_span: Adds to numeric attributes of the current span (retries, limiter wait)
+- TelemetryRecorder: Collects the spans of a trace and exports them
+- record_episode: Records an episode and writes its exports and summary report
+
+Example:
+    with record_episode(config, 'quantum_computing'):
+        with span('llm.invoke', kind='llm', model='gpt-4o') as s:
+            response = llm.invoke(prompt)
+            s.set(tokens_in=120, tokens_out=512)
+"""
+
+
+import contextvars
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# Span kinds of calls to other services, exported as OpenTelemetry CLIENT spans
+CLIENT_KINDS = {'llm', 'embeddings', 'tts', 'web'}
+
+_OTLP_KIND_INTERNAL = 1
+_OTLP_KIND_CLIENT = 3
+_OTLP_STATUS_OK = 1
+_OTLP_STATUS_ERROR = 2
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('telemetry_span', default=None)
+_current_recorder: contextvars.ContextVar[Optional['TelemetryRecorder']] = contextvars.ContextVar(
+    'telemetry_recorder', default=None
+)
+_attribute_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    """
+    A timed operation.
+
+    Attributes:
+        name (str): Operation name, e.g. 'llm.invoke' or a stage name
+        kind (str): Category: 'episode', 'stage', 'llm', 'embeddings', 'tts', 'web',
+            'ffmpeg' or 'internal'
+        trace_id (str): 32 hex digits identifying the episode's trace
+        span_id (str): 16 hex digits identifying the span
+        parent_id (Optional[str]): span_id of the parent span
+        start (float): Start time in seconds since the epoch
+        end (Optional[float]): End time, None while the span is open
+        status (str): 'ok' or 'error'
+        error (Optional[str]): Error message of a failed operation
+        attributes (Dict[str, Any]): Operation details and counters
+    """
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float
+    end: Optional[float] = None
+    status: str = 'ok'
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    _started: float = field(default=0.0, repr=False)
+    _recorder: Optional['TelemetryRecorder'] = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (so far, for an open span)."""
+        return (self.end if self.end is not None else self.start + time.perf_counter() - self._started) - self.start
+
+    def set(self, **attributes: Any) -> 'Span':
+        """Set attributes, returning the span."""
+        with _attribute_lock:
+            self.attributes.update(attributes)
+        return self
+
+    def add(self, **counters: float) -> 'Span':
+        """Add to numeric attributes (missing ones start at 0), returning the span."""
+        with _attribute_lock:
+            for name, value in counters.items():
+                self.attributes[name] = self.attributes.get(name, 0) + value
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the span as a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Span fields plus 'duration_s'
+        """
+        return {
+            'name': self.name,
+            'kind': self.kind,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start': self.start,
+            'end': self.end,
+            'duration_s': round(self.duration, 6),
+            'status': self.status,
+            'error': self.error,
+            'attributes': dict(self.attributes)
+        }
+
+
+def current_span() -> Optional[Span]:
+    """Get the innermost open span of the current context, if any."""
+    return _current_span.get()
+
+
+def start_span(name: str, kind: str = 'internal', **attributes: Any) -> Span:
+    """
+    Open a span as a child of the current span without making it current.
+
+    Args:
+        name (str): Operation name
+        kind (str): Span kind (see Span)
+        **attributes: Initial attributes
+
+    Returns:
+        Span: The open span; close it with end_span
+    """
+    parent = _current_span.get()
+    recorder = _current_recorder.get()
+    if parent is not None:
+        trace_id = parent.trace_id
+    elif recorder is not None:
+        trace_id = recorder.trace_id
+    else:
+        trace_id = uuid.uuid4().hex
+    return Span(
+        name=name,
+        kind=kind,
+        trace_id=trace_id,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent is not None else None,
+        start=time.time(),
+        attributes=attributes,
+        _started=time.perf_counter(),
+        _recorder=recorder
+    )
+
+
+def end_span(span: Span, error: Optional[BaseException] = None) -> None:
+    """
+    Close a span and hand it to the recorder that was active when it started.
+
+    Args:
+        span (Span): Span from start_span
+        error (BaseException, optional): Exception that ended the operation
+    """
+    if span.end is not None:
+        return
+    span.end = span.start + time.perf_counter() - span._started
+    if error is not None:
+        span.status = 'error'
+        span.error = f'{type(error).__name__}: {error}'
+    if span._recorder is not None:
+        span._recorder.record(span)
+
+
+@contextmanager
+def span(name: str, kind: str = 'internal', **attributes: Any) -> Iterator[Span]:
+    """
+    Record a block as a span that is the current span while the block runs.
+
+    Args:
+        name (str): Operation name
+        kind (str): Span kind (see Span)
+        **attributes: Initial attributes
+
+    Yields:
+        Span: The open span, for setting attributes
+    """
+    current = start_span(name, kind, **attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        end_span(current, e)
+        raise
+    finally:
+        _current_span.reset(token)
+        end_span(current)
+
+
+def add_to_span(**counters: float) -> None:
+    """
+    Add to numeric attributes of the current span, if there is one.
+
+    Args:
+        **counters: Amounts to add, e.g. ``retries=1`` or ``limiter_wait_s=0.4``
+    """
+    current = _current_span.get()
+    if current is not None:
+        current.add(**counters)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class TelemetryRecorder:
+    """
+    Collect the finished spans of one trace.
+
+    Safe to use from multiple threads.
+
+    Attributes:
+        name (str): Name of the traced run (e.g. the episode)
+        trace_id (str): Trace id shared by all spans
+        spans (List[Span]): Finished spans in the order they ended
+    """
+    def __init__(self, name: str):
+        """
+        Initialize the TelemetryRecorder.
+
+        Args:
+            name (str): Name of the traced run
+        """
+        self.name = name
+        self.trace_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def record(self, span: Span) -> None:
+        """Add a finished span."""
+        with self._lock:
+            self.spans.append(span)
+
+    def _finished(self) -> List[Span]:
+        with self._lock:
+            return list(self.spans)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the recorded spans.
+
+        Returns:
+            Dict[str, Any]: Wall time, duration per stage, and per operation (span name)
+                the call count, errors, total/p50/p95/max duration and the sums of all
+                numeric attributes (tokens, characters, bytes, retries, limiter wait),
+                plus LLM calls and tokens per model
+        """
+        spans = self._finished()
+        roots = [s for s in spans if s.parent_id is None]
+        wall_s = max((s.duration for s in roots), default=0.0)
+
+        stages: Dict[str, float] = {}
+        operations: Dict[str, Dict[str, Any]] = {}
+        durations: Dict[str, List[float]] = {}
+        models: Dict[str, Dict[str, float]] = {}
+        for s in spans:
+            if s.kind == 'stage':
+                stages[s.name] = round(stages.get(s.name, 0.0) + s.duration, 3)
+                continue
+            if s.kind == 'episode':
+                continue
+            operation = operations.setdefault(s.name, {'kind': s.kind, 'count': 0, 'errors': 0})
+            operation['count'] += 1
+            operation['errors'] += s.status == 'error'
+            durations.setdefault(s.name, []).append(s.duration)
+            for key, value in s.attributes.items():
+                if isinstance(value, (int, float)):
+                    operation[key] = operation.get(key, 0) + value
+            if s.kind == 'llm':
+                model = models.setdefault(str(s.attributes.get('model')), {'calls': 0, 'tokens_in': 0, 'tokens_out': 0})
+                model['calls'] += 1
+                model['tokens_in'] += s.attributes.get('tokens_in', 0)
+                model['tokens_out'] += s.attributes.get('tokens_out', 0)
+
+        for name, operation in operations.items():
+            values = durations[name]
+            operation.update({
+                'total_s': round(sum(values), 3),
+                'p50_s': round(_percentile(values, 0.5), 3),
+                'p95_s': round(_percentile(values, 0.95), 3),
+                'max_s': round(max(values), 3)
+            })
+            for key, value in operation.items():
+                if isinstance(value, float):
+                    operation[key] = round(value, 3)
+
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'wall_s': round(wall_s, 3),
+            'stages': stages,
+            'operations': dict(sorted(operations.items(), key=lambda item: -item[1]['total_s'])),
+            'llm_models': models
+        }
+
+    def format_summary(self) -> str:
+        """
+        Format the summary for the log.
+
+        Returns:
+            str: Stage durations and one line per operation
+        """
+        summary = self.summary()
+        lines = [f"Telemetry for {summary['name']} ({summary['wall_s']:.1f}s):"]
+        for name, duration in summary['stages'].items():
+            lines.append(f'  stage {name:<28} {duration:8.1f}s')
+        for name, operation in summary['operations'].items():
+            details = [f"{operation['count']:5d} calls", f"total {operation['total_s']:7.1f}s",
+                       f"p95 {operation['p95_s']:.2f}s"]
+            for key in ('tokens_in', 'tokens_out', 'chars', 'bytes', 'retries', 'limiter_wait_s', 'errors'):
+                if operation.get(key):
+                    details.append(f'{key} {operation[key]}')
+            lines.append(f"  {name:<34} {'  '.join(details)}")
+        return '\n'.join(lines)
+
+    def export_jsonl(self, path: str) -> None:
+        """
+        Write one JSON object per span.
+
+        Args:
+            path (str): Output file
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for s in self._finished():
+                f.write(json.dumps(s.to_dict(), ensure_ascii=False, default=str) + '\n')
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Get the spans as an OTLP/JSON ExportTraceServiceRequest.
+
+        Returns:
+            Dict[str, Any]: Request body for an OpenTelemetry collector's /v1/traces
+        """
+        spans = []
+        for s in self._finished():
+            otlp_span = {
+                'traceId': s.trace_id,
+                'spanId': s.span_id,
+                'name': s.name,
+                'kind': _OTLP_KIND_CLIENT if s.kind in CLIENT_KINDS else _OTLP_KIND_INTERNAL,
+                'startTimeUnixNano': str(int(s.start * 1e9)),
+                'endTimeUnixNano': str(int(s.end * 1e9)),
+                'attributes': [{'key': 'podcast_llm.kind', 'value': _otlp_value(s.kind)}] + [
+                    {'key': key, 'value': _otlp_value(value)} for key, value in s.attributes.items()
+                ],
+                'status': ({'code': _OTLP_STATUS_ERROR, 'message': s.error} if s.status == 'error'
+                           else {'code': _OTLP_STATUS_OK})
+            }
+            if s.parent_id is not None:
+                otlp_span['parentSpanId'] = s.parent_id
+            spans.append(otlp_span)
+
+        return {'resourceSpans': [{
+            'resource': {'attributes': [
+                {'key': 'service.name', 'value': {'stringValue': 'podcast_llm'}},
+                {'key': 'podcast_llm.run', 'value': {'stringValue': self.name}}
+            ]},
+            'scopeSpans': [{'scope': {'name': 'podcast_llm.telemetry'}, 'spans': spans}]
+        }]}
+
+    def export_otlp(self, path: str) -> None:
+        """
+        Write the spans as OTLP/JSON.
+
+        Args:
+            path (str): Output file
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_otlp(), f, ensure_ascii=False)
+
+
+@contextmanager
+def record_episode(config: Any, name: str, **attributes: Any) -> Iterator[Optional[TelemetryRecorder]]:
+    """
+    Record the telemetry of one episode.
+
+    Opens the root 'episode' span; every span started in this context (and in work
+    submitted with its context) belongs to the episode's trace. On exit the spans are
+    written to ``config.telemetry['output_dir']`` as ``<name>_<time>.spans.jsonl`` and
+    ``<name>_<time>.otlp.json``, the summary report as ``<name>_<time>.summary.json``,
+    and the summary is logged. Does nothing when ``config.telemetry['enabled']`` is false.
+
+    Args:
+        config (PodcastConfig): Configuration object
+        name (str): Episode name, used for the file names
+        **attributes: Attributes of the episode span (e.g. topic, mode)
+
+    Yields:
+        Optional[TelemetryRecorder]: The recorder, or None when telemetry is disabled
+    """
+    settings = getattr(config, 'telemetry', None) or {}
+    if not settings.get('enabled', False):
+        yield None
+        return
+
+    recorder = TelemetryRecorder(name)
+    token = _current_recorder.set(recorder)
+    try:
+        with span('episode', kind='episode', **attributes):
+            yield recorder
+    finally:
+        _current_recorder.reset(token)
+        try:
+            output_dir = Path(settings.get('output_dir', './output/telemetry'))
+            output_dir.mkdir(parents=True, exist_ok=True)
+            prefix = output_dir / f"{name}_{time.strftime('%Y%m%d_%H%M%S')}"
+            recorder.export_jsonl(f'{prefix}.spans.jsonl')
+            recorder.export_otlp(f'{prefix}.otlp.json')
+            with open(f'{prefix}.summary.json', 'w', encoding='utf-8') as f:
+                json.dump(recorder.summary(), f, ensure_ascii=False, indent=2)
+            logger.info(recorder.format_summary())
+            logger.info(f'Telemetry written to {prefix}.*')
+        except OSError as e:
+            logger.warning(f'Could not write telemetry for {name}: {e}')
@@ -8,6 +8,9 @@ different text representations.
 Key components:
 - generate_markdown_script: Converts podcast outline and script into markdown format
   for easy viewing and sharing
+- parse_markdown_script: Reads the script lines back from that markdown, e.g. after
+  the script was edited by hand
+- estimate_tokens / truncate_to_tokens: Approximate token counting for prompt budgets
 
 The module helps with:
 - Converting internal podcast data structures to human-readable formats
@@ -16,9 +19,59 @@ The module helps with:
 """
 
 
+import math
+import re
+
 from podcast_llm.outline import PodcastOutline
 
 
+# A script line as written by generate_markdown_script: **Speaker**: text
+SCRIPT_LINE = re.compile(r'^\*\*(?P<speaker>[^*]+)\*\*:\s?(?P<text>.*)$')
+
+# CJK ideographs, kana and hangul are roughly one token each in common tokenizers
+CJK_CHARACTERS = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text without a provider-specific tokenizer.
+
+    Counts CJK characters as one token each and assumes four characters per token for
+    everything else, which is close enough for prompt budgets across providers.
+
+    Args:
+        text (str): Text to measure
+
+    Returns:
+        int: Estimated token count
+    """
+    cjk = len(CJK_CHARACTERS.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Shorten a text to at most max_tokens estimated tokens, keeping its beginning.
+
+    Args:
+        text (str): Text to shorten
+        max_tokens (int): Token budget
+
+    Returns:
+        str: The text, or its longest prefix within the budget followed by an ellipsis
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) + 1 <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low] + "…"
+
+
 def generate_markdown_script(topic: str, outline: PodcastOutline, script: list) -> None:
     """
     Generate a markdown formatted version of the podcast script.
@@ -51,3 +104,29 @@ def generate_markdown_script(topic: str, outline: PodcastOutline, script: list)
         markdown += f'**{line["speaker"]}**: {line["text"]}\n\n'
 
     return markdown
+
+
+def parse_markdown_script(markdown: str) -> list:
+    """
+    Parse the script lines of a markdown script written by generate_markdown_script.
+
+    Only the ``## Script`` section is read (the whole text if there is none). Each line
+    starts with ``**Speaker**:``; following non-empty lines without a speaker are joined
+    to the current line, so wrapped paragraphs survive hand editing.
+
+    Args:
+        markdown (str): Markdown script
+
+    Returns:
+        list: List of dictionaries with 'speaker' and 'text'
+    """
+    _, found, script = markdown.partition('## Script\n')
+    lines = []
+    for row in (script if found else markdown).splitlines():
+        row = row.strip()
+        match = SCRIPT_LINE.match(row)
+        if match:
+            lines.append({'speaker': match['speaker'].strip(), 'text': match['text'].strip()})
+        elif row and lines and not row.startswith('#'):
+            lines[-1]['text'] = f"{lines[-1]['text']} {row}".strip()
+    return lines
@@ -0,0 +1,648 @@
+"""
+Persistent, incremental vector store for podcast research material.
+
+Every draft script run splits the background and deep research documents into chunks
+and needs their embeddings for retrieval. Embedding the same chunks again on every run
+is slow and costs API calls, so this module keeps the embeddings on disk, keyed by a
+hash of the embedding model and the chunk content. Only chunks that have never been
+seen before are sent to the embeddings API, in batches.
+
+Key components:
+- PersistentVectorStore: A LangChain VectorStore backed by a NumPy matrix of normalized
+  embeddings, with an on-disk store shared across runs
+- chunk_id: Helper function computing the content hash used as document id
+- embeddings_model_name: Name of the model behind an embeddings client, which keys the
+  stored chunks
+- mmr_select: Vectorized maximal marginal relevance selection
+
+Queries are cached too: repeated (or whitespace-only different) queries reuse their
+embedding instead of calling the embeddings API again, and repeated searches with the
+same parameters reuse their results until new documents are added.
+
+Example:
+    store = PersistentVectorStore.from_documents(
+        chunks,
+        embeddings,
+        persist_path='.cache/vector_store/baaibge_m3'
+    )
+    retriever = store.as_retriever(search_kwargs={'k': 5})
+    diverse = store.as_retriever(search_type='mmr', search_kwargs={'k': 5, 'fetch_k': 20})
+
+The on-disk store is a single ``<persist_path>.npz`` file holding the ids, the row-aligned
+embedding matrix, the time each chunk was last used and the page content and metadata of
+each id, so one ``os.replace`` commits all of it. Several episodes may share a store:
+writers hold ``<persist_path>.lock`` while they merge the chunks embedded by others since
+they last read the store and save, so no writer drops another's embeddings.
+
+The store can be bounded by age (``ttl_s``) and size (``max_bytes``): on save, chunks not
+used within ``ttl_s`` are dropped, then the least recently used ones until the store fits.
+Chunks active in the saving instance are always kept.
+"""
+
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from podcast_llm.utils.disk_cache import hash_key
+from podcast_llm.utils.telemetry import span
+
+
+logger = logging.getLogger(__name__)
+
+
+# How stale the last-use time of a reused chunk may get before a run saves the store just
+# to refresh it; saving rewrites the whole file
+TOUCH_INTERVAL_S = 24 * 3600
+
+
+def chunk_id(model_name: str, text: str) -> str:
+    """
+    Compute the id under which a chunk's embedding is stored.
+
+    Args:
+        model_name (str): Name identifying the embeddings model
+        text (str): Chunk text
+
+    Returns:
+        str: Hex digest of the model name and text
+    """
+    return hash_key(model_name, text)
+
+
+def embeddings_model_name(embedding: Embeddings) -> str:
+    """
+    Get the name of the model behind an embeddings client.
+
+    Args:
+        embedding (Embeddings): Embeddings client
+
+    Returns:
+        str: The client's ``model`` attribute, or its class name if it has none
+    """
+    return getattr(embedding, 'model', None) or type(embedding).__name__
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _normalize_query(query: str) -> str:
+    return ' '.join(query.split())
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    # Exclusive lock shared by processes and by separate opens within one process
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a+b') as f:
+        if os.name == 'nt':
+            while True:
+                try:
+                    # Blocks for up to 10 seconds before raising
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def mmr_select(query: np.ndarray, candidates: np.ndarray, k: int, lambda_mult: float = 0.5) -> List[int]:
+    """
+    Select candidates by maximal marginal relevance.
+
+    Greedily picks the candidate maximizing
+    ``lambda_mult * sim(query, c) - (1 - lambda_mult) * max(sim(c, selected))``, so later
+    picks are relevant but unlike the ones already chosen. All pairwise similarities are
+    computed with one matrix product, and each step updates the redundancy of all
+    remaining candidates at once.
+
+    Args:
+        query (np.ndarray): L2-normalized query vector
+        candidates (np.ndarray): L2-normalized candidate vectors, one per row
+        k (int): Number of candidates to select
+        lambda_mult (float): 1 for pure relevance, 0 for pure diversity
+
+    Returns:
+        List[int]: Row indices of the selected candidates, in selection order
+    """
+    n = candidates.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return []
+
+    relevance = candidates @ query
+    pairwise = candidates @ candidates.T
+    redundancy = np.full(n, -np.inf, dtype=np.float32)
+    available = np.ones(n, dtype=bool)
+    selected = []
+    for _ in range(k):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * np.where(np.isinf(redundancy), 0.0, redundancy)
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        redundancy = np.maximum(redundancy, pairwise[best])
+    return selected
+
+
+class PersistentVectorStore(VectorStore):
+    """
+    A vector store whose embeddings persist on disk between runs.
+
+    The store distinguishes between the persisted embeddings (every chunk ever embedded
+    with this model) and the active documents (the chunks added to this instance).
+    Searches only consider active documents, so one persisted store can safely be shared
+    by episodes on different topics.
+
+    Similarity is cosine similarity, computed for all active documents at once as a single
+    matrix-vector product over L2-normalized embeddings.
+
+    Attributes:
+        persist_path (Path): Path prefix of the on-disk store files
+        batch_size (int): Number of texts sent per embeddings API call
+        model_name (str): Name of the embeddings model, part of every chunk id
+        max_bytes (int): Approximate size limit of the persisted store, or None
+        ttl_s (float): Seconds after their last use that persisted chunks are dropped, or None
+    """
+    def __init__(self,
+                 embedding: Embeddings,
+                 persist_path: str,
+                 batch_size: int = 64,
+                 model_name: Optional[str] = None,
+                 query_cache_size: int = 256,
+                 max_bytes: Optional[int] = None,
+                 ttl_s: Optional[float] = None):
+        """
+        Initialize the PersistentVectorStore and load any persisted embeddings.
+
+        Args:
+            embedding (Embeddings): Embeddings model used for documents and queries
+            persist_path (str): Path prefix of the on-disk store files
+            batch_size (int): Number of texts sent per embeddings API call
+            model_name (str, optional): Name identifying the embeddings model. Defaults to the
+                model's ``model`` attribute or class name (see embeddings_model_name).
+            query_cache_size (int): Number of query embeddings and search results kept in
+                memory (least recently used are dropped first). 0 disables query caching.
+            max_bytes (int, optional): Approximate size limit of the persisted store. Unbounded
+                if not given.
+            ttl_s (float, optional): Seconds after their last use that persisted chunks are
+                dropped. Kept forever if not given.
+        """
+        self._embedding = embedding
+        self.persist_path = Path(persist_path)
+        self.batch_size = batch_size
+        self.model_name = model_name or embeddings_model_name(embedding)
+        self.query_cache_size = query_cache_size
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+
+        # Query embeddings and search results; results are only valid for one set of
+        # active documents, tracked by a version number
+        self._query_vectors: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._results: 'OrderedDict[tuple, List[Tuple[Document, float]]]' = OrderedDict()
+        self._version = 0
+        self._cache_stats = {'embedding_hits': 0, 'embedding_misses': 0, 'result_hits': 0, 'result_misses': 0}
+
+        # Persisted embeddings, shared across runs, with the time each row was last used,
+        # and the (mtime, size) of the store file they were last merged from
+        self._stored_rows = {}
+        self._stored_vectors = np.zeros((0, 0), dtype=np.float32)
+        self._stored_used = np.zeros(0, dtype=np.float64)
+        self._stored_documents = {}
+        self._stored_signature = None
+
+        # Documents active in this instance
+        self._ids: List[str] = []
+        self._documents: List[Document] = []
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+
+        self._load()
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    @property
+    def active_ids(self) -> List[str]:
+        """Content-hash ids of the active documents, in insertion order."""
+        return list(self._ids)
+
+    @property
+    def _vectors_file(self) -> Path:
+        return self.persist_path.with_name(self.persist_path.name + '.npz')
+
+    @property
+    def _documents_file(self) -> Path:
+        # Written by earlier versions next to the vectors file; read, then removed on the next save
+        return self.persist_path.with_name(self.persist_path.name + '.json')
+
+    @property
+    def _lock_file(self) -> Path:
+        return self.persist_path.with_name(self.persist_path.name + '.lock')
+
+    def _load(self) -> None:
+        # Merge the entries added to the on-disk store since it was last read
+        try:
+            stat = self._vectors_file.stat()
+        except FileNotFoundError:
+            return
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._stored_signature:
+            return
+
+        try:
+            with np.load(self._vectors_file, allow_pickle=False) as data:
+                ids = [str(i) for i in data['ids']]
+                vectors = data['vectors'].astype(np.float32)
+                # Stores written before last-use times were tracked count as used when saved
+                used = data['used'] if 'used' in data else np.full(len(ids), stat.st_mtime)
+                if 'documents' in data:
+                    documents = json.loads(data['documents'].tobytes().decode('utf-8'))
+                else:
+                    with open(self._documents_file, 'r', encoding='utf-8') as f:
+                        documents = json.load(f)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f'Ignoring unreadable vector store {self.persist_path}: {e}')
+            return
+
+        known = [(self._stored_rows[doc_id], row) for row, doc_id in enumerate(ids) if doc_id in self._stored_rows]
+        if known:
+            # Keep the latest use seen by any writer
+            own, theirs = (np.array(rows) for rows in zip(*known))
+            self._stored_used[own] = np.maximum(self._stored_used[own], used[theirs])
+        new_rows = [row for row, doc_id in enumerate(ids) if doc_id not in self._stored_rows]
+        self._stored_signature = signature
+        if new_rows:
+            self._append([ids[row] for row in new_rows], vectors[new_rows],
+                         [documents[ids[row]] for row in new_rows], used[new_rows])
+            logger.info(f'Loaded {len(new_rows)} stored embeddings from {self._vectors_file}')
+
+    def _append(self, ids: List[str], vectors: np.ndarray, documents: List[dict], used: np.ndarray) -> None:
+        if self._stored_vectors.size == 0:
+            self._stored_vectors = vectors
+        else:
+            self._stored_vectors = np.vstack([self._stored_vectors, vectors])
+        self._stored_used = np.concatenate([self._stored_used, used])
+        offset = len(self._stored_rows)
+        for i, (doc_id, document) in enumerate(zip(ids, documents)):
+            self._stored_rows[doc_id] = offset + i
+            self._stored_documents[doc_id] = document
+
+    def _evict(self, keep: set, now: float) -> None:
+        # Drop expired rows, then the least recently used until the store fits; rows in
+        # keep are never dropped
+        ids = list(self._stored_rows)
+        if not ids:
+            return
+        evict = np.zeros(len(ids), dtype=bool)
+        if self.ttl_s is not None:
+            evict = self._stored_used < now - self.ttl_s
+        if self.max_bytes is not None:
+            row_bytes = np.array([
+                len(json.dumps(self._stored_documents[doc_id], ensure_ascii=False, default=str).encode('utf-8'))
+                for doc_id in ids
+            ]) + self._stored_vectors.shape[1] * self._stored_vectors.itemsize + max(len(doc_id) for doc_id in ids) * 4
+            total = int(row_bytes[~evict].sum())
+            for row in np.argsort(self._stored_used, kind='stable'):
+                if total <= self.max_bytes:
+                    break
+                if not evict[row] and ids[row] not in keep:
+                    evict[row] = True
+                    total -= int(row_bytes[row])
+        for row in np.flatnonzero(evict):
+            if ids[row] in keep:
+                evict[row] = False
+        if not evict.any():
+            return
+
+        rows = np.flatnonzero(~evict)
+        for row in np.flatnonzero(evict):
+            del self._stored_documents[ids[row]]
+        self._stored_vectors = self._stored_vectors[rows]
+        self._stored_used = self._stored_used[rows]
+        self._stored_rows = {ids[row]: i for i, row in enumerate(rows)}
+        logger.info(f'Evicted {int(evict.sum())} stored embeddings from {self._vectors_file}')
+
+    def _save(self) -> None:
+        # Caller holds the store's file lock
+        ids = np.array(list(self._stored_rows), dtype=str)
+        documents = np.frombuffer(
+            json.dumps(self._stored_documents, ensure_ascii=False, default=str).encode('utf-8'), dtype=np.uint8
+        )
+
+        fd, tmp_vectors = tempfile.mkstemp(dir=self.persist_path.parent, suffix='.npz')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, ids=ids, vectors=self._stored_vectors, used=self._stored_used, documents=documents)
+            os.replace(tmp_vectors, self._vectors_file)
+        finally:
+            if os.path.exists(tmp_vectors):
+                os.remove(tmp_vectors)
+        stat = self._vectors_file.stat()
+        self._stored_signature = (stat.st_mtime_ns, stat.st_size)
+        self._documents_file.unlink(missing_ok=True)
+
+    def _embed_missing(self, ids: List[str], texts: List[str], metadatas: List[dict]) -> None:
+        # Reuse chunks other episodes embedded since this store was loaded
+        self._load()
+        missing = {}
+        for doc_id, text, metadata in zip(ids, texts, metadatas):
+            if doc_id not in self._stored_rows and doc_id not in missing:
+                missing[doc_id] = (text, metadata)
+
+        logger.info(f'Reusing {len(set(ids)) - len(missing)} stored embeddings, embedding {len(missing)} new chunks')
+        now = time.time()
+        if not missing:
+            touch_interval = TOUCH_INTERVAL_S if self.ttl_s is None else min(TOUCH_INTERVAL_S, self.ttl_s / 2)
+            if (self._stored_used[[self._stored_rows[doc_id] for doc_id in ids]] >= now - touch_interval).all():
+                return
+            with _file_lock(self._lock_file):
+                self._load()
+                self._touch(ids, now)
+                self._evict(set(self._ids) | set(ids), now)
+                self._save()
+            return
+
+        missing_ids = list(missing)
+        missing_texts = [missing[doc_id][0] for doc_id in missing_ids]
+        vectors = []
+        for start in range(0, len(missing_texts), self.batch_size):
+            batch = missing_texts[start:start + self.batch_size]
+            with span('embeddings.embed_documents', kind='embeddings',
+                      texts=len(batch), chars=sum(len(text) for text in batch)):
+                vectors.extend(self._embedding.embed_documents(batch))
+        new_vectors = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+
+        with _file_lock(self._lock_file):
+            # Another episode may have saved while these chunks were embedded: merge its
+            # entries first, so saving does not drop them
+            self._load()
+            new_rows = [i for i, doc_id in enumerate(missing_ids) if doc_id not in self._stored_rows]
+            self._append([missing_ids[i] for i in new_rows], new_vectors[new_rows],
+                         [{'page_content': missing[missing_ids[i]][0], 'metadata': missing[missing_ids[i]][1]}
+                          for i in new_rows], np.full(len(new_rows), now))
+            self._touch(ids, now)
+            self._evict(set(self._ids) | set(ids), now)
+            self._save()
+
+    def _touch(self, ids: List[str], now: float) -> None:
+        self._stored_used[[self._stored_rows[doc_id] for doc_id in ids]] = now
+
+    def add_texts(self,
+                  texts: Iterable[str],
+                  metadatas: Optional[List[dict]] = None,
+                  *,
+                  ids: Optional[List[str]] = None,
+                  **kwargs: Any) -> List[str]:
+        """
+        Add texts to the active documents, embedding only texts not already stored.
+
+        Args:
+            texts (Iterable[str]): Texts to add
+            metadatas (List[dict], optional): Metadata for each text
+            ids (List[str], optional): Ignored; ids are always content hashes so that
+                embeddings can be reused across runs
+
+        Returns:
+            List[str]: The content-hash ids of the added texts
+        """
+        texts = list(texts)
+        metadatas = metadatas or [{} for _ in texts]
+        content_ids = [chunk_id(self.model_name, text) for text in texts]
+
+        with self._lock:
+            self._embed_missing(content_ids, texts, metadatas)
+
+            active = set(self._ids)
+            new_rows = []
+            for doc_id, text, metadata in zip(content_ids, texts, metadatas):
+                if doc_id in active:
+                    continue
+                active.add(doc_id)
+                self._ids.append(doc_id)
+                self._documents.append(Document(id=doc_id, page_content=text, metadata=metadata))
+                new_rows.append(self._stored_rows[doc_id])
+
+            if new_rows:
+                rows = self._stored_vectors[new_rows]
+                self._matrix = rows if self._matrix.size == 0 else np.vstack([self._matrix, rows])
+                self._version += 1
+                self._results.clear()
+
+        return content_ids
+
+    def similarity_search_with_score_by_vector(self, embedding: List[float], k: int = 4) -> List[Tuple[Document, float]]:
+        """
+        Return the k active documents most similar to an embedding, with cosine similarities.
+
+        Args:
+            embedding (List[float]): Query embedding
+            k (int): Number of documents to return
+
+        Returns:
+            List[Tuple[Document, float]]: Documents and similarities, most similar first
+        """
+        query = _normalize_rows(np.asarray([embedding], dtype=np.float32))[0]
+        top, scores = self._top_rows(query, k)
+        return [(self._documents[i], float(scores[i])) for i in top]
+
+    def _top_rows(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        if not self._documents or k <= 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=np.float32)
+        scores = self._matrix @ query
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top])], scores
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k)]
+
+    def max_marginal_relevance_search_by_vector(self,
+                                                embedding: List[float],
+                                                k: int = 4,
+                                                fetch_k: int = 20,
+                                                lambda_mult: float = 0.5,
+                                                **kwargs: Any) -> List[Document]:
+        """
+        Return k diverse active documents among the fetch_k most similar to an embedding.
+
+        Args:
+            embedding (List[float]): Query embedding
+            k (int): Number of documents to return
+            fetch_k (int): Number of most similar documents to choose from
+            lambda_mult (float): 1 for pure relevance, 0 for pure diversity
+
+        Returns:
+            List[Document]: Selected documents, in selection order
+        """
+        return [doc for doc, _ in self._mmr_with_score_by_vector(embedding, k, fetch_k, lambda_mult)]
+
+    def _mmr_with_score_by_vector(self,
+                                  embedding: List[float],
+                                  k: int,
+                                  fetch_k: int,
+                                  lambda_mult: float) -> List[Tuple[Document, float]]:
+        query = _normalize_rows(np.asarray([embedding], dtype=np.float32))[0]
+        top, scores = self._top_rows(query, max(k, fetch_k))
+        selected = top[mmr_select(query, self._matrix[top], k, lambda_mult)]
+        return [(self._documents[i], float(scores[i])) for i in selected]
+
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query, reusing the embedding of an identical earlier query.
+
+        Args:
+            query (str): Query text; queries differing only in whitespace share an embedding
+
+        Returns:
+            List[float]: Query embedding
+        """
+        key = _normalize_query(query)
+        with self._lock:
+            vector = self._query_vectors.get(key)
+            if vector is not None:
+                self._query_vectors.move_to_end(key)
+                self._cache_stats['embedding_hits'] += 1
+                return vector
+            self._cache_stats['embedding_misses'] += 1
+
+        with span('embeddings.embed_query', kind='embeddings', texts=1, chars=len(query)):
+            vector = self._embedding.embed_query(query)
+        if self.query_cache_size > 0:
+            with self._lock:
+                self._query_vectors[key] = vector
+                while len(self._query_vectors) > self.query_cache_size:
+                    self._query_vectors.popitem(last=False)
+        return vector
+
+    def _cached_search(self, query: str, params: tuple,
+                       search: Callable[[List[float]], List[Tuple[Document, float]]]) -> List[Tuple[Document, float]]:
+        with self._lock:
+            key = (_normalize_query(query), params, self._version)
+            results = self._results.get(key)
+            if results is not None:
+                self._results.move_to_end(key)
+                self._cache_stats['result_hits'] += 1
+                return results
+            self._cache_stats['result_misses'] += 1
+
+        results = search(self.embed_query(query))
+        if self.query_cache_size > 0:
+            with self._lock:
+                self._results[key] = results
+                while len(self._results) > self.query_cache_size:
+                    self._results.popitem(last=False)
+        return results
+
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any) -> List[Tuple[Document, float]]:
+        return self._cached_search(
+            query, ('similarity', k),
+            lambda embedding: self.similarity_search_with_score_by_vector(embedding, k)
+        )
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k)]
+
+    def max_marginal_relevance_search(self,
+                                      query: str,
+                                      k: int = 4,
+                                      fetch_k: int = 20,
+                                      lambda_mult: float = 0.5,
+                                      **kwargs: Any) -> List[Document]:
+        """
+        Return k diverse active documents among the fetch_k most similar to a query.
+
+        Args:
+            query (str): Query text
+            k (int): Number of documents to return
+            fetch_k (int): Number of most similar documents to choose from
+            lambda_mult (float): 1 for pure relevance, 0 for pure diversity
+
+        Returns:
+            List[Document]: Selected documents, in selection order
+        """
+        results = self._cached_search(
+            query, ('mmr', k, fetch_k, lambda_mult),
+            lambda embedding: self._mmr_with_score_by_vector(embedding, k, fetch_k, lambda_mult)
+        )
+        return [doc for doc, _ in results]
+
+    def cache_stats(self) -> dict:
+        """
+        Get query cache statistics.
+
+        Returns:
+            dict: Hits and misses of the query embedding cache and the search result cache
+        """
+        with self._lock:
+            return dict(self._cache_stats)
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Scores are already cosine similarities
+        return lambda score: score
+
+    @classmethod
+    def from_texts(cls,
+                   texts: List[str],
+                   embedding: Embeddings,
+                   metadatas: Optional[List[dict]] = None,
+                   *,
+                   persist_path: str,
+                   batch_size: int = 64,
+                   model_name: Optional[str] = None,
+                   query_cache_size: int = 256,
+                   max_bytes: Optional[int] = None,
+                   ttl_s: Optional[float] = None,
+                   **kwargs: Any) -> 'PersistentVectorStore':
+        """
+        Create a store from texts, reusing persisted embeddings where possible.
+
+        Args:
+            texts (List[str]): Texts to add
+            embedding (Embeddings): Embeddings model used for documents and queries
+            metadatas (List[dict], optional): Metadata for each text
+            persist_path (str): Path prefix of the on-disk store files
+            batch_size (int): Number of texts sent per embeddings API call
+            model_name (str, optional): Name identifying the embeddings model
+            query_cache_size (int): Number of query embeddings and search results kept in memory
+            max_bytes (int, optional): Approximate size limit of the persisted store
+            ttl_s (float, optional): Seconds after their last use that persisted chunks are dropped
+
+        Returns:
+            PersistentVectorStore: Store containing the given texts as active documents
+        """
+        store = cls(embedding, persist_path, batch_size=batch_size, model_name=model_name,
+                    query_cache_size=query_cache_size, max_bytes=max_bytes, ttl_s=ttl_s)
+        store.add_texts(texts, metadatas)
+        return store
@@ -10,6 +10,8 @@
 - 格式化对话历史以适配提示词上下文  
 - 基于前一个回答生成后续追问问题  
 - 以正确的说话人标签组织完整的播客脚本结构  
+- 可选地并发生成相互独立的子章节，并按大纲顺序拼接  
+- 背景资料只格式化一次，采访者每轮只看到字符预算内的资料或按章节生成的浓缩笔记  
 
 该模块基于 LangChain 和 GPT-4，生成动态的多轮对话，在确保涵盖大纲关键内容的同时，使对话听起来真实自然。模块还包含速率限制机制，并支持长篇内容的生成。
 
@@ -24,24 +26,25 @@ print(script.as_str)
 ```
 """
 
+import concurrent.futures
 import logging
-from typing import List, Optional
+import os
+import threading
+from typing import Any, Callable, List, Optional, Union
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import InMemoryVectorStore
 from langchain_core.documents import Document
+from langchain_core.output_parsers import StrOutputParser
 from podcast_llm.outline import (
     format_wikipedia_document
 )
 import logging
-from langchain import hub
-from langchain_openai import ChatOpenAI
 from podcast_llm.outline import PodcastOutline
-from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain.chains.llm import LLMChain
-from langchain_core.vectorstores.base import VectorStoreRetriever
+from langchain_core.vectorstores.base import VectorStore, VectorStoreRetriever
 from podcast_llm.config import PodcastConfig
 from podcast_llm.utils.embeddings import get_embeddings_model
-from podcast_llm.utils.llm import get_long_context_llm
+from podcast_llm.utils.llm import get_llm_rate_limiter, get_long_context_llm, get_stage_temperature
+from podcast_llm.utils.lazy_imports import lazy_import
 from podcast_llm.utils.local_prompts import get_local_prompt
 from podcast_llm.models import (
     PodcastOutline,
@@ -51,11 +54,21 @@ from podcast_llm.models import (
     Question,
     Answer
 )
+from podcast_llm.utils.checkpointer import Checkpointer, fingerprint, to_snake_case
+from podcast_llm.utils.concurrency import submit_with_context
+from podcast_llm.utils.disk_cache import hash_key
 from podcast_llm.utils.rate_limits import retry_with_exponential_backoff
+from podcast_llm.utils.text import estimate_tokens, truncate_to_tokens
+from podcast_llm.utils.vector_store import PersistentVectorStore, embeddings_model_name
 from podcast_llm.utils.content_search import content_search
 
 logger = logging.getLogger(__name__)
 
+
+# Imported on first use: the prompt hub is only a fallback for missing local prompts
+hub = lazy_import('langchain.hub')
+
+
 def format_conversation_history(conversation_history: list) -> str:
     """
     Format a conversation history into a readable string.
@@ -99,14 +112,184 @@ def format_vector_results(docs: List[Document]):
     """
     return "\n\n".join([d.page_content for d in docs])
 
+
+def format_retrieved_context(docs: List[Document], max_tokens: Optional[int] = None) -> str:
+    """
+    Format retrieved documents within a token budget.
+
+    Documents are kept in retrieval order (most relevant first) until the budget is used
+    up; the document that crosses the budget is shortened and later ones are dropped.
+
+    Args:
+        docs (List[Document]): Retrieved documents, most relevant first
+        max_tokens (int, optional): Token budget (see estimate_tokens). Defaults to no limit.
+
+    Returns:
+        str: Document contents separated by double newlines
+    """
+    if max_tokens is None:
+        return format_vector_results(docs)
+
+    parts = []
+    remaining = max_tokens
+    for doc in docs:
+        tokens = estimate_tokens(doc.page_content)
+        if tokens <= remaining:
+            parts.append(doc.page_content)
+            remaining -= tokens
+        else:
+            if remaining > 0:
+                parts.append(truncate_to_tokens(doc.page_content, remaining))
+            break
+    return "\n\n".join(parts)
+
+def trim_to_budget(texts: List[str], max_chars: int) -> str:
+    """
+    Join texts, shortening the longest ones so the result stays within a character budget.
+
+    Every text gets an equal share of the budget; texts shorter than their share keep their
+    full length and the unused part is shared among the longer texts. Shortened texts keep
+    their beginning and are marked with an ellipsis.
+
+    Args:
+        texts (List[str]): Texts to join, e.g. formatted background documents
+        max_chars (int): Maximum length of the result, separators included
+
+    Returns:
+        str: Texts joined by blank lines, at most max_chars long
+    """
+    separator = "\n\n"
+    budget = max(0, max_chars - len(separator) * max(0, len(texts) - 1))
+    shares = [0] * len(texts)
+    remaining = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    while remaining:
+        share = budget // len(remaining)
+        i = remaining.pop(0)
+        shares[i] = min(len(texts[i]), share)
+        budget -= shares[i]
+
+    trimmed = [
+        text if len(text) <= share else text[:max(0, share - 1)] + "…"
+        for text, share in zip(texts, shares)
+    ]
+    return separator.join(trimmed)[:max_chars]
+
+
+class DiscussionContext:
+    """
+    Background research prepared once for a whole discussion.
+
+    Formatting the research documents is done once on entering the context instead of on
+    every interviewer turn. What the interviewer sees each turn depends on the mode:
+
+    - 'full': the whole formatted corpus
+    - 'budget': the corpus trimmed to ``max_chars`` (see trim_to_budget)
+    - 'summary': notes on the corpus condensed for the current outline section, generated
+      once per section by ``summarize`` and shared by all of its turns
+
+    In 'full' and 'budget' mode the background is the same for every turn, so prompts that
+    put it before the per-turn parts share a stable prefix that providers can cache.
+
+    The context also carries where the interviewee's background comes from (see
+    answer_question) and its token budget.
+
+    Example:
+        with DiscussionContext(background_info, mode='budget', max_chars=24000) as context:
+            background = context.background_for(section)
+    """
+    MODES = ('full', 'budget', 'summary')
+
+    def __init__(self,
+                 background_info: List[Document],
+                 mode: str = 'budget',
+                 max_chars: int = 24000,
+                 summarize: Optional[Callable[[PodcastSection, str], str]] = None,
+                 answer_source: str = 'content_search',
+                 answer_max_tokens: Optional[int] = None):
+        """
+        Initialize the DiscussionContext.
+
+        Args:
+            background_info (List[Document]): Background research documents
+            mode (str): 'full', 'budget' or 'summary'
+            max_chars (int): Character budget of the background in 'budget' and 'summary' mode
+            summarize (Callable[[PodcastSection, str], str], optional): Condenses the full
+                corpus for a section; required in 'summary' mode
+            answer_source (str): Background source for answers, 'content_search' or 'retriever'
+            answer_max_tokens (int, optional): Token budget of the background for answers
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown background mode '{mode}', expected one of {self.MODES}")
+        if mode == 'summary' and summarize is None:
+            raise ValueError("Background mode 'summary' requires a summarize function")
+        self.background_info = background_info
+        self.mode = mode
+        self.max_chars = max_chars
+        self.summarize = summarize
+        self.answer_source = answer_source
+        self.answer_max_tokens = answer_max_tokens
+        self.corpus = ''
+        self._documents: List[str] = []
+        self._budgeted = ''
+        self._summaries: dict = {}
+        self._locks: dict = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'DiscussionContext':
+        self._documents = [format_wikipedia_document(d) for d in self.background_info]
+        self.corpus = "\n\n".join(self._documents)
+        if self.mode == 'budget':
+            self._budgeted = trim_to_budget(self._documents, self.max_chars)
+        logger.info(f"Prepared background of {len(self.corpus)} characters "
+                    f"({self.mode} mode, {len(self.background_for_turns())} per interviewer turn)")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.corpus = ''
+        self._documents = []
+        self._budgeted = ''
+        self._summaries.clear()
+
+    def background_for_turns(self) -> str:
+        """Background shared by every turn in 'full' and 'budget' mode (empty in 'summary' mode)."""
+        if self.mode == 'full':
+            return self.corpus
+        if self.mode == 'budget':
+            return self._budgeted
+        return ''
+
+    def background_for(self, section: PodcastSection) -> str:
+        """
+        Get the background the interviewer sees while discussing a section.
+
+        Args:
+            section (PodcastSection): Section being discussed
+
+        Returns:
+            str: Formatted background for the interviewer prompt
+        """
+        if self.mode != 'summary':
+            return self.background_for_turns()
+
+        with self._lock:
+            lock = self._locks.setdefault(section.title, threading.Lock())
+        # One summary per section, even when its subsections are discussed concurrently
+        with lock:
+            if section.title not in self._summaries:
+                logger.info(f"Summarizing background for section '{section.title}'")
+                self._summaries[section.title] = self.summarize(section, self.corpus)[:self.max_chars]
+            return self._summaries[section.title]
+
+
 @retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
 def ask_question(topic: str, 
                  outline: PodcastOutline, 
                  section: PodcastSection, 
                  subsection: PodcastSubsection, 
-                 background_info: list, 
+                 background_info: Union[str, list], 
                  draft_discussion: list, 
-                 interviewer_chain: LLMChain) -> Question:
+                 interviewer_chain: LLMChain,
+                 continuity_note: str = '') -> Question:
     """
     Generate the next interview question based on the conversation context.
 
@@ -120,15 +303,19 @@ def ask_question(topic: str,
         outline (PodcastOutline): The structured outline for the episode
         section (PodcastSection): The current section being discussed
         subsection (PodcastSubsection): The current subsection being discussed
-        background_info (list): List of Wikipedia document objects with research material
+        background_info (Union[str, list]): Background prepared by DiscussionContext, or a
+            list of Wikipedia document objects with research material to format in full
         draft_discussion (list): List of previous Question and Answer objects
         interviewer_chain (LLMChain): The LangChain chain for generating questions
+        continuity_note (str, optional): Summary of the surrounding episode, prepended to the
+            conversation history when subsections are generated independently
 
     Returns:
         Question: A structured Question object containing the generated question text
     """
 
-    background_info = "\n\n".join([format_wikipedia_document(d) for d in background_info])
+    if not isinstance(background_info, str):
+        background_info = "\n\n".join([format_wikipedia_document(d) for d in background_info])
     logger.info(f"[ask_question]: 背景信息提取量= {len(background_info)}")
 
     ask_question =  interviewer_chain.invoke({
@@ -137,7 +324,7 @@ def ask_question(topic: str,
         'section': section.title,
         'subsection': subsection.title,
         'background_info':background_info,
-        'conversation_history': format_conversation_history(draft_discussion)
+        'conversation_history': continuity_note + format_conversation_history(draft_discussion)
     })
 
     return ask_question
@@ -147,10 +334,13 @@ def answer_question(topic: str,
                     outline: PodcastOutline,
                     section: PodcastSection,
                     subsection: PodcastSubsection,
-                    background_info: list, 
+                    background_info: Union[str, list], 
                     draft_discussion: list,
                     retriever: VectorStoreRetriever,
-                    interviewee_chain: LLMChain) -> Answer:
+                    interviewee_chain: LLMChain,
+                    continuity_note: str = '',
+                    context_source: str = 'content_search',
+                    max_context_tokens: Optional[int] = None) -> Answer:
     """
     Generate an answer to the current interview question.
 
@@ -158,22 +348,43 @@ def answer_question(topic: str,
     retrieved background information and conversation context. The response stays focused
     on the current subsection topic while maintaining a conversational tone.
 
+    The background information comes either from content_search, which has an LLM extract
+    the passages relevant to the question from the full corpus, or from the vector store
+    retriever (cached query embeddings and results, optionally MMR). Either way it is cut
+    to ``max_context_tokens``.
+
     Args:
         topic (str): The main podcast topic
         outline (PodcastOutline): The structured outline for the episode
         section (PodcastSection): The current section being discussed 
         subsection (PodcastSubsection): The current subsection being discussed
+        background_info (Union[str, list]): Full formatted background corpus (see
+            DiscussionContext.corpus), or the list of background documents to format
         draft_discussion (list): List of previous Question and Answer objects
         retriever (VectorStoreRetriever): Retriever for getting relevant background info
         interviewee_chain (LLMChain): The LangChain chain for generating answers
+        continuity_note (str, optional): Summary of the surrounding episode, prepended to the
+            conversation history when subsections are generated independently
+        context_source (str, optional): 'content_search' or 'retriever'. Defaults to 'content_search'.
+        max_context_tokens (int, optional): Token budget for the background information.
+            Defaults to no limit.
 
     Returns:
         Answer: A structured Answer object containing the generated response text
     """
     
-    background_information=content_search(research_topic=draft_discussion[-1].question,
-                                          context="\n\n".join([format_wikipedia_document(d) for d in background_info])
-                                         )
+    if context_source == 'retriever':
+        background_information = format_retrieved_context(
+            retriever.invoke(draft_discussion[-1].question), max_context_tokens
+        )
+    else:
+        if not isinstance(background_info, str):
+            background_info = "\n\n".join([format_wikipedia_document(d) for d in background_info])
+        background_information=content_search(research_topic=draft_discussion[-1].question,
+                                              context=background_info
+                                             )
+        if max_context_tokens is not None:
+            background_information = truncate_to_tokens(background_information, max_context_tokens)
 
     logger.info(f"[answer_question]:背景信息提取量= {len(background_information)}")
 
@@ -184,20 +395,159 @@ def answer_question(topic: str,
         'subsection': subsection.title,
         'word_count': 100,
         'background_information': background_information,
-        'conversation_history': format_conversation_history(draft_discussion),
+        'conversation_history': continuity_note + format_conversation_history(draft_discussion),
         'question': draft_discussion[-1].as_str
     })
 
     return answer_prompt
 
+def build_continuity_note(outline: PodcastOutline,
+                          section_index: int,
+                          subsection_index: int,
+                          max_previous: int = 3,
+                          max_chars: int = 800) -> str:
+    """
+    Summarize where a subsection sits in the episode.
+
+    When subsections are discussed concurrently, each one starts without the conversation
+    that precedes it. This note tells the interviewer and interviewee which subsections were
+    just covered and which comes next, with the key points the outline gives for each, so
+    questions and answers follow on naturally and do not repeat earlier material.
+
+    Args:
+        outline (PodcastOutline): The structured outline for the episode
+        section_index (int): Index of the current section in outline.sections
+        subsection_index (int): Index of the current subsection within the section
+        max_previous (int, optional): Number of preceding subsections to mention. Defaults to 3.
+        max_chars (int, optional): Character budget shared by the neighbouring subsections'
+            titles and descriptions; long descriptions are truncated. Defaults to 800.
+
+    Returns:
+        str: Continuity note ending with a newline, or an empty string for the first subsection
+            of an episode with a single subsection
+    """
+    subsections = [subsection for section in outline.sections for subsection in section.subsections]
+    current = sum(len(section.subsections) for section in outline.sections[:section_index]) + subsection_index
+    previous = subsections[max(0, current - max_previous):current]
+    upcoming = subsections[current + 1:current + 2]
+    if not previous and not upcoming:
+        return ""
+
+    per_subsection = max_chars // (len(previous) + len(upcoming))
+
+    def describe(subsection: PodcastSubsection) -> str:
+        text = subsection.title
+        if subsection.description:
+            text += f" ({subsection.description.strip()})"
+        return text if len(text) <= per_subsection else text[:max(per_subsection - 1, 0)].rstrip() + '…'
+
+    note = ""
+    if previous:
+        note += f"(Earlier in this episode we already discussed: {'; '.join(describe(s) for s in previous)}.)\n"
+    if upcoming:
+        note += f"(Coming up next: {describe(upcoming[0])}.)\n"
+    return note
+
+
+def discuss_subsection(topic: str,
+                       outline: PodcastOutline,
+                       section: PodcastSection,
+                       subsection: PodcastSubsection,
+                       context: DiscussionContext,
+                       conversation_history: list,
+                       qa_rounds: int,
+                       retriever: VectorStoreRetriever,
+                       interviewer_chain: LLMChain,
+                       interviewee_chain: LLMChain,
+                       continuity_note: str = '',
+                       checkpointer: Optional[Checkpointer] = None,
+                       checkpoint_context: Any = None) -> list:
+    """
+    Generate the Q&A rounds for a single outline subsection.
+
+    Each round depends on the rounds before it, so the rounds of one subsection are always
+    generated sequentially. New turns are appended to ``conversation_history`` as they are
+    produced. With a checkpointer, every question and answer is checkpointed under a hash
+    of the conversation so far, so a resumed run continues from the last completed turn.
+
+    Args:
+        topic (str): The main podcast topic
+        outline (PodcastOutline): The structured outline for the episode
+        section (PodcastSection): The section the subsection belongs to
+        subsection (PodcastSubsection): The subsection to discuss
+        context (DiscussionContext): Background research prepared for the discussion
+        conversation_history (list): Question and Answer objects preceding this subsection;
+            extended in place
+        qa_rounds (int): Number of question-answer exchanges
+        retriever (VectorStoreRetriever): Retriever for getting relevant background info
+        interviewer_chain (LLMChain): The LangChain chain for generating questions
+        interviewee_chain (LLMChain): The LangChain chain for generating answers
+        continuity_note (str, optional): Summary of the surrounding episode
+        checkpointer (Checkpointer, optional): Checkpointer for individual turns
+        checkpoint_context (Any, optional): Values identifying everything else the turns
+            depend on (outline, research, prompts, models); part of every turn's key
+
+    Returns:
+        list: The Question and Answer objects generated for this subsection
+    """
+    logger.info(f"Discussing section '{section.title}' subsection '{subsection.title}'")
+
+    def run_turn(stage_name: str, fn: Callable, *args):
+        if checkpointer is None:
+            return fn(*args)
+        return checkpointer.checkpoint(
+            fn, *args,
+            stage_name=stage_name,
+            key_parts=(checkpoint_context, section.title, subsection.title, continuity_note, conversation_history)
+        )
+
+    interviewer_background = context.background_for(section)
+
+    start = len(conversation_history)
+    for _ in range(qa_rounds):
+        conversation_history.append(run_turn(
+            'draft_question',
+            ask_question,
+            topic,
+            outline,
+            section,
+            subsection,
+            interviewer_background,
+            conversation_history,
+            interviewer_chain,
+            continuity_note
+        ))
+        conversation_history.append(run_turn(
+            'draft_answer',
+            answer_question,
+            topic,
+            outline,
+            section,
+            subsection,
+            context.corpus,
+            conversation_history,
+            retriever,
+            interviewee_chain,
+            continuity_note,
+            context.answer_source,
+            context.answer_max_tokens
+        ))
+
+    return conversation_history[start:]
+
+
 def discuss(config: PodcastConfig,
             topic: str, 
             outline: PodcastOutline, 
             background_info: List[Document], 
-            vector_store: InMemoryVectorStore, 
+            vector_store: VectorStore, 
             qa_rounds: int,
             base_url: Optional[str] = None,
-            language: str = 'en') -> list:
+            language: str = 'en',
+            max_parallel_subsections: Optional[int] = None,
+            checkpointer: Optional[Checkpointer] = None,
+            background_mode: Optional[str] = None,
+            background_max_chars: Optional[int] = None) -> list:
     """
     模拟播客讨论，通过多轮问答生成自然流畅的对话内容。
 
@@ -209,9 +559,20 @@ def discuss(config: PodcastConfig,
         topic (str): 播客的主要话题
         outline (PodcastOutline): 包含章节和子章节的大纲结构
         background_info (List[Document]): 包含背景资料的文档列表（如维基百科内容）
-        vector_store (InMemoryVectorStore): 存储索引研究内容的向量数据库
+        vector_store (VectorStore): 存储索引研究内容的向量数据库。config.writer_settings['answer_context'] 为
+            'retriever' 时，受访者的背景资料由它检索（retrieval_* 设置检索方式，answer_context_tokens 限制长度）
         qa_rounds (int): 每个子章节中问答交互的轮数
         base_url (str, optional): 可选的基础URL，用于兼容OpenAI接口的API服务
+        max_parallel_subsections (int, optional): 同时生成的子章节数量上限。为 1 时按顺序生成，
+            每轮问答都能看到完整的对话历史；大于 1 时各子章节并发生成（共享同一个速率限制器），
+            并通过简短的上下文提示保持章节之间的连贯，最后按大纲顺序拼接。
+            默认读取 config.writer_settings['parallel_subsections']
+        checkpointer (Checkpointer, optional): 按单轮问答保存检查点，中断后重新运行只需重做未完成的问答
+        background_mode (str, optional): 采访者每轮看到的背景资料（见 DiscussionContext）：
+            'full' 为完整资料，'budget' 为按字符预算截取的资料，'summary' 为每个章节生成一次的浓缩笔记。
+            默认读取 config.writer_settings['background_mode']
+        background_max_chars (int, optional): 'budget' 和 'summary' 模式下背景资料的字符上限。
+            默认读取 config.writer_settings['background_max_chars']
 
     Returns:
         list: 由交替出现的Question和Answer对象组成的讨论内容列表
@@ -238,46 +599,135 @@ def discuss(config: PodcastConfig,
         interviewee_prompt = hub.pull(interviewee_prompthub_path)
         logger.info(f"Got prompt from hub: {interviewee_prompthub_path}")
 
-    rate_limiter = InMemoryRateLimiter(
-        requests_per_second=0.2,
-        check_every_n_seconds=0.1,
-        max_bucket_size=10
-    )
+    rate_limiter = get_llm_rate_limiter(config, config.long_context_llm_provider)
 
-    interviewer_llm = get_long_context_llm(config, rate_limiter, base_url)
-    interviewee_llm = get_long_context_llm(config, rate_limiter, base_url)
+    interviewer_llm = get_long_context_llm(config, rate_limiter, base_url,
+                                           temperature=get_stage_temperature(config, 'interviewer'))
+    interviewee_llm = get_long_context_llm(config, rate_limiter, base_url,
+                                           temperature=get_stage_temperature(config, 'interviewee'))
     interviewer_chain = interviewer_prompt | interviewer_llm.with_structured_output(Question)
     interviewee_chain = interviewee_prompt | interviewee_llm.with_structured_output(Answer)
 
-    retriever = vector_store.as_retriever(k=5)
-
-    draft_discussion = []
-
-    for section in outline.sections:
-        for subsection in section.subsections:
-            logger.info(f"Discussing section '{section.title}' subsection '{subsection.title}'")
-            for _ in range(qa_rounds):
-                draft_discussion.append(ask_question(
-                    topic, 
-                    outline, 
+    if max_parallel_subsections is None:
+        max_parallel_subsections = config.writer_settings.get('parallel_subsections', 1)
+    if background_mode is None:
+        background_mode = config.writer_settings.get('background_mode', 'budget')
+    if background_max_chars is None:
+        background_max_chars = config.writer_settings.get('background_max_chars', 24000)
+
+    # 受访者背景资料的来源：content_search（LLM 从全文中摘取）或向量检索（带查询缓存，可选 MMR）
+    answer_source = config.writer_settings.get('answer_context', 'content_search')
+    answer_max_tokens = config.writer_settings.get('answer_context_tokens')
+    search_type = config.writer_settings.get('retrieval_search_type', 'similarity')
+    search_kwargs = {'k': config.writer_settings.get('retrieval_k', 5)}
+    if search_type == 'mmr':
+        search_kwargs['fetch_k'] = config.writer_settings.get('retrieval_fetch_k', 20)
+        search_kwargs['lambda_mult'] = config.writer_settings.get('retrieval_lambda', 0.5)
+    retriever = vector_store.as_retriever(search_type=search_type, search_kwargs=search_kwargs)
+
+    # 单轮问答检查点的公共键：除对话历史外，影响问答结果的所有输入
+    checkpoint_context = None
+    if checkpointer is not None:
+        checkpoint_context = (
+            topic,
+            outline,
+            hash_key(fingerprint(background_info)),
+            language,
+            config.long_context_llm_provider,
+            base_url,
+            repr(interviewer_prompt),
+            repr(interviewee_prompt),
+            background_mode,
+            background_max_chars,
+            answer_source,
+            answer_max_tokens,
+            search_type,
+            search_kwargs,
+            hash_key(getattr(vector_store, 'active_ids', None))
+        )
+
+    summarize = None
+    if background_mode == 'summary':
+        summary_prompt = get_local_prompt("podcast_section_background", language)
+        summary_llm = get_long_context_llm(config, rate_limiter, base_url,
+                                           temperature=get_stage_temperature(config, 'section_summary'))
+        summary_chain = summary_prompt | summary_llm | StrOutputParser()
+
+        def summarize(section: PodcastSection, corpus: str) -> str:
+            inputs = {
+                'topic': topic,
+                'outline': outline.as_str,
+                'section': section.title,
+                'subsections': "\n".join(f"- {subsection.title}" for subsection in section.subsections),
+                'max_chars': background_max_chars,
+                'background_info': corpus
+            }
+            if checkpointer is None:
+                return summary_chain.invoke(inputs)
+            # 每个章节的背景笔记单独保存检查点
+            return checkpointer.checkpoint(
+                summary_chain.invoke, inputs,
+                stage_name='section_background',
+                key_parts=(checkpoint_context, section.title, repr(summary_prompt))
+            )
+
+    subsections = [
+        (i, j, section, subsection)
+        for i, section in enumerate(outline.sections)
+        for j, subsection in enumerate(section.subsections)
+    ]
+
+    # 背景资料只格式化一次；采访者每轮只看到预算内的资料或本章节的浓缩笔记
+    with DiscussionContext(background_info, background_mode, background_max_chars, summarize,
+                           answer_source, answer_max_tokens) as context:
+        if max_parallel_subsections <= 1:
+            draft_discussion = []
+            for _, _, section, subsection in subsections:
+                discuss_subsection(
+                    topic,
+                    outline,
                     section,
                     subsection,
-                    background_info, 
-                    draft_discussion, 
-                    interviewer_chain
-                ))
-                draft_discussion.append(answer_question(
+                    context,
+                    draft_discussion,
+                    qa_rounds,
+                    retriever,
+                    interviewer_chain,
+                    interviewee_chain,
+                    checkpointer=checkpointer,
+                    checkpoint_context=checkpoint_context
+                )
+            return draft_discussion
+
+        logger.info(f"Generating {len(subsections)} subsections with up to {max_parallel_subsections} in parallel")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel_subsections) as executor:
+            futures = [
+                submit_with_context(
+                    executor,
+                    discuss_subsection,
                     topic,
                     outline,
                     section,
                     subsection,
-                    background_info,
-                    draft_discussion,
+                    context,
+                    [],
+                    qa_rounds,
                     retriever,
-                    interviewee_chain
-                ))
+                    interviewer_chain,
+                    interviewee_chain,
+                    build_continuity_note(outline, i, j),
+                    checkpointer,
+                    checkpoint_context
+                )
+                for i, j, section, subsection in subsections
+            ]
 
-    return draft_discussion
+            # Stitch subsections back together in outline order
+            draft_discussion = []
+            for future in futures:
+                draft_discussion.extend(future.result())
+
+        return draft_discussion
 
 
 def write_draft_script(config: PodcastConfig,
@@ -287,13 +737,15 @@ def write_draft_script(config: PodcastConfig,
                        deep_info: List[Document], 
                        qa_rounds: int,
                        base_url: Optional[str] = None,
-                       language: str = 'en'):
+                       language: str = 'en',
+                       checkpointer: Optional[Checkpointer] = None):
     """
     Write a complete draft podcast script through simulated Q&A discussion.
 
     This function orchestrates the generation of a podcast script by:
-    1. Creating a vector store from background research and deep dive articles
-    2. Splitting content into manageable chunks for retrieval
+    1. Splitting content into manageable chunks for retrieval
+    2. Loading them into a persistent vector store, embedding only chunks that have not
+       been embedded in an earlier run
     3. Simulating an interview-style discussion with alternating questions and answers
     
     Args:
@@ -304,6 +756,8 @@ def write_draft_script(config: PodcastConfig,
         qa_rounds (int): Number of question-answer exchanges per subsection
         base_url (str, optional): Base URL for OpenAI-compatible APIs
         language (str): Language for prompts ('en' for English, 'zh' for Chinese)
+        checkpointer (Checkpointer, optional): When given, every Q&A turn is checkpointed,
+            so a failed run resumes from the last completed turn
 
     Returns:
         list: Alternating Question and Answer objects representing the complete discussion
@@ -336,19 +790,60 @@ def write_draft_script(config: PodcastConfig,
     all_texts = background_texts + deep_texts # background_info与deep_info是一样的
     chunks = text_splitter.create_documents(all_texts)
 
-    # Create vector store
+    # Create vector store, reusing embeddings of chunks seen in earlier runs. Stored chunks
+    # are keyed by the model behind the provider, so changing it starts a new store
     embeddings = get_embeddings_model(config, base_url=base_url)
-    vector_store = InMemoryVectorStore.from_documents(
+    ttl_hours = config.vector_store.get('ttl_hours')
+    vector_store = PersistentVectorStore.from_documents(
         documents=chunks,
-        embedding=embeddings
+        embedding=embeddings,
+        persist_path=os.path.join(config.cache_dir, 'vector_store', to_snake_case(embeddings_model_name(embeddings))),
+        max_bytes=int(config.vector_store.get('max_size_mb', 512) * 1024 * 1024),
+        ttl_s=ttl_hours * 3600 if ttl_hours else None
     )
 
-    draft_script = discuss(config, topic, outline, background_info, vector_store, qa_rounds, base_url, language)
+    draft_script = discuss(config, topic, outline, background_info, vector_store, qa_rounds, base_url, language,
+                           checkpointer=checkpointer)
     return draft_script
 
 
+def format_rewrite_input(section: list, previous_context: Optional[list] = None, following_context: Optional[list] = None) -> str:
+    """
+    Format a script section for the rewriter, optionally surrounded by neighbouring lines.
+
+    The neighbouring lines are clearly marked as read-only context so the rewriter can make
+    smooth transitions into and out of the section without rewriting them itself.
+
+    Args:
+        section (list): Question/Answer objects to be rewritten
+        previous_context (list, optional): Question/Answer objects preceding the section
+        following_context (list, optional): Question/Answer objects following the section
+
+    Returns:
+        str: Script text to pass to the rewriter prompt
+    """
+    script = format_conversation_history(section)
+    if previous_context:
+        script = (
+            "[PREVIOUS CONTEXT - for continuity only, do not rewrite or repeat]\n"
+            f"{format_conversation_history(previous_context)}"
+            "[END PREVIOUS CONTEXT]\n\n"
+            f"{script}"
+        )
+    if following_context:
+        script += (
+            "\n[FOLLOWING CONTEXT - for continuity only, do not rewrite or repeat]\n"
+            f"{format_conversation_history(following_context)}"
+            "[END FOLLOWING CONTEXT]\n"
+        )
+    return script
+
+
 @retry_with_exponential_backoff(max_retries=10, base_delay=2.0)
-def rewrite_script_section(section: list, rewriter_chain) -> list:
+def rewrite_script_section(section: list,
+                           rewriter_chain,
+                           previous_context: Optional[list] = None,
+                           following_context: Optional[list] = None) -> list:
     """
     Rewrite a section of the podcast script to improve flow and naturalness.
 
@@ -359,6 +854,10 @@ def rewrite_script_section(section: list, rewriter_chain) -> list:
     Args:
         section (list): List of Question/Answer objects representing a script section
         rewriter_chain (LLMChain): Chain configured with prompt and model for rewriting
+        previous_context (list, optional): Draft lines preceding the section, shown to the
+            rewriter as read-only context
+        following_context (list, optional): Draft lines following the section, shown to the
+            rewriter as read-only context
 
     Returns:
         list: List of dictionaries containing rewritten lines with structure:
@@ -368,26 +867,45 @@ def rewrite_script_section(section: list, rewriter_chain) -> list:
             }
     """
     rewritten = rewriter_chain.invoke({
-        "script": format_conversation_history(section)
+        "script": format_rewrite_input(section, previous_context, following_context)
     })
 
     return [{'speaker': line.speaker, 'text': line.text} for line in rewritten.lines]
 
 
-def write_final_script(config: PodcastConfig, topic: str, draft_script: list, batch_size: int = 4, base_url: Optional[str] = None, language: str = 'en') -> list:
+def write_final_script(config: PodcastConfig,
+                       topic: str,
+                       draft_script: list,
+                       batch_size: int = 4,
+                       base_url: Optional[str] = None,
+                       language: str = 'en',
+                       max_parallel_batches: Optional[int] = None,
+                       overlap: Optional[int] = None,
+                       checkpointer: Optional[Checkpointer] = None,
+                       on_batch: Optional[Callable[[list], None]] = None) -> list:
     """
     Rewrite a draft podcast script to improve flow, naturalness and quality.
 
     Takes a draft script consisting of Question/Answer exchanges and processes it in batches,
     using an LLM to improve the conversational flow, word choice, and overall quality while 
     maintaining the core content and structure. The script is processed in batches to manage
-    context length and rate limits.
+    context length and rate limits. Batches are rewritten concurrently and reassembled in
+    script order.
 
     Args:
         draft_script (list): List of Question/Answer objects representing the full draft script
         batch_size (int, optional): Number of Q/A exchanges to process in each batch. Defaults to 4.
         base_url (str, optional): Base URL for OpenAI-compatible APIs
         language (str): Language for prompts ('en' for English, 'zh' for Chinese)
+        max_parallel_batches (int, optional): Maximum number of batches rewritten at once.
+            Defaults to config.writer_settings['rewrite_parallelism'].
+        overlap (int, optional): Number of draft lines from each neighbouring batch shown to
+            the rewriter as read-only context. Defaults to config.writer_settings['rewrite_overlap'].
+        checkpointer (Checkpointer, optional): When given, every rewritten batch is checkpointed
+            under a key derived from its content, so a failed run only redoes unfinished batches
+        on_batch (Callable[[list], None], optional): Called with each finished part of the
+            final script in script order (the intro line, every rewritten batch, the outro
+            line), so downstream work can start before the whole script is done
 
     Returns:
         list: List of dictionaries containing the rewritten script lines with structure:
@@ -398,6 +916,11 @@ def write_final_script(config: PodcastConfig, topic: str, draft_script: list, ba
     """
     logger.info("Processing draft script in batches")
 
+    if max_parallel_batches is None:
+        max_parallel_batches = config.writer_settings.get('rewrite_parallelism', 1)
+    if overlap is None:
+        overlap = config.writer_settings.get('rewrite_overlap', 0)
+
     # Try to load rewriter prompt from local storage first, fallback to Hub
     try:
         rewriter_prompt = get_local_prompt("podcast_rewriter", language)
@@ -408,33 +931,61 @@ def write_final_script(config: PodcastConfig, topic: str, draft_script: list, ba
         rewriter_prompt = hub.pull(rewriter_prompthub_path)
         logger.info(f"Got prompt from hub: {rewriter_prompthub_path}")
 
-    rate_limiter = InMemoryRateLimiter(
-        requests_per_second=0.2,
-        check_every_n_seconds=0.1,
-        max_bucket_size=10
-    )
+    rate_limiter = get_llm_rate_limiter(config, config.long_context_llm_provider)
 
-    long_context_llm = get_long_context_llm(config, rate_limiter, base_url)
+    long_context_llm = get_long_context_llm(config, rate_limiter, base_url,
+                                            temperature=get_stage_temperature(config, 'rewrite'))
     rewriter_chain = rewriter_prompt | long_context_llm.with_structured_output(Script)
-    
-    final_script = []
-    
-    # Process script in batches of bath_size
-    for i in range(0, len(draft_script), batch_size):
-        logger.info(f"Rewriting lines {i+1} to {i+batch_size} of {len(draft_script)}")
-        batch = draft_script[i:i + batch_size]
-        final_script.extend(rewrite_script_section(batch, rewriter_chain))
+
+    def rewrite_batch(start: int) -> list:
+        batch = draft_script[start:start + batch_size]
+        previous_context = draft_script[max(0, start - overlap):start] if overlap else None
+        following_context = draft_script[start + batch_size:start + batch_size + overlap] if overlap else None
+        logger.info(f"Rewriting lines {start+1} to {start+len(batch)} of {len(draft_script)}")
+
+        if checkpointer is None:
+            return rewrite_script_section(batch, rewriter_chain, previous_context, following_context)
+
+        return checkpointer.checkpoint(
+            rewrite_script_section,
+            batch, rewriter_chain, previous_context, following_context,
+            stage_name='final_script_batch',
+            key_parts=(
+                format_rewrite_input(batch, previous_context, following_context),
+                language,
+                config.long_context_llm_provider,
+                base_url,
+                repr(rewriter_prompt)
+            )
+        )
+
+    def emit(lines: list) -> None:
+        if on_batch is not None:
+            on_batch(lines)
 
     # Add intro line
-    final_script.insert(0, {
+    final_script = [{
         'speaker': 'Interviewer',
         'text': config.intro.format(topic=topic, podcast_name=config.podcast_name)
-    })
+    }]
+    emit(final_script[:])
+
+    batch_starts = range(0, len(draft_script), batch_size)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_parallel_batches)) as executor:
+        futures = [submit_with_context(executor, rewrite_batch, start) for start in batch_starts]
+
+        # Reassemble in script order regardless of completion order
+        for future in futures:
+            batch = future.result()
+            final_script.extend(batch)
+            emit(batch)
 
     # Add outro line
-    final_script.append({
+    outro = {
         'speaker': 'Interviewer',
         'text': config.outro.format(topic=topic, podcast_name=config.podcast_name)
-    })
+    }
+    final_script.append(outro)
+    emit([outro])
         
     return final_script
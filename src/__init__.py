@@ -1,3 +1,8 @@
-from src.filecontentextract import FileContentExtract
+# FileContentExtract 依赖 markitdown 和 LLM 客户端，导入较慢，首次访问时再导入
+def __getattr__(name):
+    if name == "FileContentExtract":
+        from src.filecontentextract import FileContentExtract
+        return FileContentExtract
+    raise AttributeError(f"module 'src' has no attribute '{name}'")
 
 __all__ = ["FileContentExtract"]
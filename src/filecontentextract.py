@@ -1,7 +1,11 @@
 import os
 import asyncio
+import contextvars
 import mimetypes
 import hashlib
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, TypedDict, Any,Union
 from pathlib import Path
 from functools import partial
@@ -17,9 +21,40 @@ from langchain_core.prompts import ChatPromptTemplate
 from .models import FileMatchList, OverallState
 from .directorytreegenerator import DirectoryTreeGenerator
 from .prompts_zh import file_extract_instructions,final_answer_instructions
+from .metrics import MetricsCallbackHandler, record_cache, record_skipped, track_file
 
 logger = logging.getLogger(__name__)
 
+# 文件内容缓存：键为 (路径, 修改时间, 大小)，文件变化后自动失效；按总字节数 LRU 淘汰
+READ_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_read_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+_read_cache_bytes = 0
+_read_cache_lock = threading.Lock()
+
+
+def _read_cache_get(key: tuple) -> Optional[Dict]:
+    with _read_cache_lock:
+        entry = _read_cache.get(key)
+        if entry is not None:
+            _read_cache.move_to_end(key)
+        return entry
+
+
+def _read_cache_put(key: tuple, entry: Dict) -> None:
+    global _read_cache_bytes
+    size = entry["file_size"]
+    if size > READ_CACHE_MAX_BYTES:
+        return
+    with _read_cache_lock:
+        if key in _read_cache:
+            return
+        _read_cache[key] = entry
+        _read_cache_bytes += size
+        while _read_cache_bytes > READ_CACHE_MAX_BYTES:
+            _, evicted = _read_cache.popitem(last=False)
+            _read_cache_bytes -= evicted["file_size"]
+
+
 class FileContentExtract:
     def __init__(
         self,
@@ -35,6 +70,7 @@ class FileContentExtract:
             max_retries=2,
             openai_api_key=api_key,
             openai_api_base=api_base,
+            callbacks=[MetricsCallbackHandler(model)],
         )
         self.name = name
         self.config = {"configurable": {"thread_id": "chatbot_agent"}}
@@ -122,8 +158,10 @@ class FileContentExtract:
         if os.path.isfile(path):
             # 如果是单个文件，判断是否符合过滤条件
             if not include_hidden and os.path.basename(path).startswith('.'):
+                record_skipped('hidden')
                 return []
             if include_extensions is not None and os.path.splitext(path)[1] not in include_extensions:
+                record_skipped('extension')
                 return []
             file_paths.append(path)
         elif os.path.isdir(path):
@@ -134,8 +172,10 @@ class FileContentExtract:
                     dirs[:] = [d for d in dirs if not d.startswith('.')]
                 for file in files:
                     if not include_hidden and file.startswith('.'):
+                        record_skipped('hidden')
                         continue
                     if include_extensions is not None and os.path.splitext(file)[1] not in include_extensions:
+                        record_skipped('extension')
                         continue
                     file_path = os.path.join(root, file)
                     file_paths.append(file_path)
@@ -182,6 +222,7 @@ class FileContentExtract:
     def read_file(self, path: str) -> Optional[Dict]:
         """
         读取指定路径的文件内容，并添加行号前缀。
+        未修改的文件直接从进程内缓存返回，命中情况记入指标 wikidocu_cache_requests_total。
         """
         if not os.path.exists(path):
             logger.warning("文件路径不存在: %s", path)
@@ -193,7 +234,14 @@ class FileContentExtract:
             return None
 
         file_name = os.path.basename(path)
-        file_size = os.path.getsize(path)
+        stat = os.stat(path)
+        file_size = stat.st_size
+
+        cache_key = (os.path.abspath(path), stat.st_mtime_ns, file_size)
+        cached = _read_cache_get(cache_key)
+        record_cache('file_read', cached is not None)
+        if cached is not None:
+            return dict(cached, file_path=path)
 
         mime_type, _ = mimetypes.guess_type(path)
         file_type = mime_type or os.path.splitext(path)[1][1:].lower() or "unknown"
@@ -205,7 +253,7 @@ class FileContentExtract:
             logger.error("无法读取文件内容: %s", e)
             return None
 
-        return {
+        result = {
             "file_path": path,
             "file_hash": hashlib.md5(path.encode('utf-8')).hexdigest(),
             "context": context,
@@ -213,6 +261,8 @@ class FileContentExtract:
             "file_type": file_type,
             "file_size": file_size,
         }
+        _read_cache_put(cache_key, result)
+        return result
 
     def scanning(self, file_path: str, tree_str: str = None, research_topic: str = None) -> OverallState:
         """
@@ -227,6 +277,7 @@ class FileContentExtract:
         # 读取文件内容
         file_result = self.read_file(file_path)
         if not file_result or "context" not in file_result:
+            record_skipped('unreadable')
             raise ValueError(f"无法读取文件内容: {file_path}")
 
         # 构造查询上下文
@@ -414,6 +465,27 @@ class FileContentExtract:
             logger.error("处理URL内容时出错: %s, 错误: %s", url, e)
             return None
 
+    def _timed_scanning(self, submitted: float, file_path: str, tree_str: str = None,
+                        research_topic: str = None) -> OverallState:
+        """
+        扫描单个文件并记录指标（耗时、排队等待、Token、匹配数）。
+        :param submitted: 任务提交时的 time.perf_counter()，用于计算线程池排队等待
+        """
+        with track_file(file_path, time.perf_counter() - submitted) as record:
+            result = self.scanning(file_path, tree_str, research_topic)
+            record["matches"] = len(result["sources_gathered"])
+        return result
+
+    def _submit(self, loop: asyncio.AbstractEventLoop, func, *args) -> asyncio.Future:
+        """
+        在默认线程池中运行阻塞函数，并沿用当前上下文，使指标归属到当前问题。
+        """
+        return loop.run_in_executor(None, partial(contextvars.copy_context().run, func, *args))
+
+    def _submit_scanning(self, loop: asyncio.AbstractEventLoop, file_path: str, tree_str: str,
+                         research_topic: str) -> asyncio.Future:
+        return self._submit(loop, self._timed_scanning, time.perf_counter(), file_path, tree_str, research_topic)
+
     def run(self, file_paths: List[str], research_topic:str)->List[OverallState]:
         """
         批量运行文件分析，支持多个文件。
@@ -424,7 +496,7 @@ class FileContentExtract:
             #参数是文件
             if os.path.isfile(file_path):
                 logger.info("Scanning the file: %s", file_path)
-                result = self.scanning(file_path, None, research_topic)
+                result = self._timed_scanning(time.perf_counter(), file_path, None, research_topic)
                 results.append(result)
 
             #参数是目录
@@ -440,7 +512,7 @@ class FileContentExtract:
                 file_list = self._filelist(file_path)
                 for _file_paths in file_list:
                     logger.info("Scanning the file: %s", _file_paths)
-                    result = self.scanning( _file_paths, tree_str, research_topic)
+                    result = self._timed_scanning(time.perf_counter(), _file_paths, tree_str, research_topic)
                     results.append(result)
             else:
                 logger.warning("找不到文件或目录：%s", file_path)
@@ -460,7 +532,7 @@ class FileContentExtract:
             if os.path.isfile(file_path):
                 logger.info("Scanning the file: %s", file_path)
                 # 在线程池中运行阻塞函数
-                result = await loop.run_in_executor(None, self.scanning, file_path, None, research_topic)
+                result = await self._submit_scanning(loop, file_path, None, research_topic)
                 results.append(result)
 
             elif os.path.isdir(file_path):
@@ -473,13 +545,13 @@ class FileContentExtract:
                 )
 
                 # 获取文件列表（假设 _filelist 是同步函数）
-                file_list = await loop.run_in_executor(None, self._filelist, file_path)
+                file_list = await self._submit(loop, self._filelist, file_path)
 
                 # 创建所有文件扫描任务
                 tasks = []
                 for _file_path in file_list:
                     logger.info("Scanning the file: %s", _file_path)
-                    task = loop.run_in_executor(None, self.scanning, _file_path, tree_str, research_topic)
+                    task = self._submit_scanning(loop, _file_path, tree_str, research_topic)
                     tasks.append(task)
 
                 # 并发执行并收集结果
@@ -493,7 +565,7 @@ class FileContentExtract:
         if urls is not None and len(urls) > 0:  # 更准确地判断urls是否为None或空
             for url in urls:
                 logger.info("Processing URL: %s", url)
-                result = await loop.run_in_executor(None, self.url_scanning, url, research_topic)
+                result = await self._submit(loop, self.url_scanning, url, research_topic)
                 if result:
                     results.append(result)
 
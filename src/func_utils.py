@@ -6,7 +6,6 @@ import shutil
 from shiny import ui
 from typing import Dict, List, Optional, Any,Union
 import requests
-from markitdown import MarkItDown
 from urllib.parse import urlparse
 
 import logging
@@ -257,7 +256,8 @@ def webfetch(
         if not parsed.scheme or not parsed.netloc:
             raise ValueError(f"Invalid URL: {url}")
 
-        # 创建 MarkItDown 实例
+        # 创建 MarkItDown 实例（markitdown 导入较慢，首次抓取时再导入）
+        from markitdown import MarkItDown
         md_converter = MarkItDown(requests_kwargs=requests_kwargs)
 
         # 执行转换
@@ -19,6 +19,7 @@ from .tools_and_schemas import SearchQueryList
 from .filecontentextract import FileContentExtract
 from .prompts_zh import final_answer_instructions, general_doc_retrieval_prompt
 from .func_utils import get_current_date, get_research_topic
+from .metrics import MetricsCallbackHandler, instrument_node
 # from config.global_vars import ui_detail_output_handler, WIKIDOCU_QA_DIR
 from config.global_vars import WIKIDOCU_QA_DIR
 
@@ -174,6 +175,7 @@ def create_async_tools_graph(api_key: str, model_name: str, base_url: str):
         max_retries=2,
         openai_api_key=api_key,
         openai_api_base=base_url,
+        callbacks=[MetricsCallbackHandler(model_name)],
     )
 
     # 使用 functools.partial 绑定参数
@@ -191,10 +193,11 @@ def create_async_tools_graph(api_key: str, model_name: str, base_url: str):
     # 构建图
     builder = StateGraph(OverallState)
 
-    builder.add_node("generate_research_topic", _generate_research_topic)
-    builder.add_node("chatbox", _chatbox)
-    builder.add_node("file_research", _file_research)
-    builder.add_node("final_answer", _final_answer)
+    # 各节点耗时、错误与 LLM Token 记入 src.metrics 指标注册表
+    builder.add_node("generate_research_topic", instrument_node("generate_research_topic", _generate_research_topic))
+    builder.add_node("chatbox", instrument_node("chatbox", _chatbox))
+    builder.add_node("file_research", instrument_node("file_research", _file_research))
+    builder.add_node("final_answer", instrument_node("final_answer", _final_answer))
 
     # 条件边等保持不变
     builder.add_edge(START, "generate_research_topic")
@@ -0,0 +1,464 @@
+"""
+WikiDocu 问答链路的性能指标。
+
+create_async_tools_graph 的每个节点（generate_research_topic、file_research、final_answer、
+chatbox）、file_research 中的每个文件扫描以及每次 LLM 调用都会记录到进程级的指标注册表
+REGISTRY 中，同时记入当前问题的 QuestionMetrics，用于：
+- 通过 Shiny 应用的 /metrics 接口以 Prometheus 文本格式导出，据此设置问答延迟的 SLO
+- 在 generate_full_report 生成的报告末尾附加本次问题的 JSON 指标摘要
+
+主要组件:
+- MetricsRegistry: 线程安全的计数器与直方图注册表，可导出 Prometheus 文本格式与 JSON
+- QuestionMetrics: 单个问题的节点耗时、逐文件耗时、Token、缓存命中与排队等待
+- track_question / track_file: 记录一次问题 / 一个文件扫描的上下文管理器
+- instrument_node: 包装 LangGraph 节点函数，记录节点耗时与错误
+- MetricsCallbackHandler: LangChain 回调，统计 LLM 调用次数与输入/输出 Token
+
+当前问题、节点与文件通过 contextvars 传递；提交到线程池的任务需在
+contextvars.copy_context() 中运行才能归属到正确的问题。
+
+示例:
+    with track_question(question) as question_metrics:
+        response = await graph.ainvoke({"messages": [HumanMessage(content=question)]}, config)
+    report = generate_full_report(question, answer, file_paths, timestamp, question_metrics.summary())
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+logger = logging.getLogger(__name__)
+
+
+# 秒级直方图的桶边界，覆盖单次 LLM 调用到整轮问答
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# 每个直方图序列保留的最近样本数，用于 JSON 摘要中的分位数
+RECENT_SAMPLES = 1000
+
+# 指标名称 -> (类型, 说明)
+METRICS = {
+    'wikidocu_questions_total': ('counter', 'Questions answered, by status'),
+    'wikidocu_question_seconds': ('histogram', 'End-to-end latency of a question'),
+    'wikidocu_node_seconds': ('histogram', 'Duration of a graph node'),
+    'wikidocu_node_errors_total': ('counter', 'Graph node invocations that raised'),
+    'wikidocu_file_scan_seconds': ('histogram', 'Duration of scanning one file, including its LLM extraction'),
+    'wikidocu_file_queue_wait_seconds': ('histogram', 'Time a file scan waited for an executor thread'),
+    'wikidocu_files_scanned_total': ('counter', 'Files scanned successfully by file_research'),
+    'wikidocu_files_skipped_total': ('counter', 'Files skipped by file_research, by reason'),
+    'wikidocu_llm_calls_total': ('counter', 'LLM calls, by node and model'),
+    'wikidocu_llm_tokens_total': ('counter', 'LLM tokens, by node, model and type (input/output)'),
+    'wikidocu_cache_requests_total': ('counter', 'Cache lookups, by cache and result (hit/miss)'),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ''
+    escaped = (
+        f'{key}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for key, value in items
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.recent: deque = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+
+class MetricsRegistry:
+    """
+    线程安全的指标注册表，保存计数器与直方图（按标签区分序列）。
+    """
+    def __init__(self, metrics: Optional[Dict[str, Tuple[str, str]]] = None,
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        :param metrics: 指标名称 -> (类型 'counter' 或 'histogram', 说明)
+        :param buckets: 直方图桶边界（秒）
+        """
+        self.metrics = dict(metrics if metrics is not None else METRICS)
+        self.buckets = buckets
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def _check(self, name: str, kind: str) -> None:
+        if self.metrics.get(name, (kind,))[0] != kind:
+            raise ValueError(f"指标 {name} 不是 {kind} 类型")
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """计数器增加 value。"""
+        self._check(name, 'counter')
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """向直方图记录一个观测值（秒）。"""
+        self._check(name, 'histogram')
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        """清空所有指标。"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        """
+        以 Prometheus 文本格式（0.0.4）导出全部指标。
+
+        :return: 可直接作为 /metrics 响应体的文本
+        """
+        lines = []
+        with self._lock:
+            for name in sorted(set(self._counters) | set(self._histograms)):
+                kind, help_text = self.metrics.get(name, ('untyped', ''))
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+                for labels, value in sorted(self._counters.get(name, {}).items()):
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+                for labels, histogram in sorted(self._histograms.get(name, {}).items()):
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(f'{name}_bucket{_format_labels(labels, ("le", _format_value(bound)))} {count}')
+                    lines.append(f'{name}_bucket{_format_labels(labels, ("le", "+Inf"))} {histogram.count}')
+                    lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(round(histogram.sum, 6))}')
+                    lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        导出全部指标为 JSON 友好的字典。
+
+        :return: 计数器取值；直方图给出次数、总和以及最近样本的 p50/p95/最大值
+        """
+        def series_name(labels: Labels) -> str:
+            return ','.join(f'{key}={value}' for key, value in labels) or 'all'
+
+        with self._lock:
+            counters = {
+                name: {series_name(labels): value for labels, value in sorted(series.items())}
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: {
+                    series_name(labels): {
+                        'count': histogram.count,
+                        'sum_s': round(histogram.sum, 3),
+                        'p50_s': round(_percentile(list(histogram.recent), 0.5), 3),
+                        'p95_s': round(_percentile(list(histogram.recent), 0.95), 3),
+                        'max_s': round(max(histogram.recent, default=0.0), 3),
+                    }
+                    for labels, histogram in sorted(series.items())
+                }
+                for name, series in self._histograms.items()
+            }
+        return {'counters': counters, 'histograms': histograms}
+
+
+# 进程级注册表，由 /metrics 接口导出
+REGISTRY = MetricsRegistry()
+
+
+class QuestionMetrics:
+    """
+    单个问题的指标：节点耗时、逐文件扫描记录、LLM Token、缓存命中与文件排队等待。
+    线程安全。
+    """
+    def __init__(self, question: str):
+        self.question = question
+        self.started = time.perf_counter()
+        self.seconds: Optional[float] = None
+        self.nodes: Dict[str, float] = {}
+        self.files: List[Dict[str, Any]] = []
+        self.skipped: Dict[str, int] = {}
+        self.llm_calls = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._lock = threading.Lock()
+
+    def add_node(self, node: str, seconds: float) -> None:
+        with self._lock:
+            self.nodes[node] = self.nodes.get(node, 0.0) + seconds
+
+    def add_file(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.files.append(record)
+
+    def add_skipped(self, reason: str, count: int) -> None:
+        with self._lock:
+            self.skipped[reason] = self.skipped.get(reason, 0) + count
+
+    def add_llm_call(self, tokens_in: int, tokens_out: int) -> None:
+        with self._lock:
+            self.llm_calls += 1
+            self.tokens_in += tokens_in
+            self.tokens_out += tokens_out
+
+    def add_cache(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        本次问题的指标摘要。
+
+        :return: 总耗时、各节点耗时、LLM 调用与 Token、文件扫描/跳过数、缓存命中率、
+                 排队等待以及按耗时降序的逐文件记录
+        """
+        with self._lock:
+            files = sorted(self.files, key=lambda record: -record['seconds'])
+            waits = [record['queue_wait_s'] for record in self.files]
+            lookups = self.cache_hits + self.cache_misses
+            seconds = self.seconds if self.seconds is not None else time.perf_counter() - self.started
+            return {
+                'question': self.question,
+                'seconds': round(seconds, 3),
+                'nodes': {node: round(value, 3) for node, value in self.nodes.items()},
+                'llm': {'calls': self.llm_calls, 'tokens_in': self.tokens_in, 'tokens_out': self.tokens_out},
+                'files_scanned': sum(1 for record in self.files if record['status'] == 'ok'),
+                'files_skipped': dict(self.skipped),
+                'cache': {
+                    'hits': self.cache_hits,
+                    'misses': self.cache_misses,
+                    'hit_rate': round(self.cache_hits / lookups, 3) if lookups else None,
+                },
+                'queue_wait': {
+                    'total_s': round(sum(waits), 3),
+                    'max_s': round(max(waits, default=0.0), 3),
+                },
+                'files': files,
+            }
+
+
+_current_question: contextvars.ContextVar[Optional[QuestionMetrics]] = contextvars.ContextVar(
+    'wikidocu_question', default=None)
+_current_node: contextvars.ContextVar[str] = contextvars.ContextVar('wikidocu_node', default='none')
+_current_file: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    'wikidocu_file', default=None)
+
+
+def current_question() -> Optional[QuestionMetrics]:
+    """获取当前上下文中正在记录的问题指标。"""
+    return _current_question.get()
+
+
+@contextmanager
+def track_question(question: str, registry: MetricsRegistry = REGISTRY) -> Iterator[QuestionMetrics]:
+    """
+    记录一次问答：在此上下文中运行的节点、文件扫描与 LLM 调用都会计入返回的 QuestionMetrics。
+
+    :param question: 用户问题
+    :param registry: 指标注册表
+    """
+    metrics = QuestionMetrics(question)
+    token = _current_question.set(metrics)
+    status = 'ok'
+    try:
+        yield metrics
+    except BaseException:
+        status = 'error'
+        raise
+    finally:
+        _current_question.reset(token)
+        metrics.seconds = time.perf_counter() - metrics.started
+        registry.observe('wikidocu_question_seconds', metrics.seconds)
+        registry.inc('wikidocu_questions_total', status=status)
+        logger.info("问题处理完成，耗时 %.2fs，LLM 调用 %d 次，扫描文件 %d 个",
+                    metrics.seconds, metrics.llm_calls, len(metrics.files))
+
+
+def instrument_node(name: str, func: Callable, registry: MetricsRegistry = REGISTRY) -> Callable:
+    """
+    包装 LangGraph 节点函数（同步或异步），记录节点耗时与错误，并标记节点内的 LLM 调用。
+
+    :param name: 节点名称
+    :param func: 节点函数
+    :param registry: 指标注册表
+    :return: 包装后的节点函数
+    """
+    def record(started: float, failed: bool) -> None:
+        seconds = time.perf_counter() - started
+        registry.observe('wikidocu_node_seconds', seconds, node=name)
+        if failed:
+            registry.inc('wikidocu_node_errors_total', node=name)
+        question = _current_question.get()
+        if question is not None:
+            question.add_node(name, seconds)
+
+    if asyncio.iscoroutinefunction(func) or asyncio.iscoroutinefunction(getattr(func, 'func', None)):
+        @functools.wraps(func)
+        async def async_node(state, *args, **kwargs):
+            token = _current_node.set(name)
+            started, failed = time.perf_counter(), True
+            try:
+                result = await func(state, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                record(started, failed)
+                _current_node.reset(token)
+        return async_node
+
+    @functools.wraps(func)
+    def node(state, *args, **kwargs):
+        token = _current_node.set(name)
+        started, failed = time.perf_counter(), True
+        try:
+            result = func(state, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            record(started, failed)
+            _current_node.reset(token)
+    return node
+
+
+@contextmanager
+def track_file(file_path: str, queue_wait: float = 0.0,
+               registry: MetricsRegistry = REGISTRY) -> Iterator[Dict[str, Any]]:
+    """
+    记录一个文件的扫描：耗时、排队等待以及扫描期间 LLM 调用的 Token。
+
+    只有成功的扫描计入 wikidocu_files_scanned_total；扫描中经 record_skipped 记为跳过的文件
+    （如无法读取）只计入跳过数，不计入耗时与逐文件记录。
+
+    :param file_path: 文件路径
+    :param queue_wait: 扫描任务提交后等待线程池执行的时间（秒）
+    :param registry: 指标注册表
+    :return: 文件记录，可在扫描中补充字段（如 chars、matches）
+    """
+    record = {'file': file_path, 'seconds': 0.0, 'queue_wait_s': round(queue_wait, 3),
+              'tokens_in': 0, 'tokens_out': 0, 'status': 'ok'}
+    token = _current_file.set(record)
+    started = time.perf_counter()
+    try:
+        yield record
+    except BaseException:
+        if record['status'] == 'ok':
+            record['status'] = 'error'
+        raise
+    finally:
+        _current_file.reset(token)
+        # 被跳过的文件（如无法读取）已计入跳过数
+        if record['status'] != 'skipped':
+            seconds = time.perf_counter() - started
+            record['seconds'] = round(seconds, 3)
+            registry.observe('wikidocu_file_scan_seconds', seconds)
+            registry.observe('wikidocu_file_queue_wait_seconds', queue_wait)
+            if record['status'] == 'ok':
+                registry.inc('wikidocu_files_scanned_total')
+            question = _current_question.get()
+            if question is not None:
+                question.add_file(record)
+
+
+def record_skipped(reason: str, count: int = 1, registry: MetricsRegistry = REGISTRY) -> None:
+    """记录被跳过的文件数（如隐藏文件、无法读取的文件）。在 track_file 中调用时，该文件不再计为已扫描。"""
+    if count <= 0:
+        return
+    record = _current_file.get()
+    if record is not None:
+        record['status'] = 'skipped'
+    registry.inc('wikidocu_files_skipped_total', count, reason=reason)
+    question = _current_question.get()
+    if question is not None:
+        question.add_skipped(reason, count)
+
+
+def record_cache(cache: str, hit: bool, registry: MetricsRegistry = REGISTRY) -> None:
+    """记录一次缓存查询的命中或未命中。"""
+    registry.inc('wikidocu_cache_requests_total', cache=cache, result='hit' if hit else 'miss')
+    question = _current_question.get()
+    if question is not None:
+        question.add_cache(hit)
+
+
+def _token_usage(response: LLMResult) -> Tuple[int, int]:
+    tokens_in = tokens_out = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, 'message', None), 'usage_metadata', None) or {}
+            tokens_in += usage.get('input_tokens', 0)
+            tokens_out += usage.get('output_tokens', 0)
+    if not tokens_in and not tokens_out:
+        usage = (response.llm_output or {}).get('token_usage') or {}
+        tokens_in = usage.get('prompt_tokens', 0) or 0
+        tokens_out = usage.get('completion_tokens', 0) or 0
+    return tokens_in, tokens_out
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain 回调：统计 LLM 调用次数与 Token，按当前节点与模型记入注册表、当前问题与当前文件。
+    """
+    # 在调用方的线程与上下文中直接执行，才能读取当前问题/节点/文件
+    run_inline = True
+
+    def __init__(self, model: str, registry: MetricsRegistry = REGISTRY):
+        self.model = model
+        self.registry = registry
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        tokens_in, tokens_out = _token_usage(response)
+        node = _current_node.get()
+        self.registry.inc('wikidocu_llm_calls_total', node=node, model=self.model)
+        self.registry.inc('wikidocu_llm_tokens_total', tokens_in, node=node, model=self.model, type='input')
+        self.registry.inc('wikidocu_llm_tokens_total', tokens_out, node=node, model=self.model, type='output')
+        question = _current_question.get()
+        if question is not None:
+            question.add_llm_call(tokens_in, tokens_out)
+        record = _current_file.get()
+        if record is not None:
+            record['tokens_in'] += tokens_in
+            record['tokens_out'] += tokens_out
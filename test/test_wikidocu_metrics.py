@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+测试 src/metrics.py 的问答链路指标：节点耗时、LLM Token、文件扫描/跳过、缓存命中与 Prometheus 导出
+"""
+
+import asyncio
+import os
+import sys
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+
+from src.filecontentextract import FileContentExtract
+from src.metrics import (MetricsCallbackHandler, MetricsRegistry, REGISTRY, instrument_node,
+                         track_question)
+from src.state import OverallState
+
+
+def test_prometheus_text_format():
+    """测试计数器与直方图的 Prometheus 文本输出"""
+    registry = MetricsRegistry()
+    registry.inc('wikidocu_files_skipped_total', 2, reason='hidden')
+    registry.observe('wikidocu_node_seconds', 0.3, node='chatbox')
+
+    text = registry.render_prometheus()
+
+    assert '# TYPE wikidocu_files_skipped_total counter' in text
+    assert 'wikidocu_files_skipped_total{reason="hidden"} 2' in text
+    assert 'wikidocu_node_seconds_bucket{node="chatbox",le="0.25"} 0' in text
+    assert 'wikidocu_node_seconds_bucket{node="chatbox",le="0.5"} 1' in text
+    assert 'wikidocu_node_seconds_count{node="chatbox"} 1' in text
+
+
+def test_graph_nodes_and_tokens_are_recorded():
+    """测试同步/异步节点耗时与节点内 LLM 调用的 Token 计入当前问题"""
+    llm = GenericFakeChatModel(
+        messages=iter([AIMessage(content='答案', usage_metadata={
+            'input_tokens': 12, 'output_tokens': 3, 'total_tokens': 15})]),
+        callbacks=[MetricsCallbackHandler('fake-model')]
+    )
+
+    def generate_research_topic(state):
+        return {'search_query': ['问题']}
+
+    async def final_answer(state):
+        return {'messages': [await llm.ainvoke('问题')]}
+
+    builder = StateGraph(OverallState)
+    builder.add_node('generate_research_topic', instrument_node('generate_research_topic', generate_research_topic))
+    builder.add_node('final_answer', instrument_node('final_answer', final_answer))
+    builder.add_edge(START, 'generate_research_topic')
+    builder.add_edge('generate_research_topic', 'final_answer')
+    builder.add_edge('final_answer', END)
+    graph = builder.compile()
+
+    async def ask():
+        with track_question('问题') as question_metrics:
+            await graph.ainvoke({'messages': [('user', '问题')]})
+        return question_metrics
+
+    summary = asyncio.run(ask()).summary()
+
+    assert set(summary['nodes']) == {'generate_research_topic', 'final_answer'}
+    assert summary['llm'] == {'calls': 1, 'tokens_in': 12, 'tokens_out': 3}
+    assert ('wikidocu_llm_tokens_total{model="fake-model",node="final_answer",type="input"} 12'
+            in REGISTRY.render_prometheus())
+
+
+def test_file_scans_skips_and_read_cache(tmp_path, monkeypatch):
+    """测试逐文件记录、隐藏文件跳过以及重复提问时的文件读取缓存命中"""
+    (tmp_path / 'a.md').write_text('第一行\n第二行\n', encoding='utf-8')
+    (tmp_path / 'b.txt').write_text('内容\n', encoding='utf-8')
+    (tmp_path / '.hidden.md').write_text('隐藏\n', encoding='utf-8')
+    monkeypatch.setattr(FileContentExtract, 'content_extract',
+                        lambda self, file_content, research_topic: [
+                            {'start_line': 1, 'end_line': 1, 'reasoning': '相关'}])
+    researcher = FileContentExtract(model='fake-model', api_key='sk-test', api_base='http://localhost')
+
+    async def ask():
+        with track_question('问题') as question_metrics:
+            await researcher.async_run(file_paths=[str(tmp_path)], urls=None, research_topic='问题')
+        return question_metrics.summary()
+
+    first, second = asyncio.run(ask()), asyncio.run(ask())
+
+    assert first['files_scanned'] == 2 and first['files_skipped'] == {'hidden': 1}
+    assert {os.path.basename(record['file']) for record in first['files']} == {'a.md', 'b.txt'}
+    assert all(record['matches'] == 1 and record['queue_wait_s'] >= 0 for record in first['files'])
+    assert first['cache']['hit_rate'] == 0.0
+    assert second['cache'] == {'hits': 2, 'misses': 0, 'hit_rate': 1.0}
+
+
+def test_unreadable_file_is_only_counted_as_skipped(tmp_path):
+    """测试无法读取的文件只计入跳过数，不计入已扫描文件数"""
+    (tmp_path / 'broken.md').write_bytes(b'\xff\xfe\xfa')
+    researcher = FileContentExtract(model='fake-model', api_key='sk-test', api_base='http://localhost')
+
+    def scanned():
+        return REGISTRY.snapshot()['counters'].get('wikidocu_files_scanned_total', {}).get('all', 0)
+
+    before = scanned()
+    with track_question('问题') as question_metrics:
+        with pytest.raises(ValueError):
+            researcher._timed_scanning(0.0, str(tmp_path / 'broken.md'))
+    summary = question_metrics.summary()
+
+    assert scanned() == before
+    assert summary['files_scanned'] == 0 and summary['files'] == []
+    assert summary['files_skipped'] == {'unreadable': 1}